@@ -0,0 +1,69 @@
+"""
+Compare buffered ``get_commits`` parsing with the streaming ``iter_commits``.
+
+Builds a synthetic linear history with ``git fast-import`` and reports wall
+time, time to the first commit and peak Python memory for reading the whole
+log both ways.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import git, synthetic_history  # noqa: E402
+
+from fractary_core.repo.manager import RepoManager  # noqa: E402
+
+
+def legacy_get_commits(repo: Path, limit: int) -> int:
+    """The buffered ``%H|%s|%an|%ai`` parsing used before iter_commits."""
+    output = git(repo, "log", f"-{limit}", "--format=%H|%s|%an|%ai")
+    commits = [line.split("|") for line in output.split("\n") if line]
+    return len(commits)
+
+
+def timed(fn) -> tuple[float, float, float]:  # type: ignore[no-untyped-def]
+    """Return (total ms, first-result ms, peak MiB) for a generator-returning fn."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    first = None
+    for _ in fn():
+        if first is None:
+            first = time.perf_counter()
+    total = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total * 1000, ((first or time.perf_counter()) - start) * 1000, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commits", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with synthetic_history(args.commits) as repo:
+        manager = RepoManager({"default_branch": "main"}, repo_path=repo)
+
+        def legacy():  # type: ignore[no-untyped-def]
+            yield legacy_get_commits(repo, args.commits)
+
+        rows = [
+            ("legacy buffered log", *timed(legacy)),
+            ("iter_commits", *timed(manager.iter_commits)),
+            ("iter_commits(stats=True)", *timed(lambda: manager.iter_commits(stats=True))),
+        ]
+
+    print(f"Full history walk ({args.commits} commits)")
+    print(f"  {'reader':<28} {'total ms':>10} {'first ms':>10} {'peak MiB':>10}")
+    for label, total, first, peak in rows:
+        print(f"  {label:<28} {total:>10.0f} {first:>10.1f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
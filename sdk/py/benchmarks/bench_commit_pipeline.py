@@ -0,0 +1,71 @@
+"""
+Forks and wall time per commit on a repository with many tracked files.
+
+Compares ``RepoManager.commit`` against the previous pipeline (status,
+``add -A``, commit, ``log -1``), emulated with plain ``git`` calls.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import git, measure, report, scratch_repo  # noqa: E402
+
+from fractary_core.repo.history import commit_log_args  # noqa: E402
+from fractary_core.repo.manager import RepoManager  # noqa: E402
+
+
+def populate(repo: Path, files: int) -> None:
+    for i in range(files):
+        directory = repo / f"dir{i % 100:02d}"
+        directory.mkdir(exist_ok=True)
+        (directory / f"file{i}.txt").write_text(f"{i}\n")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "Populate")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    with scratch_repo() as repo:
+        populate(repo, args.files)
+        target = repo / "dir00" / "file0.txt"
+        counter = iter(range(10**9))
+
+        def legacy_commit() -> None:
+            target.write_text(f"legacy {next(counter)}\n")
+            if git(repo, "status", "--porcelain"):
+                git(repo, "add", "-A")
+            git(repo, "commit", "-q", "-m", "legacy")
+            git(repo, *commit_log_args("HEAD", max_count=1))
+
+        manager = RepoManager({"default_branch": "main"}, repo_path=repo)
+
+        def pipeline_commit() -> None:
+            target.write_text(f"pipeline {next(counter)}\n")
+            manager.commit("pipeline", commit_type="chore")
+
+        def pipeline_commit_paths() -> None:
+            target.write_text(f"paths {next(counter)}\n")
+            manager.commit("paths", commit_type="chore", paths=[str(target.relative_to(repo))])
+
+        pipeline_commit()  # warm the batch process
+        rows = [
+            ("legacy commit", *measure(legacy_commit, repeat=args.repeat)),
+            ("commit()", *measure(pipeline_commit, repeat=args.repeat)),
+            ("commit(paths=...)", *measure(pipeline_commit_paths, repeat=args.repeat)),
+        ]
+        manager.close()
+
+    report(f"Forks per commit ({args.files} tracked files)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Forks and wall time for bringing many branches up to date with main.
+
+Compares ``RepoManager.forward_branches`` against checking each branch out in
+the main worktree and running ``git rebase main``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import git, measure, report, scratch_repo  # noqa: E402
+
+from fractary_core.repo.manager import RepoManager  # noqa: E402
+
+
+def make_branches(repo: Path, count: int, diverged: int) -> list[str]:
+    """Create ``count`` branches behind main, ``diverged`` of them with a commit of their own."""
+    names = [f"agent/{i:04d}" for i in range(count)]
+    for i, name in enumerate(names):
+        git(repo, "branch", name, "main")
+        if i < diverged:
+            git(repo, "checkout", "-q", name)
+            (repo / f"{i}.txt").write_text(f"{i}\n")
+            git(repo, "add", f"{i}.txt")
+            git(repo, "commit", "-q", "-m", f"work {i}")
+    git(repo, "checkout", "-q", "main")
+    git(repo, "commit", "-q", "--allow-empty", "-m", "advance main")
+    return names
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--branches", type=int, default=200)
+    parser.add_argument("--diverged", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with scratch_repo() as repo:
+        names = make_branches(repo, args.branches, args.diverged)
+
+        def checkout_loop() -> None:
+            for name in names:
+                git(repo, "checkout", "-q", name)
+                git(repo, "rebase", "-q", "main")
+            git(repo, "checkout", "-q", "main")
+
+        legacy = measure(checkout_loop, repeat=1)
+
+    with scratch_repo() as repo:
+        names = make_branches(repo, args.branches, args.diverged)
+        manager = RepoManager({"default_branch": "main"}, repo_path=repo)
+        forward = measure(
+            lambda: manager.forward_branches(names, max_workers=args.workers), repeat=1
+        )
+        rerun = measure(lambda: manager.forward_branches(names), repeat=1)
+        manager.close()
+
+    report(f"Forward ({args.branches} branches, {args.diverged} diverged)", [
+        ("checkout + rebase per branch", *legacy),
+        (f"forward_branches (workers={args.workers})", *forward),
+        ("forward_branches (all up to date)", *rerun),
+    ])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Count git processes spawned per high-level RepoManager branch query.
+
+Compares the session-backed implementation against the previous
+one-process-per-question approach (emulated with plain ``git`` calls).
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import git, measure, report, scratch_repo  # noqa: E402
+
+from fractary_core.repo.manager import RepoManager  # noqa: E402
+
+
+def legacy_get_branch(repo: Path, name: str) -> None:
+    """The fork pattern of get_branch before the query session existed."""
+    git(repo, "rev-parse", name)
+    git(repo, "branch", "--show-current")
+    try:
+        git(repo, "rev-parse", "--abbrev-ref", f"{name}@{{upstream}}")
+    except Exception:
+        pass
+    for args in (
+        ["symbolic-ref", "refs/remotes/origin/HEAD", "--short"],
+        ["branch", "--list", "main"],
+    ):
+        try:
+            git(repo, *args)
+        except Exception:
+            continue
+
+
+def main() -> None:
+    with scratch_repo(branches=200) as repo:
+        manager = RepoManager(
+            {"default_branch": "main", "branch_cache_ttl": 0}, repo_path=repo
+        )
+        manager.get_branch("main")  # warm the batch process
+        names = ["main"] + [f"feat/branch-{i:04d}" for i in range(200)]
+
+        def get_all_branches() -> None:
+            with manager.operation():
+                for name in names:
+                    manager.get_branch(name)
+
+        rows = [
+            ("legacy get_branch", *measure(lambda: legacy_get_branch(repo, "main"))),
+            ("get_branch", *measure(lambda: manager.get_branch("main"))),
+            ("get_default_branch", *measure(manager.get_default_branch)),
+            ("list_branches (201 branches)", *measure(manager.list_branches)),
+            ("session.resolve_many (201 refs)", *measure(
+                lambda: manager.session.resolve_many(names)
+            )),
+            ("get_branch x201 in operation()", *measure(get_all_branches, repeat=3)),
+        ]
+        manager.close()
+
+        reader = RepoManager({"default_branch": "main", "ref_reader": True}, repo_path=repo)
+        rows += [
+            ("get_branch (ref_reader)", *measure(lambda: reader.get_branch("main"))),
+            ("list_branches (ref_reader)", *measure(reader.list_branches)),
+        ]
+
+    report("Forks per call (warm session)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Wall time for validating every spec in a specs directory.
+
+Compares the per-spec ``validate_spec`` + ``generate_refinement_questions``
+loop a CI gate runs (with the checks as they were computed before they
+shared one scan) against ``SpecManager.validate_all`` with a cold and a warm
+result cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import measure, report  # noqa: E402
+
+from fractary_core.spec import SpecManager  # noqa: E402
+from fractary_core.spec.validation import REQUIRED_SECTIONS, STANDARD_QUESTIONS  # noqa: E402
+
+
+def legacy_validate(manager: SpecManager, spec_id: str) -> list[str]:
+    """Re-read the spec and score it with separate substring and regex passes."""
+    content = manager.get_spec(spec_id).content
+    missing = [opts[0] for opts in REQUIRED_SECTIONS if not any(s in content for s in opts)]
+    len(re.findall(r"- \[ \]", content))
+    len(re.findall(r"- \[x\]", content, re.IGNORECASE))
+    return missing
+
+
+def legacy_questions(manager: SpecManager, spec_id: str) -> list[str]:
+    content = manager.get_spec(spec_id).content
+    questions = [f"Can you provide details for {s}?" for s in legacy_validate(manager, spec_id)]
+    for pattern in (r"\[.+\]", "TODO", "TBD"):
+        if re.search(pattern, content, re.IGNORECASE):
+            questions.append(pattern)
+    questions.extend(q for q in STANDARD_QUESTIONS if q.split()[3].lower() not in content.lower())
+    return questions[:10]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--specs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        specs_dir = Path(tmp) / "specs"
+        manager = SpecManager({"specs_dir": str(specs_dir)})
+        ids = [
+            manager.create_spec(f"Spec {i}", template="api" if i % 2 else "feature").id
+            for i in range(args.specs)
+        ]
+        cache = specs_dir / ".index" / "validation.json"
+
+        def legacy_loop() -> None:
+            for spec_id in ids:
+                legacy_validate(manager, spec_id)
+                legacy_questions(manager, spec_id)
+
+        def current_loop() -> None:
+            for spec_id in ids:
+                manager.validate_spec(spec_id)
+                manager.generate_refinement_questions(spec_id)
+
+        def cold(workers: int) -> None:
+            cache.unlink(missing_ok=True)
+            manager.validate_all(max_workers=workers)
+
+        legacy = measure(legacy_loop, repeat=1)
+        current = measure(current_loop, repeat=1)
+        serial = measure(lambda: cold(1), repeat=3)
+        parallel = measure(lambda: cold(args.workers), repeat=3)
+        warm = measure(lambda: manager.validate_all(max_workers=args.workers), repeat=3)
+
+    report(f"Validate ({args.specs} specs)", [
+        ("legacy validate + questions loop", *legacy),
+        ("validate_spec + questions loop", *current),
+        ("validate_all (cold, workers=1)", *serial),
+        (f"validate_all (cold, workers={args.workers})", *parallel),
+        ("validate_all (warm cache)", *warm),
+    ])
+
+
+if __name__ == "__main__":
+    main()
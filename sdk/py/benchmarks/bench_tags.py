@@ -0,0 +1,55 @@
+"""
+Forks and wall time for creating and listing many tags.
+
+Compares ``RepoManager.create_tags`` against one ``git tag -a`` per tag, and
+``list_tags`` against ``git tag --sort=version:refname``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import git, measure, report, scratch_repo  # noqa: E402
+
+from fractary_core.repo.manager import RepoManager  # noqa: E402
+from fractary_core.repo.tags import TagSpec  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tags", type=int, default=10_000)
+    args = parser.parse_args()
+    names = [f"v{i // 100}.{i % 100}.0" for i in range(args.tags)]
+
+    with scratch_repo() as repo:
+        manager = RepoManager({"default_branch": "main"}, repo_path=repo)
+
+        def tag_loop() -> None:
+            for name in names[:100]:
+                git(repo, "tag", "-a", "-m", f"Release {name}", f"legacy-{name}")
+
+        def create_batch() -> None:
+            manager.create_tags(TagSpec(name, message=f"Release {name}") for name in names)
+
+        rows = [
+            ("git tag -a x100", *measure(tag_loop, repeat=1)),
+            (f"create_tags x{args.tags}", *measure(create_batch, repeat=1)),
+            ("git tag --sort=version:refname", *measure(
+                lambda: git(repo, "tag", "--sort=version:refname"), repeat=5
+            )),
+            ("list_tags()", *measure(manager.list_tags, repeat=5)),
+            ("list_tags(descending, limit=10)", *measure(
+                lambda: manager.list_tags(descending=True, limit=10), repeat=5
+            )),
+        ]
+        manager.close()
+
+    report(f"Tags ({args.tags} annotated)", rows)
+
+
+if __name__ == "__main__":
+    main()
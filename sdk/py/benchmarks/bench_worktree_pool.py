@@ -0,0 +1,70 @@
+"""
+Compare workflow start latency of fresh clones with WorktreePool leases.
+
+A "workflow start" is getting a checkout of a new branch off main. Fresh
+clones go through ``file://`` so git runs the pack protocol as it would for
+a network remote (a plain local path would hardlink objects instead).
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common import git, synthetic_history  # noqa: E402
+
+from fractary_core.repo.worktree import WorktreePool  # noqa: E402
+
+
+def timed(fn, repeat: int) -> float:  # type: ignore[no-untyped-def]
+    """Return milliseconds per call of fn(i)."""
+    start = time.perf_counter()
+    for i in range(repeat):
+        fn(i)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commits", type=int, default=20_000)
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with synthetic_history(args.commits, args.files) as repo, tempfile.TemporaryDirectory() as tmp:
+        def fresh_clone(i: int) -> None:
+            target = Path(tmp) / f"clone{i}"
+            git(Path(tmp), "clone", "-q", f"file://{repo}", str(target))
+            git(target, "checkout", "-q", "-b", f"feat/clone-{i}")
+            shutil.rmtree(target)
+
+        pool = WorktreePool(repo, root=Path(tmp) / "pool", max_worktrees=2)
+
+        def cold_lease(i: int) -> None:
+            pool.acquire(f"feat/cold-{i}").release()
+            pool.clear()
+
+        def warm_lease(i: int) -> None:
+            pool.acquire(f"feat/warm-{i}").release()
+
+        rows = [
+            ("fresh clone (file://)", timed(fresh_clone, args.repeat)),
+            ("pool lease, new worktree", timed(cold_lease, args.repeat)),
+        ]
+        pool.prewarm(1)
+        rows.append(("pool lease, recycled worktree", timed(warm_lease, args.repeat)))
+
+    print(f"Workflow start ({args.commits} commits, {args.files} files)")
+    print(f"  {'method':<32} {'ms':>9}")
+    for label, ms in rows:
+        print(f"  {label:<32} {ms:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
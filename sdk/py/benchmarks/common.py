@@ -0,0 +1,105 @@
+"""
+Shared helpers for the fractary-core benchmarks.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+os.environ.setdefault("GIT_AUTHOR_NAME", "Bench")
+os.environ.setdefault("GIT_AUTHOR_EMAIL", "bench@example.com")
+os.environ.setdefault("GIT_COMMITTER_NAME", "Bench")
+os.environ.setdefault("GIT_COMMITTER_EMAIL", "bench@example.com")
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run a git command in cwd and return stripped stdout."""
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@contextmanager
+def scratch_repo(branches: int = 0) -> Iterator[Path]:
+    """Create a temporary repository on 'main' with optional extra branches."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        repo.mkdir()
+        git(repo, "init", "-q", "-b", "main")
+        git(repo, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+        for i in range(branches):
+            git(repo, "branch", f"feat/branch-{i:04d}")
+        yield repo
+
+
+@contextmanager
+def synthetic_history(commits: int, files: int = 50) -> Iterator[Path]:
+    """Create a temporary repository with a linear history via fast-import."""
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / "repo"
+        repo.mkdir()
+        git(repo, "init", "-q", "-b", "main")
+        stream = []
+        for i in range(commits):
+            message = f"chore(bench): change {i} | touches file {i % files}\n".encode()
+            content = f"{i}\n".encode()
+            stream.append(
+                b"commit refs/heads/main\n"
+                b"committer Bench <bench@example.com> %d +0000\n"
+                b"data %d\n%s"
+                b"M 100644 inline src/file%d.txt\n"
+                b"data %d\n%s\n"
+                % (1_600_000_000 + i, len(message), message, i % files, len(content), content)
+            )
+        subprocess.run(
+            ["git", "fast-import", "--quiet"],
+            cwd=repo, input=b"".join(stream), check=True,
+        )
+        git(repo, "reset", "-q", "--hard", "main")
+        yield repo
+
+
+class ForkCounter:
+    """Count processes spawned through subprocess.Popen."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._real_popen = subprocess.Popen
+
+    def __enter__(self) -> ForkCounter:
+        counter = self
+        real_popen = self._real_popen
+
+        class CountingPopen(real_popen):  # type: ignore[misc, valid-type]
+            def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+                counter.count += 1
+                super().__init__(*args, **kwargs)
+
+        subprocess.Popen = CountingPopen  # type: ignore[misc]
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        subprocess.Popen = self._real_popen  # type: ignore[misc]
+
+
+def measure(fn, repeat: int = 20) -> tuple[float, float]:  # type: ignore[no-untyped-def]
+    """Return (forks per call, milliseconds per call) for fn."""
+    with ForkCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        elapsed = time.perf_counter() - start
+    return counter.count / repeat, elapsed * 1000 / repeat
+
+
+def report(title: str, rows: list[tuple[str, float, float]]) -> None:
+    """Print a small fixed-width table of (label, forks, ms) rows."""
+    print(title)
+    print(f"  {'operation':<36} {'forks':>7} {'ms':>9}")
+    for label, forks, ms in rows:
+        print(f"  {label:<36} {forks:>7.1f} {ms:>9.2f}")
@@ -5,6 +5,14 @@ from fractary_core.common.config import (
     is_git_repository,
     get_fractary_dir,
     ensure_dir,
+    get_cache_dir,
+    atomic_write,
+)
+from fractary_core.common.telemetry import (
+    Telemetry,
+    enable_telemetry,
+    disable_telemetry,
+    get_telemetry,
 )
 
 __all__ = [
@@ -12,4 +20,10 @@ __all__ = [
     "is_git_repository",
     "get_fractary_dir",
     "ensure_dir",
+    "get_cache_dir",
+    "atomic_write",
+    "Telemetry",
+    "enable_telemetry",
+    "disable_telemetry",
+    "get_telemetry",
 ]
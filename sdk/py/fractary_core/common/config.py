@@ -4,7 +4,9 @@ Configuration utilities for fractary-core.
 Provides utilities for finding project roots and managing configuration.
 """
 
+import contextlib
 import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -75,3 +77,45 @@ def ensure_dir(dir_path: str | Path) -> None:
         dir_path: Directory path to create
     """
     Path(dir_path).mkdir(parents=True, exist_ok=True)
+
+
+def get_cache_dir(project_root: str | Path) -> Path:
+    """Get the .fractary/cache directory, creating it if needed.
+
+    The directory holds derived data that can always be rebuilt, so it is
+    created with a ``.gitignore`` that keeps it out of ``git status``.
+
+    Args:
+        project_root: Project root directory
+
+    Returns:
+        Path to .fractary/cache directory
+    """
+    cache_dir = get_fractary_dir(str(project_root)) / "cache"
+    ensure_dir(cache_dir)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        atomic_write(gitignore, b"*\n")
+    return cache_dir
+
+
+def atomic_write(path: str | Path, data: bytes, mode: Optional[int] = None) -> None:
+    """Write a file so readers see either the old or the new contents.
+
+    Args:
+        path: Destination file path
+        data: File contents
+        mode: Permission bits for the file (default: 0o600)
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
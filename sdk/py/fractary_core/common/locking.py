@@ -0,0 +1,76 @@
+"""
+Inter-process file locks for fractary-core.
+
+Where ``fcntl`` is available the lock is an ``flock`` on the lock file itself,
+which supports shared locks and is released by the OS if the holder dies.
+Elsewhere (Windows) the lock is held by creating ``<path>.held`` with
+``O_EXCL``; such locks are always exclusive, and one left behind by a crashed
+process is broken once it is older than ``stale_after`` seconds.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+HAS_FCNTL = fcntl is not None
+
+# Seconds between attempts to take an O_EXCL lock held by someone else
+_POLL_INTERVAL = 0.01
+
+
+@contextmanager
+def file_lock(
+    path: str | Path,
+    shared: bool = False,
+    stale_after: float = 600.0,
+) -> Iterator[None]:
+    """Hold a lock on ``path`` for the duration of the block.
+
+    Args:
+        path: Lock file; created if missing and left in place (the
+            ``O_EXCL`` fallback uses ``<path>.held`` and removes it)
+        shared: Take a shared lock (exclusive where ``fcntl`` is missing)
+        stale_after: Without ``fcntl``, seconds after which a lock left by
+            another process is considered abandoned
+    """
+    path = Path(path)
+    if fcntl is not None:
+        with open(path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        return
+
+    held = path.with_name(path.name + ".held")
+    while True:
+        try:
+            fd = os.open(held, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - held.stat().st_mtime > stale_after:
+                    held.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(_POLL_INTERVAL)
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            held.unlink()
+        except FileNotFoundError:
+            pass
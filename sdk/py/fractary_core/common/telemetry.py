@@ -0,0 +1,332 @@
+"""
+Subprocess telemetry - Timing, exit codes and output sizes of git and gh calls.
+
+Telemetry is off by default. While it is off, ``run`` calls
+``subprocess.run`` after one global check and ``record`` returns at once.
+``enable_telemetry()`` installs a process-wide ``Telemetry`` registry. The
+registry keeps a duration histogram per command class (``git status``,
+``gh pr view``, ...) and can be exported as JSON or Prometheus text. It can
+also report calls slower than a threshold through a ``LogManager``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+if TYPE_CHECKING:
+    from fractary_core.logs.manager import LogManager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Global git options that take their value as the next argument
+_GIT_OPTIONS_WITH_VALUE = frozenset({"-C", "-c", "--git-dir", "--work-tree", "--namespace"})
+
+# gh subcommands whose next word is an argument (an API path), not a subcommand
+_GH_LEAF_COMMANDS = frozenset({"api", "auth"})
+
+
+def command_class(argv: Sequence[str]) -> str:
+    """Reduce an argv to a low-cardinality label.
+
+    ``git`` commands keep their subcommand (``git status``) and ``gh``
+    commands two words (``gh pr view``, but ``gh api``); options and their
+    values are skipped.
+    """
+    if not argv:
+        return ""
+    program = os.path.basename(str(argv[0]))
+    words = [program]
+    depth = 2 if program == "gh" else 1
+    args = iter(argv[1:])
+    for arg in args:
+        arg = str(arg)
+        if arg.startswith("-"):
+            if program == "git" and arg in _GIT_OPTIONS_WITH_VALUE:
+                next(args, None)
+            continue
+        words.append(arg)
+        if len(words) > depth or (program == "gh" and arg in _GH_LEAF_COMMANDS):
+            break
+    return " ".join(words)
+
+
+@dataclass
+class CommandStats:
+    """Histogram and counters for one command class."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    output_bytes: int = 0
+    exit_codes: dict[str, int] = field(default_factory=dict)
+    bucket_counts: list[int] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.bucket_counts:
+            # One slot per bound plus the +Inf overflow
+            self.bucket_counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, duration: float, exit_code: str, output_bytes: int) -> None:
+        self.count += 1
+        self.total_seconds += duration
+        self.max_seconds = max(self.max_seconds, duration)
+        self.output_bytes += output_bytes
+        self.exit_codes[exit_code] = self.exit_codes.get(exit_code, 0) + 1
+        for i, bound in enumerate(self.buckets):
+            if duration <= bound:
+                self.bucket_counts[i] += 1
+                break
+        else:
+            self.bucket_counts[-1] += 1
+
+    def cumulative_buckets(self) -> list[tuple[str, int]]:
+        """Return (upper bound, cumulative count) pairs ending with ``+Inf``."""
+        total = 0
+        pairs = []
+        for bound, count in zip([*map(_format_bound, self.buckets), "+Inf"], self.bucket_counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_seconds": self.total_seconds,
+            "max_seconds": self.max_seconds,
+            "output_bytes": self.output_bytes,
+            "exit_codes": dict(self.exit_codes),
+            "buckets": dict(self.cumulative_buckets()),
+        }
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+class Telemetry:
+    """Registry of subprocess timings keyed by command class.
+
+    Example:
+        telemetry = enable_telemetry(slow_threshold=2.0, log_manager=logs)
+        repo.fetch()
+        print(telemetry.to_prometheus())
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        slow_threshold: Optional[float] = None,
+        log_manager: Optional[LogManager] = None,
+    ) -> None:
+        """Initialize Telemetry.
+
+        Args:
+            buckets: Upper bounds of the duration histogram, in seconds
+            slow_threshold: Log calls taking at least this many seconds
+            log_manager: Where slow calls are logged (nothing is logged without one)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.slow_threshold = slow_threshold
+        self.log_manager = log_manager
+        self._stats: dict[str, CommandStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        argv: Sequence[str],
+        duration: float,
+        exit_code: Optional[int | str],
+        output_bytes: int = 0,
+    ) -> None:
+        """Record one finished subprocess.
+
+        Args:
+            argv: Command line that was run
+            duration: Wall time in seconds
+            exit_code: Return code, or a label such as ``timeout`` or ``error``
+            output_bytes: Size of stdout, 0 when not measured
+        """
+        label = command_class(argv)
+        code = str(exit_code)
+        with self._lock:
+            stats = self._stats.get(label)
+            if stats is None:
+                stats = self._stats[label] = CommandStats(self.buckets)
+            stats.observe(duration, code, output_bytes)
+
+        if (self.log_manager is not None and self.slow_threshold is not None
+                and duration >= self.slow_threshold):
+            self._log_slow(label, argv, duration, code, output_bytes)
+
+    def _log_slow(
+        self,
+        label: str,
+        argv: Sequence[str],
+        duration: float,
+        exit_code: str,
+        output_bytes: int,
+    ) -> None:
+        from fractary_core.logs.manager import LogLevel
+
+        assert self.log_manager is not None
+        duration_ms = int(duration * 1000)
+        self.log_manager.log(
+            LogLevel.WARNING,
+            self.log_manager.current_phase,
+            f"Slow subprocess: {label} took {duration_ms}ms",
+            tool=label,
+            duration_ms=duration_ms,
+            metadata={
+                "argv": [str(arg)[:200] for arg in argv[:20]],
+                "exit_code": exit_code,
+                "output_bytes": output_bytes,
+            },
+        )
+
+    def stats(self) -> dict[str, CommandStats]:
+        """Return a copy of the per-command statistics."""
+        with self._lock:
+            return {
+                label: CommandStats(
+                    stats.buckets, stats.count, stats.total_seconds, stats.max_seconds,
+                    stats.output_bytes, dict(stats.exit_codes), list(stats.bucket_counts),
+                )
+                for label, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {label: stats.to_dict() for label, stats in sorted(self.stats().items())}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "fractary_subprocess") -> str:
+        """Render the registry in the Prometheus text exposition format."""
+        stats = sorted(self.stats().items())
+        lines = [
+            f"# HELP {prefix}_duration_seconds Wall time of subprocess calls.",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        for label, entry in stats:
+            command = _escape(label)
+            for bound, count in entry.cumulative_buckets():
+                lines.append(
+                    f'{prefix}_duration_seconds_bucket{{command="{command}",le="{bound}"}} {count}'
+                )
+            lines.append(f'{prefix}_duration_seconds_sum{{command="{command}"}} '
+                         f"{entry.total_seconds!r}")
+            lines.append(f'{prefix}_duration_seconds_count{{command="{command}"}} {entry.count}')
+
+        lines += [
+            f"# HELP {prefix}_exits_total Subprocess calls by exit code.",
+            f"# TYPE {prefix}_exits_total counter",
+        ]
+        for label, entry in stats:
+            for code, count in sorted(entry.exit_codes.items()):
+                lines.append(
+                    f'{prefix}_exits_total{{command="{_escape(label)}",code="{_escape(code)}"}} '
+                    f"{count}"
+                )
+
+        lines += [
+            f"# HELP {prefix}_output_bytes_total Bytes written to stdout by subprocesses.",
+            f"# TYPE {prefix}_output_bytes_total counter",
+        ]
+        for label, entry in stats:
+            lines.append(
+                f'{prefix}_output_bytes_total{{command="{_escape(label)}"}} {entry.output_bytes}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_active: Optional[Telemetry] = None
+
+
+def enable_telemetry(
+    slow_threshold: Optional[float] = None,
+    log_manager: Optional[LogManager] = None,
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Telemetry:
+    """Start recording subprocess calls in a new process-wide registry.
+
+    Args:
+        slow_threshold: Log calls taking at least this many seconds
+        log_manager: LogManager that receives slow-call warnings
+        buckets: Upper bounds of the duration histogram, in seconds
+
+    Returns:
+        The active registry
+    """
+    global _active
+    _active = Telemetry(buckets, slow_threshold, log_manager)
+    return _active
+
+
+def disable_telemetry() -> Optional[Telemetry]:
+    """Stop recording; return the registry that was active, if any."""
+    global _active
+    registry, _active = _active, None
+    return registry
+
+
+def get_telemetry() -> Optional[Telemetry]:
+    """Return the active registry, or None while telemetry is disabled."""
+    return _active
+
+
+def record(
+    argv: Sequence[str],
+    duration: float,
+    exit_code: Optional[int | str],
+    output_bytes: int = 0,
+) -> None:
+    """Record a subprocess managed outside ``run`` (streams, long-lived processes)."""
+    registry = _active
+    if registry is not None:
+        registry.record(argv, duration, exit_code, output_bytes)
+
+
+def run(args: Sequence[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """``subprocess.run`` that is recorded while telemetry is enabled."""
+    registry = _active
+    if registry is None:
+        return subprocess.run(args, **kwargs)
+
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(args, **kwargs)
+    except subprocess.CalledProcessError as error:
+        registry.record(args, time.perf_counter() - start, error.returncode, _size(error.stdout))
+        raise
+    except subprocess.TimeoutExpired:
+        registry.record(args, time.perf_counter() - start, "timeout")
+        raise
+    except OSError:
+        registry.record(args, time.perf_counter() - start, "error")
+        raise
+    registry.record(args, time.perf_counter() - start, result.returncode, _size(result.stdout))
+    return result
+
+
+def _size(output: Optional[str | bytes]) -> int:
+    if not output:
+        return 0
+    if isinstance(output, str):
+        return len(output.encode(errors="surrogateescape"))
+    return len(output)
@@ -124,6 +124,16 @@ class LogManager:
         self._current_workflow: Optional[WorkflowLog] = None
         self._phase_start_times: dict[str, datetime] = {}
 
+    @property
+    def current_phase(self) -> FaberPhase:
+        """Phase of the current workflow, or ``UNKNOWN`` outside a workflow."""
+        if self._current_workflow is None:
+            return FaberPhase.UNKNOWN
+        try:
+            return FaberPhase(self._current_workflow.current_phase)
+        except ValueError:
+            return FaberPhase.UNKNOWN
+
     def _load_config(self) -> dict[str, Any]:
         """Load configuration."""
         return {
@@ -1,5 +1,56 @@
 """Repository management module for fractary-core."""
 
-from fractary_core.repo.manager import RepoManager, Branch, Commit, PullRequest
+from fractary_core.repo.async_manager import AsyncRepoManager
+from fractary_core.repo.blame import BlameCommit, BlameHunk, BlameLine
+from fractary_core.repo.clone_cache import CloneCache
+from fractary_core.repo.commit_graph import CommitGraph
+from fractary_core.repo.diff import ChangedFile, FileDiff, Hunk
+from fractary_core.repo.environments import EnvironmentIndex
+from fractary_core.repo.fleet import FleetReport, FleetResult, RepoFleet
+from fractary_core.repo.forward import BranchForwarder, ForwardResult
+from fractary_core.repo.history import FileRevision, FileStat
+from fractary_core.repo.manager import RepoManager, Branch, BranchSnapshot, Commit, PullRequest
+from fractary_core.repo.naming import BranchNamer
+from fractary_core.repo.refs import RefReader, UnsupportedRepository
+from fractary_core.repo.status import RepoStatus, StatusEntry
+from fractary_core.repo.session import GitQuerySession, ObjectInfo, RefRecord
+from fractary_core.repo.tags import Tag, TagSpec, compare_versions
+from fractary_core.repo.worktree import WorktreeLease, WorktreePool
 
-__all__ = ["RepoManager", "Branch", "Commit", "PullRequest"]
+__all__ = [
+    "RepoManager",
+    "AsyncRepoManager",
+    "RepoFleet",
+    "FleetReport",
+    "FleetResult",
+    "WorktreePool",
+    "WorktreeLease",
+    "BranchForwarder",
+    "ForwardResult",
+    "CloneCache",
+    "RepoStatus",
+    "StatusEntry",
+    "Branch",
+    "BranchNamer",
+    "EnvironmentIndex",
+    "BranchSnapshot",
+    "Commit",
+    "CommitGraph",
+    "ChangedFile",
+    "FileDiff",
+    "Hunk",
+    "FileStat",
+    "FileRevision",
+    "BlameCommit",
+    "BlameHunk",
+    "BlameLine",
+    "PullRequest",
+    "Tag",
+    "TagSpec",
+    "compare_versions",
+    "GitQuerySession",
+    "ObjectInfo",
+    "RefRecord",
+    "RefReader",
+    "UnsupportedRepository",
+]
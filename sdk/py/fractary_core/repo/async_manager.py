@@ -0,0 +1,396 @@
+"""
+AsyncRepoManager - asyncio counterpart of RepoManager.
+
+Runs git through ``asyncio.create_subprocess_exec`` so orchestrators can
+drive many repositories concurrently without parking a thread per
+``git fetch``. Writes to the same repository are serialized (git's index and
+ref locks forbid concurrent writers); different repositories run in parallel.
+Pull request calls go through the configured ``PRProvider`` (see
+``RepoManager.provider``) in a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Optional
+
+from fractary_core.common import telemetry
+from fractary_core.repo.manager import (
+    BRANCH_REF_PATTERNS,
+    Branch,
+    BranchSnapshot,
+    Commit,
+    PullRequest,
+    RepoManager,
+    _branches_from_snapshot,
+    _build_commit_message,
+)
+from fractary_core.repo.history import commit_log_args, parse_commit_log
+from fractary_core.repo.session import parse_ref_records, ref_listing_command
+from fractary_core.repo.status import parse_status, status_args
+
+# One lock per repository per event loop; asyncio locks cannot cross loops.
+_repo_locks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+
+def _repo_lock(repo_key: str) -> asyncio.Lock:
+    """Return the write lock for a repository on the running loop."""
+    loop = asyncio.get_running_loop()
+    locks = _repo_locks.setdefault(loop, {})
+    lock = locks.get(repo_key)
+    if lock is None:
+        lock = locks[repo_key] = asyncio.Lock()
+    return lock
+
+
+class AsyncRepoManager:
+    """Asyncio repository operations mirroring RepoManager's public API.
+
+    Config-only helpers (branch naming, environment lookups) are shared with
+    RepoManager and stay synchronous. Every git/gh call accepts a timeout;
+    cancelling the awaiting task or hitting the timeout kills the child
+    process so a hung ``git fetch`` never outlives its caller.
+    """
+
+    def __init__(
+        self,
+        config: Optional[dict[str, Any]] = None,
+        repo_path: Optional[str | Path] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize AsyncRepoManager.
+
+        Args:
+            config: Repo configuration dict. If None, loads from .fractary/core/config.yaml
+            repo_path: Repository working directory (default: current directory)
+            timeout: Default per-command timeout in seconds (None = no limit)
+        """
+        self._sync = RepoManager(config, repo_path=repo_path, timeout=timeout)
+        self.config = self._sync.config
+        self.repo_path = self._sync.repo_path
+        self.timeout = timeout
+        self._repo_key = str(Path(repo_path or os.getcwd()).resolve())
+
+    async def _run(
+        self,
+        argv: list[str],
+        check: bool = True,
+        timeout: Optional[float] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run a command, killing it on cancellation or timeout."""
+        start = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.repo_path,
+        )
+
+        timeout = timeout if timeout is not None else self.timeout
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            await self._kill(proc)
+            telemetry.record(argv, time.perf_counter() - start, "timeout")
+            raise subprocess.TimeoutExpired(argv, timeout) from None
+        except asyncio.CancelledError:
+            await self._kill(proc)
+            telemetry.record(argv, time.perf_counter() - start, "cancelled")
+            raise
+        telemetry.record(argv, time.perf_counter() - start, proc.returncode, len(stdout))
+
+        result = subprocess.CompletedProcess(
+            argv,
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+        if check and result.returncode != 0:
+            raise subprocess.CalledProcessError(
+                result.returncode, argv, result.stdout, result.stderr
+            )
+        return result
+
+    @staticmethod
+    async def _kill(proc: asyncio.subprocess.Process) -> None:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+
+    async def _run_git(
+        self,
+        args: list[str],
+        check: bool = True,
+        timeout: Optional[float] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run a read-only git command."""
+        return await self._run(["git"] + args, check=check, timeout=timeout)
+
+    async def _write_git(
+        self,
+        args: list[str],
+        check: bool = True,
+        timeout: Optional[float] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run a git command that writes to the repository, serialized per repo."""
+        async with _repo_lock(self._repo_key):
+            return await self._run_git(args, check=check, timeout=timeout)
+
+    # =========================================================================
+    # Config Helpers (synchronous, no git access)
+    # =========================================================================
+
+    def get_branch_for_environment(self, env_id: str) -> Optional[str]:
+        """Get the branch name for a specific environment."""
+        return self._sync.get_branch_for_environment(env_id)
+
+    def get_environment_for_branch(self, branch_name: str) -> Optional[str]:
+        """Get the environment ID for a given branch name."""
+        return self._sync.get_environment_for_branch(branch_name)
+
+    def is_protected_branch(self, branch_name: str) -> bool:
+        """Check if a branch is protected."""
+        return self._sync.is_protected_branch(branch_name)
+
+    def generate_branch_name(
+        self,
+        description: str,
+        work_type: str = "feature",
+        work_id: Optional[str] = None,
+    ) -> str:
+        """Generate a semantic branch name."""
+        return self._sync.generate_branch_name(description, work_type, work_id)
+
+    # =========================================================================
+    # Branch Operations
+    # =========================================================================
+
+    async def _branch_snapshot(self) -> BranchSnapshot:
+        """Read branch state with a single for-each-ref."""
+        result = await self._run(ref_listing_command(BRANCH_REF_PATTERNS))
+        refs = parse_ref_records(result.stdout)
+        return BranchSnapshot(
+            refs=refs,
+            current=next((ref.short_name for ref in refs if ref.is_head), ""),
+            default=self._sync._default_branch_from_refs(refs),
+            taken_at=0.0,
+        )
+
+    async def get_current_branch(self) -> str:
+        """Get the current branch name."""
+        result = await self._run_git(["branch", "--show-current"])
+        return result.stdout.strip()
+
+    async def get_default_branch(self) -> str:
+        """Get the default branch name (same resolution order as RepoManager)."""
+        return (await self._branch_snapshot()).default
+
+    async def get_branch(self, name: str) -> Branch:
+        """Get branch details."""
+        sha_result, snapshot = await asyncio.gather(
+            self._run_git(["rev-parse", name]),
+            self._branch_snapshot(),
+        )
+        branch_ref = next(
+            (ref for ref in snapshot.refs if ref.name == f"refs/heads/{name}"), None
+        )
+        return Branch(
+            name=name,
+            sha=sha_result.stdout.strip(),
+            is_default=(name == snapshot.default),
+            upstream=branch_ref.upstream if branch_ref else None,
+            is_current=(name == snapshot.current),
+        )
+
+    async def list_branches(self, pattern: Optional[str] = None) -> list[Branch]:
+        """List branches, optionally filtered by pattern."""
+        return _branches_from_snapshot(await self._branch_snapshot(), pattern)
+
+    async def create_branch(
+        self,
+        name: str,
+        base: Optional[str] = None,
+        checkout: bool = True,
+    ) -> Branch:
+        """Create a new branch.
+
+        Args:
+            name: Branch name
+            base: Base branch (default: default branch)
+            checkout: Whether to checkout the new branch
+
+        Returns:
+            Created Branch object
+        """
+        base = base or await self.get_default_branch()
+
+        if checkout:
+            await self._write_git(["checkout", "-b", name, base])
+        else:
+            await self._write_git(["branch", name, base])
+
+        return await self.get_branch(name)
+
+    async def checkout_branch(self, name: str) -> Branch:
+        """Checkout an existing branch."""
+        await self._write_git(["checkout", name])
+        return await self.get_branch(name)
+
+    async def delete_branch(self, name: str, force: bool = False) -> bool:
+        """Delete a branch."""
+        flag = "-D" if force else "-d"
+        await self._write_git(["branch", flag, name])
+        return True
+
+    # =========================================================================
+    # Commit Operations
+    # =========================================================================
+
+    async def stage_all(self) -> None:
+        """Stage all changes."""
+        await self._write_git(["add", "-A"])
+
+    async def stage_files(self, files: list[str]) -> None:
+        """Stage specific files."""
+        await self._write_git(["add"] + files)
+
+    async def commit(
+        self,
+        message: str,
+        commit_type: str = "feat",
+        scope: Optional[str] = None,
+        work_id: Optional[str] = None,
+        breaking: bool = False,
+        body: Optional[str] = None,
+    ) -> Commit:
+        """Create a semantic commit (see RepoManager.commit)."""
+        full_message = _build_commit_message(message, commit_type, scope, work_id, breaking, body)
+
+        # Status, staging and commit form one unit against the index lock
+        async with _repo_lock(self._repo_key):
+            status = await self._run_git(status_args())
+            if not parse_status(status.stdout).clean:
+                await self._run_git(["add", "-A"])
+            await self._run_git(["commit", "-m", full_message])
+            result = await self._run_git(commit_log_args("HEAD", max_count=1))
+
+        return parse_commit_log(result.stdout)[0]
+
+    async def get_commits(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 50,
+    ) -> list[Commit]:
+        """Get commit history."""
+        rev = None
+        if since and until:
+            rev = f"{since}..{until}"
+        elif since:
+            rev = since
+
+        result = await self._run_git(commit_log_args(rev, max_count=limit))
+        return parse_commit_log(result.stdout)
+
+    # =========================================================================
+    # Remote Operations
+    # =========================================================================
+
+    async def push(
+        self,
+        branch: Optional[str] = None,
+        remote: str = "origin",
+        set_upstream: bool = False,
+        force: bool = False,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Push to remote."""
+        branch = branch or await self.get_current_branch()
+
+        args = ["push"]
+        if force:
+            args.append("--force-with-lease")
+        if set_upstream:
+            args.extend(["-u", remote, branch])
+        else:
+            args.extend([remote, branch])
+
+        await self._write_git(args, timeout=timeout)
+        return {"success": True, "branch": branch, "remote": remote}
+
+    async def pull(
+        self,
+        branch: Optional[str] = None,
+        remote: str = "origin",
+        rebase: bool = False,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Pull from remote."""
+        args = ["pull", remote]
+        if branch:
+            args.append(branch)
+        if rebase:
+            args.append("--rebase")
+
+        await self._write_git(args, timeout=timeout)
+        return {"success": True}
+
+    async def fetch(
+        self,
+        remote: str = "origin",
+        prune: bool = True,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Fetch from remote.
+
+        Cancelling the awaiting task terminates the underlying ``git fetch``.
+        """
+        args = ["fetch", remote]
+        if prune:
+            args.append("--prune")
+
+        await self._write_git(args, timeout=timeout)
+        return {"success": True}
+
+    # =========================================================================
+    # Pull Request Operations (via provider)
+    # =========================================================================
+
+    async def create_pr(
+        self,
+        title: str,
+        body: str,
+        head: Optional[str] = None,
+        base: Optional[str] = None,
+        draft: bool = False,
+    ) -> PullRequest:
+        """Create a pull request."""
+        head = head or await self.get_current_branch()
+        base = base or await self.get_default_branch()
+        provider = self._sync.provider
+        return await asyncio.to_thread(provider.create_pr, title, body, head, base, draft)
+
+    async def get_pr(self, number: int) -> PullRequest:
+        """Get pull request details."""
+        return await asyncio.to_thread(self._sync.provider.get_pr, number)
+
+    async def merge_pr(
+        self,
+        number: int,
+        method: str = "squash",
+        delete_branch: bool = True,
+    ) -> dict[str, Any]:
+        """Merge a pull request."""
+        provider = self._sync.provider
+        return await asyncio.to_thread(provider.merge_pr, number, method, delete_branch)
+
+    def close(self) -> None:
+        """Release the pull request provider and query processes."""
+        self._sync.close()
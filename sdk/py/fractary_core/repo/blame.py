@@ -0,0 +1,201 @@
+"""
+Blame - Streaming ``git blame --incremental`` parsing.
+
+``--incremental`` emits one record per blamed range as soon as git settles
+it, so ranges can be consumed while git is still walking history. Commit
+metadata is sent only the first time a commit appears and is shared by every
+range it owns. Line contents are not part of the output; ``blame_lines``
+joins the ranges with the blob they describe.
+"""
+
+from __future__ import annotations
+
+import codecs
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from fractary_core.common import telemetry
+
+
+@dataclass(slots=True)
+class BlameCommit:
+    """Commit metadata from blame porcelain headers."""
+
+    sha: str
+    author: str = ""
+    author_email: str = ""
+    author_time: int = 0
+    author_tz: str = ""
+    summary: str = ""
+    boundary: bool = False
+
+
+@dataclass(slots=True)
+class BlameHunk:
+    """A range of consecutive final lines last changed by one commit."""
+
+    commit: BlameCommit
+    orig_start: int
+    final_start: int
+    num_lines: int
+    orig_path: str
+
+
+@dataclass(slots=True)
+class BlameLine:
+    """One line of a blamed file; line numbers are 1-based."""
+
+    line_number: int
+    content: str
+    commit: BlameCommit
+    orig_line: int
+    orig_path: str
+
+    @property
+    def sha(self) -> str:
+        return self.commit.sha
+
+
+def _unquote(name: str) -> str:
+    """Undo git's C-style quoting of a path, if present."""
+    if len(name) < 2 or not (name.startswith('"') and name.endswith('"')):
+        return name
+    raw = codecs.escape_decode(name[1:-1].encode("utf-8", errors="surrogateescape"))[0]
+    return raw.decode("utf-8", errors="surrogateescape")
+
+
+class BlameParser:
+    """Incremental parser for ``git blame --incremental`` output.
+
+    Feed complete lines; each range is returned once its ``filename`` line,
+    which always ends a record, has been read.
+    """
+
+    def __init__(self) -> None:
+        self.commits: dict[str, BlameCommit] = {}
+        self._pending: Optional[tuple[BlameCommit, int, int, int]] = None
+
+    def feed(self, lines: Iterable[str]) -> Iterator[BlameHunk]:
+        for line in lines:
+            hunk = self.feed_line(line)
+            if hunk is not None:
+                yield hunk
+
+    def feed_line(self, line: str) -> Optional[BlameHunk]:
+        if self._pending is None:
+            parts = line.split(" ")
+            if len(parts) != 4:
+                return None
+            sha = parts[0]
+            commit = self.commits.get(sha)
+            if commit is None:
+                commit = self.commits[sha] = BlameCommit(sha=sha)
+            self._pending = (commit, int(parts[1]), int(parts[2]), int(parts[3]))
+            return None
+
+        commit = self._pending[0]
+        key, _, value = line.partition(" ")
+        if key == "filename":
+            _, orig_start, final_start, num_lines = self._pending
+            self._pending = None
+            return BlameHunk(commit, orig_start, final_start, num_lines, _unquote(value))
+        if key == "author":
+            commit.author = value
+        elif key == "author-mail":
+            commit.author_email = value.strip("<>")
+        elif key == "author-time":
+            commit.author_time = int(value)
+        elif key == "author-tz":
+            commit.author_tz = value
+        elif key == "summary":
+            commit.summary = value
+        elif key == "boundary":
+            commit.boundary = True
+        return None
+
+
+def blame_args(path: str, rev: Optional[str] = None) -> list[str]:
+    """Build ``git blame`` arguments whose output ``BlameParser`` understands."""
+    args = ["-c", "core.quotePath=false", "blame", "--incremental"]
+    if rev is not None:
+        args.append(rev)
+    return [*args, "--", path]
+
+
+def stream_blame(args: list[str], cwd: Optional[str | Path] = None) -> Iterator[BlameHunk]:
+    """Run ``git`` with ``args`` and yield blame ranges as git settles them.
+
+    Closing the iterator early terminates the ``git blame`` process.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        ["git"] + args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    parser = BlameParser()
+    lines = (raw.decode(errors="replace").rstrip("\n") for raw in proc.stdout)
+    finished = False
+    try:
+        yield from parser.feed(lines)
+        finished = True
+    finally:
+        if not finished and proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.stderr.close()
+        proc.wait()
+        telemetry.record(proc.args, time.perf_counter() - start, proc.returncode)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, None, stderr)
+
+
+def blame_lines(hunks: Iterable[BlameHunk], content: bytes) -> list[BlameLine]:
+    """Attach blamed ranges to the lines of the blob they were computed for."""
+    texts = content.decode(errors="replace").split("\n")
+    if texts and texts[-1] == "":
+        texts.pop()
+    lines: list[Optional[BlameLine]] = [None] * len(texts)
+    for hunk in hunks:
+        for i in range(hunk.num_lines):
+            index = hunk.final_start - 1 + i
+            if 0 <= index < len(texts):
+                lines[index] = BlameLine(
+                    index + 1, texts[index], hunk.commit, hunk.orig_start + i, hunk.orig_path,
+                )
+    return [line for line in lines if line is not None]
+
+
+def hunks_to_dict(hunks: list[BlameHunk]) -> dict[str, Any]:
+    """Serialize blame ranges compactly, storing each commit once."""
+    commits = {}
+    for hunk in hunks:
+        c = hunk.commit
+        commits[c.sha] = [
+            c.author, c.author_email, c.author_time, c.author_tz, c.summary, c.boundary,
+        ]
+    return {
+        "commits": commits,
+        "hunks": [
+            [h.commit.sha, h.orig_start, h.final_start, h.num_lines, h.orig_path] for h in hunks
+        ],
+    }
+
+
+def hunks_from_dict(data: dict[str, Any]) -> list[BlameHunk]:
+    """Inverse of ``hunks_to_dict``."""
+    commits = {sha: BlameCommit(sha, *fields) for sha, fields in data["commits"].items()}
+    return [
+        BlameHunk(commits[sha], orig_start, final_start, num_lines, orig_path)
+        for sha, orig_start, final_start, num_lines, orig_path in data["hunks"]
+    ]
@@ -0,0 +1,213 @@
+"""
+CloneCache - Bare mirrors shared by many working copies.
+
+Each remote is mirrored once into a bare repository under the cache dir and
+refreshed with an incremental fetch. New working copies are then made from
+the local mirror instead of the network, either borrowing its objects
+through alternates (``reference``) or as blobless partial clones
+(``partial``) that fetch file contents on demand, optionally limited to a
+set of sparse-checkout cone directories.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from fractary_core.common import telemetry
+from fractary_core.common.config import get_cache_dir
+from fractary_core.common.locking import file_lock
+
+CLONE_MODES = ("reference", "partial", "full")
+
+# Mirrors track branches and tags only; hosting-specific refs such as
+# GitHub's refs/pull/* can outnumber branches by orders of magnitude.
+MIRROR_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+
+def _git(*args: str, cwd: Optional[Path] = None, timeout: Optional[float] = None) -> str:
+    result = telemetry.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=cwd,
+        timeout=timeout,
+    )
+    return result.stdout.strip()
+
+
+def mirror_name(url: str) -> str:
+    """Derive a stable, filesystem-safe mirror directory name for a remote URL."""
+    stripped = re.sub(r"^[a-z+]+://|^[^@/]+@", "", url.rstrip("/")).removesuffix(".git")
+    readable = re.sub(r"[^A-Za-z0-9._-]+", "-", stripped).strip("-.")[-60:]
+    digest = hashlib.sha256(url.encode()).hexdigest()[:12]
+    return f"{readable}-{digest}.git"
+
+
+class CloneCache:
+    """Cache of bare mirrors used to create working copies quickly.
+
+    Mirrors live under ``cache_dir`` (default ``~/.fractary/cache/clones``)
+    and are shared between processes: creation and refresh of a mirror are
+    serialized with an exclusive lock on a sibling lock file, and
+    clones hold a shared lock so a refresh never runs underneath them.
+    Mirrors are configured never to prune unreachable objects, because
+    working copies made with ``reference`` mode may still point at them.
+
+    Example:
+        cache = CloneCache()
+        cache.clone("https://github.com/org/repo.git", "/work/repo")
+        cache.clone(url, "/work/docs", mode="partial", sparse=["docs"])
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str | Path] = None,
+        refresh_interval: float = 0.0,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize CloneCache.
+
+        Args:
+            cache_dir: Directory holding the mirrors
+            refresh_interval: Skip refreshing a mirror fetched less than this
+                many seconds ago
+            timeout: Timeout in seconds for each git command (None = no limit)
+        """
+        if cache_dir is None:
+            cache_dir = get_cache_dir(Path.home()) / "clones"
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.refresh_interval = refresh_interval
+        self.timeout = timeout
+
+    def mirror_path(self, url: str) -> Path:
+        """Return where the mirror of ``url`` is (or would be) stored."""
+        return self.cache_dir / mirror_name(url)
+
+    @contextmanager
+    def _locked(self, url: str, exclusive: bool) -> Iterator[Path]:
+        path = self.mirror_path(url)
+        # Cloning a large mirror can take a while; only break far older locks
+        with file_lock(path.with_name(path.name + ".lock"), shared=not exclusive,
+                       stale_after=3600.0):
+            yield path
+
+    def _fresh(self, path: Path) -> bool:
+        if self.refresh_interval <= 0:
+            return False
+        try:
+            fetched = (path / "FETCH_HEAD").stat().st_mtime
+        except OSError:
+            return False
+        return time.time() - fetched < self.refresh_interval
+
+    def _create(self, url: str, path: Path) -> None:
+        tmp = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+        _git("init", "-q", "--bare", str(tmp))
+        for key, value in (
+            ("remote.origin.url", url),
+            ("remote.origin.tagOpt", "--no-tags"),
+            ("uploadpack.allowFilter", "true"),
+            ("gc.pruneExpire", "never"),
+        ):
+            _git("config", key, value, cwd=tmp)
+        for refspec in MIRROR_REFSPECS:
+            _git("config", "--add", "remote.origin.fetch", refspec, cwd=tmp)
+        self._fetch(tmp)
+        # Point the mirror's HEAD at the remote's default branch
+        symref = _git("ls-remote", "--symref", "origin", "HEAD", cwd=tmp, timeout=self.timeout)
+        if symref.startswith("ref: "):
+            _git("symbolic-ref", "HEAD", symref[5:].split("\t", 1)[0], cwd=tmp)
+        os.rename(tmp, path)
+
+    def _fetch(self, path: Path) -> None:
+        _git("fetch", "--quiet", "--prune", "origin", cwd=path, timeout=self.timeout)
+
+    def mirror(self, url: str, refresh: bool = True) -> Path:
+        """Create or incrementally refresh the mirror of ``url``.
+
+        Args:
+            url: Remote URL
+            refresh: Fetch new objects into an existing mirror
+
+        Returns:
+            Path to the bare mirror
+        """
+        with self._locked(url, exclusive=True) as path:
+            if not path.exists():
+                self._create(url, path)
+            elif refresh and not self._fresh(path):
+                self._fetch(path)
+        return path
+
+    def clone(
+        self,
+        url: str,
+        dest: str | Path,
+        mode: str = "reference",
+        branch: Optional[str] = None,
+        sparse: Optional[Sequence[str]] = None,
+        dissociate: bool = False,
+        refresh: bool = True,
+    ) -> Path:
+        """Create a working copy of ``url`` at ``dest`` from the local mirror.
+
+        The working copy's ``origin`` points at ``url``, with remote-tracking
+        branches as of the mirror refresh.
+
+        Args:
+            url: Remote URL
+            dest: Target directory (must not exist or be empty)
+            mode: ``reference`` (share the mirror's objects via alternates),
+                ``partial`` (``--filter=blob:none``; missing blobs are fetched
+                from ``url`` on demand) or ``full`` (independent copy)
+            branch: Branch to check out (default: the remote's HEAD)
+            sparse: Directories for a cone-mode sparse checkout
+            dissociate: In ``reference`` mode, copy the borrowed objects so
+                the working copy survives the mirror being deleted
+            refresh: Refresh the mirror before cloning
+
+        Returns:
+            Path to the new working copy
+
+        Raises:
+            ValueError: If ``mode`` is unknown
+            subprocess.CalledProcessError: If git fails
+        """
+        if mode not in CLONE_MODES:
+            raise ValueError(f"Unknown clone mode '{mode}', expected one of {CLONE_MODES}")
+        self.mirror(url, refresh=refresh)
+        dest = Path(dest)
+
+        with self._locked(url, exclusive=False) as path:
+            args = ["clone", "--quiet"]
+            if branch:
+                args += ["--branch", branch]
+            if sparse:
+                args.append("--sparse")
+            if mode == "reference":
+                args += ["--reference", str(path)]
+                if dissociate:
+                    args.append("--dissociate")
+                source = str(path)
+            elif mode == "partial":
+                # Filters are only honoured over a transport, not local copies
+                args.append("--filter=blob:none")
+                source = path.resolve().as_uri()
+            else:
+                args.append("--no-local")
+                source = str(path)
+            _git(*args, source, str(dest), timeout=self.timeout)
+            if sparse:
+                # Blobs for the cone are still fetched from the mirror here
+                _git("sparse-checkout", "set", "--cone", *sparse, cwd=dest, timeout=self.timeout)
+
+        _git("remote", "set-url", "origin", url, cwd=dest)
+        return dest
@@ -0,0 +1,336 @@
+"""
+CommitGraph - In-process index of commit parent links.
+
+Stores every reachable commit once, with parent links in compressed sparse
+row form (one offsets array, one parent-index array) plus generation numbers
+and commit times. Ancestry, merge-base, ahead/behind and range questions are
+answered by walking these arrays instead of running ``git log A..B``.
+
+The graph is persisted to a single file and brought up to date incrementally
+with ``git rev-list --all --not <known heads>``, so refreshing after a fetch
+only reads the commits that arrived.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Optional
+
+from fractary_core.common import telemetry
+from fractary_core.common.config import atomic_write
+
+_MAGIC = b"FCGRAPH1"
+_HEADER = struct.Struct("<8sI")
+
+# Walk flags: reachable from the first / second side; STALE marks commits
+# below an already-found merge base.
+_LEFT = 1
+_RIGHT = 2
+_BOTH = _LEFT | _RIGHT
+_STALE = 4
+
+
+class CommitGraph:
+    """Array-backed commit graph.
+
+    Commits are numbered in insertion order, which is always parents-first,
+    so a commit's generation (1 + the highest parent generation) strictly
+    exceeds that of every ancestor. Walks visit commits in descending
+    generation order, which guarantees each commit is reached from all of its
+    descendants before it is expanded.
+    """
+
+    def __init__(self) -> None:
+        self.hash_len = 0
+        self._oids = bytearray()
+        self._index: dict[bytes, int] = {}
+        self._parent_start = array("I", [0])
+        self._parents = array("I")
+        self._generation = array("I")
+        self._time = array("q")
+        self.heads: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._generation)
+
+    def __contains__(self, sha: str) -> bool:
+        return self._key(sha) in self._index
+
+    # =========================================================================
+    # Lookups
+    # =========================================================================
+
+    @staticmethod
+    def _key(sha: str) -> bytes:
+        try:
+            return bytes.fromhex(sha)
+        except ValueError:
+            return b""
+
+    def _sha(self, idx: int) -> str:
+        return self._oids[idx * self.hash_len:(idx + 1) * self.hash_len].hex()
+
+    def _idx(self, sha: str) -> int:
+        idx = self._index.get(self._key(sha))
+        if idx is None:
+            raise KeyError(sha)
+        return idx
+
+    def _parents_of(self, idx: int) -> array:
+        return self._parents[self._parent_start[idx]:self._parent_start[idx + 1]]
+
+    def parents(self, sha: str) -> list[str]:
+        """Return the parent shas of a commit."""
+        return [self._sha(p) for p in self._parents_of(self._idx(sha))]
+
+    def generation(self, sha: str) -> int:
+        """Return the commit's generation number (root commits are 1)."""
+        return self._generation[self._idx(sha)]
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """True if ``ancestor`` is reachable from ``descendant`` (or equal)."""
+        target = self._idx(ancestor)
+        start = self._idx(descendant)
+        floor = self._generation[target]
+        seen = {start}
+        stack = [start]
+        while stack:
+            idx = stack.pop()
+            if idx == target:
+                return True
+            for parent in self._parents_of(idx):
+                # Nothing at or below the target's generation can lead to it
+                if parent not in seen and (
+                    parent == target or self._generation[parent] > floor
+                ):
+                    seen.add(parent)
+                    stack.append(parent)
+        return False
+
+    def _paint(
+        self,
+        left: str,
+        right: str,
+        find_bases: bool = False,
+    ) -> tuple[dict[int, int], list[int]]:
+        """Colour both histories until the unshared parts are fully known.
+
+        Commits are expanded in descending generation order, so a commit's
+        flags are final when it is popped. The walk stops once every queued
+        commit is reachable from both sides (or, when ``find_bases``, lies
+        below an already-found merge base).
+
+        Returns:
+            (flags of every visited commit, best common ancestors found)
+        """
+        done = _STALE if find_bases else _BOTH
+        flags: dict[int, int] = {}
+        heap: list[tuple[int, int]] = []
+        bases: list[int] = []
+        pending = 0
+
+        def mark(idx: int, flag: int) -> None:
+            nonlocal pending
+            old = flags.get(idx)
+            if old is None:
+                flags[idx] = flag
+                heapq.heappush(heap, (-self._generation[idx], idx))
+                if flag & done != done:
+                    pending += 1
+            elif old | flag != old:
+                flags[idx] = old | flag
+                if old & done != done and (old | flag) & done == done:
+                    pending -= 1
+
+        mark(self._idx(left), _LEFT)
+        mark(self._idx(right), _RIGHT)
+
+        while pending:
+            _, idx = heapq.heappop(heap)
+            flag = flags[idx]
+            if flag & done != done:
+                pending -= 1
+            if find_bases and flag & _BOTH == _BOTH and not flag & _STALE:
+                bases.append(idx)
+                flag |= _STALE
+                flags[idx] = flag
+            for parent in self._parents_of(idx):
+                mark(parent, flag)
+        return flags, bases
+
+    def merge_bases(self, left: str, right: str) -> list[str]:
+        """Return all best common ancestors, highest generation first."""
+        _, bases = self._paint(left, right, find_bases=True)
+        return [self._sha(i) for i in bases]
+
+    def merge_base(self, left: str, right: str) -> Optional[str]:
+        """Return one best common ancestor (like ``git merge-base``), or None."""
+        bases = self.merge_bases(left, right)
+        return bases[0] if bases else None
+
+    def ahead_behind(self, left: str, right: str) -> tuple[int, int]:
+        """Count commits only in ``left`` (ahead) and only in ``right`` (behind)."""
+        flags, _ = self._paint(left, right)
+        ahead = sum(1 for flag in flags.values() if flag == _LEFT)
+        behind = sum(1 for flag in flags.values() if flag == _RIGHT)
+        return ahead, behind
+
+    def range(self, base: str, head: str) -> list[str]:
+        """Commits reachable from ``head`` but not ``base`` (``git log base..head``).
+
+        Returns:
+            Commit shas, newest commit time first
+        """
+        flags, _ = self._paint(base, head)
+        only_head = [idx for idx, flag in flags.items() if flag == _RIGHT]
+        only_head.sort(key=lambda i: (-self._time[i], -self._generation[i]))
+        return [self._sha(i) for i in only_head]
+
+    # =========================================================================
+    # Building
+    # =========================================================================
+
+    def update(self, cwd: Optional[str | Path] = None) -> int:
+        """Add commits reachable from any ref that the graph does not know yet.
+
+        Only history beyond the recorded heads is read from git, so after a
+        fetch this costs time proportional to the number of new commits.
+
+        Args:
+            cwd: Repository working directory
+
+        Returns:
+            Number of commits added
+        """
+        result = telemetry.run(
+            [
+                "git", "rev-list", "--all", "--parents", "--timestamp",
+                "--topo-order", "--reverse", "--ignore-missing", "--stdin",
+            ],
+            input="".join(f"^{head}\n" for head in self.heads),
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+        return self.add_commits(result.stdout.splitlines())
+
+    def add_commits(self, lines: Iterable[str]) -> int:
+        """Append ``rev-list --parents --timestamp`` lines (parents first).
+
+        Parents the graph has never seen (e.g. beyond a shallow boundary) are
+        dropped. Returns the number of commits added.
+        """
+        added = 0
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 2:
+                continue
+            timestamp, sha, *parent_shas = fields
+            key = bytes.fromhex(sha)
+            if key in self._index:
+                continue
+            if not self.hash_len:
+                self.hash_len = len(key)
+
+            generation = 0
+            for parent_sha in parent_shas:
+                parent = self._index.get(bytes.fromhex(parent_sha))
+                if parent is not None:
+                    self._parents.append(parent)
+                    generation = max(generation, self._generation[parent])
+
+            self._index[key] = len(self._generation)
+            self._oids += key
+            self._parent_start.append(len(self._parents))
+            self._generation.append(generation + 1)
+            self._time.append(int(timestamp))
+            added += 1
+
+        if added:
+            self.heads = self._find_heads()
+        return added
+
+    def _find_heads(self) -> list[str]:
+        """Commits nothing else in the graph points at."""
+        has_child = bytearray(len(self))
+        for parent in self._parents:
+            has_child[parent] = 1
+        return [self._sha(i) for i, flag in enumerate(has_child) if not flag]
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, path: str | Path) -> None:
+        """Write the graph to ``path`` atomically."""
+        header = json.dumps({
+            "hash_len": self.hash_len,
+            "count": len(self),
+            "parent_count": len(self._parents),
+            "byteorder": sys.byteorder,
+            "heads": self.heads,
+        }).encode()
+        atomic_write(path, b"".join([
+            _HEADER.pack(_MAGIC, len(header)),
+            header,
+            bytes(self._oids),
+            self._parent_start.tobytes(),
+            self._parents.tobytes(),
+            self._generation.tobytes(),
+            self._time.tobytes(),
+        ]))
+
+    @classmethod
+    def load(cls, path: str | Path) -> CommitGraph:
+        """Read a graph saved with ``save``; returns an empty graph if unusable."""
+        graph = cls()
+        try:
+            data = Path(path).read_bytes()
+            magic, header_len = _HEADER.unpack_from(data)
+            if magic != _MAGIC:
+                return graph
+            offset = _HEADER.size
+            header = json.loads(data[offset:offset + header_len])
+            offset += header_len
+            if header["byteorder"] != sys.byteorder:
+                return graph
+
+            count = header["count"]
+            hash_len = header["hash_len"]
+            oids = bytearray(data[offset:offset + count * hash_len])
+            offset += len(oids)
+            arrays = []
+            for typecode, length in (
+                ("I", count + 1),
+                ("I", header["parent_count"]),
+                ("I", count),
+                ("q", count),
+            ):
+                values = array(typecode)
+                end = offset + length * values.itemsize
+                values.frombytes(data[offset:end])
+                offset = end
+                arrays.append(values)
+        except (OSError, ValueError, KeyError, struct.error):
+            return graph
+
+        if offset != len(data):
+            return graph
+        graph.hash_len = hash_len
+        graph._oids = oids
+        graph._parent_start, graph._parents, graph._generation, graph._time = arrays
+        graph._index = {
+            bytes(oids[i * hash_len:(i + 1) * hash_len]): i for i in range(count)
+        }
+        graph.heads = header["heads"]
+        return graph
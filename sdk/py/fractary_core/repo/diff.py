@@ -0,0 +1,348 @@
+"""
+Structured diffs - Streaming ``git diff`` parsing.
+
+File-level changes come from ``git diff --raw -z`` (exact paths, modes,
+blob shas, rename/copy similarity). Patches come from a second, streamed
+``git diff --patch`` whose per-file blocks are matched to the raw entries in
+order, so path quoting in patch headers never has to be undone and hunks are
+yielded file by file instead of buffering the whole patch. Each block's header
+is checked against the path of its raw entry, so a tree that changes between
+the two runs fails loudly instead of pairing hunks with the wrong file.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from fractary_core.common import telemetry
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)$")
+
+# Patch blocks git emits per raw entry: the "U" marker of an unmerged path
+# gets none (its worktree entry carries a combined diff), type changes are
+# shown as a deletion + creation.
+_BLOCKS_PER_STATUS = {"U": 0, "T": 2}
+
+# C-style escapes git uses for quoted paths; other unsafe bytes become octal
+_QUOTE_ESCAPES = {
+    0x07: "a", 0x08: "b", 0x09: "t", 0x0A: "n", 0x0B: "v", 0x0C: "f", 0x0D: "r",
+    0x22: '"', 0x5C: "\\",
+}
+
+
+@dataclass(slots=True)
+class ChangedFile:
+    """One entry of ``git diff --raw``."""
+
+    status: str
+    path: str
+    old_path: Optional[str] = None
+    similarity: Optional[int] = None
+    old_mode: str = ""
+    new_mode: str = ""
+    old_sha: str = ""
+    new_sha: str = ""
+
+
+@dataclass(slots=True)
+class Hunk:
+    """A single ``@@`` hunk; lines keep their ``' '``, ``+``, ``-`` or ``\\`` prefix."""
+
+    old_start: int
+    old_lines: int
+    new_start: int
+    new_lines: int
+    section: str = ""
+    lines: list[str] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FileDiff:
+    """Patch for one changed file."""
+
+    file: ChangedFile
+    hunks: list[Hunk] = field(default_factory=list)
+    binary: bool = False
+    truncated: bool = False
+    combined: bool = False
+    additions: int = 0
+    deletions: int = 0
+
+    @property
+    def path(self) -> str:
+        return self.file.path
+
+    @property
+    def status(self) -> str:
+        return self.file.status
+
+
+def diff_args(
+    base: Optional[str] = None,
+    head: Optional[str] = None,
+    staged: bool = False,
+    renames: bool = True,
+    copies: bool = False,
+) -> list[str]:
+    """Build the revision/option part shared by raw and patch invocations.
+
+    With no revisions the working tree is compared to the index (or, when
+    ``staged``, the index to ``base`` or HEAD). With only ``base`` the working
+    tree is compared to ``base``.
+    """
+    args = ["diff", "--no-color", "--no-ext-diff", "--no-textconv"]
+    if renames:
+        args.append("-M")
+    if copies:
+        args.append("-C")
+    if staged:
+        args.append("--cached")
+    args.extend(rev for rev in (base, head) if rev)
+    return args
+
+
+def _pathspec(paths: Optional[Sequence[str]]) -> list[str]:
+    return ["--", *paths] if paths else ["--"]
+
+
+def quote_path(path: str) -> str:
+    """Quote a path the way git writes it in patch headers (``core.quotePath=true``)."""
+    data = path.encode(errors="surrogateescape")
+    if all(0x20 <= b < 0x7F and b not in _QUOTE_ESCAPES for b in data):
+        return path
+    quoted = "".join(
+        "\\" + _QUOTE_ESCAPES[b] if b in _QUOTE_ESCAPES
+        else chr(b) if 0x20 <= b < 0x7F
+        else f"\\{b:03o}"
+        for b in data
+    )
+    return f'"{quoted}"'
+
+
+def parse_raw(output: str) -> list[ChangedFile]:
+    """Parse ``git diff --raw -z --no-abbrev`` output."""
+    tokens = output.split("\0")
+    files = []
+    i = 0
+    while i < len(tokens) and tokens[i].startswith(":"):
+        old_mode, new_mode, old_sha, new_sha, status = tokens[i][1:].split(" ")
+        letter, score = status[0], status[1:]
+        if letter in "RC":
+            old_path, path = tokens[i + 1], tokens[i + 2]
+            i += 3
+        else:
+            old_path, path = None, tokens[i + 1]
+            i += 2
+        files.append(ChangedFile(
+            status=letter,
+            path=path,
+            old_path=old_path,
+            similarity=int(score) if score else None,
+            old_mode=old_mode,
+            new_mode=new_mode,
+            old_sha=old_sha,
+            new_sha=new_sha,
+        ))
+    return files
+
+
+class PatchParser:
+    """Split ``git diff --patch`` lines into FileDiff objects.
+
+    Hunk bodies are consumed by their line counts, so content lines that look
+    like headers (``--- x``, ``diff --git``) are never misread. Lines beyond
+    ``max_lines`` per file are dropped and the file is marked truncated.
+    Combined diffs of conflicted paths are flagged but not parsed.
+
+    The patch must use the ``a/`` and ``b/`` prefixes and quote paths with
+    ``core.quotePath=true``; a block whose header does not name the expected
+    entry raises RuntimeError.
+    """
+
+    def __init__(self, files: list[ChangedFile], max_lines: Optional[int] = None) -> None:
+        self._files = iter(files)
+        self.max_lines = max_lines
+        self._current: Optional[FileDiff] = None
+        self._blocks_left = 0
+        self._hunk: Optional[Hunk] = None
+        self._old_left = 0
+        self._new_left = 0
+        self._kept = 0
+
+    def feed(self, lines: Iterable[str]) -> Iterator[FileDiff]:
+        """Consume patch lines, yielding each file once its patch is complete."""
+        for line in lines:
+            in_hunk = self._old_left or self._new_left or line.startswith("\\")
+            if self._hunk is not None and in_hunk:
+                self._hunk_line(line)
+            elif line.startswith(("diff --git ", "diff --cc ", "diff --combined ")):
+                self._hunk = None
+                if self._blocks_left:
+                    self._blocks_left -= 1
+                else:
+                    yield from self._next_file()
+                self._check_header(line)
+                if line.startswith("diff --c") and self._current is not None:
+                    # Conflicted paths get a combined diff; its hunks are skipped
+                    self._current.combined = True
+            elif line.startswith("@@") and self._current is not None:
+                self._start_hunk(line)
+            elif line.startswith("Binary files ") and self._current is not None:
+                self._current.binary = True
+
+    def close(self) -> Iterator[FileDiff]:
+        """Yield the last file and any entries that need no patch block.
+
+        Raises:
+            RuntimeError: If an entry is missing its patch block
+        """
+        if self._blocks_left:
+            assert self._current is not None
+            raise RuntimeError(f"git diff produced no patch for '{self._current.path}'")
+        if self._current is not None:
+            yield self._current
+            self._current = None
+        for changed in self._files:
+            if _BLOCKS_PER_STATUS.get(changed.status, 1):
+                raise RuntimeError(f"git diff produced no patch for '{changed.path}'")
+            yield FileDiff(file=changed)
+
+    def _check_header(self, line: str) -> None:
+        """Make sure a patch block belongs to the entry it is paired with."""
+        if self._current is None:
+            raise RuntimeError(f"git diff produced a patch for an unlisted file: {line}")
+        changed = self._current.file
+        if line.startswith("diff --git "):
+            old_path = changed.old_path or changed.path
+            expected = f"diff --git {quote_path('a/' + old_path)} {quote_path('b/' + changed.path)}"
+        else:
+            keyword = "diff --cc" if line.startswith("diff --cc ") else "diff --combined"
+            expected = f"{keyword} {quote_path(changed.path)}"
+        if line != expected:
+            raise RuntimeError(
+                f"git diff patch '{line}' does not match changed file '{changed.path}'; "
+                "the tree changed while the diff was read"
+            )
+
+    def _next_file(self) -> list[FileDiff]:
+        """Finish the current file and advance to the next entry with a patch."""
+        done = [self._current] if self._current is not None else []
+        self._current = None
+        self._hunk = None
+        self._kept = 0
+        for changed in self._files:
+            blocks = _BLOCKS_PER_STATUS.get(changed.status, 1)
+            if not blocks:
+                # Entries without a patch block are complete as they are
+                done.append(FileDiff(file=changed))
+                continue
+            self._current = FileDiff(file=changed)
+            self._blocks_left = blocks - 1
+            break
+        return done
+
+    def _start_hunk(self, line: str) -> None:
+        match = _HUNK_HEADER.match(line)
+        if match is None:
+            return
+        old_start, old_lines, new_start, new_lines, section = match.groups()
+        self._hunk = Hunk(
+            old_start=int(old_start),
+            old_lines=int(old_lines) if old_lines is not None else 1,
+            new_start=int(new_start),
+            new_lines=int(new_lines) if new_lines is not None else 1,
+            section=section,
+        )
+        self._old_left = self._hunk.old_lines
+        self._new_left = self._hunk.new_lines
+        assert self._current is not None
+        if not self._current.truncated:
+            self._current.hunks.append(self._hunk)
+
+    def _hunk_line(self, line: str) -> None:
+        assert self._hunk is not None and self._current is not None
+        prefix = line[:1]
+        if prefix == "+":
+            self._new_left -= 1
+            self._current.additions += 1
+        elif prefix == "-":
+            self._old_left -= 1
+            self._current.deletions += 1
+        elif prefix != "\\":
+            self._old_left -= 1
+            self._new_left -= 1
+
+        if self.max_lines is not None and self._kept >= self.max_lines:
+            self._current.truncated = True
+            return
+        self._kept += 1
+        self._hunk.lines.append(line)
+
+
+def run_raw_diff(
+    args: list[str],
+    paths: Optional[Sequence[str]] = None,
+    cwd: Optional[str | Path] = None,
+    timeout: Optional[float] = None,
+) -> list[ChangedFile]:
+    """Run ``git <args> --raw -z`` and parse the changed files."""
+    result = telemetry.run(
+        ["git", *args, "--raw", "-z", "--no-abbrev", *_pathspec(paths)],
+        capture_output=True,
+        check=True,
+        cwd=cwd,
+        timeout=timeout,
+    )
+    return parse_raw(result.stdout.decode(errors="surrogateescape"))
+
+
+def stream_patch(
+    args: list[str],
+    files: list[ChangedFile],
+    paths: Optional[Sequence[str]] = None,
+    cwd: Optional[str | Path] = None,
+    context: int = 3,
+    max_lines: Optional[int] = None,
+) -> Iterator[FileDiff]:
+    """Run ``git <args> --patch`` and yield a FileDiff per entry of ``files``.
+
+    Closing the iterator early terminates the ``git diff`` process.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [
+            "git", "-c", "core.quotePath=true", *args,
+            "--patch", "--src-prefix=a/", "--dst-prefix=b/", f"-U{context}",
+            *_pathspec(paths),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    parser = PatchParser(files, max_lines=max_lines)
+    lines = (raw.decode(errors="replace").rstrip("\n") for raw in proc.stdout)
+    finished = False
+    try:
+        yield from parser.feed(lines)
+        yield from parser.close()
+        finished = True
+    finally:
+        if not finished and proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read().decode(errors="replace")
+        proc.stderr.close()
+        proc.wait()
+        telemetry.record(proc.args, time.perf_counter() - start, proc.returncode)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, None, stderr)
@@ -0,0 +1,104 @@
+"""
+Environment index - Compiled lookups over the ``environments`` repo config.
+
+Branch values may be exact names (``main``) or fnmatch-style globs
+(``release/*``). Exact names are answered from dicts; all globs are folded
+into one alternation regex whose matching group names the environment, so a
+lookup costs a hash probe plus at most one regex match however many
+environments are configured.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from typing import Any, Optional
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _is_glob(branch: str) -> bool:
+    return not _GLOB_CHARS.isdisjoint(branch)
+
+
+def _compile(patterns: list[tuple[str, str]]) -> Optional[re.Pattern[str]]:
+    """Fold (group, glob) pairs into one regex; the first listed pattern wins."""
+    if not patterns:
+        return None
+    return re.compile("|".join(
+        f"(?P<{group}>{fnmatch.translate(glob)})" for group, glob in patterns
+    ))
+
+
+class EnvironmentIndex:
+    """Branch -> environment lookups compiled from an ``environments`` mapping.
+
+    An exact branch name takes precedence over glob patterns; among several
+    matching entries of the same kind the first configured environment wins.
+
+    Example:
+        index = EnvironmentIndex({
+            "production": {"branch": "main", "protected": True},
+            "release": {"branch": "release/*", "protected": True},
+        })
+        index.environment_for("release/1.2")  # "release"
+        index.is_protected("release/1.2")     # True
+    """
+
+    def __init__(self, environments: dict[str, Any]) -> None:
+        """Build the index.
+
+        Args:
+            environments: Mapping of environment ID to its config dict
+        """
+        self._branch_by_env: dict[str, Optional[str]] = {}
+        self._env_by_branch: dict[str, str] = {}
+        self._protected: set[str] = set()
+        self._env_ids: list[str] = []
+        patterns: list[tuple[str, str]] = []
+        protected_patterns: list[tuple[str, str]] = []
+
+        for env_id, env_config in environments.items():
+            if not isinstance(env_config, dict):
+                continue
+            branch = env_config.get("branch")
+            self._branch_by_env[env_id] = branch
+            if not isinstance(branch, str):
+                continue
+            protected = env_config.get("protected") is True
+            if _is_glob(branch):
+                group = f"e{len(self._env_ids)}"
+                self._env_ids.append(env_id)
+                patterns.append((group, branch))
+                if protected:
+                    protected_patterns.append((group, branch))
+            else:
+                self._env_by_branch.setdefault(branch, env_id)
+                if protected:
+                    self._protected.add(branch)
+
+        self._pattern = _compile(patterns)
+        self._protected_pattern = _compile(protected_patterns)
+
+    def branch_for(self, env_id: str) -> Optional[str]:
+        """Return the configured branch (or pattern) of an environment."""
+        return self._branch_by_env.get(env_id)
+
+    def environment_for(self, branch_name: str) -> Optional[str]:
+        """Return the environment a branch belongs to, or None."""
+        env_id = self._env_by_branch.get(branch_name)
+        if env_id is not None or self._pattern is None:
+            return env_id
+        match = self._pattern.match(branch_name)
+        if match is None or match.lastgroup is None:
+            return None
+        return self._env_ids[int(match.lastgroup[1:])]
+
+    def is_protected(self, branch_name: str) -> bool:
+        """True if any protected environment matches the branch."""
+        if branch_name in self._protected:
+            return True
+        return (
+            self._protected_pattern is not None
+            and self._protected_pattern.match(branch_name) is not None
+        )
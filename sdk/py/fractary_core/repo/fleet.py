@@ -0,0 +1,199 @@
+"""
+RepoFleet - Fan repository operations out across many clones.
+
+Runs fetch, pull, status and branch listing over a list of repositories on a
+bounded thread pool. Results are yielded as each repository finishes, so a
+slow remote never holds back reporting for the rest of the fleet.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from fractary_core.repo.manager import RepoManager
+
+
+@dataclass
+class FleetResult:
+    """Outcome of one operation on one repository."""
+
+    repo_path: Path
+    operation: str
+    ok: bool
+    value: Any = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    duration: float = 0.0
+    exception: Optional[Exception] = None
+
+
+@dataclass
+class FleetReport:
+    """Aggregated results of a fleet-wide operation."""
+
+    results: list[FleetResult]
+
+    @property
+    def succeeded(self) -> list[FleetResult]:
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self) -> list[FleetResult]:
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def timed_out(self) -> list[FleetResult]:
+        return [r for r in self.results if r.timed_out]
+
+    def by_repo(self) -> dict[Path, FleetResult]:
+        """Index results by repository path."""
+        return {r.repo_path: r for r in self.results}
+
+
+class RepoFleet:
+    """Bounded parallel operations over a set of repositories.
+
+    Each repository gets its own RepoManager; ``timeout`` applies to each git
+    command run against a repository, so one hung remote cannot stall the
+    fleet. It is not a deadline for the whole operation: one that runs
+    several commands (e.g. a custom ``run`` operation) may take up to that
+    many times ``timeout``. Streaming methods (``iter_*``) yield a FleetResult per repository
+    in completion order; the plain methods collect them into a FleetReport.
+
+    Example:
+        fleet = RepoFleet(paths, max_workers=16, timeout=120)
+        for result in fleet.iter_fetch():
+            if not result.ok:
+                print(result.repo_path, result.error)
+    """
+
+    def __init__(
+        self,
+        repo_paths: Iterable[str | Path],
+        config: Optional[dict[str, Any]] = None,
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize RepoFleet.
+
+        Args:
+            repo_paths: Repository working directories
+            config: Repo configuration shared by every repository
+            max_workers: Maximum number of repositories processed at once
+            timeout: Timeout in seconds for each git command (None = no limit)
+        """
+        self.repo_paths = [Path(p) for p in repo_paths]
+        self.config = config
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def _manager(self, repo_path: Path) -> RepoManager:
+        return RepoManager(self.config, repo_path=repo_path, timeout=self.timeout)
+
+    def _call(
+        self,
+        repo_path: Path,
+        name: str,
+        operation: Callable[[RepoManager], Any],
+    ) -> FleetResult:
+        """Run ``operation`` against one repository, capturing any failure.
+
+        An exception never escapes to the pool: it is recorded on the result
+        so the rest of the fleet is still reported.
+        """
+        start = time.monotonic()
+        result = FleetResult(repo_path=repo_path, operation=name, ok=False)
+        try:
+            with self._manager(repo_path) as repo:
+                result.value = operation(repo)
+            result.ok = True
+        except subprocess.TimeoutExpired as e:
+            result.timed_out = True
+            result.error = f"timed out after {e.timeout}s: {' '.join(e.cmd)}"
+            result.exception = e
+        except subprocess.CalledProcessError as e:
+            result.error = (e.stderr or "").strip() or str(e)
+            result.exception = e
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            result.exception = e
+        result.duration = time.monotonic() - start
+        return result
+
+    def iter_run(
+        self,
+        name: str,
+        operation: Callable[[RepoManager], Any],
+    ) -> Iterator[FleetResult]:
+        """Run ``operation`` on every repository, yielding results as they finish.
+
+        Closing the iterator early cancels repositories that have not started.
+
+        Args:
+            name: Operation name recorded on each result
+            operation: Callable receiving the repository's RepoManager
+
+        Returns:
+            Iterator of FleetResult objects in completion order
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="repo-fleet"
+        )
+        try:
+            futures: list[Future[FleetResult]] = [
+                executor.submit(self._call, path, name, operation)
+                for path in self.repo_paths
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, name: str, operation: Callable[[RepoManager], Any]) -> FleetReport:
+        """Run ``operation`` on every repository and collect the results."""
+        return FleetReport(list(self.iter_run(name, operation)))
+
+    # =========================================================================
+    # Fleet Operations
+    # =========================================================================
+
+    def iter_fetch(self, remote: str = "origin", prune: bool = True) -> Iterator[FleetResult]:
+        """Fetch every repository, yielding results as they complete."""
+        return self.iter_run("fetch", lambda repo: repo.fetch(remote, prune=prune))
+
+    def fetch(self, remote: str = "origin", prune: bool = True) -> FleetReport:
+        """Fetch every repository."""
+        return FleetReport(list(self.iter_fetch(remote, prune)))
+
+    def iter_pull(
+        self,
+        remote: str = "origin",
+        rebase: bool = False,
+    ) -> Iterator[FleetResult]:
+        """Pull every repository's current branch, yielding results as they complete."""
+        return self.iter_run("pull", lambda repo: repo.pull(remote=remote, rebase=rebase))
+
+    def pull(self, remote: str = "origin", rebase: bool = False) -> FleetReport:
+        """Pull every repository's current branch."""
+        return FleetReport(list(self.iter_pull(remote, rebase)))
+
+    def iter_status(self) -> Iterator[FleetResult]:
+        """Read every repository's working tree status (value: RepoStatus)."""
+        return self.iter_run("status", lambda repo: repo.status())
+
+    def status(self) -> FleetReport:
+        """Read every repository's working tree status."""
+        return FleetReport(list(self.iter_status()))
+
+    def iter_branches(self, pattern: Optional[str] = None) -> Iterator[FleetResult]:
+        """List every repository's branches (value: list[Branch])."""
+        return self.iter_run("branches", lambda repo: repo.list_branches(pattern))
+
+    def branches(self, pattern: Optional[str] = None) -> FleetReport:
+        """List every repository's branches."""
+        return FleetReport(list(self.iter_branches(pattern)))
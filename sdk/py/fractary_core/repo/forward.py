@@ -0,0 +1,364 @@
+"""
+Branch forwarding - Bring many branches up to date with a base branch.
+
+Branches are classified against the commit graph without spawning git:
+already based on the target, fast-forwardable, or diverged. Fast-forwards
+are applied to the refs in a single ``git update-ref --stdin`` transaction.
+Each diverged branch is test-merged with ``git merge-tree --write-tree``,
+which merges in the object store and never touches a checkout; branches
+that would conflict are reported with the conflicting paths and left alone,
+and the rest are rebased in pooled worktrees on a thread pool. Results are
+written to a state file as branches finish, so an interrupted run resumes
+where it stopped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+from fractary_core.common import telemetry
+from fractary_core.common.config import atomic_write
+from fractary_core.repo.worktree import WorktreePool, parse_worktree_list
+
+if TYPE_CHECKING:
+    from fractary_core.repo.manager import RepoManager
+
+FORWARD_STATUSES = ("up_to_date", "fast_forward", "rebased", "conflict", "skipped", "error")
+
+# Outcomes a resumed run may reuse, with the field the branch tip must still match
+_RESUMABLE = {
+    "up_to_date": "new_sha",
+    "fast_forward": "new_sha",
+    "rebased": "new_sha",
+    "conflict": "old_sha",
+}
+
+
+@dataclass
+class ForwardResult:
+    """Outcome of forwarding one branch.
+
+    ``status`` is one of ``FORWARD_STATUSES``. ``conflicts`` lists the paths
+    that keep a ``conflict`` branch from being rebased. ``resumed`` is set
+    when the result was carried over from an interrupted run.
+    """
+
+    branch: str
+    status: str
+    old_sha: Optional[str] = None
+    new_sha: Optional[str] = None
+    conflicts: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+    resumed: bool = False
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("up_to_date", "fast_forward", "rebased")
+
+    @property
+    def changed(self) -> bool:
+        return self.status in ("fast_forward", "rebased")
+
+
+def merge_tree_args(onto: str, head: str) -> list[str]:
+    """Build ``git merge-tree`` arguments whose output ``parse_merge_tree`` understands."""
+    return [
+        "-c", "core.quotePath=false",
+        "merge-tree", "--write-tree", "--name-only", "--no-messages", "-z", onto, head,
+    ]
+
+
+def parse_merge_tree(output: str) -> tuple[str, list[str]]:
+    """Split ``merge_tree_args`` output into the merged tree and conflicting paths."""
+    tree, *paths = output.split("\0")
+    return tree, [path for path in paths if path]
+
+
+class ForwardState:
+    """Per-branch results of a forwarding run, persisted after every update."""
+
+    def __init__(self, path: Optional[Path]) -> None:
+        """Initialize ForwardState.
+
+        Args:
+            path: JSON state file (None keeps the state in memory only)
+        """
+        self.path = path
+        self.results: dict[str, ForwardResult] = {}
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text())
+                self.results = {
+                    branch: ForwardResult(**entry) for branch, entry in data["results"].items()
+                }
+            except (OSError, ValueError, KeyError, TypeError):
+                self.results = {}
+
+    def resumable(self, branch: str, tip: Optional[str]) -> Optional[ForwardResult]:
+        """Return the recorded result for ``branch`` if its tip has not moved since."""
+        result = self.results.get(branch)
+        if result is None or tip is None:
+            return None
+        key = _RESUMABLE.get(result.status)
+        if key is None or getattr(result, key) != tip:
+            return None
+        result.resumed = True
+        result.duration = 0.0
+        return result
+
+    def record(self, *results: ForwardResult) -> None:
+        with self._lock:
+            for result in results:
+                self.results[result.branch] = result
+            if self.path is not None:
+                data = {"results": {b: asdict(r) for b, r in self.results.items()}}
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write(self.path, json.dumps(data).encode())
+
+    def discard(self) -> None:
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+
+class BranchForwarder:
+    """Fast-forward or rebase many branches onto a base.
+
+    Nothing runs in the main checkout: refs are moved with ``update-ref`` and
+    rebases happen in worktrees leased from a ``WorktreePool``. Branches
+    checked out in any worktree are skipped rather than changed under it.
+
+    Example:
+        forwarder = BranchForwarder(repo, max_workers=8, state_dir=".fractary/cache/forward")
+        for result in forwarder.forward(branches, onto="main"):
+            if result.status == "conflict":
+                print(result.branch, result.conflicts)
+    """
+
+    def __init__(
+        self,
+        manager: RepoManager,
+        pool: Optional[WorktreePool] = None,
+        max_workers: int = 4,
+        state_dir: Optional[str | Path] = None,
+    ) -> None:
+        """Initialize BranchForwarder.
+
+        Args:
+            manager: RepoManager of the repository
+            pool: Worktree pool for rebases (default: the repository's pool)
+            max_workers: Rebases run at the same time
+            state_dir: Directory for resume state files (None = no resume)
+        """
+        self.manager = manager
+        self.repo_path = manager.repo_path
+        self.max_workers = max_workers
+        self.state_dir = Path(state_dir) if state_dir is not None else None
+        self._pool = pool
+
+    @property
+    def pool(self) -> WorktreePool:
+        if self._pool is None:
+            self._pool = WorktreePool(
+                self.repo_path or ".", max_worktrees=self.max_workers, config=self.manager.config,
+            )
+        return self._pool
+
+    def _git(
+        self,
+        *args: str,
+        cwd: Optional[Path] = None,
+        check: bool = True,
+        input: Optional[str] = None,
+    ) -> subprocess.CompletedProcess:
+        return telemetry.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=check,
+            cwd=cwd or self.repo_path,
+            timeout=self.manager.timeout,
+            input=input,
+        )
+
+    def _state(self, onto_sha: str, branches: list[str]) -> ForwardState:
+        if self.state_dir is None:
+            return ForwardState(None)
+        key = hashlib.sha1("\0".join([onto_sha, *branches]).encode()).hexdigest()
+        return ForwardState(self.state_dir / f"{key}.json")
+
+    def forward(
+        self,
+        branches: Iterable[str],
+        onto: Optional[str] = None,
+        resume: bool = True,
+    ) -> list[ForwardResult]:
+        """Bring ``branches`` up to date with ``onto``.
+
+        Args:
+            branches: Local branch names
+            onto: Base revision (default: the default branch)
+            resume: Reuse results of an interrupted run with the same branches
+                and base, for branches that have not moved since
+
+        Returns:
+            One ForwardResult per branch, in the order given
+
+        Raises:
+            ValueError: If ``onto`` does not resolve to a commit reachable from a ref
+        """
+        branches = list(dict.fromkeys(branches))
+        onto = onto or self.manager.get_default_branch()
+        onto_sha = self.manager.session.resolve(f"{onto}^{{commit}}")
+        if onto_sha is None:
+            raise ValueError(f"Unknown revision: {onto}")
+        graph = self.manager.commit_graph()
+        if onto_sha not in graph:
+            raise ValueError(f"Revision is not reachable from any ref: {onto}")
+
+        tips = self.manager.session.resolve_many(f"refs/heads/{b}" for b in branches)
+        state = self._state(onto_sha, branches)
+        if not resume:
+            state.results.clear()
+        checked_out = {
+            wt.branch: wt.path
+            for wt in parse_worktree_list(self._git("worktree", "list", "--porcelain", "-z").stdout)
+            if wt.branch is not None
+        }
+
+        results: dict[str, ForwardResult] = {}
+        fast_forwards: list[tuple[str, str]] = []
+        diverged: list[tuple[str, str]] = []
+        for branch in branches:
+            tip = tips[f"refs/heads/{branch}"]
+            previous = state.resumable(branch, tip)
+            if previous is not None:
+                results[branch] = previous
+            elif tip is None or tip not in graph:
+                results[branch] = ForwardResult(branch, "error", error=f"Unknown branch: {branch}")
+            elif graph.is_ancestor(onto_sha, tip):
+                results[branch] = ForwardResult(branch, "up_to_date", tip, tip)
+            elif branch in checked_out:
+                results[branch] = ForwardResult(
+                    branch, "skipped", tip, tip,
+                    error=f"Checked out at {checked_out[branch]}",
+                )
+            elif graph.is_ancestor(tip, onto_sha):
+                fast_forwards.append((branch, tip))
+            else:
+                diverged.append((branch, tip))
+        state.record(*(result for result in results.values() if not result.resumed))
+
+        for result in self._fast_forward(fast_forwards, onto_sha):
+            results[result.branch] = result
+        state.record(*(results[branch] for branch, _ in fast_forwards))
+
+        if diverged:
+            self.pool.reclaim()
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            try:
+                futures: list[Future[ForwardResult]] = [
+                    executor.submit(self._rebase, branch, tip, onto_sha) for branch, tip in diverged
+                ]
+                for future in as_completed(futures):
+                    result = future.result()
+                    results[result.branch] = result
+                    state.record(result)
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+            executor.shutdown(wait=True)
+
+        state.discard()
+        if any(result.changed for result in results.values()):
+            self.manager.invalidate_branch_cache()
+        return [results[branch] for branch in branches]
+
+    def _fast_forward(
+        self, branches: list[tuple[str, str]], onto_sha: str,
+    ) -> list[ForwardResult]:
+        """Move fast-forwardable refs in one transaction, one by one if that fails."""
+        if not branches:
+            return []
+        start = time.perf_counter()
+        transaction = "".join(
+            f"update refs/heads/{branch}\0{onto_sha}\0{tip}\0" for branch, tip in branches
+        )
+        proc = self._git("update-ref", "-z", "--stdin", input=transaction, check=False)
+        if proc.returncode == 0:
+            duration = (time.perf_counter() - start) / len(branches)
+            return [
+                ForwardResult(branch, "fast_forward", tip, onto_sha, duration=duration)
+                for branch, tip in branches
+            ]
+
+        # A ref moved underneath us; apply the others individually
+        results = []
+        for branch, tip in branches:
+            start = time.perf_counter()
+            proc = self._git(
+                "update-ref", f"refs/heads/{branch}", onto_sha, tip, check=False,
+            )
+            duration = time.perf_counter() - start
+            if proc.returncode == 0:
+                results.append(ForwardResult(branch, "fast_forward", tip, onto_sha,
+                                             duration=duration))
+            else:
+                results.append(ForwardResult(branch, "error", tip, error=proc.stderr.strip(),
+                                             duration=duration))
+        return results
+
+    def _rebase(self, branch: str, tip: str, onto_sha: str) -> ForwardResult:
+        """Test-merge a diverged branch and rebase it in a pooled worktree if clean."""
+        start = time.perf_counter()
+
+        def finish(status: str, new_sha: Optional[str] = None, **kwargs: Any) -> ForwardResult:
+            return ForwardResult(
+                branch, status, tip, new_sha, duration=time.perf_counter() - start, **kwargs,
+            )
+
+        proc = self._git(*merge_tree_args(onto_sha, tip), check=False)
+        if proc.returncode == 1:
+            return finish("conflict", conflicts=parse_merge_tree(proc.stdout)[1])
+        if proc.returncode != 0:
+            return finish("error", error=proc.stderr.strip())
+
+        try:
+            lease = self.pool.acquire(branch)
+        except ValueError as error:
+            return finish("skipped", tip, error=str(error))
+        except subprocess.CalledProcessError as error:
+            return finish("error", error=(error.stderr or str(error)).strip())
+
+        try:
+            head = self._git("rev-parse", "HEAD", cwd=lease.path).stdout.strip()
+            if head != tip:
+                return finish("error", error=f"Branch moved during forwarding (now {head})")
+            proc = self._git("rebase", "-q", onto_sha, cwd=lease.path, check=False)
+            if proc.returncode != 0:
+                # merge-tree checks the combined result; replaying commit by
+                # commit can still stop on an intermediate conflict
+                unmerged = self._git(
+                    "-c", "core.quotePath=false", "diff", "--name-only", "-z",
+                    "--diff-filter=U", cwd=lease.path, check=False,
+                ).stdout
+                self._git("rebase", "--abort", cwd=lease.path, check=False)
+                conflicts = [path for path in unmerged.split("\0") if path]
+                if not conflicts:
+                    return finish("error", error=proc.stderr.strip())
+                return finish("conflict", conflicts=conflicts)
+            new_sha = self._git("rev-parse", "HEAD", cwd=lease.path).stdout.strip()
+            return finish("rebased", new_sha)
+        except subprocess.CalledProcessError as error:
+            return finish("error", error=(error.stderr or str(error)).strip())
+        finally:
+            lease.release()
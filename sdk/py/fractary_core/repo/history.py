@@ -0,0 +1,335 @@
+"""
+Commit history - Streaming ``git log`` reader.
+
+``git log -z`` output is parsed incrementally as it arrives, so histories of
+any size can be walked in constant memory. Fields are separated with ASCII
+unit separators and records are NUL-terminated, so subjects and paths may
+contain ``|``, tabs or newlines without breaking the parser.
+"""
+
+from __future__ import annotations
+
+import codecs
+import subprocess
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+from fractary_core.common import telemetry
+
+# Each record starts with a record separator so headers can be told apart
+# from --numstat path entries, which are NUL-terminated as well.
+_RECORD_START = "\x1e"
+_FIELD_SEP = "\x1f"
+COMMIT_LOG_FORMAT = _RECORD_START + _FIELD_SEP.join([
+    "%H",   # sha
+    "%s",   # subject
+    "%an",  # author name
+    "%ai",  # author date
+    "%ae",  # author email
+    "%P",   # parent shas
+])
+
+_READ_SIZE = 64 * 1024
+
+
+@dataclass(slots=True)
+class FileStat:
+    """Per-file line counts from ``--numstat``."""
+
+    path: str
+    additions: Optional[int]
+    deletions: Optional[int]
+    old_path: Optional[str] = None
+
+    @property
+    def binary(self) -> bool:
+        """True for binary files, which git reports without line counts."""
+        return self.additions is None
+
+
+@dataclass(slots=True)
+class Commit:
+    """Represents a Git commit."""
+
+    sha: str
+    message: str
+    author: str
+    date: str
+    author_email: Optional[str] = None
+    parents: tuple[str, ...] = ()
+    files: Optional[list[FileStat]] = None
+
+
+@dataclass(slots=True)
+class FileRevision:
+    """A commit in a file's history and the file's path at that commit.
+
+    ``old_path`` is set on the commit that renamed the file from it.
+    """
+
+    commit: Commit
+    path: str
+    old_path: Optional[str] = None
+
+
+class CommitLogParser:
+    """Incremental parser for ``git log -z --format=COMMIT_LOG_FORMAT``.
+
+    Feed decoded text in arbitrary chunks; completed commits are returned as
+    soon as the following record begins (or on ``close``).
+    """
+
+    def __init__(self, stats: bool = False) -> None:
+        self.stats = stats
+        self._buffer = ""
+        self._current: Optional[Commit] = None
+        self._rename: Optional[list[str]] = None
+
+    def feed(self, text: str) -> list[Commit]:
+        """Consume a chunk of output and return the commits it completed."""
+        tokens = (self._buffer + text).split("\0")
+        self._buffer = tokens.pop()
+        done: list[Commit] = []
+        for token in tokens:
+            self._token(token, done)
+        return done
+
+    def close(self) -> list[Commit]:
+        """Flush the final commit once the output has ended."""
+        done: list[Commit] = []
+        if self._buffer:
+            self._token(self._buffer, done)
+            self._buffer = ""
+        if self._current is not None:
+            done.append(self._current)
+            self._current = None
+        return done
+
+    def _token(self, token: str, done: list[Commit]) -> None:
+        if self._rename is not None:
+            # Rename entries span three tokens: counts, old path, new path
+            self._rename.append(token)
+            if len(self._rename) == 4:
+                added, deleted, old_path, new_path = self._rename
+                self._rename = None
+                self._add_stat(added, deleted, new_path, old_path)
+            return
+
+        if token.startswith(_RECORD_START):
+            if self._current is not None:
+                done.append(self._current)
+            self._current = _parse_header(token[1:], self.stats)
+            return
+
+        # The first --numstat entry follows the header after a newline
+        token = token.lstrip("\n")
+        if not token or self._current is None:
+            return
+        added, _, rest = token.partition("\t")
+        deleted, tab, path = rest.partition("\t")
+        if not tab:
+            return
+        if path:
+            self._add_stat(added, deleted, path)
+        else:
+            self._rename = [added, deleted]
+
+    def _add_stat(
+        self,
+        added: str,
+        deleted: str,
+        path: str,
+        old_path: Optional[str] = None,
+    ) -> None:
+        assert self._current is not None
+        if self._current.files is None:
+            self._current.files = []
+        self._current.files.append(FileStat(
+            path=path,
+            additions=int(added) if added.isdigit() else None,
+            deletions=int(deleted) if deleted.isdigit() else None,
+            old_path=old_path,
+        ))
+
+
+def _parse_header(record: str, stats: bool) -> Commit:
+    sha, subject, author, date, email, parents = record.split(_FIELD_SEP)
+    return Commit(
+        sha=sha,
+        message=subject,
+        author=author,
+        date=date,
+        author_email=email,
+        parents=tuple(parents.split()),
+        files=[] if stats else None,
+    )
+
+
+def parse_commit_object(sha: str, data: bytes) -> Commit:
+    """Build a Commit from a raw commit object as printed by ``cat-file``.
+
+    Fields match ``parse_commit_log``: ``message`` is the subject (the first
+    paragraph joined onto one line, like ``%s``) and ``date`` the author date
+    in ``%ai`` form.
+    """
+    header, _, body = data.decode("utf-8", errors="replace").partition("\n\n")
+    parents = []
+    author = email = date = ""
+    for line in header.split("\n"):
+        key, _, value = line.partition(" ")
+        if key == "parent":
+            parents.append(value)
+        elif key == "author":
+            ident, _, stamp = value.rpartition("> ")
+            author, _, email = ident.partition(" <")
+            date = format_git_date(stamp)
+    return Commit(
+        sha=sha,
+        message=message_subject(body),
+        author=author,
+        date=date,
+        author_email=email,
+        parents=tuple(parents),
+    )
+
+
+def message_subject(message: str) -> str:
+    """Return the subject of a commit or tag message, as ``%s`` prints it.
+
+    The subject is the first paragraph, joined onto one line.
+    """
+    paragraph = message.lstrip("\n").split("\n\n", 1)[0]
+    return " ".join(line.strip() for line in paragraph.split("\n")).strip()
+
+
+def format_git_date(stamp: str) -> str:
+    """Format a raw ``<epoch> <+hhmm>`` timestamp like ``%ai``."""
+    seconds, _, offset = stamp.partition(" ")
+    try:
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        tz = timezone(timedelta(minutes=-minutes if offset.startswith("-") else minutes))
+        return datetime.fromtimestamp(int(seconds), tz).strftime("%Y-%m-%d %H:%M:%S %z")
+    except ValueError:
+        return stamp
+
+
+def parse_commit_log(output: str, stats: bool = False) -> list[Commit]:
+    """Parse complete ``git log -z --format=COMMIT_LOG_FORMAT`` output."""
+    parser = CommitLogParser(stats)
+    return parser.feed(output) + parser.close()
+
+
+def commit_log_args(
+    revs: Optional[str | Sequence[str]] = None,
+    paths: Optional[Sequence[str]] = None,
+    author: Optional[str] = None,
+    since_date: Optional[str] = None,
+    until_date: Optional[str] = None,
+    max_count: Optional[int] = None,
+    stats: bool = False,
+    first_parent: bool = False,
+    follow: bool = False,
+) -> list[str]:
+    """Build ``git log`` arguments whose output ``CommitLogParser`` understands.
+
+    ``follow`` tracks a single path across renames (``git log --follow``).
+    """
+    args = ["log", "-z", f"--format={COMMIT_LOG_FORMAT}"]
+    if max_count is not None:
+        args.append(f"--max-count={max_count}")
+    if author:
+        args.append(f"--author={author}")
+    if since_date:
+        args.append(f"--since={since_date}")
+    if until_date:
+        args.append(f"--until={until_date}")
+    if first_parent:
+        args.append("--first-parent")
+    if stats:
+        args.extend(["--numstat", "-M"])
+    if follow:
+        args.append("--follow")
+    if isinstance(revs, str):
+        args.append(revs)
+    elif revs:
+        args.extend(revs)
+    args.append("--")
+    if paths:
+        args.extend(paths)
+    return args
+
+
+def stream_commit_log(
+    args: list[str],
+    cwd: Optional[str | Path] = None,
+    stats: bool = False,
+    timeout: Optional[float] = None,
+) -> Iterator[Commit]:
+    """Run ``git`` with ``args`` and yield commits as its output arrives.
+
+    Closing the iterator early terminates the ``git log`` process. The
+    ``timeout`` covers the whole run, including time the caller spends
+    between commits.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+        subprocess.TimeoutExpired: If git is still running after ``timeout``
+            seconds; it is killed
+    """
+    start = time.perf_counter()
+    # stderr is only read once git has exited, so it goes to a file: a pipe
+    # could fill up with warnings and block git
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            ["git"] + args,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            cwd=cwd,
+        )
+        assert proc.stdout is not None
+        expired = threading.Event()
+
+        def expire() -> None:
+            if proc.poll() is None:
+                expired.set()
+                proc.kill()
+
+        timer = threading.Timer(timeout, expire) if timeout is not None else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        parser = CommitLogParser(stats)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        output_bytes = 0
+        finished = False
+        try:
+            while chunk := proc.stdout.read1(_READ_SIZE):
+                output_bytes += len(chunk)
+                yield from parser.feed(decoder.decode(chunk))
+            if not expired.is_set():
+                # A killed git may have stopped mid-record
+                yield from parser.feed(decoder.decode(b"", final=True))
+                yield from parser.close()
+            finished = True
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if not finished and proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+            exit_code = "timeout" if expired.is_set() else proc.returncode
+            telemetry.record(proc.args, time.perf_counter() - start, exit_code, output_bytes)
+
+        if expired.is_set():
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        if proc.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors="replace")
+            raise subprocess.CalledProcessError(proc.returncode, proc.args, None, stderr)
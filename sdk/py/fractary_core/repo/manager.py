@@ -7,15 +7,72 @@ platform-specific features like PRs.
 
 from __future__ import annotations
 
+import fnmatch
+import hashlib
+import heapq
+import itertools
+import json
 import os
-import re
 import subprocess
+import tempfile
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
 import yaml
 
+from fractary_core.common import telemetry
+from fractary_core.common.config import atomic_write, get_cache_dir
+from fractary_core.repo.blame import (
+    BlameHunk,
+    BlameLine,
+    blame_args,
+    blame_lines,
+    hunks_from_dict,
+    hunks_to_dict,
+    stream_blame,
+)
+from fractary_core.repo.clone_cache import CloneCache
+from fractary_core.repo.commit_graph import CommitGraph
+from fractary_core.repo.diff import (
+    ChangedFile,
+    FileDiff,
+    diff_args,
+    run_raw_diff,
+    stream_patch,
+)
+from fractary_core.repo.environments import EnvironmentIndex
+from fractary_core.repo.history import (
+    Commit,
+    FileRevision,
+    commit_log_args,
+    format_git_date,
+    message_subject,
+    parse_commit_log,
+    parse_commit_object,
+    stream_commit_log,
+)
+from fractary_core.repo.naming import BranchNamer, BranchSpec, branch_name_error
+from fractary_core.repo.refs import RefReader, UnsupportedRepository, locate_git_dirs
+from fractary_core.repo.session import GitQuerySession, RefRecord
+from fractary_core.repo.status import RepoStatus, parse_status, status_args
+from fractary_core.repo.tags import (
+    Tag,
+    TagSpec,
+    stream_tags,
+    tag_listing_args,
+    tag_object,
+    tag_sort_key,
+)
+
+if TYPE_CHECKING:
+    from fractary_core.repo.forward import ForwardResult
+    from fractary_core.repo.providers.base import PRProvider
+    from fractary_core.repo.worktree import WorktreePool
+
 
 @dataclass
 class Branch:
@@ -29,13 +86,14 @@ class Branch:
 
 
 @dataclass
-class Commit:
-    """Represents a Git commit."""
+class BranchSnapshot:
+    """Point-in-time view of branch refs shared by branch queries."""
 
-    sha: str
-    message: str
-    author: str
-    date: str
+    refs: list[RefRecord]
+    current: str
+    default: str
+    taken_at: float
+    key: Optional[tuple[Any, ...]] = None
 
 
 @dataclass
@@ -51,6 +109,56 @@ class PullRequest:
     url: str
     draft: bool = False
     raw: dict[str, Any] = field(default_factory=dict)
+    head_repo: Optional[str] = None  # "owner/name" of the head branch's repository, if known
+
+
+BRANCH_REF_PATTERNS = ("refs/heads", "refs/remotes/origin/HEAD")
+
+def _build_commit_message(
+    message: str,
+    commit_type: str,
+    scope: Optional[str],
+    work_id: Optional[str],
+    breaking: bool,
+    body: Optional[str],
+) -> str:
+    """Build a conventional commit message."""
+    prefix = commit_type
+    if scope:
+        prefix = f"{commit_type}({scope})"
+    if breaking:
+        prefix = f"{prefix}!"
+
+    full_message = f"{prefix}: {message}"
+
+    if body:
+        full_message += f"\n\n{body}"
+
+    if work_id:
+        full_message += f"\n\nRefs: #{work_id}"
+
+    return full_message
+
+
+def _branches_from_snapshot(snapshot: BranchSnapshot, pattern: Optional[str]) -> list[Branch]:
+    """Build the list_branches result from a snapshot."""
+    branches = []
+    for ref in snapshot.refs:
+        if not ref.name.startswith("refs/heads/"):
+            continue
+        name = ref.short_name
+        if pattern and not fnmatch.fnmatchcase(name, pattern):
+            continue
+
+        branches.append(Branch(
+            name=name,
+            sha=ref.short_sha,
+            is_default=(name == snapshot.default),
+            upstream=ref.upstream,
+            is_current=ref.is_head,
+        ))
+
+    return branches
 
 
 class RepoManager:
@@ -58,12 +166,126 @@ class RepoManager:
 
     Provides Git operations and platform-specific features (PRs)
     without any LangChain dependencies.
+
+    Set ``ref_reader: true`` in the repo config to answer branch queries by
+    reading refs from disk instead of spawning git; repositories the reader
+    does not understand fall back to git transparently.
+
+    Branch state (refs, current and default branch) is read once per logical
+    operation: inside ``with repo.operation():`` it is computed at most once,
+    and outside a scope it is cached for ``branch_cache_ttl`` seconds
+    (default 1.0, 0 disables) as long as HEAD, the ref directories and the
+    repo config are unchanged on disk.
+
+    ``status()`` results are likewise cached for ``status_cache_ttl`` seconds
+    (default 1.0, 0 disables) while the index and HEAD are unchanged. Set
+    ``untracked_cache: true`` and/or ``fsmonitor: true`` (or a hook path) to
+    have the manager enable git's untracked cache and file system monitor on
+    the repository the first time status is read.
     """
 
-    def __init__(self, config: Optional[dict[str, Any]] = None) -> None:
-        """Initialize RepoManager with optional config."""
+    def __init__(
+        self,
+        config: Optional[dict[str, Any]] = None,
+        repo_path: Optional[str | Path] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize RepoManager with optional config.
+
+        Args:
+            config: Repo configuration dict. If None, loads from .fractary/core/config.yaml
+            repo_path: Repository working directory (default: current directory)
+            timeout: Per-command timeout in seconds for git calls (None = no limit)
+        """
         self.config = config or self._load_config()
-        self._provider = None
+        self.repo_path = Path(repo_path) if repo_path is not None else None
+        self.timeout = timeout
+        self._provider: Optional[PRProvider] = None
+        self._session: Optional[GitQuerySession] = None
+        self._ref_reader: Optional[RefReader] = None
+        self._use_ref_reader = bool(self.config.get("ref_reader", False))
+        self._snapshot: Optional[BranchSnapshot] = None
+        self._operation_depth = 0
+        self._git_dirs: Optional[tuple[Path, Path]] = None
+        self._toplevel: Optional[Path] = None
+        self._status: Optional[tuple[tuple[Any, ...], float, RepoStatus]] = None
+        self._fast_status_checked = False
+        self._commit_graph: Optional[CommitGraph] = None
+        self._branch_namer: Optional[BranchNamer] = None
+        self._environment_index: Optional[tuple[dict[str, Any], EnvironmentIndex]] = None
+
+    @classmethod
+    def clone(
+        cls,
+        url: str,
+        dest: str | Path,
+        config: Optional[dict[str, Any]] = None,
+        mode: str = "reference",
+        branch: Optional[str] = None,
+        sparse: Optional[list[str]] = None,
+        cache: Optional[CloneCache] = None,
+        timeout: Optional[float] = None,
+    ) -> RepoManager:
+        """Clone ``url`` into ``dest`` through the shared clone cache.
+
+        The remote is mirrored once under ``clone_cache_dir`` (repo config,
+        default ``~/.fractary/cache/clones``) and refreshed incrementally; the
+        working copy is created from the local mirror. Mirrors fetched less
+        than ``clone_cache_refresh_interval`` seconds ago are not refreshed.
+
+        Args:
+            url: Remote URL
+            dest: Target directory
+            config: Repo configuration for the returned manager
+            mode: ``reference``, ``partial`` or ``full`` (see CloneCache.clone)
+            branch: Branch to check out (default: the remote's HEAD)
+            sparse: Directories for a cone-mode sparse checkout
+            cache: CloneCache to use instead of one built from config
+            timeout: Per-command timeout in seconds for git calls
+
+        Returns:
+            RepoManager for the new working copy
+        """
+        manager = cls(config, repo_path=dest, timeout=timeout)
+        if cache is None:
+            cache = CloneCache(
+                manager.config.get("clone_cache_dir"),
+                refresh_interval=float(manager.config.get("clone_cache_refresh_interval", 0)),
+                timeout=timeout,
+            )
+        cache.clone(url, dest, mode=mode, branch=branch, sparse=sparse)
+        return manager
+
+    def __enter__(self) -> RepoManager:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @property
+    def session(self) -> GitQuerySession:
+        """Lazy-load the persistent git query session."""
+        if self._session is None:
+            self._session = GitQuerySession(self.repo_path)
+        return self._session
+
+    def _reader(self) -> Optional[RefReader]:
+        """Return the in-process ref reader, or None if disabled or unsupported."""
+        if self._use_ref_reader and self._ref_reader is None:
+            try:
+                self._ref_reader = RefReader(self.repo_path)
+            except UnsupportedRepository:
+                self._use_ref_reader = False
+        return self._ref_reader
+
+    def close(self) -> None:
+        """Shut down long-lived git processes held by this manager."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        if self._provider is not None:
+            self._provider.close()
+            self._provider = None
 
     def _load_config(self) -> dict[str, Any]:
         """Load configuration from .fractary/core/config.yaml."""
@@ -98,14 +320,147 @@ class RepoManager:
             },
         }
 
-    def _run_git(self, args: list[str], check: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command."""
-        return subprocess.run(
+    def _run_git(
+        self,
+        args: list[str],
+        check: bool = True,
+        input: Optional[str] = None,
+    ) -> subprocess.CompletedProcess:
+        """Run a git command.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command outlives ``self.timeout``
+        """
+        return telemetry.run(
             ["git"] + args,
             capture_output=True,
             text=True,
             check=check,
+            cwd=self.repo_path,
+            timeout=self.timeout,
+            input=input,
+        )
+
+    def _read_branch_refs(self) -> list[RefRecord]:
+        """Read local branches and the remote HEAD with a single for-each-ref."""
+        reader = self._reader()
+        if reader is not None:
+            try:
+                return reader.branch_records()
+            except UnsupportedRepository:
+                pass
+        return self.session.read_refs(BRANCH_REF_PATTERNS)
+
+    def _locate_git_dirs(self) -> Optional[tuple[Path, Path]]:
+        """Return (git_dir, common_dir), or None if they cannot be determined."""
+        if self._git_dirs is None:
+            try:
+                self._git_dirs = locate_git_dirs(Path(self.repo_path or os.getcwd()).resolve())
+            except (UnsupportedRepository, OSError):
+                return None
+        return self._git_dirs
+
+    @staticmethod
+    def _stat_signature(paths: list[Path]) -> tuple[Any, ...]:
+        signature = []
+        for path in paths:
+            try:
+                st = path.stat()
+                signature.append((st.st_ino, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _refs_signature(self) -> Optional[tuple[Any, ...]]:
+        """Stat signature of the files that branch state is derived from."""
+        dirs = self._locate_git_dirs()
+        if dirs is None:
+            return None
+        git_dir, common_dir = dirs
+        paths = [git_dir / "HEAD", common_dir / "packed-refs", common_dir / "config"]
+        # Every loose ref and directory: updating ``feat/x`` only touches
+        # ``refs/heads/feat``, not ``refs/heads`` itself
+        for root in (common_dir / "refs" / "heads", common_dir / "refs" / "remotes" / "origin"):
+            paths.append(root)
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames.sort()
+                base = Path(dirpath)
+                paths.extend(base / name for name in dirnames)
+                paths.extend(base / name for name in sorted(filenames))
+        return self._stat_signature(paths)
+
+    def _branch_snapshot(self) -> BranchSnapshot:
+        """Return branch state, reusing the scoped or cached snapshot when valid."""
+        snapshot = self._snapshot
+        if snapshot is not None and self._operation_depth:
+            return snapshot
+
+        ttl = float(self.config.get("branch_cache_ttl", 1.0))
+        key = self._refs_signature() if ttl > 0 else None
+        now = time.monotonic()
+        if (snapshot is not None and key is not None and snapshot.key == key
+                and now - snapshot.taken_at < ttl):
+            return snapshot
+
+        refs = self._read_branch_refs()
+        self._snapshot = BranchSnapshot(
+            refs=refs,
+            current=next((ref.short_name for ref in refs if ref.is_head), ""),
+            default=self._default_branch_from_refs(refs),
+            taken_at=now,
+            key=key,
         )
+        return self._snapshot
+
+    def invalidate_branch_cache(self) -> None:
+        """Drop cached branch state; called after operations that move refs."""
+        self._snapshot = None
+
+    @contextmanager
+    def operation(self) -> Iterator[BranchSnapshot]:
+        """Scope in which current/default branch and refs are read only once.
+
+        Operations inside the scope that move refs (checkout, branch creation
+        or deletion, commit, fetch, pull, push) still invalidate the snapshot.
+
+        Example:
+            with repo.operation():
+                for name in names:
+                    repo.get_branch(name)
+        """
+        snapshot = self._branch_snapshot()
+        self._operation_depth += 1
+        try:
+            yield snapshot
+        finally:
+            self._operation_depth -= 1
+
+    def _default_branch_from_refs(self, refs: list[RefRecord]) -> str:
+        """Resolve the default branch from an already-read ref listing."""
+        # Resolve from environments config if available
+        environments = self.config.get("environments")
+        default_env = self.config.get("default_environment")
+        if environments and default_env and default_env in environments:
+            env_config = environments[default_env]
+            if isinstance(env_config, dict) and env_config.get("branch"):
+                return env_config["branch"]
+
+        # Try the remote HEAD symbolic ref
+        local_branches = set()
+        for ref in refs:
+            if ref.name == "refs/remotes/origin/HEAD":
+                if ref.symref:
+                    return ref.symref.removeprefix("refs/remotes/").replace("origin/", "")
+            else:
+                local_branches.add(ref.short_name)
+
+        # Fallback to config or common defaults
+        default = self.config.get("default_branch", "main")
+        if default in local_branches:
+            return default
+        if "master" in local_branches:
+            return "master"
+        return "main"
 
     # =========================================================================
     # Branch Operations
@@ -113,6 +468,17 @@ class RepoManager:
 
     def get_current_branch(self) -> str:
         """Get the current branch name."""
+        current = self._branch_snapshot().current
+        if current:
+            return current
+
+        # Detached or unborn HEAD: ask directly
+        reader = self._reader()
+        if reader is not None:
+            try:
+                return reader.current_branch()
+            except UnsupportedRepository:
+                pass
         result = self._run_git(["branch", "--show-current"])
         return result.stdout.strip()
 
@@ -124,33 +490,24 @@ class RepoManager:
         2. Try remote HEAD symbolic ref
         3. Fall back to config default_branch or 'main'
         """
-        # Resolve from environments config if available
-        environments = self.config.get("environments")
-        default_env = self.config.get("default_environment")
-        if environments and default_env and default_env in environments:
-            env_config = environments[default_env]
-            if isinstance(env_config, dict) and env_config.get("branch"):
-                return env_config["branch"]
+        return self._branch_snapshot().default
 
-        # Try to get from remote
-        result = self._run_git(
-            ["symbolic-ref", "refs/remotes/origin/HEAD", "--short"],
-            check=False,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip().replace("origin/", "")
+    @property
+    def environment_index(self) -> EnvironmentIndex:
+        """Compiled lookup index over ``config["environments"]``.
 
-        # Fallback to config or common defaults
-        default = self.config.get("default_branch", "main")
-        result = self._run_git(["branch", "--list", default], check=False)
-        if result.stdout.strip():
-            return default
-
-        result = self._run_git(["branch", "--list", "master"], check=False)
-        if result.stdout.strip():
-            return "master"
+        Rebuilt when a different ``environments`` mapping is assigned to the
+        config; call ``invalidate_environment_index()`` after editing the
+        mapping in place.
+        """
+        environments = self.config.get("environments") or {}
+        if self._environment_index is None or self._environment_index[0] is not environments:
+            self._environment_index = (environments, EnvironmentIndex(environments))
+        return self._environment_index[1]
 
-        return "main"
+    def invalidate_environment_index(self) -> None:
+        """Drop the compiled environment index."""
+        self._environment_index = None
 
     def get_branch_for_environment(self, env_id: str) -> Optional[str]:
         """Get the branch name for a specific environment.
@@ -159,34 +516,30 @@ class RepoManager:
             env_id: Environment identifier (e.g., "production", "test", "staging")
 
         Returns:
-            Branch name or None if environment is not configured
+            Branch name (or glob pattern) or None if environment is not configured
         """
-        environments = self.config.get("environments", {})
-        env_config = environments.get(env_id)
-        if isinstance(env_config, dict):
-            return env_config.get("branch")
-        return None
+        return self.environment_index.branch_for(env_id)
 
     def get_environment_for_branch(self, branch_name: str) -> Optional[str]:
         """Get the environment ID for a given branch name.
 
+        Environment branches may be exact names or glob patterns such as
+        ``release/*``; exact names take precedence.
+
         Args:
             branch_name: The branch name to look up
 
         Returns:
             Environment ID (e.g., "production") or None
         """
-        environments = self.config.get("environments", {})
-        for env_id, env_config in environments.items():
-            if isinstance(env_config, dict) and env_config.get("branch") == branch_name:
-                return env_id
-        return None
+        return self.environment_index.environment_for(branch_name)
 
     def is_protected_branch(self, branch_name: str) -> bool:
         """Check if a branch is protected.
 
-        Uses environment configuration if available, otherwise falls back
-        to checking common protected branch names.
+        Uses environment configuration if available (branch names or glob
+        patterns), otherwise falls back to checking common protected branch
+        names.
 
         Args:
             branch_name: The branch name to check
@@ -194,74 +547,47 @@ class RepoManager:
         Returns:
             True if the branch is protected
         """
-        environments = self.config.get("environments")
-        if environments:
-            for env_config in environments.values():
-                if (isinstance(env_config, dict)
-                        and env_config.get("branch") == branch_name
-                        and env_config.get("protected") is True):
-                    return True
-            return False
+        if self.config.get("environments"):
+            return self.environment_index.is_protected(branch_name)
 
         # Fallback: common protected branch names
         return branch_name in ("main", "master", "develop", "production", "staging")
 
     def get_branch(self, name: str) -> Branch:
-        """Get branch details."""
-        result = self._run_git(["rev-parse", name])
-        sha = result.stdout.strip()
-
-        # Check if it's the current branch
-        current = self.get_current_branch()
-        is_current = name == current
-
-        # Check upstream
-        upstream_result = self._run_git(
-            ["rev-parse", "--abbrev-ref", f"{name}@{{upstream}}"],
-            check=False,
-        )
-        upstream = upstream_result.stdout.strip() if upstream_result.returncode == 0 else None
+        """Get branch details.
 
-        # Check if default
-        default_branch = self.get_default_branch()
-        is_default = name == default_branch
+        The sha is resolved through the persistent query session and the
+        current/upstream/default details come from a single ref listing.
+        """
+        sha = None
+        reader = self._reader()
+        if reader is not None:
+            try:
+                sha = reader.resolve(name)
+            except UnsupportedRepository:
+                pass
+        if sha is None:
+            sha = self.session.resolve(name)
+        if sha is None:
+            # Let git produce the authoritative error for unknown revisions
+            sha = self._run_git(["rev-parse", name]).stdout.strip()
+
+        snapshot = self._branch_snapshot()
+        branch_ref = next(
+            (ref for ref in snapshot.refs if ref.name == f"refs/heads/{name}"), None
+        )
 
         return Branch(
             name=name,
             sha=sha,
-            is_default=is_default,
-            upstream=upstream,
-            is_current=is_current,
+            is_default=(name == snapshot.default),
+            upstream=branch_ref.upstream if branch_ref else None,
+            is_current=(name == snapshot.current),
         )
 
     def list_branches(self, pattern: Optional[str] = None) -> list[Branch]:
         """List branches, optionally filtered by pattern."""
-        args = ["branch", "--format=%(refname:short)|%(objectname:short)|%(upstream:short)"]
-        if pattern:
-            args.append(pattern)
-
-        result = self._run_git(args)
-        branches = []
-        current = self.get_current_branch()
-        default = self.get_default_branch()
-
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("|")
-            name = parts[0]
-            sha = parts[1] if len(parts) > 1 else ""
-            upstream = parts[2] if len(parts) > 2 and parts[2] else None
-
-            branches.append(Branch(
-                name=name,
-                sha=sha,
-                is_default=(name == default),
-                upstream=upstream,
-                is_current=(name == current),
-            ))
-
-        return branches
+        return _branches_from_snapshot(self._branch_snapshot(), pattern)
 
     def create_branch(
         self,
@@ -283,14 +609,18 @@ class RepoManager:
 
         if checkout:
             self._run_git(["checkout", "-b", name, base])
+            self.invalidate_status_cache()
         else:
             self._run_git(["branch", name, base])
+        self.invalidate_branch_cache()
 
         return self.get_branch(name)
 
     def checkout_branch(self, name: str) -> Branch:
         """Checkout an existing branch."""
         self._run_git(["checkout", name])
+        self.invalidate_branch_cache()
+        self.invalidate_status_cache()
         return self.get_branch(name)
 
     def delete_branch(self, name: str, force: bool = False) -> bool:
@@ -305,8 +635,16 @@ class RepoManager:
         """
         flag = "-D" if force else "-d"
         self._run_git(["branch", flag, name])
+        self.invalidate_branch_cache()
         return True
 
+    @property
+    def branch_namer(self) -> BranchNamer:
+        """BranchNamer built once from this manager's config."""
+        if self._branch_namer is None:
+            self._branch_namer = BranchNamer(self.config)
+        return self._branch_namer
+
     def generate_branch_name(
         self,
         description: str,
@@ -323,19 +661,149 @@ class RepoManager:
         Returns:
             Generated branch name following conventions
         """
-        # Normalize description to slug
-        slug = description.lower()
-        slug = re.sub(r"[^a-z0-9]+", "-", slug)
-        slug = re.sub(r"-+", "-", slug).strip("-")
-        slug = slug[:50]  # Limit length
+        return self.branch_namer.generate(description, work_type, work_id)
 
-        # Get prefix from config
-        prefixes = self.config.get("branch_prefixes", {})
-        prefix = prefixes.get(work_type, "feat")
+    def generate_branch_names(
+        self,
+        specs: Iterable[BranchSpec],
+    ) -> list[str]:
+        """Generate unique branch names for many work items at once.
+
+        Names are validated against git's ref format rules and made unique
+        against the local branches and each other (see BranchNamer.generate_many).
 
-        if work_id:
-            return f"{prefix}/{work_id}-{slug}"
-        return f"{prefix}/{slug}"
+        Args:
+            specs: Descriptions or ``(description, work_type, work_id)`` tuples
+
+        Returns:
+            One branch name per spec, in order
+
+        Raises:
+            ValueError: If a generated name is not a valid branch name
+        """
+        refs = self._branch_snapshot().refs
+        existing = (ref.short_name for ref in refs if ref.name.startswith("refs/heads/"))
+        return self.branch_namer.generate_many(specs, existing)
+
+    # =========================================================================
+    # Working Tree Status
+    # =========================================================================
+
+    def _status_signature(self) -> Optional[tuple[Any, ...]]:
+        """Stat signature of the index and HEAD (including its reflog)."""
+        dirs = self._locate_git_dirs()
+        if dirs is None:
+            return None
+        git_dir, _ = dirs
+        return self._stat_signature(
+            [git_dir / "index", git_dir / "HEAD", git_dir / "logs" / "HEAD"]
+        )
+
+    def _read_status(
+        self,
+        untracked: str = "normal",
+        ignored: bool = False,
+        refresh: bool = False,
+    ) -> tuple[RepoStatus, bool]:
+        """Return (status, whether it was served from cache)."""
+        self._enable_fast_status_once()
+        ttl = float(self.config.get("status_cache_ttl", 1.0))
+        options = (untracked, ignored)
+        cached = self._status
+        if not refresh and ttl > 0 and cached is not None:
+            key, taken_at, status = cached
+            if (key[0] == options and key[1] is not None and key[1] == self._status_signature()
+                    and time.monotonic() - taken_at < ttl):
+                return status, True
+
+        result = self._run_git(status_args(untracked, ignored))
+        status = parse_status(result.stdout)
+        # Taken after the call: git status may rewrite the index while refreshing it
+        self._status = ((options, self._status_signature()), time.monotonic(), status)
+        return status, False
+
+    def status(
+        self,
+        untracked: str = "normal",
+        ignored: bool = False,
+        refresh: bool = False,
+    ) -> RepoStatus:
+        """Get the working tree status.
+
+        Parses ``git status --porcelain=v2 -z`` into typed entries. The result
+        is cached for ``status_cache_ttl`` seconds while the index and HEAD are
+        unchanged, and dropped after operations that stage, commit, check out
+        or pull. Edits to tracked files do not touch the index, so pass
+        ``refresh=True`` when a result must reflect edits made since the last
+        call.
+
+        Args:
+            untracked: Untracked file mode: ``no``, ``normal`` or ``all``
+            ignored: Also report ignored files
+            refresh: Bypass the cache
+
+        Returns:
+            RepoStatus with branch information and entries
+        """
+        return self._read_status(untracked, ignored, refresh)[0]
+
+    def invalidate_status_cache(self) -> None:
+        """Drop the cached status; called after operations that change the index."""
+        self._status = None
+
+    def enable_fast_status(
+        self,
+        untracked_cache: bool = True,
+        fsmonitor: bool | str = True,
+    ) -> dict[str, Any]:
+        """Enable git's untracked cache and file system monitor on the repository.
+
+        ``core.fsmonitor`` is only set to ``true`` where git ships a built-in
+        monitor daemon; pass a hook path (e.g. a Watchman hook) to use one
+        elsewhere. Settings already present are left untouched.
+
+        Args:
+            untracked_cache: Set ``core.untrackedCache``
+            fsmonitor: True for the built-in daemon, or a hook path
+
+        Returns:
+            Dict of the settings now in effect
+        """
+        current = self._run_git(
+            ["config", "--get-regexp", r"^core\.(untrackedcache|fsmonitor)$"], check=False
+        )
+        settings = dict(
+            line.split(" ", 1) for line in current.stdout.splitlines() if " " in line
+        )
+
+        if untracked_cache and "core.untrackedcache" not in settings:
+            self._run_git(["config", "core.untrackedCache", "true"])
+            settings["core.untrackedcache"] = "true"
+
+        if fsmonitor and "core.fsmonitor" not in settings:
+            value = fsmonitor if isinstance(fsmonitor, str) else "true"
+            if value != "true" or self._builtin_fsmonitor_supported():
+                self._run_git(["config", "core.fsmonitor", value])
+                settings["core.fsmonitor"] = value
+
+        self.invalidate_branch_cache()
+        return {
+            "untracked_cache": settings.get("core.untrackedcache"),
+            "fsmonitor": settings.get("core.fsmonitor"),
+        }
+
+    def _builtin_fsmonitor_supported(self) -> bool:
+        result = self._run_git(["fsmonitor--daemon", "status"], check=False)
+        return "not supported" not in result.stderr and "is not a git command" not in result.stderr
+
+    def _enable_fast_status_once(self) -> None:
+        if self._fast_status_checked:
+            return
+        self._fast_status_checked = True
+        untracked_cache = bool(self.config.get("untracked_cache", False))
+        fsmonitor = self.config.get("fsmonitor", False)
+        if untracked_cache or fsmonitor:
+            self.enable_fast_status(untracked_cache=untracked_cache, fsmonitor=fsmonitor)
 
     # =========================================================================
     # Commit Operations
@@ -344,10 +812,28 @@ class RepoManager:
     def stage_all(self) -> None:
         """Stage all changes."""
         self._run_git(["add", "-A"])
+        self.invalidate_status_cache()
 
     def stage_files(self, files: list[str]) -> None:
         """Stage specific files."""
-        self._run_git(["add"] + files)
+        self._stage_paths(files)
+
+    def _stage_paths(self, paths: list[str], literal: bool = False) -> None:
+        """Stage additions, modifications and removals under ``paths``.
+
+        Pathspecs are passed to ``git add -A`` on stdin, so only the named
+        paths are scanned and the command line stays short however many
+        there are. With ``literal``, the paths are exact file names relative
+        to the repository root, as ``status()`` reports them, whatever
+        directory git runs in.
+        """
+        if not paths:
+            return
+        if literal:
+            paths = [f":(top,literal){path}" for path in paths]
+        args = ["add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul"]
+        self._run_git(args, input="\0".join(paths))
+        self.invalidate_status_cache()
 
     def commit(
         self,
@@ -357,9 +843,18 @@ class RepoManager:
         work_id: Optional[str] = None,
         breaking: bool = False,
         body: Optional[str] = None,
+        paths: Optional[list[str]] = None,
     ) -> Commit:
         """Create a semantic commit.
 
+        Without ``paths``, only the paths the status reports as changed are
+        staged, instead of rescanning the whole tree with ``git add -A``. The
+        status is read afresh, except inside an ``operation()`` scope, where
+        the cached one (see ``status()``) is reused; edits made since it was
+        read are then not staged unless ``paths`` names them. The new commit
+        is read back through the query session rather than a separate
+        ``git log``.
+
         Args:
             message: Commit message (without type prefix)
             commit_type: Conventional commit type (feat, fix, chore, docs, etc.)
@@ -367,42 +862,41 @@ class RepoManager:
             work_id: Optional work item ID to reference
             breaking: Whether this is a breaking change
             body: Extended commit description
+            paths: Stage only these pathspecs (already staged changes are
+                committed as well)
 
         Returns:
             Created Commit object
         """
-        # Build conventional commit message
-        prefix = commit_type
-        if scope:
-            prefix = f"{commit_type}({scope})"
-        if breaking:
-            prefix = f"{prefix}!"
-
-        full_message = f"{prefix}: {message}"
+        full_message = _build_commit_message(message, commit_type, scope, work_id, breaking, body)
 
-        if body:
-            full_message += f"\n\n{body}"
-
-        if work_id:
-            full_message += f"\n\nRefs: #{work_id}"
-
-        # Stage if there are unstaged changes
-        status = self._run_git(["status", "--porcelain"])
-        if status.stdout.strip():
-            self.stage_all()
-
-        self._run_git(["commit", "-m", full_message])
-
-        # Get the commit we just created
-        result = self._run_git(["log", "-1", "--format=%H|%s|%an|%ai"])
-        parts = result.stdout.strip().split("|")
-
-        return Commit(
-            sha=parts[0],
-            message=parts[1],
-            author=parts[2],
-            date=parts[3],
-        )
+        if paths is not None:
+            self._stage_paths(paths)
+        else:
+            # Edits to tracked files do not touch the index the cache is keyed
+            # on, so a cached status is only trusted inside operation(), and a
+            # cached "clean" is re-checked even there.
+            status, cached = self._read_status(refresh=not self._operation_depth)
+            if status.clean and cached:
+                status, cached = self._read_status(refresh=True)
+            try:
+                self._stage_paths(status.unstaged_paths, literal=True)
+            except subprocess.CalledProcessError:
+                if not cached:
+                    raise
+                # A cached untracked file may have been removed since
+                status, _ = self._read_status(refresh=True)
+                self._stage_paths(status.unstaged_paths, literal=True)
+
+        self._run_git(["commit", "-q", "-m", full_message])
+        self.invalidate_branch_cache()
+        self.invalidate_status_cache()
+
+        head = self.session.read_object("HEAD")
+        if head is not None and head[0].type == "commit":
+            return parse_commit_object(head[0].sha, head[1])
+        result = self._run_git(commit_log_args("HEAD", max_count=1))
+        return parse_commit_log(result.stdout)[0]
 
     def get_commits(
         self,
@@ -420,28 +914,223 @@ class RepoManager:
         Returns:
             List of Commit objects
         """
-        args = ["log", f"-{limit}", "--format=%H|%s|%an|%ai"]
-
+        rev = None
         if since and until:
-            args.append(f"{since}..{until}")
+            rev = f"{since}..{until}"
         elif since:
-            args.append(since)
+            rev = since
 
-        result = self._run_git(args)
-        commits = []
+        return list(self.iter_commits(rev, max_count=limit))
 
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("|")
-            commits.append(Commit(
-                sha=parts[0],
-                message=parts[1],
-                author=parts[2],
-                date=parts[3],
-            ))
+    def iter_commits(
+        self,
+        rev: Optional[str | list[str]] = None,
+        paths: Optional[list[str]] = None,
+        author: Optional[str] = None,
+        since_date: Optional[str] = None,
+        until_date: Optional[str] = None,
+        max_count: Optional[int] = None,
+        stats: bool = False,
+        first_parent: bool = False,
+    ) -> Iterator[Commit]:
+        """Stream commit history without buffering the whole log.
+
+        Commits are parsed from ``git log -z`` as the output arrives, so large
+        histories are walked in constant memory. Stop iterating (or close the
+        iterator) to terminate the underlying ``git log``. The manager's
+        ``timeout`` bounds the whole ``git log`` run, however slowly the
+        commits are consumed.
+
+        Args:
+            rev: Revision or range (e.g. ``main``, ``v1.0..HEAD``); default HEAD
+            paths: Only commits touching these paths
+            author: Author name/email pattern (``git log --author``)
+            since_date: Only commits after this date (``git log --since``)
+            until_date: Only commits before this date (``git log --until``)
+            max_count: Maximum commits to yield
+            stats: Populate ``Commit.files`` with per-file line counts
+            first_parent: Follow only the first parent of merges
+
+        Returns:
+            Iterator of Commit objects, newest first
 
-        return commits
+        Raises:
+            subprocess.TimeoutExpired: While iterating, if ``git log`` outlives
+                the timeout
+        """
+        args = commit_log_args(
+            rev,
+            paths=paths,
+            author=author,
+            since_date=since_date,
+            until_date=until_date,
+            max_count=max_count,
+            stats=stats,
+            first_parent=first_parent,
+        )
+        return stream_commit_log(args, cwd=self.repo_path, stats=stats, timeout=self.timeout)
+
+    def file_history(
+        self,
+        path: str,
+        rev: Optional[str] = None,
+        max_count: Optional[int] = None,
+    ) -> list[FileRevision]:
+        """List the commits that changed a file, following renames.
+
+        Args:
+            path: File path (at ``rev``)
+            rev: Revision to start from (default HEAD)
+            max_count: Maximum commits to return
+
+        Returns:
+            List of FileRevision objects, newest first, each with the path
+            the file had in that commit
+        """
+        args = commit_log_args(rev, paths=[path], max_count=max_count, stats=True, follow=True)
+        revisions = []
+        current = path
+        for commit in stream_commit_log(args, cwd=self.repo_path, stats=True, timeout=self.timeout):
+            # Merges carry no stats; the file keeps the path it has in the child
+            stat = commit.files[0] if commit.files else None
+            if stat is not None:
+                current = stat.path
+            revisions.append(FileRevision(commit, current, stat.old_path if stat else None))
+            if stat is not None and stat.old_path:
+                current = stat.old_path
+        return revisions
+
+    def iter_blame(self, path: str, rev: Optional[str] = "HEAD") -> Iterator[BlameHunk]:
+        """Stream blamed line ranges from ``git blame --incremental``.
+
+        Ranges arrive in the order git settles them, not in line order.
+
+        Args:
+            path: File path
+            rev: Revision to blame, or None for the working tree file
+        """
+        return stream_blame(blame_args(path, rev), cwd=self.repo_path)
+
+    def blame(self, path: str, rev: str = "HEAD", cache: bool = True) -> list[BlameLine]:
+        """Blame every line of a file.
+
+        Results are cached in ``.fractary/cache/blame`` keyed on the blob sha
+        and path, so a file whose contents have not changed is never blamed
+        twice, across commits and across runs. Contents restored by a revert
+        keep the blame they had before; pass ``cache=False`` to recompute.
+
+        Args:
+            path: File path, relative to the repository working directory
+            rev: Revision to blame
+            cache: Read and write the blame cache
+
+        Returns:
+            One BlameLine per line, in order
+
+        Raises:
+            ValueError: If ``path`` is not a file at ``rev``
+        """
+        obj = self.session.read_object(f"{rev}:./{path}")
+        if obj is None or obj[0].type != "blob":
+            raise ValueError(f"'{path}' is not a file at '{rev}'")
+        info, content = obj
+
+        hunks: Optional[list[BlameHunk]] = None
+        cache_path = None
+        if cache:
+            key = hashlib.sha1(f"{info.sha}\0{path}".encode()).hexdigest()
+            cache_path = self._cache_root() / "blame" / key[:2] / f"{key}.json"
+            try:
+                hunks = hunks_from_dict(json.loads(cache_path.read_bytes()))
+            except (OSError, ValueError, KeyError, TypeError):
+                hunks = None
+
+        if hunks is None:
+            hunks = list(self.iter_blame(path, rev))
+            if cache_path is not None:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                atomic_write(cache_path, json.dumps(hunks_to_dict(hunks)).encode())
+        return blame_lines(hunks, content)
+
+    # =========================================================================
+    # Diff Operations
+    # =========================================================================
+
+    def changed_files(
+        self,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        paths: Optional[list[str]] = None,
+        staged: bool = False,
+        renames: bool = True,
+        copies: bool = False,
+    ) -> list[ChangedFile]:
+        """List changed files without generating any patch text.
+
+        With no revisions, unstaged changes are listed (``staged=True``: staged
+        changes). With only ``base``, the working tree is compared to it.
+
+        Args:
+            base: Base revision
+            head: Head revision
+            paths: Limit to these paths
+            staged: Compare the index instead of the working tree
+            renames: Detect renames
+            copies: Detect copies
+
+        Returns:
+            List of ChangedFile objects
+        """
+        args = diff_args(base, head, staged=staged, renames=renames, copies=copies)
+        return run_raw_diff(args, paths, cwd=self.repo_path, timeout=self.timeout)
+
+    def diff(
+        self,
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        paths: Optional[list[str]] = None,
+        staged: bool = False,
+        renames: bool = True,
+        copies: bool = False,
+        context: int = 3,
+        max_lines_per_file: Optional[int] = None,
+    ) -> Iterator[FileDiff]:
+        """Stream per-file structured diffs.
+
+        Files are yielded as soon as their patch has been read, in the order
+        of ``changed_files()``. Binary files are flagged instead of parsed;
+        files whose patch exceeds ``max_lines_per_file`` keep only the first
+        lines and are marked ``truncated`` (line counts stay exact).
+
+        Args:
+            base: Base revision
+            head: Head revision
+            paths: Limit to these paths
+            staged: Compare the index instead of the working tree
+            renames: Detect renames
+            copies: Detect copies
+            context: Lines of context around each change
+            max_lines_per_file: Cap on patch lines kept per file (None = no cap)
+
+        Returns:
+            Iterator of FileDiff objects
+
+        Raises:
+            RuntimeError: While iterating, if the files changed between listing
+                them and reading their patches
+        """
+        args = diff_args(base, head, staged=staged, renames=renames, copies=copies)
+        files = run_raw_diff(args, paths, cwd=self.repo_path, timeout=self.timeout)
+        if not files:
+            return iter(())
+        return stream_patch(
+            args,
+            files,
+            paths,
+            cwd=self.repo_path,
+            context=context,
+            max_lines=max_lines_per_file,
+        )
 
     # =========================================================================
     # Remote Operations
@@ -476,6 +1165,7 @@ class RepoManager:
             args.extend([remote, branch])
 
         self._run_git(args)
+        self.invalidate_branch_cache()
         return {"success": True, "branch": branch, "remote": remote}
 
     def pull(
@@ -501,6 +1191,8 @@ class RepoManager:
             args.append("--rebase")
 
         self._run_git(args)
+        self.invalidate_branch_cache()
+        self.invalidate_status_cache()
         return {"success": True}
 
     def fetch(self, remote: str = "origin", prune: bool = True) -> dict[str, Any]:
@@ -518,12 +1210,336 @@ class RepoManager:
             args.append("--prune")
 
         self._run_git(args)
+        self.invalidate_branch_cache()
+        self._refresh_commit_graph(only_if_cached=True)
         return {"success": True}
 
+    # =========================================================================
+    # Tag Operations
+    # =========================================================================
+
+    def iter_tags(self, pattern: Optional[str] = None) -> Iterator[Tag]:
+        """Stream tags in refname order from a single ``for-each-ref``.
+
+        Args:
+            pattern: Tag name pattern (e.g. ``v1.*``), matched like ``for-each-ref``
+        """
+        return stream_tags(tag_listing_args(pattern), cwd=self.repo_path)
+
+    def list_tags(
+        self,
+        pattern: Optional[str] = None,
+        sort: str = "version",
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> list[Tag]:
+        """List tags, ordered in-process.
+
+        ``version`` ordering follows semantic version precedence (an optional
+        ``v`` prefix is allowed), with other names first in name order. With
+        a ``limit`` only that many tags are kept while streaming, so
+        ``list_tags(descending=True, limit=10)`` finds the ten latest
+        releases without sorting every tag.
+
+        Args:
+            pattern: Tag name pattern (e.g. ``v1.*``)
+            sort: ``version``, ``name``, ``date`` or ``none`` (refname order)
+            descending: Reverse the order
+            limit: Maximum tags to return
+
+        Returns:
+            List of Tag objects
+
+        Raises:
+            ValueError: If ``sort`` is unknown
+        """
+        key = tag_sort_key(sort)
+        tags = self.iter_tags(pattern)
+        if key is None:
+            if descending:
+                # The last ``limit`` tags in refname order, kept while streaming
+                return list(deque(tags, maxlen=limit))[::-1]
+            return list(itertools.islice(tags, limit))
+        if limit is not None:
+            select = heapq.nlargest if descending else heapq.nsmallest
+            return select(limit, tags, key=key)
+        return sorted(tags, key=key, reverse=descending)
+
+    def create_tags(
+        self,
+        specs: Iterable[TagSpec | str],
+        push: bool = False,
+        remote: str = "origin",
+    ) -> list[Tag]:
+        """Create many tags in one ref transaction.
+
+        Annotated tag objects are written by a single ``git hash-object``, and
+        all refs are created by one ``git update-ref --stdin`` transaction:
+        either every tag is created or none is. With ``push``, the new tags
+        are pushed in a single ``git push``; a failed push leaves the local
+        tags in place.
+
+        Args:
+            specs: Tags to create; a plain string is a lightweight tag on HEAD
+            push: Push the new tags to ``remote``
+            remote: Remote to push to
+
+        Returns:
+            The created tags, in order. ``date`` is only set for annotated tags.
+
+        Raises:
+            ValueError: If a name is invalid or repeated, a target does not
+                resolve, or a tag already exists and ``force`` is not set
+        """
+        specs = [TagSpec(spec) if isinstance(spec, str) else spec for spec in specs]
+        if not specs:
+            return []
+        for spec in specs:
+            error = branch_name_error(spec.name)
+            if error is not None:
+                raise ValueError(f"Invalid tag name '{spec.name}': {error}")
+        repeated = [name for name, count in Counter(s.name for s in specs).items() if count > 1]
+        if repeated:
+            raise ValueError(f"Tag names given more than once: {', '.join(repeated)}")
+
+        infos = self.session.object_info(
+            [spec.target for spec in specs] + [f"refs/tags/{spec.name}" for spec in specs]
+        )
+        targets, current = infos[:len(specs)], infos[len(specs):]
+        unresolved = [spec.target for spec, info in zip(specs, targets) if info is None]
+        if unresolved:
+            raise ValueError(f"Cannot resolve tag targets: {', '.join(unresolved)}")
+        existing = [spec.name for spec, info in zip(specs, current) if info and not spec.force]
+        if existing:
+            raise ValueError(f"Tags already exist: {', '.join(existing)}")
+
+        tags = [
+            Tag(name=spec.name, sha=info.sha, target=info.sha)
+            for spec, info in zip(specs, targets) if info is not None
+        ]
+        annotated = [i for i, spec in enumerate(specs) if spec.message is not None]
+        if annotated:
+            tagger = self._run_git(["var", "GIT_COMMITTER_IDENT"]).stdout.strip()
+            ident, _, stamp = tagger.rpartition("> ")
+            name, _, email = ident.partition(" <")
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = []
+                for i in annotated:
+                    info = targets[i]
+                    assert info is not None and specs[i].message is not None
+                    path = Path(tmp) / str(i)
+                    path.write_bytes(
+                        tag_object(specs[i].name, info.sha, info.type, tagger, specs[i].message)
+                    )
+                    paths.append(f"{path}\n")
+                result = self._run_git(
+                    ["hash-object", "-t", "tag", "-w", "--stdin-paths"], input="".join(paths)
+                )
+            for i, sha in zip(annotated, result.stdout.split()):
+                tag = tags[i]
+                tag.sha = sha
+                tag.message = message_subject(specs[i].message or "")
+                tag.tagger, tag.tagger_email = name, email
+                tag.date = format_git_date(stamp)
+
+        transaction = "".join(
+            f"update refs/tags/{tag.name}\0{tag.sha}\0\0" if spec.force
+            else f"create refs/tags/{tag.name}\0{tag.sha}\0"
+            for spec, tag in zip(specs, tags)
+        )
+        self._run_git(["update-ref", "-z", "--stdin"], input=transaction)
+
+        if push:
+            self._run_git(["push", remote] + [
+                f"{'+' if spec.force else ''}refs/tags/{spec.name}" for spec in specs
+            ])
+        return tags
+
+    # =========================================================================
+    # Commit Graph
+    # =========================================================================
+
+    def _cache_root(self) -> Path:
+        """Return ``.fractary/cache`` at the top of the working tree."""
+        if self._toplevel is None:
+            result = self._run_git(["rev-parse", "--show-toplevel"])
+            self._toplevel = Path(result.stdout.strip())
+        return get_cache_dir(self._toplevel)
+
+    def _commit_graph_path(self) -> Path:
+        return self._cache_root() / "commit-graph"
+
+    def _refresh_commit_graph(self, only_if_cached: bool = False) -> CommitGraph:
+        """Load the persisted graph and append commits it has not seen."""
+        path = self._commit_graph_path()
+        if only_if_cached and self._commit_graph is None and not path.exists():
+            return CommitGraph()
+        if self._commit_graph is None:
+            self._commit_graph = CommitGraph.load(path)
+        if self._commit_graph.update(self.repo_path):
+            self._commit_graph.save(path)
+        return self._commit_graph
+
+    def commit_graph(self) -> CommitGraph:
+        """Get the commit graph index, bringing it up to date.
+
+        The graph is persisted to ``.fractary/cache/commit-graph`` and updated
+        incrementally: only commits not yet indexed are read from git. It is
+        refreshed automatically after ``fetch()`` once it exists.
+
+        Returns:
+            Up-to-date CommitGraph
+        """
+        return self._refresh_commit_graph()
+
+    def _graph_shas(self, *revs: str) -> tuple[CommitGraph, list[str]]:
+        """Resolve revisions to commit shas known to the commit graph."""
+        resolved = self.session.resolve_many(f"{rev}^{{commit}}" for rev in revs)
+        shas = []
+        for rev in revs:
+            sha = resolved[f"{rev}^{{commit}}"]
+            if sha is None:
+                raise ValueError(f"Unknown revision: {rev}")
+            shas.append(sha)
+
+        graph = self._commit_graph
+        if graph is None or any(sha not in graph for sha in shas):
+            graph = self._refresh_commit_graph()
+        for rev, sha in zip(revs, shas):
+            if sha not in graph:
+                raise ValueError(f"Revision is not reachable from any ref: {rev}")
+        return graph, shas
+
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Check whether ``ancestor`` is reachable from ``descendant``.
+
+        Args:
+            ancestor: Candidate ancestor revision
+            descendant: Descendant revision
+
+        Returns:
+            True if ancestor is an ancestor of (or equal to) descendant
+        """
+        graph, (a, d) = self._graph_shas(ancestor, descendant)
+        return graph.is_ancestor(a, d)
+
+    def merge_base(self, left: str, right: str) -> Optional[str]:
+        """Find the best common ancestor of two revisions.
+
+        Args:
+            left: First revision
+            right: Second revision
+
+        Returns:
+            Merge base sha, or None if the histories are unrelated
+        """
+        graph, (a, b) = self._graph_shas(left, right)
+        return graph.merge_base(a, b)
+
+    def ahead_behind(self, branch: str, base: Optional[str] = None) -> tuple[int, int]:
+        """Count commits a branch is ahead of and behind a base.
+
+        Args:
+            branch: Branch or revision to compare
+            base: Base revision (default: default branch)
+
+        Returns:
+            (ahead, behind) commit counts
+        """
+        base = base or self.get_default_branch()
+        graph, (head, other) = self._graph_shas(branch, base)
+        return graph.ahead_behind(head, other)
+
+    def list_range(self, base: str, head: str) -> list[str]:
+        """List commits in ``head`` but not in ``base`` (``git log base..head``).
+
+        Args:
+            base: Revision whose history is excluded
+            head: Revision whose history is listed
+
+        Returns:
+            Commit shas, newest first
+        """
+        graph, (b, h) = self._graph_shas(base, head)
+        return graph.range(b, h)
+
+    # =========================================================================
+    # Branch Forwarding
+    # =========================================================================
+
+    def forward_branches(
+        self,
+        branches: Iterable[str],
+        onto: Optional[str] = None,
+        max_workers: int = 4,
+        resume: bool = True,
+        pool: Optional[WorktreePool] = None,
+    ) -> list[ForwardResult]:
+        """Fast-forward or rebase many branches onto ``onto``.
+
+        Branches that already contain ``onto`` are left alone and
+        fast-forwardable ones are moved in one ref transaction. Diverged
+        branches are test-merged with ``git merge-tree``; clean ones are
+        rebased in pooled worktrees, ``max_workers`` at a time, and
+        conflicting ones are reported with their conflicting paths. The main
+        checkout is never touched, and branches checked out in any worktree
+        are skipped. Progress is kept under ``.fractary/cache/forward`` so a
+        rerun after an interruption reuses the results of branches that have
+        not moved since.
+
+        Args:
+            branches: Local branch names
+            onto: Base revision (default: default branch)
+            max_workers: Rebases run in parallel
+            resume: Reuse results recorded by an interrupted run
+            pool: Worktree pool for rebases (default: the repository's pool)
+
+        Returns:
+            One ForwardResult per branch, in the order given
+
+        Raises:
+            ValueError: If ``onto`` does not resolve to a commit reachable from a ref
+        """
+        from fractary_core.repo.forward import BranchForwarder
+
+        forwarder = BranchForwarder(
+            self, pool=pool, max_workers=max_workers, state_dir=self._cache_root() / "forward",
+        )
+        return forwarder.forward(branches, onto=onto, resume=resume)
+
     # =========================================================================
     # Pull Request Operations (via provider)
     # =========================================================================
 
+    @property
+    def provider(self) -> PRProvider:
+        """Lazy-load the pull request provider."""
+        if self._provider is None:
+            self._provider = self._init_provider()
+        return self._provider
+
+    def _init_provider(self) -> PRProvider:
+        """Initialize the pull request provider based on config.
+
+        ``pr_provider: gh`` (default) drives the gh CLI; ``pr_provider: http``
+        talks to the GitHub REST API over a pooled HTTP session.
+        """
+        platform = self.config.get("platform", "github").lower()
+        if platform != "github":
+            raise ValueError(f"Unsupported repo platform: {platform}")
+
+        kind = self.config.get("pr_provider", "gh").lower()
+        if kind == "gh":
+            from fractary_core.repo.providers.github import GitHubCLIProvider
+
+            return GitHubCLIProvider(self.config, cwd=self.repo_path, timeout=self.timeout)
+        elif kind == "http":
+            from fractary_core.repo.providers.github_http import GitHubHTTPProvider
+
+            return GitHubHTTPProvider(self.config, cwd=self.repo_path, timeout=self.timeout)
+        else:
+            raise ValueError(f"Unsupported PR provider: {kind}")
+
     def create_pr(
         self,
         title: str,
@@ -544,53 +1560,67 @@ class RepoManager:
         Returns:
             Created PullRequest object
         """
-        import json
-
         head = head or self.get_current_branch()
         base = base or self.get_default_branch()
+        return self.provider.create_pr(title, body, head, base, draft)
 
-        args = [
-            "gh", "pr", "create",
-            "--title", title,
-            "--body", body,
-            "--head", head,
-            "--base", base,
-        ]
-        if draft:
-            args.append("--draft")
+    def get_pr(self, number: int) -> PullRequest:
+        """Get pull request details."""
+        return self.provider.get_pr(number)
 
-        result = subprocess.run(args, capture_output=True, text=True, check=True)
+    def list_prs(
+        self,
+        state: str = "open",
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+        fields: Optional[list[str]] = None,
+        limit: Optional[int] = None,
+        raw: bool = False,
+    ) -> list[PullRequest]:
+        """List pull requests, newest first.
 
-        # Output is the PR URL
-        pr_url = result.stdout.strip()
-        pr_number = int(pr_url.split("/")[-1])
+        The gh provider pages through GitHub's GraphQL API 100 pull requests
+        per request, selecting only the GraphQL fields behind ``fields``.
 
-        return self.get_pr(pr_number)
+        Args:
+            state: ``open``, ``closed``, ``merged`` or ``all``
+            base: Only PRs targeting this branch
+            head: Only PRs from this branch
+            fields: PullRequest attributes to populate (default: all);
+                ``number`` is always included, other attributes may stay empty
+            limit: Maximum number of PRs to return (None = all)
+            raw: Keep the API payload in ``PullRequest.raw``
 
-    def get_pr(self, number: int) -> PullRequest:
-        """Get pull request details."""
-        import json
+        Returns:
+            List of PullRequest objects
 
-        result = subprocess.run(
-            ["gh", "pr", "view", str(number), "--json",
-             "number,title,body,state,headRefName,baseRefName,url,isDraft"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        data = json.loads(result.stdout)
-
-        return PullRequest(
-            number=data["number"],
-            title=data["title"],
-            body=data.get("body", "") or "",
-            state=data["state"].lower(),
-            head_branch=data["headRefName"],
-            base_branch=data["baseRefName"],
-            url=data["url"],
-            draft=data.get("isDraft", False),
-            raw=data,
-        )
+        Raises:
+            ValueError: If ``state`` or a field name is unknown
+        """
+        return self.provider.list_prs(state, base, head, fields, limit, raw)
+
+    def get_prs(
+        self,
+        numbers: list[int],
+        fields: Optional[list[str]] = None,
+        raw: bool = False,
+    ) -> dict[int, PullRequest]:
+        """Get several pull requests at once.
+
+        The gh provider fetches up to 50 numbers per GraphQL request.
+
+        Args:
+            numbers: PR numbers
+            fields: PullRequest attributes to populate (default: all)
+            raw: Keep the API payload in ``PullRequest.raw``
+
+        Returns:
+            PullRequest objects by number; numbers that do not exist are absent
+
+        Raises:
+            ValueError: If a field name is unknown
+        """
+        return self.provider.get_prs(numbers, fields, raw)
 
     def merge_pr(
         self,
@@ -608,9 +1638,4 @@ class RepoManager:
         Returns:
             Result dict
         """
-        args = ["gh", "pr", "merge", str(number), f"--{method}"]
-        if delete_branch:
-            args.append("--delete-branch")
-
-        subprocess.run(args, capture_output=True, text=True, check=True)
-        return {"success": True, "method": method}
+        return self.provider.merge_pr(number, method, delete_branch)
@@ -0,0 +1,159 @@
+"""
+Branch naming - Precompiled generation and validation of branch names.
+
+``BranchNamer`` builds the slug rules and prefix table once, validates names
+against git's ``check-ref-format --branch`` rules without spawning git, and
+generates many unique names in one pass over the existing branches.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable, Optional, Union
+
+# Characters and sequences git forbids anywhere in a ref name
+_FORBIDDEN = re.compile(r"[\x00-\x20\x7f~^:?*\[\\]|\.\.|@\{|//")
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
+
+BranchSpec = Union[str, tuple[str], tuple[str, str], tuple[str, str, Optional[str]]]
+
+
+def branch_name_error(name: str) -> Optional[str]:
+    """Return why ``name`` is not a valid branch name, or None if it is.
+
+    Implements the rules of ``git check-ref-format --branch``.
+    """
+    if not name:
+        return "name is empty"
+    if name == "HEAD" or name == "@":
+        return f"'{name}' is reserved"
+    if name.startswith("-"):
+        return "name starts with '-'"
+    match = _FORBIDDEN.search(name)
+    if match:
+        return f"name contains {match.group()!r}"
+    if name.startswith("/") or name.endswith("/"):
+        return "name starts or ends with '/'"
+    if name.endswith("."):
+        return "name ends with '.'"
+    for component in name.split("/"):
+        if component.startswith("."):
+            return f"component '{component}' starts with '.'"
+        if component.endswith(".lock"):
+            return f"component '{component}' ends with '.lock'"
+    return None
+
+
+class BranchNamer:
+    """Generate and validate branch names from a repo config.
+
+    Names have the form ``<prefix>/[<work_id>-]<slug>``, where the prefix is
+    looked up from ``branch_prefixes`` by work type (default ``feat``) and the
+    slug is the lowercased description with runs of other characters turned
+    into ``-``, cut to ``max_slug_length``.
+
+    Example:
+        namer = BranchNamer(config)
+        names = namer.generate_many(
+            [("Add login", "feature", "12"), ("Fix crash", "bug", "13")],
+            existing=["feat/12-add-login"],
+        )
+        # ['feat/12-add-login-2', 'fix/13-fix-crash']
+    """
+
+    def __init__(self, config: Optional[dict[str, Any]] = None, max_slug_length: int = 50) -> None:
+        """Initialize BranchNamer.
+
+        Args:
+            config: Repo configuration providing ``branch_prefixes``
+            max_slug_length: Maximum length of the description slug
+        """
+        self.prefixes: dict[str, str] = dict((config or {}).get("branch_prefixes") or {})
+        self.max_slug_length = max_slug_length
+
+    def slugify(self, description: str) -> str:
+        """Normalize a description to a branch slug."""
+        return _NON_SLUG.sub("-", description.lower()).strip("-")[:self.max_slug_length]
+
+    def generate(
+        self,
+        description: str,
+        work_type: str = "feature",
+        work_id: Optional[str] = None,
+    ) -> str:
+        """Generate a branch name (not checked for validity or uniqueness)."""
+        prefix = self.prefixes.get(work_type, "feat")
+        slug = self.slugify(description)
+        if work_id:
+            return f"{prefix}/{work_id}-{slug}"
+        return f"{prefix}/{slug}"
+
+    def validate(self, name: str) -> None:
+        """Check a branch name against git's ref format rules.
+
+        Raises:
+            ValueError: If the name is not a valid branch name
+        """
+        error = branch_name_error(name)
+        if error is not None:
+            raise ValueError(f"Invalid branch name '{name}': {error}")
+
+    def is_valid(self, name: str) -> bool:
+        return branch_name_error(name) is None
+
+    def generate_many(
+        self,
+        specs: Iterable[BranchSpec],
+        existing: Iterable[str] = (),
+    ) -> list[str]:
+        """Generate valid, unique branch names for many work items.
+
+        Each spec is a description or a ``(description, work_type, work_id)``
+        tuple. A name that is already taken - by an existing branch, an
+        earlier spec, or as the directory of a branch (``feat/x`` when
+        ``feat/x/y`` exists) - gets the first free ``-2``, ``-3``, ... suffix.
+
+        Args:
+            specs: Work items to name
+            existing: Branch names already in use (short names)
+
+        Returns:
+            One name per spec, in order
+
+        Raises:
+            ValueError: If a generated name is not a valid branch name, or
+                would be nested under an existing branch
+        """
+        taken = set(existing)
+        # Every directory a taken name lives under; such paths cannot be branches
+        dirs = {name[:i] for name in taken for i, c in enumerate(name) if c == "/"}
+        next_suffix: dict[str, int] = {}
+
+        def free(name: str) -> bool:
+            return name not in taken and name not in dirs
+
+        names = []
+        for spec in specs:
+            if isinstance(spec, str):
+                base = self.generate(spec)
+            else:
+                base = self.generate(*spec)
+            self.validate(base)
+            parent = next(
+                (base[:i] for i, c in enumerate(base) if c == "/" and base[:i] in taken), None
+            )
+            if parent is not None:
+                # No suffix helps: the branch would have to live inside another
+                raise ValueError(f"Branch name '{base}' conflicts with existing branch '{parent}'")
+
+            name = base
+            suffix = next_suffix.get(base, 2)
+            while not free(name):
+                name = f"{base}-{suffix}"
+                suffix += 1
+            next_suffix[base] = suffix
+
+            taken.add(name)
+            dirs.update(name[:i] for i, c in enumerate(name) if c == "/")
+            names.append(name)
+        return names
@@ -0,0 +1,84 @@
+"""
+Base provider interface for pull request hosting platforms.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from fractary_core.repo.manager import PullRequest
+
+
+def pr_from_rest(data: dict[str, Any], raw: bool = True) -> PullRequest:
+    """Build a PullRequest from a GitHub REST ``pulls`` object."""
+    state = "merged" if data.get("merged_at") else data.get("state", "")
+    head_repo = (data.get("head") or {}).get("repo") or {}
+    return PullRequest(
+        number=data["number"],
+        title=data.get("title", ""),
+        body=data.get("body") or "",
+        state=state.lower(),
+        head_branch=data.get("head", {}).get("ref", ""),
+        base_branch=data.get("base", {}).get("ref", ""),
+        url=data.get("html_url", ""),
+        draft=data.get("draft", False),
+        raw=data if raw else {},
+        head_repo=head_repo.get("full_name"),
+    )
+
+
+class PRProvider(ABC):
+    """Abstract base class for pull request providers."""
+
+    def __init__(self, config: dict[str, Any]) -> None:
+        """Initialize provider with config."""
+        self.config = config
+
+    @abstractmethod
+    def create_pr(
+        self,
+        title: str,
+        body: str,
+        head: str,
+        base: str,
+        draft: bool,
+    ) -> PullRequest:
+        """Create a pull request and return it as created."""
+        pass
+
+    @abstractmethod
+    def get_pr(self, number: int) -> PullRequest:
+        """Get a pull request by number."""
+        pass
+
+    @abstractmethod
+    def merge_pr(self, number: int, method: str, delete_branch: bool) -> dict[str, Any]:
+        """Merge a pull request."""
+        pass
+
+    @abstractmethod
+    def list_prs(
+        self,
+        state: str,
+        base: Optional[str],
+        head: Optional[str],
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        raw: bool,
+    ) -> list[PullRequest]:
+        """List pull requests, newest first."""
+        pass
+
+    @abstractmethod
+    def get_prs(
+        self,
+        numbers: list[int],
+        fields: Optional[list[str]],
+        raw: bool,
+    ) -> dict[int, PullRequest]:
+        """Get several pull requests by number; missing numbers are absent."""
+        pass
+
+    def close(self) -> None:
+        """Release connections or processes held by the provider."""
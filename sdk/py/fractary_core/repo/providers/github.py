@@ -0,0 +1,190 @@
+"""
+GitHub pull request provider using the gh CLI.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Optional
+
+from fractary_core.common import telemetry
+from fractary_core.repo.manager import PullRequest
+from fractary_core.repo.providers.base import PRProvider, pr_from_rest
+from fractary_core.repo.pulls import BATCH_SIZE, PAGE_SIZE, get_prs_query, list_prs_query
+
+_PR_FIELDS = "number,title,body,state,headRefName,baseRefName,url,isDraft"
+
+
+def _pr_from_gh(data: dict[str, Any]) -> PullRequest:
+    """Build a PullRequest from ``gh pr view --json`` output."""
+    return PullRequest(
+        number=data["number"],
+        title=data["title"],
+        body=data.get("body", "") or "",
+        state=data["state"].lower(),
+        head_branch=data["headRefName"],
+        base_branch=data["baseRefName"],
+        url=data["url"],
+        draft=data.get("isDraft", False),
+        raw=data,
+    )
+
+
+def _pr_from_graphql(node: dict[str, Any], raw: bool = False) -> PullRequest:
+    """Build a PullRequest from a GraphQL node; unselected fields stay empty."""
+    state = node.get("state")
+    return PullRequest(
+        number=node["number"],
+        title=node.get("title", ""),
+        body=node.get("body") or "",
+        state=state.lower() if state else "",
+        head_branch=node.get("headRefName", ""),
+        base_branch=node.get("baseRefName", ""),
+        url=node.get("url", ""),
+        draft=node.get("isDraft", False),
+        raw=node if raw else {},
+    )
+
+
+class GitHubCLIProvider(PRProvider):
+    """GitHub pull requests through the gh CLI, run in the repository directory."""
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        cwd: Optional[str | Path] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        super().__init__(config)
+        self.cwd = cwd
+        self.timeout = timeout
+
+    def _run_gh(self, args: list[str]) -> str:
+        """Run gh CLI command and return output."""
+        result = telemetry.run(
+            ["gh", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=self.cwd,
+            timeout=self.timeout,
+        )
+        return result.stdout
+
+    def _graphql(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+        allow_errors: bool = False,
+    ) -> dict[str, Any]:
+        """Run a GraphQL query against the current repository via ``gh api``.
+
+        ``$owner`` and ``$name`` are filled in by gh from the repository of
+        the working directory.
+
+        Args:
+            query: GraphQL query text
+            variables: Extra variables; None values are left out
+            allow_errors: Return partial data when the response also carries
+                errors (e.g. a missing pull request in a batch)
+
+        Raises:
+            subprocess.CalledProcessError: If gh fails or the query errors
+        """
+        args = ["gh", "api", "graphql", "-f", f"query={query}",
+                "-F", "owner={owner}", "-F", "name={repo}"]
+        for key, value in (variables or {}).items():
+            if value is None:
+                continue
+            # -F sends numbers as integers, -f keeps strings as strings
+            flag = "-F" if isinstance(value, int) else "-f"
+            args += [flag, f"{key}={value}"]
+
+        result = telemetry.run(
+            args, capture_output=True, text=True, cwd=self.cwd, timeout=self.timeout,
+        )
+        if result.returncode != 0:
+            try:
+                response = json.loads(result.stdout)
+            except ValueError:
+                response = None
+            if not (allow_errors and isinstance(response, dict) and response.get("data")):
+                raise subprocess.CalledProcessError(
+                    result.returncode, args, result.stdout, result.stderr,
+                )
+            return response["data"]
+        return json.loads(result.stdout)["data"]
+
+    def create_pr(
+        self,
+        title: str,
+        body: str,
+        head: str,
+        base: str,
+        draft: bool,
+    ) -> PullRequest:
+        """Create a PR with one REST call; the response is the created PR."""
+        output = self._run_gh([
+            "api", "repos/{owner}/{repo}/pulls", "--method", "POST",
+            "-f", f"title={title}",
+            "-f", f"body={body}",
+            "-f", f"head={head}",
+            "-f", f"base={base}",
+            "-F", f"draft={'true' if draft else 'false'}",
+        ])
+        return pr_from_rest(json.loads(output))
+
+    def get_pr(self, number: int) -> PullRequest:
+        output = self._run_gh(["pr", "view", str(number), "--json", _PR_FIELDS])
+        return _pr_from_gh(json.loads(output))
+
+    def merge_pr(self, number: int, method: str, delete_branch: bool) -> dict[str, Any]:
+        args = ["pr", "merge", str(number), f"--{method}"]
+        if delete_branch:
+            args.append("--delete-branch")
+        self._run_gh(args)
+        return {"success": True, "method": method}
+
+    def list_prs(
+        self,
+        state: str,
+        base: Optional[str],
+        head: Optional[str],
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        raw: bool,
+    ) -> list[PullRequest]:
+        query = list_prs_query(state, fields)
+        prs: list[PullRequest] = []
+        cursor = None
+        while limit is None or len(prs) < limit:
+            first = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - len(prs))
+            data = self._graphql(
+                query, {"base": base, "head": head, "first": first, "after": cursor},
+            )
+            page = data["repository"]["pullRequests"]
+            prs.extend(_pr_from_graphql(node, raw) for node in page["nodes"])
+            if not page["pageInfo"]["hasNextPage"]:
+                break
+            cursor = page["pageInfo"]["endCursor"]
+        return prs
+
+    def get_prs(
+        self,
+        numbers: list[int],
+        fields: Optional[list[str]],
+        raw: bool,
+    ) -> dict[int, PullRequest]:
+        unique = list(dict.fromkeys(numbers))
+        prs: dict[int, PullRequest] = {}
+        for start in range(0, len(unique), BATCH_SIZE):
+            batch = unique[start:start + BATCH_SIZE]
+            data = self._graphql(get_prs_query(batch, fields), allow_errors=True)
+            repository = data.get("repository") or {}
+            for number in batch:
+                node = repository.get(f"pr{number}")
+                if node is not None:
+                    prs[number] = _pr_from_graphql(node, raw)
+        return prs
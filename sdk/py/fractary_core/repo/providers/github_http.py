@@ -0,0 +1,296 @@
+"""
+GitHub pull request provider talking to the REST API over pooled HTTP.
+
+One ``requests.Session`` keeps connections to the API alive across calls,
+so creating, reading and merging pull requests costs a request each rather
+than a ``gh`` process each. GET responses are cached with their ETags and
+revalidated with ``If-None-Match``; GitHub does not count ``304 Not
+Modified`` answers against the rate limit.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from fractary_core.common import telemetry
+from fractary_core.repo.manager import PullRequest
+from fractary_core.repo.providers.base import PRProvider, pr_from_rest
+from fractary_core.repo.pulls import PR_STATES, pr_selection
+
+_REMOTE_RE = re.compile(r"[:/]([^/:]+)/([^/]+?)(?:\.git)?/?$")
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a GitHub API request.
+
+    Server errors and dropped connections are retried for idempotent methods
+    only; rate-limit responses (429, or 403 with ``Retry-After`` or an
+    exhausted quota) are retried for every method because GitHub did not
+    act on the request. Waits grow as ``backoff * 2**attempt``, or follow
+    ``Retry-After``/``X-RateLimit-Reset``, and never exceed ``max_wait``.
+    """
+
+    max_retries: int = 3
+    backoff: float = 0.5
+    max_wait: float = 60.0
+    retry_statuses: tuple[int, ...] = (500, 502, 503, 504)
+
+    def rate_limit_wait(self, response: requests.Response) -> Optional[float]:
+        """Seconds to wait if ``response`` is a rate-limit rejection, else None."""
+        if response.status_code not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                return None
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            reset = float(response.headers.get("X-RateLimit-Reset", "0"))
+            return max(reset - time.time(), 0.0)
+        return 0.0 if response.status_code == 429 else None
+
+    def delay(self, attempt: int) -> float:
+        return min(self.backoff * 2**attempt, self.max_wait)
+
+
+def parse_remote(url: str) -> tuple[str, str]:
+    """Extract (owner, repo) from an https or ssh GitHub remote URL.
+
+    Raises:
+        ValueError: If the URL has no owner/repo path
+    """
+    match = _REMOTE_RE.search(url.strip())
+    if match is None:
+        raise ValueError(f"Cannot determine owner/repo from remote '{url}'")
+    return match.group(1), match.group(2)
+
+
+class GitHubHTTPProvider(PRProvider):
+    """GitHub pull requests over the REST API with connection pooling.
+
+    Config keys: ``owner``/``repo`` (default: parsed from the ``origin``
+    remote), ``token`` (default: ``GITHUB_TOKEN``, ``GH_TOKEN``, then
+    ``gh auth token``), ``api_url`` (default ``https://api.github.com``,
+    set it for GitHub Enterprise) and ``http_pool_size`` (default 10).
+    """
+
+    ETAG_CACHE_SIZE = 512
+
+    def __init__(
+        self,
+        config: dict[str, Any],
+        cwd: Optional[str | Path] = None,
+        timeout: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
+        super().__init__(config)
+        self.cwd = cwd
+        self.timeout = timeout if timeout is not None else 30.0
+        self.retry = retry or RetryPolicy()
+        self.api_url = config.get("api_url", "https://api.github.com").rstrip("/")
+        self.owner = config.get("owner", "")
+        self.repo = config.get("repo", "")
+        if not self.owner or not self.repo:
+            self._detect_repo()
+
+        self.session = session or requests.Session()
+        pool_size = int(config.get("http_pool_size", 10))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+        token = self._resolve_token()
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        self._etags: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    def _detect_repo(self) -> None:
+        """Detect owner/repo from the origin remote."""
+        result = telemetry.run(
+            ["git", "remote", "get-url", "origin"],
+            capture_output=True, text=True, check=True, cwd=self.cwd,
+        )
+        self.owner, self.repo = parse_remote(result.stdout)
+
+    def _resolve_token(self) -> Optional[str]:
+        token = self.config.get("token") or os.getenv("GITHUB_TOKEN") or os.getenv("GH_TOKEN")
+        if token:
+            return token
+        try:
+            result = telemetry.run(
+                ["gh", "auth", "token"], capture_output=True, text=True, check=True,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
+        return result.stdout.strip() or None
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _url(self, path: str) -> str:
+        return f"{self.api_url}/repos/{self.owner}/{self.repo}{path}"
+
+    def _send(
+        self, method: str, url: str, headers: Optional[dict[str, str]] = None, **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request, retrying according to the retry policy."""
+        idempotent = method in ("GET", "HEAD", "PUT", "DELETE")
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(
+                    method, url, headers=headers, timeout=self.timeout, **kwargs,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if not idempotent or attempt >= self.retry.max_retries:
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            wait = self.retry.rate_limit_wait(response)
+            if wait is None and idempotent and response.status_code in self.retry.retry_statuses:
+                wait = self.retry.delay(attempt)
+            if wait is None or attempt >= self.retry.max_retries or wait > self.retry.max_wait:
+                return response
+            time.sleep(max(wait, self.retry.delay(attempt)))
+            attempt += 1
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Make an API request and return the decoded JSON body.
+
+        Raises:
+            requests.HTTPError: If the API answers with an error status
+        """
+        response = self._send(method, self._url(path), **kwargs)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def _get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """GET with ETag revalidation of previously seen responses."""
+        request = requests.Request("GET", self._url(path), params=params).prepare()
+        url = request.url or self._url(path)
+        cached = self._etags.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self._send("GET", url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self._etags.move_to_end(url)
+            return cached[1]
+        response.raise_for_status()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[url] = (etag, data)
+            self._etags.move_to_end(url)
+            while len(self._etags) > self.ETAG_CACHE_SIZE:
+                self._etags.popitem(last=False)
+        return data
+
+    def create_pr(
+        self,
+        title: str,
+        body: str,
+        head: str,
+        base: str,
+        draft: bool,
+    ) -> PullRequest:
+        data = self._request(
+            "POST", "/pulls",
+            json={"title": title, "body": body, "head": head, "base": base, "draft": draft},
+        )
+        return pr_from_rest(data)
+
+    def get_pr(self, number: int) -> PullRequest:
+        return pr_from_rest(self._get(f"/pulls/{int(number)}"))
+
+    def merge_pr(self, number: int, method: str, delete_branch: bool) -> dict[str, Any]:
+        head = None
+        if delete_branch:
+            pr = self.get_pr(number)
+            # Like ``gh pr merge --delete-branch``, leave heads in other
+            # repositories (forks) alone: a same-named branch here is not theirs
+            if (pr.head_repo or "").lower() == f"{self.owner}/{self.repo}".lower():
+                head = pr.head_branch
+        result = self._request("PUT", f"/pulls/{int(number)}/merge", json={"merge_method": method})
+        if head:
+            response = self._send("DELETE", self._url(f"/git/refs/heads/{head}"))
+            # The branch may already be gone (e.g. auto-deleted on merge)
+            if response.status_code not in (204, 404, 422):
+                response.raise_for_status()
+        return {"success": True, "method": method, "sha": (result or {}).get("sha")}
+
+    def list_prs(
+        self,
+        state: str,
+        base: Optional[str],
+        head: Optional[str],
+        fields: Optional[list[str]],
+        limit: Optional[int],
+        raw: bool,
+    ) -> list[PullRequest]:
+        if state not in PR_STATES:
+            raise ValueError(
+                f"Unknown pull request state '{state}', expected one of {list(PR_STATES)}"
+            )
+        pr_selection(fields)
+        params: dict[str, Any] = {
+            "state": "open" if state == "open" else ("all" if state == "all" else "closed"),
+            "sort": "created",
+            "direction": "desc",
+            "per_page": 100,
+        }
+        if base:
+            params["base"] = base
+        if head:
+            params["head"] = head if ":" in head else f"{self.owner}:{head}"
+
+        prs: list[PullRequest] = []
+        page = 1
+        while limit is None or len(prs) < limit:
+            items = self._get("/pulls", {**params, "page": page})
+            for item in items:
+                pr = pr_from_rest(item, raw)
+                if state == "merged" and pr.state != "merged":
+                    continue
+                if state == "closed" and pr.state == "merged":
+                    continue
+                prs.append(pr)
+            if len(items) < params["per_page"]:
+                break
+            page += 1
+        return prs if limit is None else prs[:limit]
+
+    def get_prs(
+        self,
+        numbers: list[int],
+        fields: Optional[list[str]],
+        raw: bool,
+    ) -> dict[int, PullRequest]:
+        pr_selection(fields)
+        prs: dict[int, PullRequest] = {}
+        for number in dict.fromkeys(numbers):
+            try:
+                data = self._get(f"/pulls/{int(number)}")
+            except requests.HTTPError as error:
+                if error.response is not None and error.response.status_code == 404:
+                    continue
+                raise
+            prs[number] = pr_from_rest(data, raw)
+        return prs
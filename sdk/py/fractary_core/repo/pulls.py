@@ -0,0 +1,80 @@
+"""
+Pull request queries - Batched, projected GitHub GraphQL lookups.
+
+``list_prs`` pages through a repository's pull requests 100 at a time and
+``get_prs`` fetches many pull requests by number with aliased fields in one
+query, instead of one ``gh pr view`` per pull request. Only the GraphQL
+fields backing the requested PullRequest attributes are selected.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence
+
+# PullRequest attribute -> GraphQL selection
+PR_GRAPHQL_FIELDS = {
+    "number": "number",
+    "title": "title",
+    "body": "body",
+    "state": "state",
+    "head_branch": "headRefName",
+    "base_branch": "baseRefName",
+    "url": "url",
+    "draft": "isDraft",
+}
+
+PR_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED"],
+    "merged": ["MERGED"],
+    "all": ["OPEN", "CLOSED", "MERGED"],
+}
+
+PAGE_SIZE = 100
+BATCH_SIZE = 50
+
+
+def pr_selection(fields: Optional[Iterable[str]] = None) -> str:
+    """Build the GraphQL selection set for the given PullRequest attributes.
+
+    Raises:
+        ValueError: If a field is not a PullRequest attribute
+    """
+    names = list(PR_GRAPHQL_FIELDS) if fields is None else ["number", *fields]
+    unknown = [name for name in names if name not in PR_GRAPHQL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown pull request fields: {', '.join(unknown)}")
+    return " ".join(dict.fromkeys(PR_GRAPHQL_FIELDS[name] for name in names))
+
+
+def list_prs_query(state: str = "open", fields: Optional[Iterable[str]] = None) -> str:
+    """GraphQL query for one page of ``repository.pullRequests``.
+
+    Raises:
+        ValueError: If ``state`` or a field is unknown
+    """
+    if state not in PR_STATES:
+        raise ValueError(f"Unknown pull request state '{state}', expected one of {list(PR_STATES)}")
+    return (
+        "query($owner: String!, $name: String!, $base: String, $head: String, "
+        "$first: Int!, $after: String) { "
+        "repository(owner: $owner, name: $name) { "
+        f"pullRequests(states: [{', '.join(PR_STATES[state])}], "
+        "baseRefName: $base, headRefName: $head, "
+        "first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) { "
+        "pageInfo { hasNextPage endCursor } "
+        f"nodes {{ {pr_selection(fields)} }} }} }} }}"
+    )
+
+
+def get_prs_query(numbers: Sequence[int], fields: Optional[Iterable[str]] = None) -> str:
+    """GraphQL query fetching several pull requests through aliases ``pr<number>``."""
+    selection = pr_selection(fields)
+    aliases = " ".join(
+        f"pr{int(number)}: pullRequest(number: {int(number)}) {{ {selection} }}"
+        for number in numbers
+    )
+    return (
+        "query($owner: String!, $name: String!) { "
+        f"repository(owner: $owner, name: $name) {{ {aliases} }} }}"
+    )
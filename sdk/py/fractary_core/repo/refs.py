@@ -0,0 +1,434 @@
+"""
+RefReader - In-process, read-only access to git refs.
+
+Parses ``HEAD``, loose refs, ``packed-refs``, worktree ``gitdir`` links and
+branch upstream configuration directly from disk so that hot branch queries
+need no ``git`` process at all. Anything the reader does not understand
+raises ``UnsupportedRepository`` so callers can fall back to git itself.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import stat
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from fractary_core.repo.session import RefRecord
+
+_SHA_RE = re.compile(r"^[0-9a-f]{40}$")
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]\s*(.*)$')
+_MAX_SYMREF_DEPTH = 5
+
+# Length of abbreviated shas; matches git's default core.abbrev minimum
+SHORT_SHA_LENGTH = 7
+# With core.abbrev unset or "auto", git lengthens abbreviations once the
+# packed object count reaches 2**14; repositories past half of that are left
+# to git
+_AUTO_ABBREV_MAX_OBJECTS = 1 << 13
+
+
+class UnsupportedRepository(RuntimeError):
+    """Raised when a repository layout is outside what RefReader handles."""
+
+
+@dataclass
+class _CachedFile:
+    """File contents cached against the stat signature they were read at."""
+
+    signature: tuple[int, int, int]
+    value: object
+
+
+def locate_git_dirs(start: Path) -> tuple[Path, Path]:
+    """Find the per-worktree git dir and the shared common dir above start.
+
+    Raises:
+        UnsupportedRepository: If the layout cannot be read from disk safely
+    """
+    if os.environ.get("GIT_DIR") or os.environ.get("GIT_COMMON_DIR"):
+        raise UnsupportedRepository("GIT_DIR/GIT_COMMON_DIR overrides are not supported")
+
+    for candidate in (start, *start.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            git_dir = dot_git
+            break
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir:"):
+                raise UnsupportedRepository(f"Unrecognized .git file: {dot_git}")
+            git_dir = (candidate / content[len("gitdir:"):].strip()).resolve()
+            break
+    else:
+        raise UnsupportedRepository(f"No .git found above {start}")
+
+    common_dir = git_dir
+    commondir_file = git_dir / "commondir"
+    if commondir_file.is_file():
+        common_dir = (git_dir / commondir_file.read_text().strip()).resolve()
+
+    if (common_dir / "reftable").exists():
+        raise UnsupportedRepository("reftable ref storage is not supported")
+    if (git_dir / "HEAD").is_symlink():
+        raise UnsupportedRepository("Symlinked HEAD is not supported")
+
+    return git_dir, common_dir
+
+
+class RefReader:
+    """Read-only ref reader for the repository at ``repo_path``.
+
+    Supports regular repositories and linked worktrees using the ``files``
+    ref backend. Parsed files are cached by (inode, mtime, size) and re-read
+    only when they change on disk.
+    """
+
+    def __init__(self, repo_path: Optional[str | Path] = None) -> None:
+        """Initialize the reader, locating the git and common directories."""
+        self.repo_path = Path(repo_path or os.getcwd()).resolve()
+        self.git_dir, self.common_dir = locate_git_dirs(self.repo_path)
+        self._cache: dict[Path, _CachedFile] = {}
+        self._pack_count: Optional[tuple[tuple[int, int, int], int]] = None
+        self._lock = threading.Lock()
+
+    # =========================================================================
+    # Cached File Access
+    # =========================================================================
+
+    def _cached(self, path: Path, parse):  # type: ignore[no-untyped-def]
+        """Return parse(text) for path, reusing the result while the file is unchanged."""
+        try:
+            st = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            with self._lock:
+                self._cache.pop(path, None)
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached.signature == signature:
+                return cached.value
+
+        try:
+            value = parse(path.read_text())
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            self._cache[path] = _CachedFile(signature=signature, value=value)
+        return value
+
+    @staticmethod
+    def _parse_ref_file(text: str) -> tuple[Optional[str], Optional[str]]:
+        """Parse a loose ref file into (symref target, sha)."""
+        text = text.strip()
+        if text.startswith("ref:"):
+            return text[4:].strip(), None
+        if _SHA_RE.match(text):
+            return None, text
+        raise UnsupportedRepository(f"Unrecognized ref contents: {text[:60]!r}")
+
+    @staticmethod
+    def _parse_packed_refs(text: str) -> dict[str, str]:
+        """Parse packed-refs into a refname -> sha mapping (peeled lines skipped)."""
+        refs: dict[str, str] = {}
+        for line in text.splitlines():
+            if not line or line[0] in "#^":
+                continue
+            sha, _, name = line.partition(" ")
+            refs[name] = sha
+        return refs
+
+    def _packed_refs(self) -> dict[str, str]:
+        return self._cached(self.common_dir / "packed-refs", self._parse_packed_refs) or {}
+
+    def _ref_path(self, name: str) -> Path:
+        """Per-worktree refs live in git_dir, everything else in the common dir."""
+        if "/" not in name or name.startswith(("refs/worktree/", "refs/bisect/")):
+            return self.git_dir / name
+        return self.common_dir / name
+
+    # =========================================================================
+    # Ref Resolution
+    # =========================================================================
+
+    def read_ref(self, name: str) -> tuple[Optional[str], Optional[str]]:
+        """Read a single ref without following symrefs.
+
+        Returns:
+            (symref target, sha); both None if the ref does not exist
+        """
+        loose = self._cached(self._ref_path(name), self._parse_ref_file)
+        if loose is not None:
+            return loose
+        return None, self._packed_refs().get(name)
+
+    def resolve_ref(self, name: str) -> Optional[str]:
+        """Resolve a full ref name (following symrefs) to a sha."""
+        for _ in range(_MAX_SYMREF_DEPTH):
+            target, sha = self.read_ref(name)
+            if target is None:
+                return sha
+            name = target
+        raise UnsupportedRepository(f"Symref chain too deep at {name}")
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Resolve a ref-like name using git's lookup order.
+
+        Only plain ref names and full shas are handled; expressions such as
+        ``HEAD~2`` or abbreviated shas return None so the caller can ask git.
+        """
+        if _SHA_RE.match(rev):
+            return rev
+        if not rev or ".." in rev or rev.startswith("/") or "@{" in rev:
+            return None
+        for candidate in (
+            rev,
+            f"refs/{rev}",
+            f"refs/tags/{rev}",
+            f"refs/heads/{rev}",
+            f"refs/remotes/{rev}",
+            f"refs/remotes/{rev}/HEAD",
+        ):
+            sha = self.resolve_ref(candidate)
+            if sha is not None:
+                return sha
+        return None
+
+    def current_branch(self) -> str:
+        """Return the checked-out branch name, or '' when HEAD is detached."""
+        target, _ = self.read_ref("HEAD")
+        if target and target.startswith("refs/heads/"):
+            return target[len("refs/heads/"):]
+        return ""
+
+    def symbolic_ref(self, name: str) -> Optional[str]:
+        """Return the target of a symbolic ref, or None if it is not symbolic."""
+        target, _ = self.read_ref(name)
+        return target
+
+    def _loose_refs(
+        self, directory: Path, prefix: str,
+    ) -> dict[str, tuple[Optional[str], Optional[str]]]:
+        """Parsed loose refs under directory, keyed by full ref name.
+
+        Git writes refs via lock-file rename, so any ref update changes the
+        mtime of its directory; an unchanged directory is served from cache
+        with a single stat.
+        """
+        try:
+            st = directory.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._cache.get(directory)
+        if cached is not None and cached.signature == signature:
+            files, subdirs = cached.value  # type: ignore[misc]
+        else:
+            files, subdirs = {}, []
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(".lock"):
+                        parsed = self._cached(Path(entry.path), self._parse_ref_file)
+                        if parsed is not None:
+                            files[prefix + entry.name] = parsed
+            with self._lock:
+                self._cache[directory] = _CachedFile(signature=signature, value=(files, subdirs))
+
+        refs = dict(files)
+        for subdir in subdirs:
+            refs.update(self._loose_refs(directory / subdir, f"{prefix}{subdir}/"))
+        return refs
+
+    def list_refs(self, prefix: str = "refs/heads/") -> dict[str, str]:
+        """List refs under prefix as a sorted refname -> sha mapping.
+
+        Loose refs take precedence over packed refs of the same name.
+        """
+        refs = {
+            name: sha for name, sha in self._packed_refs().items() if name.startswith(prefix)
+        }
+
+        for name, (target, sha) in self._loose_refs(self.common_dir / prefix, prefix).items():
+            if target is not None:
+                sha = self.resolve_ref(target)
+            if sha is not None:
+                refs[name] = sha
+
+        return dict(sorted(refs.items()))
+
+    # =========================================================================
+    # Upstream Configuration
+    # =========================================================================
+
+    @staticmethod
+    def _parse_config(text: str) -> dict[tuple[str, str], dict[str, list[str]]]:
+        """Parse the subset of git config needed for upstream lookups.
+
+        Returns a mapping of (section, subsection) -> key -> values.
+        """
+        sections: dict[tuple[str, str], dict[str, list[str]]] = {}
+        current: Optional[dict[str, list[str]]] = None
+        for raw in text.splitlines():
+            line = raw.strip()
+            if not line or line[0] in "#;":
+                continue
+            if line.startswith("["):
+                match = _SECTION_RE.match(line)
+                if not match:
+                    raise UnsupportedRepository(f"Unsupported config section: {line!r}")
+                section = match.group(1).lower()
+                if section in ("include", "includeif") or "." in section:
+                    raise UnsupportedRepository("Config includes are not supported")
+                subsection = re.sub(r"\\(.)", r"\1", match.group(2) or "")
+                current = sections.setdefault((section, subsection), {})
+                line = match.group(3).strip()
+                if not line:
+                    continue
+            if current is None:
+                continue
+            key, _, value = line.partition("=")
+            value = value.strip()
+            if value.endswith("\\") or "#" in value or ";" in value:
+                raise UnsupportedRepository(f"Unsupported config value: {raw!r}")
+            if len(value) >= 2 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            current.setdefault(key.strip().lower(), []).append(value)
+        return sections
+
+    def _config(self) -> dict[tuple[str, str], dict[str, list[str]]]:
+        return self._cached(self.common_dir / "config", self._parse_config) or {}
+
+    def upstream(self, branch: str) -> Optional[str]:
+        """Return the short upstream name for a local branch (e.g. 'origin/main')."""
+        return self._upstream_from(self._config(), branch)
+
+    @staticmethod
+    def _upstream_from(
+        config: dict[tuple[str, str], dict[str, list[str]]],
+        branch: str,
+    ) -> Optional[str]:
+        branch_config = config.get(("branch", branch), {})
+        remote = (branch_config.get("remote") or [None])[-1]
+        merge = (branch_config.get("merge") or [None])[-1]
+        if not remote or not merge:
+            return None
+
+        if remote == ".":
+            return merge.removeprefix("refs/heads/")
+
+        remote_config = config.get(("remote", remote))
+        if remote_config is None:
+            return None
+        for refspec in remote_config.get("fetch", []):
+            src, _, dst = refspec.lstrip("+").partition(":")
+            if src.endswith("*") and dst.endswith("*"):
+                if merge.startswith(src[:-1]):
+                    tracking = dst[:-1] + merge[len(src) - 1:]
+                    return tracking.removeprefix("refs/remotes/")
+            elif src == merge:
+                return dst.removeprefix("refs/remotes/")
+        return None
+
+    # =========================================================================
+    # Abbreviation Length
+    # =========================================================================
+
+    def _packed_object_count(self) -> int:
+        """Objects in the pack indexes, the estimate git bases auto abbreviation on."""
+        pack_dir = self.common_dir / "objects" / "pack"
+        try:
+            st = pack_dir.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._pack_count
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        count = 0
+        for idx in pack_dir.glob("*.idx"):
+            try:
+                with open(idx, "rb") as f:
+                    header = f.read(8 + 256 * 4)
+            except FileNotFoundError:
+                continue
+            # v2 indexes start with a magic number and version before the fanout
+            # table; the last fanout entry is the number of objects
+            fanout = 8 if header[:4] == b"\377tOc" else 0
+            count += int.from_bytes(header[fanout + 255 * 4:fanout + 256 * 4], "big")
+        self._pack_count = (signature, count)
+        return count
+
+    def abbrev_length(self) -> int:
+        """Length of the abbreviated shas git prints (``%(objectname:short)``).
+
+        Raises:
+            UnsupportedRepository: If ``core.abbrev`` is invalid, or is unset or
+                ``auto`` in a repository large enough for git to lengthen it
+        """
+        values = self._config().get(("core", ""), {}).get("abbrev")
+        value = values[-1].strip().lower() if values else "auto"
+        if value in ("false", "no", "off"):
+            return 40
+        if value != "auto":
+            if not value.isdigit() or not 4 <= int(value) <= 40:
+                raise UnsupportedRepository(f"Unsupported core.abbrev: {value!r}")
+            return int(value)
+        if (self.common_dir / "objects" / "info" / "alternates").exists():
+            raise UnsupportedRepository("Automatic abbreviation with alternates is not supported")
+        if self._packed_object_count() >= _AUTO_ABBREV_MAX_OBJECTS:
+            raise UnsupportedRepository("Automatic abbreviation in large repositories")
+        return SHORT_SHA_LENGTH
+
+    # =========================================================================
+    # Branch Listing
+    # =========================================================================
+
+    def branch_records(self, remote_head: str = "refs/remotes/origin/HEAD") -> list[RefRecord]:
+        """Build the same records ``GitQuerySession.read_refs`` returns for branches.
+
+        Args:
+            remote_head: Symbolic remote HEAD ref to include when present
+
+        Returns:
+            RefRecords for every local branch plus the remote HEAD
+
+        Raises:
+            UnsupportedRepository: If git would abbreviate shas in a way the
+                reader cannot reproduce (see ``abbrev_length``)
+        """
+        head_target = self.symbolic_ref("HEAD")
+        config = self._config()
+        abbrev = self.abbrev_length()
+        records = [
+            RefRecord(
+                name=name,
+                sha=sha,
+                short_sha=sha[:abbrev],
+                upstream=self._upstream_from(config, name[len("refs/heads/"):]),
+                is_head=(name == head_target),
+            )
+            for name, sha in self.list_refs("refs/heads/").items()
+        ]
+
+        remote_target = self.symbolic_ref(remote_head)
+        remote_sha = self.resolve_ref(remote_head)
+        if remote_sha is not None:
+            records.append(RefRecord(
+                name=remote_head,
+                sha=remote_sha,
+                short_sha=remote_sha[:abbrev],
+                symref=remote_target,
+            ))
+        return records
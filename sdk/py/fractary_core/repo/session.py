@@ -0,0 +1,336 @@
+"""
+GitQuerySession - Long-lived git plumbing processes for batched lookups.
+
+Keeps ``git cat-file --batch-check`` and ``--batch`` processes open for the
+lifetime of the session so that object and ref lookups are pipelined through a
+single process instead of forking ``git rev-parse`` or ``git log`` for every
+query.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Optional
+
+from fractary_core.common import telemetry
+
+# Number of revisions written to cat-file before reading the answers back.
+# Bounded so neither side of the pipe can fill up and deadlock.
+_PIPELINE_CHUNK = 128
+
+_REF_FORMAT = "%00".join([
+    "%(HEAD)",
+    "%(refname)",
+    "%(objectname)",
+    "%(objectname:short)",
+    "%(upstream:short)",
+    "%(symref)",
+])
+
+
+@dataclass
+class ObjectInfo:
+    """Object metadata returned by ``cat-file --batch-check``."""
+
+    sha: str
+    type: str
+    size: int
+
+
+@dataclass
+class RefRecord:
+    """A single ref as reported by ``for-each-ref``."""
+
+    name: str
+    sha: str
+    short_sha: str
+    upstream: Optional[str] = None
+    symref: Optional[str] = None
+    is_head: bool = False
+
+    @property
+    def short_name(self) -> str:
+        """Ref name without its ``refs/heads/`` or ``refs/remotes/`` namespace."""
+        for prefix in ("refs/heads/", "refs/remotes/", "refs/tags/"):
+            if self.name.startswith(prefix):
+                return self.name[len(prefix):]
+        return self.name
+
+
+class GitQuerySession:
+    """Persistent git query session.
+
+    Object lookups are answered by a single long-running
+    ``git cat-file --batch-check`` process, and object contents by a
+    ``git cat-file --batch`` process started on first use; ref listings are
+    answered by one ``git for-each-ref`` invocation that returns everything
+    needed for branch queries (sha, upstream, HEAD marker and symbolic refs)
+    at once.
+
+    The session is safe to share between threads. If the batch process exits
+    (e.g. on a revision git cannot parse) it is restarted transparently.
+    """
+
+    def __init__(self, cwd: Optional[str | Path] = None) -> None:
+        """Initialize the session for the repository at ``cwd``."""
+        self.cwd = str(cwd) if cwd is not None else None
+        self._batch_check: Optional[subprocess.Popen] = None
+        self._batch: Optional[subprocess.Popen] = None
+        self._started: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> GitQuerySession:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Terminate the batch processes held by this session."""
+        with self._lock:
+            self._stop(self._batch_check)
+            self._stop(self._batch)
+            self._batch_check = None
+            self._batch = None
+
+    def _spawn(self, argv: list[str], text: bool) -> subprocess.Popen:
+        proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=text,
+            cwd=self.cwd,
+        )
+        self._started[proc.pid] = time.perf_counter()
+        return proc
+
+    def _stop(self, proc: Optional[subprocess.Popen]) -> None:
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+        finally:
+            if proc.stdout:
+                proc.stdout.close()
+            # Long-lived processes are recorded once, with their lifetime
+            started = self._started.pop(proc.pid, None)
+            if started is not None:
+                telemetry.record(proc.args, time.perf_counter() - started, proc.returncode)
+
+    def _batch_check_proc(self) -> subprocess.Popen:
+        """Return the running batch-check process, starting it if needed."""
+        proc = self._batch_check
+        if proc is None or proc.poll() is not None:
+            self._stop(proc)
+            proc = self._spawn(["git", "cat-file", "--batch-check"], text=True)
+            self._batch_check = proc
+        return proc
+
+    def _batch_proc(self) -> subprocess.Popen:
+        """Return the running binary ``cat-file --batch`` process, starting it if needed."""
+        proc = self._batch
+        if proc is None or proc.poll() is not None:
+            self._stop(proc)
+            proc = self._spawn(["git", "cat-file", "--batch"], text=False)
+            self._batch = proc
+        return proc
+
+    # =========================================================================
+    # Object Lookups
+    # =========================================================================
+
+    def object_info(self, revs: Iterable[str]) -> list[Optional[ObjectInfo]]:
+        """Look up several revisions in one pipelined round trip.
+
+        Args:
+            revs: Revision expressions (branch names, shas, ``HEAD~2``, ...)
+
+        Returns:
+            One entry per revision, None where the revision does not resolve
+        """
+        revs = list(revs)
+        results: list[Optional[ObjectInfo]] = [None] * len(revs)
+
+        # Names containing line breaks would desync the line protocol; they
+        # can never name an object anyway.
+        queryable = [
+            i for i, rev in enumerate(revs) if rev and "\n" not in rev and "\r" not in rev
+        ]
+
+        with self._lock:
+            for start in range(0, len(queryable), _PIPELINE_CHUNK):
+                indexes = queryable[start:start + _PIPELINE_CHUNK]
+                answers = self._query_chunk([revs[i] for i in indexes])
+                for i, info in zip(indexes, answers):
+                    results[i] = info
+        return results
+
+    def _query_chunk(self, revs: list[str]) -> list[Optional[ObjectInfo]]:
+        results: list[Optional[ObjectInfo]] = []
+        pending = revs
+        while pending:
+            proc = self._batch_check_proc()
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.write("".join(f"{rev}\n" for rev in pending))
+                proc.stdin.flush()
+            except BrokenPipeError:
+                pass
+
+            done = len(results)
+            try:
+                answered = self._read_answers(proc.stdout, len(pending), results)
+            except ValueError:
+                # The answers still queued can no longer be matched to their
+                # revisions; give up on this process
+                proc.kill()
+                answered = len(results) - done
+            else:
+                if answered == len(pending):
+                    break
+
+            # cat-file exits on revisions it cannot parse (e.g. ``x@{upstream}``
+            # without an upstream). That revision gets None; retry the rest.
+            results.append(None)
+            self._stop(proc)
+            self._batch_check = None
+            pending = pending[answered + 1:]
+        return results
+
+    @staticmethod
+    def _read_answers(
+        stdout: IO[str],
+        count: int,
+        results: list[Optional[ObjectInfo]],
+    ) -> int:
+        """Read up to ``count`` answers into ``results``; return how many arrived.
+
+        Raises:
+            ValueError: If an answer cannot be parsed
+        """
+        for answered in range(count):
+            line = stdout.readline()
+            if not line:
+                return answered
+            results.append(_parse_answer(line.rstrip("\n")))
+        return count
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Resolve a single revision to a full object sha."""
+        info = self.object_info([rev])[0]
+        return info.sha if info else None
+
+    def resolve_many(self, revs: Iterable[str]) -> dict[str, Optional[str]]:
+        """Resolve several revisions to full object shas in one round trip."""
+        revs = list(revs)
+        return {
+            rev: (info.sha if info else None)
+            for rev, info in zip(revs, self.object_info(revs))
+        }
+
+    def read_object(self, rev: str) -> Optional[tuple[ObjectInfo, bytes]]:
+        """Read an object's metadata and raw contents.
+
+        Args:
+            rev: Revision expression naming the object
+
+        Returns:
+            (ObjectInfo, contents), or None if the revision does not resolve
+        """
+        if not rev or "\n" in rev or "\r" in rev:
+            return None
+        with self._lock:
+            proc = self._batch_proc()
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.write(rev.encode() + b"\n")
+                proc.stdin.flush()
+            except BrokenPipeError:
+                pass
+            line = proc.stdout.readline()
+            try:
+                info = _parse_answer(line.decode(errors="replace").rstrip("\n")) if line else None
+            except ValueError:
+                proc.kill()
+                line = b""
+            if not line:
+                # cat-file exited on an unparseable revision, or is out of step
+                self._stop(proc)
+                self._batch = None
+                return None
+            if info is None:
+                return None
+            data = proc.stdout.read(info.size)
+            proc.stdout.read(1)  # trailing newline
+        return info, data
+
+    # =========================================================================
+    # Ref Listings
+    # =========================================================================
+
+    def read_refs(self, patterns: Iterable[str] = ("refs/heads",)) -> list[RefRecord]:
+        """List refs matching ``patterns`` with a single ``for-each-ref`` call.
+
+        Args:
+            patterns: for-each-ref patterns (prefixes or globs)
+
+        Returns:
+            List of RefRecord objects
+        """
+        result = telemetry.run(
+            ref_listing_command(patterns),
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=self.cwd,
+        )
+        return parse_ref_records(result.stdout)
+
+
+def _parse_answer(line: str) -> Optional[ObjectInfo]:
+    """Parse a ``cat-file`` header line; None for a missing or ambiguous revision.
+
+    The revision is echoed back in those answers and may contain spaces, so
+    only the end of the line is trusted.
+
+    Raises:
+        ValueError: If the line is not a header
+    """
+    if line.endswith((" missing", " ambiguous")):
+        return None
+    sha, type_, size = line.rsplit(" ", 2)
+    return ObjectInfo(sha=sha, type=type_, size=int(size))
+
+
+def ref_listing_command(patterns: Iterable[str]) -> list[str]:
+    """Build the for-each-ref argv whose output ``parse_ref_records`` understands."""
+    return ["git", "for-each-ref", f"--format={_REF_FORMAT}", *patterns]
+
+
+def parse_ref_records(output: str) -> list[RefRecord]:
+    """Parse output of the command built by ``ref_listing_command``."""
+    refs = []
+    for line in output.splitlines():
+        parts = line.split("\0")
+        if len(parts) != 6:
+            continue
+        head, name, sha, short_sha, upstream, symref = parts
+        refs.append(RefRecord(
+            name=name,
+            sha=sha,
+            short_sha=short_sha,
+            upstream=upstream or None,
+            symref=symref or None,
+            is_head=(head == "*"),
+        ))
+    return refs
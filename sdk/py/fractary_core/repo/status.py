@@ -0,0 +1,174 @@
+"""
+Working tree status - Typed ``git status --porcelain=v2 -z`` results.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True)
+class StatusEntry:
+    """One path reported by ``git status --porcelain=v2``.
+
+    ``kind`` is one of ``changed``, ``renamed`` (renames and copies),
+    ``unmerged``, ``untracked`` or ``ignored``. ``index_status`` and
+    ``worktree_status`` are git's X/Y letters, ``.`` meaning unchanged.
+    """
+
+    kind: str
+    path: str
+    index_status: str = "."
+    worktree_status: str = "."
+    orig_path: Optional[str] = None
+    similarity: Optional[int] = None
+    submodule: str = "N..."
+    head_mode: str = ""
+    index_mode: str = ""
+    worktree_mode: str = ""
+    head_sha: str = ""
+    index_sha: str = ""
+
+    @property
+    def staged(self) -> bool:
+        """True if the index differs from HEAD for this path."""
+        return self.kind in ("changed", "renamed") and self.index_status != "."
+
+    @property
+    def unstaged(self) -> bool:
+        """True if the working tree differs from the index for this path."""
+        return self.kind in ("changed", "renamed") and self.worktree_status != "."
+
+
+@dataclass
+class RepoStatus:
+    """Branch header and entries of a working tree status."""
+
+    branch: Optional[str]
+    upstream: Optional[str] = None
+    ahead: int = 0
+    behind: int = 0
+    oid: Optional[str] = None
+    entries: list[StatusEntry] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        """True when there are no staged, unstaged, unmerged or untracked changes."""
+        return all(entry.kind == "ignored" for entry in self.entries)
+
+    @property
+    def staged(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.staged]
+
+    @property
+    def unstaged(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.unstaged]
+
+    @property
+    def untracked(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.kind == "untracked"]
+
+    @property
+    def unmerged(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.kind == "unmerged"]
+
+    @property
+    def ignored(self) -> list[StatusEntry]:
+        return [e for e in self.entries if e.kind == "ignored"]
+
+    @property
+    def unstaged_paths(self) -> list[str]:
+        """Paths ``git add -A`` would stage: unstaged, unmerged and untracked entries."""
+        return [
+            e.path for e in self.entries
+            if e.unstaged or e.kind in ("unmerged", "untracked")
+        ]
+
+
+def status_args(untracked: str = "normal", ignored: bool = False) -> list[str]:
+    """Build the ``git status`` arguments understood by ``parse_status``.
+
+    Args:
+        untracked: ``no``, ``normal`` or ``all`` (``--untracked-files``)
+        ignored: Also report ignored files
+    """
+    args = ["status", "--porcelain=v2", "-z", "--branch", f"--untracked-files={untracked}"]
+    if ignored:
+        args.append("--ignored")
+    return args
+
+
+def parse_status(output: str) -> RepoStatus:
+    """Parse ``git status --porcelain=v2 -z --branch`` output."""
+    status = RepoStatus(branch=None)
+    tokens = iter(output.split("\0"))
+    for token in tokens:
+        if not token:
+            continue
+        kind = token[0]
+        if kind == "#":
+            _parse_header(token, status)
+        elif kind == "1":
+            xy, sub, m_head, m_index, m_work, h_head, h_index, path = token[2:].split(" ", 7)
+            status.entries.append(StatusEntry(
+                kind="changed",
+                path=path,
+                index_status=xy[0],
+                worktree_status=xy[1],
+                submodule=sub,
+                head_mode=m_head,
+                index_mode=m_index,
+                worktree_mode=m_work,
+                head_sha=h_head,
+                index_sha=h_index,
+            ))
+        elif kind == "2":
+            xy, sub, m_head, m_index, m_work, h_head, h_index, score, path = (
+                token[2:].split(" ", 8)
+            )
+            status.entries.append(StatusEntry(
+                kind="renamed",
+                path=path,
+                index_status=xy[0],
+                worktree_status=xy[1],
+                orig_path=next(tokens, ""),
+                similarity=int(score[1:]),
+                submodule=sub,
+                head_mode=m_head,
+                index_mode=m_index,
+                worktree_mode=m_work,
+                head_sha=h_head,
+                index_sha=h_index,
+            ))
+        elif kind == "u":
+            # Stage 2 ("ours") is HEAD's side; the index holds no single entry
+            xy, sub, _m1, m_ours, _m3, m_work, _h1, h_ours, _h3, path = token[2:].split(" ", 9)
+            status.entries.append(StatusEntry(
+                kind="unmerged",
+                path=path,
+                index_status=xy[0],
+                worktree_status=xy[1],
+                submodule=sub,
+                head_mode=m_ours,
+                worktree_mode=m_work,
+                head_sha=h_ours,
+            ))
+        elif kind == "?":
+            status.entries.append(StatusEntry(kind="untracked", path=token[2:]))
+        elif kind == "!":
+            status.entries.append(StatusEntry(kind="ignored", path=token[2:]))
+    return status
+
+
+def _parse_header(token: str, status: RepoStatus) -> None:
+    _, key, value = (token.split(" ", 2) + ["", ""])[:3]
+    if key == "branch.oid":
+        status.oid = None if value == "(initial)" else value
+    elif key == "branch.head":
+        status.branch = None if value == "(detached)" else value
+    elif key == "branch.upstream":
+        status.upstream = value
+    elif key == "branch.ab":
+        ahead, behind = value.split(" ")
+        status.ahead, status.behind = int(ahead), -int(behind)
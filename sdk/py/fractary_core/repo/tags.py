@@ -0,0 +1,217 @@
+"""
+Tags - Streamed tag listings, semantic version ordering and batch creation.
+
+Tags are listed with a single ``git for-each-ref`` whose output is parsed as
+it arrives, and ordered in-process by semantic version. Many tags are
+created at once: annotated tag objects are written by one ``git hash-object``
+and every ref is updated in one ``git update-ref --stdin`` transaction, so a
+batch either lands completely or not at all.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from fractary_core.common import telemetry
+
+_SEMVER = re.compile(
+    r"v?(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)"
+    r"(?:-((?:0|[1-9]\d*|\d*[A-Za-z-][0-9A-Za-z-]*)"
+    r"(?:\.(?:0|[1-9]\d*|\d*[A-Za-z-][0-9A-Za-z-]*))*))?"
+    r"(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?"
+)
+
+_TAG_FORMAT = "%00".join([
+    "%(refname)",
+    "%(objectname)",
+    "%(objecttype)",
+    "%(*objectname)",
+    "%(taggername)",
+    "%(taggeremail:trim)",
+    "%(creatordate:iso)",
+    "%(contents:subject)",
+])
+
+TAG_SORTS = ("version", "name", "date", "none")
+
+
+@dataclass(slots=True)
+class Tag:
+    """A tag ref.
+
+    ``sha`` is the object the ref points at: the tag object for annotated
+    tags, the tagged object itself for lightweight ones. ``target`` is always
+    the tagged object. ``date`` is the tagger date of annotated tags and the
+    commit date of lightweight ones.
+    """
+
+    name: str
+    sha: str
+    target: str
+    date: str = ""
+    message: Optional[str] = None
+    tagger: Optional[str] = None
+    tagger_email: Optional[str] = None
+
+    @property
+    def annotated(self) -> bool:
+        return self.sha != self.target
+
+
+@dataclass
+class TagSpec:
+    """A tag to create.
+
+    A ``message`` makes the tag annotated; without one it is lightweight.
+    ``force`` replaces an existing tag of the same name.
+    """
+
+    name: str
+    target: str = "HEAD"
+    message: Optional[str] = None
+    force: bool = False
+
+
+def version_key(name: str) -> Optional[tuple]:
+    """Return a sort key ordering tag names by semantic version precedence.
+
+    Accepts ``MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]`` with an optional ``v``
+    prefix. Pre-releases sort before their release; numeric identifiers
+    compare numerically and before alphanumeric ones; build metadata is
+    ignored. Returns None for names that are not semantic versions.
+    """
+    match = _SEMVER.fullmatch(name)
+    if match is None:
+        return None
+    major, minor, patch, prerelease = match.groups()
+    if prerelease is None:
+        pre: tuple = (1,)
+    else:
+        pre = (0, *(
+            (0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in prerelease.split(".")
+        ))
+    return int(major), int(minor), int(patch), pre
+
+
+def compare_versions(a: str, b: str) -> int:
+    """Compare two semantic versions; return -1, 0 or 1.
+
+    Raises:
+        ValueError: If either name is not a semantic version
+    """
+    key_a, key_b = version_key(a), version_key(b)
+    if key_a is None or key_b is None:
+        raise ValueError(f"Not a semantic version: '{a if key_a is None else b}'")
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def tag_sort_key(sort: str) -> Optional[Callable[[Tag], Any]]:
+    """Return a key function for ``sort``, or None for git's (refname) order.
+
+    ``version`` puts names that are not semantic versions first, by name.
+
+    Raises:
+        ValueError: If ``sort`` is not one of ``TAG_SORTS``
+    """
+    if sort == "version":
+        def by_version(tag: Tag) -> tuple:
+            key = version_key(tag.name)
+            return (0, (), tag.name) if key is None else (1, key, tag.name)
+        return by_version
+    if sort == "name":
+        return lambda tag: tag.name
+    if sort == "date":
+        return lambda tag: (_timestamp(tag.date), tag.name)
+    if sort == "none":
+        return None
+    raise ValueError(f"Unknown tag sort '{sort}', expected one of {list(TAG_SORTS)}")
+
+
+def _timestamp(date: str) -> float:
+    try:
+        return datetime.strptime(date, "%Y-%m-%d %H:%M:%S %z").timestamp()
+    except ValueError:
+        return 0.0
+
+
+def tag_listing_args(pattern: Optional[str] = None) -> list[str]:
+    """Build the ``for-each-ref`` arguments whose output ``parse_tag_record`` understands."""
+    if pattern is None:
+        pattern = "refs/tags"
+    elif not pattern.startswith("refs/"):
+        pattern = f"refs/tags/{pattern}"
+    return ["for-each-ref", f"--format={_TAG_FORMAT}", pattern]
+
+
+def parse_tag_record(line: str) -> Tag:
+    """Parse one line of ``tag_listing_args`` output."""
+    refname, sha, obj_type, peeled, tagger, email, date, subject = line.split("\0")
+    annotated = obj_type == "tag"
+    return Tag(
+        name=refname[len("refs/tags/"):],
+        sha=sha,
+        target=peeled if annotated else sha,
+        date=date,
+        message=subject if annotated else None,
+        tagger=tagger or None,
+        tagger_email=email or None,
+    )
+
+
+def stream_tags(args: list[str], cwd: Optional[str | Path] = None) -> Iterator[Tag]:
+    """Run ``git`` with ``args`` and yield tags as its output arrives.
+
+    Raises:
+        subprocess.CalledProcessError: If git exits with an error
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        ["git"] + args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        text=True,
+        errors="replace",
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    finished = False
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
+            if line:
+                yield parse_tag_record(line)
+        finished = True
+    finally:
+        if not finished and proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        stderr = proc.stderr.read()
+        proc.stderr.close()
+        proc.wait()
+        telemetry.record(proc.args, time.perf_counter() - start, proc.returncode)
+
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, None, stderr)
+
+
+def tag_object(name: str, target: str, target_type: str, tagger: str, message: str) -> bytes:
+    """Serialize an annotated tag object as ``git tag -a`` would write it.
+
+    Args:
+        name: Tag name
+        target: Sha of the tagged object
+        target_type: Type of the tagged object (usually ``commit``)
+        tagger: Identity line, ``Name <email> <epoch> <tz>``
+        message: Tag message; trailing whitespace is trimmed
+    """
+    return (
+        f"object {target}\ntype {target_type}\ntag {name}\ntagger {tagger}\n\n"
+        f"{message.rstrip()}\n"
+    ).encode()
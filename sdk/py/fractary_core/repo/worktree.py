@@ -0,0 +1,353 @@
+"""
+WorktreePool - Recycled ``git worktree`` checkouts for parallel workflows.
+
+Every worktree shares the repository's object store, so handing a workflow a
+checkout costs a branch switch in an existing directory instead of a full
+clone. Leases are marked with ``git worktree lock`` so several processes can
+share one pool; idle worktrees are detached and cleaned, and the least
+recently used ones are removed once the pool exceeds its size or disk cap.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from fractary_core.common import telemetry
+from fractary_core.common.config import get_cache_dir
+from fractary_core.repo.manager import RepoManager
+
+_LOCK_PREFIX = "fractary-pool"
+
+
+@dataclass
+class PooledWorktree:
+    """A worktree directory managed by the pool."""
+
+    path: Path
+    head: Optional[str] = None
+    branch: Optional[str] = None
+    lock_reason: Optional[str] = None
+
+    @property
+    def leased(self) -> bool:
+        return self.lock_reason is not None
+
+    @property
+    def last_used(self) -> float:
+        try:
+            return self.path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+
+@dataclass
+class WorktreeLease:
+    """A worktree checked out on ``branch`` for the holder's exclusive use."""
+
+    path: Path
+    branch: str
+    pool: WorktreePool
+    _repo: Optional[RepoManager] = field(default=None, repr=False)
+
+    @property
+    def repo(self) -> RepoManager:
+        """RepoManager operating on the leased worktree."""
+        if self._repo is None:
+            self._repo = RepoManager(self.pool.config, repo_path=self.path)
+        return self._repo
+
+    def release(self) -> None:
+        """Return the worktree to the pool."""
+        self.pool.release(self)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def parse_worktree_list(output: str) -> list[PooledWorktree]:
+    """Parse ``git worktree list --porcelain -z`` output."""
+    worktrees: list[PooledWorktree] = []
+    current: Optional[PooledWorktree] = None
+    for line in output.split("\0"):
+        if not line:
+            current = None
+            continue
+        key, _, value = line.partition(" ")
+        if key == "worktree":
+            current = PooledWorktree(path=Path(value))
+            worktrees.append(current)
+        elif current is None:
+            continue
+        elif key == "HEAD":
+            current.head = value
+        elif key == "branch":
+            current.branch = value.removeprefix("refs/heads/")
+        elif key == "locked":
+            current.lock_reason = value
+    return worktrees
+
+
+class WorktreePool:
+    """Pool of reusable worktrees of one repository.
+
+    Worktrees live under ``root`` (default ``.fractary/cache/worktrees`` of
+    the main checkout). ``acquire()`` reuses an idle worktree when one exists
+    and otherwise adds a new one; ``release()`` discards all changes and
+    untracked files, detaches HEAD so the branch can be checked out elsewhere,
+    and trims the idle set to ``max_worktrees`` and ``max_bytes`` by evicting
+    the least recently used worktrees. Leased worktrees are never evicted, so
+    the pool may temporarily grow past its caps under load.
+
+    A process that dies holding a lease leaves its worktree locked; such
+    leases are reclaimed once their owning process is gone.
+
+    Example:
+        pool = WorktreePool("/path/to/repo", max_worktrees=4)
+        with pool.lease("feat/123-login", base="main") as lease:
+            lease.repo.commit("Add login", commit_type="feat")
+    """
+
+    def __init__(
+        self,
+        repo_path: str | Path,
+        root: Optional[str | Path] = None,
+        max_worktrees: int = 8,
+        max_bytes: Optional[int] = None,
+        config: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Initialize WorktreePool.
+
+        Args:
+            repo_path: Any checkout of the repository
+            root: Directory holding the pooled worktrees
+            max_worktrees: Number of worktrees kept once released
+            max_bytes: Disk budget for idle worktrees (None = unlimited)
+            config: Repo configuration passed to lease RepoManagers
+        """
+        self.repo_path = Path(repo_path)
+        self.config = config if config is not None else {}
+        self.max_worktrees = max_worktrees
+        self.max_bytes = max_bytes
+        self._manager = RepoManager(self.config, repo_path=self.repo_path)
+        if root is None:
+            toplevel = self._git("rev-parse", "--path-format=absolute", "--git-common-dir")
+            root = get_cache_dir(Path(toplevel).parent) / "worktrees"
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _git(self, *args: str, cwd: Optional[Path] = None) -> str:
+        result = telemetry.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd or self.repo_path,
+        )
+        return result.stdout.strip()
+
+    def _lock_reason(self) -> str:
+        return f"{_LOCK_PREFIX} {socket.gethostname()} {os.getpid()}"
+
+    def _is_stale(self, reason: str) -> bool:
+        """True if a pool lock belongs to a dead process on this host."""
+        parts = reason.split(" ")
+        if len(parts) != 3 or parts[0] != _LOCK_PREFIX or parts[1] != socket.gethostname():
+            return False
+        return parts[2].isdigit() and not _pid_alive(int(parts[2]))
+
+    def _list_all(self) -> list[PooledWorktree]:
+        output = telemetry.run(
+            ["git", "worktree", "list", "--porcelain", "-z"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=self.repo_path,
+        ).stdout
+        return parse_worktree_list(output)
+
+    def worktrees(self) -> list[PooledWorktree]:
+        """List the worktrees under the pool root."""
+        return [wt for wt in self._list_all() if wt.path.parent == self.root]
+
+    def _claim(self, worktree: PooledWorktree) -> bool:
+        """Lock an idle worktree for this process; False if someone else won."""
+        if worktree.lock_reason is not None:
+            if not self._is_stale(worktree.lock_reason):
+                return False
+            self._unlock_stale(worktree.path)
+        try:
+            self._git("worktree", "lock", "--reason", self._lock_reason(), str(worktree.path))
+        except subprocess.CalledProcessError:
+            return False
+        return True
+
+    def _unlock_stale(self, path: Path) -> None:
+        """Unlock a dead holder's worktree, quitting any rebase it left running.
+
+        An unfinished rebase keeps its branch reserved, so checking that
+        branch out in another worktree would fail until it is dropped.
+        """
+        git_dir = Path(self._git("rev-parse", "--absolute-git-dir", cwd=path))
+        if (git_dir / "rebase-merge").exists() or (git_dir / "rebase-apply").exists():
+            self._git("rebase", "--quit", cwd=path)
+        self._git("worktree", "unlock", str(path))
+
+    def reclaim(self) -> int:
+        """Unlock every worktree whose lease holder has died.
+
+        Returns:
+            Number of worktrees reclaimed
+        """
+        reclaimed = 0
+        with self._lock:
+            for wt in self.worktrees():
+                if wt.lock_reason is not None and self._is_stale(wt.lock_reason):
+                    self._unlock_stale(wt.path)
+                    reclaimed += 1
+        return reclaimed
+
+    def _add(self, commit: str) -> Path:
+        path = self.root / f"wt-{uuid.uuid4().hex[:12]}"
+        self._git(
+            "worktree", "add", "--detach", "--lock", "--reason", self._lock_reason(),
+            str(path), commit,
+        )
+        return path
+
+    def acquire(self, branch: str, base: Optional[str] = None) -> WorktreeLease:
+        """Lease a worktree with ``branch`` checked out.
+
+        An existing branch is checked out as is; a missing one is created
+        from ``base`` (default: the repository's default branch).
+
+        Raises:
+            ValueError: If ``branch`` is already checked out in another worktree
+            subprocess.CalledProcessError: If git fails
+        """
+        branch_exists = self._manager.session.resolve(f"refs/heads/{branch}") is not None
+        start = branch if branch_exists else (base or self._manager.get_default_branch())
+        with self._lock:
+            worktrees = self._list_all()
+            if any(wt.branch == branch for wt in worktrees):
+                raise ValueError(f"Branch '{branch}' is checked out in another worktree")
+            idle = sorted(
+                (
+                    wt for wt in worktrees
+                    if wt.path.parent == self.root
+                    and (wt.lock_reason is None or self._is_stale(wt.lock_reason))
+                ),
+                key=lambda wt: wt.last_used,
+                reverse=True,
+            )
+            path = next((wt.path for wt in idle if self._claim(wt)), None)
+            if path is None:
+                path = self._add(start)
+
+        try:
+            if branch_exists:
+                self._git("checkout", "-q", "-f", branch, cwd=path)
+            else:
+                self._git("checkout", "-q", "-f", "-b", branch, start, cwd=path)
+        except subprocess.CalledProcessError:
+            self._recycle(path)
+            raise
+        return WorktreeLease(path=path, branch=branch, pool=self)
+
+    def _recycle(self, path: Path) -> None:
+        """Clean a worktree, detach it and mark it idle."""
+        self._git("reset", "-q", "--hard", cwd=path)
+        self._git("clean", "-q", "-ffdx", cwd=path)
+        self._git("checkout", "-q", "--detach", cwd=path)
+        self._git("worktree", "unlock", str(path))
+        os.utime(path)
+
+    def release(self, lease: WorktreeLease) -> None:
+        """Return a leased worktree to the pool.
+
+        Uncommitted changes and untracked files in the worktree are discarded;
+        commits on the branch are kept.
+        """
+        if lease._repo is not None:
+            lease._repo.close()
+            lease._repo = None
+        with self._lock:
+            self._recycle(lease.path)
+            self._evict()
+
+    @contextmanager
+    def lease(self, branch: str, base: Optional[str] = None) -> Iterator[WorktreeLease]:
+        """Context manager around ``acquire()``/``release()``."""
+        lease = self.acquire(branch, base)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def prewarm(self, count: int, commit: Optional[str] = None) -> int:
+        """Create idle worktrees until at least ``count`` exist.
+
+        Returns:
+            Number of worktrees created
+        """
+        commit = commit or self._manager.get_default_branch()
+        created = 0
+        with self._lock:
+            for _ in range(count - len(self.worktrees())):
+                path = self._add(commit)
+                self._git("worktree", "unlock", str(path))
+                created += 1
+        return created
+
+    @staticmethod
+    def _disk_usage(path: Path) -> int:
+        total = 0
+        for dirpath, _dirnames, filenames in os.walk(path):
+            for name in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, name)).st_size
+                except OSError:
+                    pass
+        return total
+
+    def _evict(self) -> None:
+        """Remove least recently used idle worktrees beyond the caps."""
+        worktrees = self.worktrees()
+        idle = sorted((wt for wt in worktrees if not wt.leased), key=lambda wt: wt.last_used)
+        excess = len(worktrees) - self.max_worktrees
+        usage = sum(self._disk_usage(wt.path) for wt in idle) if self.max_bytes is not None else 0
+        for wt in idle:
+            over_bytes = self.max_bytes is not None and usage > self.max_bytes
+            if excess <= 0 and not over_bytes:
+                break
+            if over_bytes:
+                usage -= self._disk_usage(wt.path)
+            self.remove(wt.path)
+            excess -= 1
+
+    def remove(self, path: str | Path) -> None:
+        """Delete an idle worktree from the pool."""
+        self._git("worktree", "remove", "--force", str(path))
+
+    def clear(self) -> None:
+        """Remove every idle worktree and prune stale administrative entries."""
+        with self._lock:
+            for wt in self.worktrees():
+                if not wt.leased:
+                    self.remove(wt.path)
+            self._git("worktree", "prune")
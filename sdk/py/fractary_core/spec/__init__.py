@@ -1,5 +1,19 @@
 """Specification management module for fractary-core."""
 
+from fractary_core.spec.document import SpecDocument, SpecSection
+from fractary_core.spec.header import SpecHeader, read_spec_header
+from fractary_core.spec.ids import SpecIdAllocator
+from fractary_core.spec.index import SpecIndex
 from fractary_core.spec.manager import SpecManager, Specification, ValidationResult
 
-__all__ = ["SpecManager", "Specification", "ValidationResult"]
+__all__ = [
+    "SpecManager",
+    "Specification",
+    "ValidationResult",
+    "SpecDocument",
+    "SpecSection",
+    "SpecHeader",
+    "SpecIdAllocator",
+    "SpecIndex",
+    "read_spec_header",
+]
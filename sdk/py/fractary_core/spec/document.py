@@ -0,0 +1,320 @@
+"""
+Spec documents - Section-structured view of a specification file.
+
+A ``SpecDocument`` holds the raw bytes of a spec and, on first use, indexes
+its Markdown headings (outside fenced code blocks) with their byte offsets.
+Section bodies, checkboxes and the header are decoded only when asked for.
+Edits such as ticking a checkbox, replacing section 4.2 or changing the
+status splice the affected bytes in place and leave the rest of the file
+untouched; ``save`` writes the result atomically.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from fractary_core.common.config import atomic_write
+from fractary_core.spec.header import SpecHeader, SpecHeaderParser, update_header
+
+# Both patterns match from the newline before a line, which lets the regex
+# engine skip ahead to newlines instead of trying every position; they are run
+# over the content with a newline prepended
+_HEADING = re.compile(
+    rb"\n(?=[#`~])(?:(?P<fence>```|~~~)[^\n]*"
+    rb"|(?P<hashes>#{1,6})[ \t]+(?P<title>[^\r\n]*?)[ \t]*)(?=\r?\n|\Z)"
+)
+_CHECKBOX = re.compile(rb"\n[ \t]*[-*] \[(?P<mark>[ xX])\] ?(?P<label>[^\r\n]*)")
+_SECTION_NUMBER = re.compile(r"(\d+(?:\.\d+)*)\.?(?:\s+|$)")
+
+
+@dataclass(frozen=True)
+class SpecSection:
+    """A heading and the byte range it covers.
+
+    ``body_start`` is where the line after the heading begins; ``end`` is
+    where the next heading of the same or a higher level begins, so a
+    section includes its subsections.
+    """
+
+    level: int
+    heading: str
+    number: Optional[str]
+    title: str
+    start: int
+    body_start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class Checkbox:
+    """A ``- [ ]`` / ``- [x]`` item; ``offset`` is the byte of its mark."""
+
+    label: str
+    checked: bool
+    offset: int
+
+
+class SpecDocument:
+    """Spec content indexed by section.
+
+    Sections are looked up by number (``"4.2"``), title (``"Steps"``,
+    case-insensitive) or full heading (``"4.2 Steps"``); the first match in
+    document order wins.
+
+    Example:
+        doc = SpecDocument.load("specs/SPEC-00001-login.md")
+        doc.set_checkbox("Prerequisite 1")
+        doc.replace_section("4.2", "1. Add the form\\n2. Wire up the API\\n")
+        doc.save()
+    """
+
+    def __init__(self, data: bytes | str, path: Optional[str | Path] = None) -> None:
+        """Initialize SpecDocument.
+
+        Args:
+            data: Spec content
+            path: File the content belongs to, used by ``save``
+        """
+        self._data = data.encode() if isinstance(data, str) else bytes(data)
+        self.path = Path(path) if path is not None else None
+        self._sections: Optional[list[SpecSection]] = None
+        self._header: Optional[tuple[SpecHeader, int]] = None
+
+    @classmethod
+    def load(cls, path: str | Path) -> SpecDocument:
+        """Read a spec file.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        return cls(Path(path).read_bytes(), path)
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @property
+    def text(self) -> str:
+        return self._data.decode()
+
+    # Reading
+
+    @property
+    def sections(self) -> list[SpecSection]:
+        """All sections in document order."""
+        if self._sections is None:
+            self._sections = self._index_sections()
+        return self._sections
+
+    def _index_sections(self) -> list[SpecSection]:
+        headings = []
+        ends: list[int] = []
+        open_headings: list[int] = []  # indexes into headings, by increasing level
+        fence: Optional[bytes] = None
+        for match in _HEADING.finditer(b"\n" + self._data):
+            marker = match.group("fence")
+            if marker is not None:
+                if fence is None:
+                    fence = marker
+                elif marker == fence:
+                    fence = None
+                continue
+            if fence is not None:
+                continue
+            level = len(match.group("hashes"))
+            while open_headings and headings[open_headings[-1]][0] >= level:
+                ends[open_headings.pop()] = match.start()
+            open_headings.append(len(headings))
+            # The match starts at the newline before the heading, one byte
+            # early in the padded content: the line start in ``_data``
+            headings.append((level, match.group("title"), match.start()))
+            ends.append(len(self._data))
+
+        sections = []
+        for (level, title, start), end in zip(headings, ends):
+            line_end = self._data.find(b"\n", start)
+            heading = title.decode(errors="replace")
+            number = _SECTION_NUMBER.match(heading)
+            sections.append(SpecSection(
+                level,
+                heading,
+                number.group(1) if number else None,
+                heading[number.end():] if number else heading,
+                start,
+                line_end + 1 if line_end != -1 else len(self._data),
+                end,
+            ))
+        return sections
+
+    def find_section(self, key: str) -> Optional[SpecSection]:
+        """Return the first section matching a number, title or heading."""
+        key = key.strip()
+        lowered = key.lower()
+        for matches in (
+            lambda s: s.number == key,
+            lambda s: s.title.lower() == lowered,
+            lambda s: s.heading == key,
+        ):
+            section = next((s for s in self.sections if matches(s)), None)
+            if section is not None:
+                return section
+        return None
+
+    def section(self, key: str) -> SpecSection:
+        """Like ``find_section``, but raise KeyError if there is no match."""
+        section = self.find_section(key)
+        if section is None:
+            raise KeyError(f"Section not found: {key}")
+        return section
+
+    def body(self, key: str | SpecSection) -> str:
+        """Text under a section's heading, subsections included."""
+        section = self.section(key) if isinstance(key, str) else key
+        return self._data[section.body_start:section.end].decode()
+
+    def checkboxes(self, section: Optional[str] = None) -> list[Checkbox]:
+        """Checkbox items of the document or of one section."""
+        start, end = 0, len(self._data)
+        if section is not None:
+            found = self.section(section)
+            start, end = found.body_start, found.end
+        return [
+            Checkbox(
+                label=match.group("label").decode(errors="replace").rstrip(),
+                checked=match.group("mark") != b" ",
+                offset=match.start("mark") - 1,
+            )
+            for match in _CHECKBOX.finditer(b"\n" + self._data, start, end + 1)
+        ]
+
+    @property
+    def header(self) -> SpecHeader:
+        """Metadata from the header block."""
+        return self._parse_header()[0]
+
+    def _parse_header(self) -> tuple[SpecHeader, int]:
+        """Parse the header; also return the offset where the header block ends."""
+        if self._header is None:
+            parser = SpecHeaderParser()
+            offset = 0
+            while offset < len(self._data):
+                newline = self._data.find(b"\n", offset)
+                end = len(self._data) if newline == -1 else newline + 1
+                line = self._data[offset:end].decode(errors="replace").rstrip("\r\n")
+                offset = end
+                if parser.feed(line):
+                    break
+            default_title = self.path.stem if self.path is not None else ""
+            self._header = (parser.result(default_title), offset)
+        return self._header
+
+    # Editing
+
+    def _splice(self, start: int, end: int, new: bytes) -> None:
+        """Replace ``data[start:end]`` and keep the section index in step."""
+        old = self._data[start:end]
+        self._data = self._data[:start] + new + self._data[end:]
+        if self._header is not None and start < self._header[1]:
+            self._header = None
+        if self._sections is None:
+            return
+        if _HEADING.search(b"\n" + new) or b"```" in old or b"~~~" in old:
+            # New headings, or a fence that hid or exposed some; index again when needed
+            self._sections = None
+            return
+        delta = len(new) - len(old)
+        if not delta:
+            return
+        sections = []
+        for s in self._sections:
+            if s.start >= end:
+                sections.append(SpecSection(
+                    s.level, s.heading, s.number, s.title,
+                    s.start + delta, s.body_start + delta, s.end + delta,
+                ))
+            elif s.body_start <= start and end <= s.end:
+                sections.append(SpecSection(
+                    s.level, s.heading, s.number, s.title, s.start, s.body_start, s.end + delta,
+                ))
+            elif start <= s.start and s.end <= end:
+                continue  # a subsection of the replaced body
+            elif s.end <= start:
+                sections.append(s)
+            else:
+                # The edit cut through a heading line
+                self._sections = None
+                return
+        self._sections = sections
+
+    def replace_section(self, key: str, body: str) -> None:
+        """Replace everything under a section's heading, subsections included.
+
+        Raises:
+            KeyError: If the section does not exist
+        """
+        section = self.section(key)
+        new = body.encode()
+        if section.end < len(self._data) and not new.endswith(b"\n"):
+            new += b"\n"
+        self._splice(section.body_start, section.end, new)
+
+    def set_checkbox(self, label: str, checked: bool = True, section: Optional[str] = None) -> bool:
+        """Tick or clear a checkbox.
+
+        The first item whose label equals ``label`` is used, or failing that
+        the first one whose label starts with it.
+
+        Args:
+            label: Checkbox label
+            checked: New state
+            section: Only look in this section
+
+        Returns:
+            True if the checkbox changed
+
+        Raises:
+            KeyError: If there is no such checkbox (or section)
+        """
+        boxes = self.checkboxes(section)
+        box = next((b for b in boxes if b.label == label), None) or next(
+            (b for b in boxes if b.label.startswith(label)), None
+        )
+        if box is None:
+            raise KeyError(f"Checkbox not found: {label}")
+        if box.checked == checked:
+            return False
+        self._splice(box.offset, box.offset + 1, b"x" if checked else b" ")
+        return True
+
+    def set_header(self, status: Optional[str] = None, version: Optional[str] = None) -> None:
+        """Change the status and/or version in the header block only."""
+        if not status and not version:
+            return
+        end = self._parse_header()[1]
+        head = self._data[:end].decode()
+        updated = update_header(head, status=status, version=version)
+        if updated != head:
+            self._splice(0, end, updated.encode())
+
+    def save(self, path: Optional[str | Path] = None) -> None:
+        """Write the document atomically, keeping the file's permissions.
+
+        Args:
+            path: Destination (default: the path it was loaded from)
+
+        Raises:
+            ValueError: If the document has no path
+        """
+        target = Path(path) if path is not None else self.path
+        if target is None:
+            raise ValueError("SpecDocument has no path to save to")
+        try:
+            mode: Optional[int] = os.stat(target).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = None
+        atomic_write(target, self._data, mode=mode)
+        self.path = target
@@ -0,0 +1,256 @@
+"""
+Spec headers - Single-pass extraction of specification metadata.
+
+A spec's metadata lives at the top of the file, either as YAML front matter::
+
+    ---
+    status: draft
+    version: 1.0.0
+    work_id: "123"
+    ---
+    # Login form
+
+or as the Markdown header written by the built-in templates::
+
+    # Login form
+
+    ## Status: Draft
+    ## Version: 1.0.0
+    ## Work ID: 123
+
+    ---
+
+Both forms are read line by line in one pass that stops at the end of the
+header block, so the body of a large spec is never scanned; ``read_spec_header``
+reads at most ``limit`` bytes from disk. Front matter values take precedence
+over Markdown header lines.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import yaml
+
+# Bytes read from a spec file when only its metadata is needed
+HEADER_READ_BYTES = 16 * 1024
+
+_FRONT_MATTER_OPEN = "---"
+_FRONT_MATTER_CLOSE = ("---", "...")
+_HEADER_LINE = re.compile(r"#+ (Status|Version|Work ID): (.*)$")
+_HEADER_FIELDS = {"Status": "status", "Version": "version", "Work ID": "work_id"}
+_FRONT_MATTER_KEYS = {
+    "title": "title",
+    "status": "status",
+    "version": "version",
+    "work_id": "work_id",
+    "work-id": "work_id",
+    "workId": "work_id",
+}
+
+
+@dataclass
+class SpecHeader:
+    """Metadata from the header block of a spec.
+
+    ``metadata`` holds front matter keys other than the standard fields.
+    ``front_matter`` tells whether the values came from YAML front matter.
+    """
+
+    title: str
+    status: str = "draft"
+    version: str = "1.0.0"
+    work_id: Optional[str] = None
+    metadata: dict[str, Any] = field(default_factory=dict)
+    front_matter: bool = False
+
+    def fields(self) -> dict[str, Any]:
+        """The standard fields, as ``Specification`` keyword arguments."""
+        return {
+            "title": self.title,
+            "status": self.status,
+            "version": self.version,
+            "work_id": self.work_id,
+        }
+
+
+class SpecHeaderParser:
+    """Incremental header parser; feed lines until ``feed`` returns True."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.metadata: dict[str, Any] = {}
+        self.front_matter = False
+        self._front_lines: Optional[list[str]] = None
+        self._started = False
+
+    @property
+    def in_front_matter(self) -> bool:
+        return self._front_lines is not None
+
+    def feed(self, line: str) -> bool:
+        """Consume one line (without its newline); return True once the header has ended."""
+        if self._front_lines is not None:
+            if line.rstrip() in _FRONT_MATTER_CLOSE:
+                self._finish_front_matter()
+            else:
+                self._front_lines.append(line)
+            return False
+
+        stripped = line.strip()
+        if not self._started:
+            if not stripped:
+                return False
+            self._started = True
+            if stripped == _FRONT_MATTER_OPEN:
+                self._front_lines = []
+                return False
+
+        if stripped == "---":
+            # The rule that closes the Markdown header
+            return True
+        if line.startswith("# "):
+            self.values.setdefault("title", line[2:].strip())
+        else:
+            match = _HEADER_LINE.match(line)
+            if match:
+                self.values.setdefault(_HEADER_FIELDS[match.group(1)], match.group(2).strip())
+        return len(self.values) == 4
+
+    def _finish_front_matter(self) -> None:
+        assert self._front_lines is not None
+        try:
+            data = yaml.safe_load("\n".join(self._front_lines))
+        except yaml.YAMLError:
+            data = None
+        self._front_lines = None
+        if not isinstance(data, dict):
+            return
+        self.front_matter = True
+        for key, value in data.items():
+            name = _FRONT_MATTER_KEYS.get(str(key))
+            if name is None:
+                self.metadata[str(key)] = value
+            elif value is not None:
+                # Front matter wins over any Markdown header line
+                self.values[name] = str(value)
+
+    def result(self, default_title: str) -> SpecHeader:
+        """Build the header; fields that were not found get their defaults."""
+        values = self.values
+        work_id = values.get("work_id")
+        return SpecHeader(
+            title=values.get("title") or default_title,
+            status=values.get("status", "draft").lower(),
+            version=values.get("version", "1.0.0"),
+            work_id=work_id if work_id and work_id != "N/A" else None,
+            metadata=self.metadata,
+            front_matter=self.front_matter,
+        )
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of ``text`` without splitting all of it up front."""
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end].rstrip("\r")
+        start = end + 1
+
+
+def parse_spec_header(lines: str | Iterable[str], default_title: str) -> SpecHeader:
+    """Parse the header of spec content (a string or an iterable of lines)."""
+    if isinstance(lines, str):
+        lines = _iter_lines(lines)
+    parser = SpecHeaderParser()
+    for line in lines:
+        if parser.feed(line):
+            break
+    return parser.result(default_title)
+
+
+def _front_matter_span(content: str) -> Optional[tuple[int, int]]:
+    """Return the (start, end) offsets of the YAML between front matter fences."""
+    offset = 0
+    opened: Optional[int] = None
+    for line in content.splitlines(keepends=True):
+        stripped = line.strip()
+        if opened is None:
+            if stripped == _FRONT_MATTER_OPEN:
+                opened = offset + len(line)
+            elif stripped:
+                return None
+        elif line.rstrip() in _FRONT_MATTER_CLOSE:
+            return opened, offset
+        offset += len(line)
+    return None
+
+
+def update_header(
+    content: str,
+    status: Optional[str] = None,
+    version: Optional[str] = None,
+) -> str:
+    """Return ``content`` with its status and/or version replaced.
+
+    In front matter the keys are rewritten in place (or added); otherwise the
+    ``## Status:`` and ``## Version:`` lines are replaced, with the status
+    title-cased as the templates write it.
+    """
+    updates = {key: value for key, value in (("status", status), ("version", version)) if value}
+    if not updates:
+        return content
+
+    span = _front_matter_span(content)
+    if span is not None:
+        start, end = span
+        block = content[start:end]
+        for key, value in updates.items():
+            line = f"{key}: {yaml.safe_dump(value).splitlines()[0]}"
+            block, count = re.subn(
+                rf"^{key}[ \t]*:.*$", lambda _, line=line: line, block, count=1, flags=re.MULTILINE,
+            )
+            if not count:
+                block += f"{line}\n"
+        return content[:start] + block + content[end:]
+
+    if status:
+        content = re.sub(
+            r"## Status: .+$", f"## Status: {status.title()}", content, flags=re.MULTILINE,
+        )
+    if version:
+        content = re.sub(
+            r"## Version: .+$", f"## Version: {version}", content, flags=re.MULTILINE,
+        )
+    return content
+
+
+def read_spec_header(path: str | Path, limit: int = HEADER_READ_BYTES) -> SpecHeader:
+    """Read the header of a spec file without loading its body.
+
+    Args:
+        path: Spec file
+        limit: Maximum bytes to read; a header (including front matter)
+            longer than this is cut off there
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path)
+    parser = SpecHeaderParser()
+    consumed = 0
+    with open(path, "rb") as f:
+        while consumed < limit:
+            raw = f.readline(limit - consumed)
+            if not raw:
+                break
+            consumed += len(raw)
+            if parser.feed(raw.decode("utf-8", errors="replace").rstrip("\r\n")):
+                break
+    return parser.result(path.stem)
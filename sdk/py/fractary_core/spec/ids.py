@@ -0,0 +1,156 @@
+"""
+Spec IDs - Atomic allocation of specification numbers.
+
+The last number handed out for each ID prefix is kept in
+``<specs_dir>/.index/counters``, one ``PREFIX NUMBER`` line per prefix.
+Every allocation reads, increments and rewrites that file under an exclusive
+lock (``fcntl`` where available, a lockfile elsewhere), so concurrent agents
+never receive the same ``SPEC-NNNNN`` and no allocation has to look at the
+spec files. A prefix without a counter
+is seeded once from the highest number already in use.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from fractary_core.common import locking
+from fractary_core.common.config import atomic_write
+from fractary_core.spec.index import INDEX_DIR, ensure_index_dir
+
+COUNTERS_FILE = "counters"
+
+
+def parse_counters(data: bytes) -> dict[str, int]:
+    """Parse the counters file; malformed lines are skipped."""
+    counters: dict[str, int] = {}
+    for line in data.decode(errors="replace").splitlines():
+        prefix, _, number = line.rpartition(" ")
+        if prefix and number.isdigit():
+            counters[prefix] = int(number)
+    return counters
+
+
+def format_counters(counters: dict[str, int]) -> bytes:
+    return "".join(f"{prefix} {number}\n" for prefix, number in sorted(counters.items())).encode()
+
+
+class SpecIdAllocator:
+    """Hands out increasing numbers per prefix, safely across threads and processes.
+
+    The counters file stays open for the life of the allocator. Threads of a
+    process take turns through an in-process lock, since ``fcntl`` locks held
+    through one open file do not exclude each other; a forked child reopens
+    the file so that it stops sharing its parent's lock. Without ``fcntl``
+    the file is rewritten atomically under a ``counters.lock`` lockfile.
+
+    Example:
+        ids = SpecIdAllocator("specs")
+        ids.allocate("SPEC")  # 1, then 2, 3, ...
+    """
+
+    def __init__(self, specs_dir: str | Path) -> None:
+        """Initialize SpecIdAllocator.
+
+        Args:
+            specs_dir: Directory holding the spec files
+        """
+        self.specs_dir = Path(specs_dir)
+        self.path = self.specs_dir / INDEX_DIR / COUNTERS_FILE
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _file(self) -> int:
+        if self._fd is None or self._pid != os.getpid():
+            ensure_index_dir(self.specs_dir)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def close(self) -> None:
+        """Close the counters file."""
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+
+    def allocate(
+        self,
+        prefix: str,
+        seed: Optional[Callable[[], Optional[int]]] = None,
+        floor: Optional[int] = None,
+        reserve: bool = True,
+    ) -> int:
+        """Return the next number for ``prefix``.
+
+        Args:
+            prefix: ID prefix, e.g. ``SPEC``
+            seed: Called (under the lock) when the prefix has no counter yet;
+                returns the highest number already in use, or None
+            floor: A number known to be in use; the result is always above it
+            reserve: Record the number as used; without it the next call
+                returns the same number
+
+        Raises:
+            ValueError: If ``prefix`` contains whitespace
+        """
+        if not prefix or prefix.split() != [prefix]:
+            raise ValueError(f"Invalid spec ID prefix: '{prefix}'")
+        fcntl = locking.fcntl
+        with self._lock:
+            if fcntl is None:
+                return self._allocate_with_lockfile(prefix, seed, floor, reserve)
+            fd = self._file()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                size = os.fstat(fd).st_size
+                counters = parse_counters(os.pread(fd, size, 0))
+                number = _next_number(counters, prefix, seed, floor, reserve)
+                if reserve:
+                    data = format_counters(counters)
+                    os.pwrite(fd, data, 0)
+                    if len(data) < size:
+                        os.ftruncate(fd, len(data))
+                return number
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _allocate_with_lockfile(
+        self,
+        prefix: str,
+        seed: Optional[Callable[[], Optional[int]]],
+        floor: Optional[int],
+        reserve: bool,
+    ) -> int:
+        ensure_index_dir(self.specs_dir)
+        with locking.file_lock(self.path.with_name(COUNTERS_FILE + ".lock")):
+            try:
+                counters = parse_counters(self.path.read_bytes())
+            except FileNotFoundError:
+                counters = {}
+            number = _next_number(counters, prefix, seed, floor, reserve)
+            if reserve:
+                atomic_write(self.path, format_counters(counters))
+            return number
+
+
+def _next_number(
+    counters: dict[str, int],
+    prefix: str,
+    seed: Optional[Callable[[], Optional[int]]],
+    floor: Optional[int],
+    reserve: bool,
+) -> int:
+    """Work out the next number for ``prefix``, recording it if ``reserve``."""
+    last = counters.get(prefix)
+    if last is None:
+        last = (seed() if seed is not None else None) or 0
+    if floor is not None:
+        last = max(last, floor)
+    if reserve:
+        counters[prefix] = last + 1
+    return last + 1
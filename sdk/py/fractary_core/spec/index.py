@@ -0,0 +1,357 @@
+"""
+Spec index - Persistent metadata index of a specs directory.
+
+The index lives in ``<specs_dir>/.index/specs.json`` and records the title,
+status, version and work ID of every spec file, keyed by file name. Lookups
+by spec ID, work ID and status are answered from memory. The index is kept
+current incrementally: while the directory's mtime is unchanged the file
+names are trusted as is, and a refresh lists the directory once and re-reads
+only the headers of files whose mtime or size changed.
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from fractary_core.common.config import atomic_write
+from fractary_core.spec.header import SpecHeader, parse_spec_header, read_spec_header
+
+INDEX_DIR = ".index"
+INDEX_FILE = "specs.json"
+_INDEX_VERSION = 1
+
+# Timestamps this close to a scan may be followed by a change that leaves
+# them unchanged (coarse file system clocks), so they are not trusted
+_RACY_NS = 1_000_000_000
+
+_GLOB_CHARS = frozenset("*?[")
+_SPEC_ID = re.compile(r"[A-Za-z][A-Za-z0-9_]*-\d+")
+
+
+def ensure_index_dir(specs_dir: str | Path) -> Path:
+    """Create ``<specs_dir>/.index`` if needed and return it.
+
+    Specs are usually committed, so the directory gets a ``.gitignore`` that
+    keeps it out of ``git status``.
+    """
+    index_dir = Path(specs_dir) / INDEX_DIR
+    gitignore = index_dir / ".gitignore"
+    if not gitignore.exists():
+        index_dir.mkdir(parents=True, exist_ok=True)
+        atomic_write(gitignore, b"*\n")
+    return index_dir
+
+
+def _number_in(prefix: str, name: str) -> Optional[int]:
+    if not name.startswith(f"{prefix}-"):
+        return None
+    match = re.search(rf"{re.escape(prefix)}-(\d+)", name)
+    return int(match.group(1)) if match else None
+
+
+@dataclass
+class SpecIndexEntry:
+    """Indexed metadata of one spec file."""
+
+    name: str
+    mtime_ns: int
+    size: int
+    title: str
+    status: str
+    version: str
+    work_id: Optional[str] = None
+
+    def fields(self) -> tuple[Any, ...]:
+        """Everything but the name, as stored in the index file."""
+        return (self.mtime_ns, self.size, self.title, self.status, self.version, self.work_id)
+
+    @property
+    def stem(self) -> str:
+        return self.name[:-3]
+
+    @property
+    def spec_id(self) -> Optional[str]:
+        """The ID the file name starts with (``SPEC-00001``, ``WORK-00123``)."""
+        match = _SPEC_ID.match(self.name)
+        return match.group(0) if match else None
+
+
+class SpecIndex:
+    """Metadata index over the ``*.md`` files of a specs directory.
+
+    ``find()`` resolves an ID the way a sequence of ``glob`` scans would
+    (``{id}*.md``, then ``WORK-{id:0>5}*.md`` for numeric IDs, then
+    ``*{id}*.md``), but against the sorted in-memory name list; among
+    several matches the first name in sort order wins.
+
+    Example:
+        index = SpecIndex("specs")
+        entry = index.find("SPEC-00042")
+        drafts = index.entries(status="draft")
+    """
+
+    def __init__(self, specs_dir: str | Path) -> None:
+        """Initialize SpecIndex.
+
+        Args:
+            specs_dir: Directory holding the spec files
+        """
+        self.specs_dir = Path(specs_dir)
+        self.path = self.specs_dir / INDEX_DIR / INDEX_FILE
+        self._entries: dict[str, SpecIndexEntry] = {}
+        self._names: list[str] = []
+        self._max_numbers: dict[str, Optional[int]] = {}
+        self._dir_mtime_ns: Optional[int] = None
+        self._scanned_ns = 0
+        self._loaded = False
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != _INDEX_VERSION:
+                return
+            self._entries = {
+                name: SpecIndexEntry(name, *fields) for name, fields in data["entries"].items()
+            }
+            self._dir_mtime_ns = data["dir_mtime_ns"]
+            self._scanned_ns = data["scanned_ns"]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._entries = {}
+            self._dir_mtime_ns = None
+        self._names = sorted(self._entries)
+        self._max_numbers = {}
+
+    def _save(self) -> None:
+        data: dict[str, Any] = {
+            "version": _INDEX_VERSION,
+            "dir_mtime_ns": self._dir_mtime_ns,
+            "scanned_ns": self._scanned_ns,
+            "entries": {name: entry.fields() for name, entry in self._entries.items()},
+        }
+        try:
+            ensure_index_dir(self.specs_dir)
+            atomic_write(self.path, json.dumps(data, separators=(",", ":")).encode())
+        except OSError:
+            # The index can always be rebuilt; a read-only specs directory still works
+            pass
+
+    def _dir_mtime(self) -> Optional[int]:
+        try:
+            return self.specs_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _names_current(self) -> bool:
+        """True if no file can have been added, removed or renamed since the last scan."""
+        mtime = self._dir_mtime()
+        return (
+            mtime is not None
+            and mtime == self._dir_mtime_ns
+            and mtime < self._scanned_ns - _RACY_NS
+        )
+
+    def _ensure_current(self) -> None:
+        if not self._loaded:
+            self._load()
+        if not self._names_current():
+            self.refresh()
+
+    def _index_file(
+        self, name: str, st: os.stat_result, content: Optional[str] = None,
+    ) -> Optional[SpecIndexEntry]:
+        header: SpecHeader
+        if content is not None:
+            header = parse_spec_header(content, name[:-3])
+        else:
+            try:
+                header = read_spec_header(self.specs_dir / name)
+            except OSError:
+                return None
+        # A file modified just now may change again without its mtime
+        # moving; record no mtime so it is re-read next time
+        mtime_ns = st.st_mtime_ns if st.st_mtime_ns < time.time_ns() - _RACY_NS else 0
+        return SpecIndexEntry(name, mtime_ns, st.st_size, **header.fields())
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the directory.
+
+        Returns:
+            Number of files (re)indexed or dropped
+        """
+        if not self._loaded:
+            self._load()
+        self._scanned_ns = time.time_ns()
+        dir_mtime = self._dir_mtime()
+        entries: dict[str, SpecIndexEntry] = {}
+        changed = 0
+        try:
+            with os.scandir(self.specs_dir) as it:
+                for dirent in it:
+                    name = dirent.name
+                    if name.startswith(".") or not name.endswith(".md"):
+                        continue
+                    try:
+                        if not dirent.is_file():
+                            continue
+                        st = dirent.stat()
+                    except OSError:
+                        continue
+                    entry = self._entries.get(name)
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    if entry is None or (entry.mtime_ns, entry.size) != stamp:
+                        entry = self._index_file(name, st)
+                        changed += 1
+                        if entry is None:
+                            continue
+                    entries[name] = entry
+        except FileNotFoundError:
+            pass
+
+        changed += len(self._entries.keys() - entries.keys())
+        dir_changed = dir_mtime != self._dir_mtime_ns
+        self._entries = entries
+        self._names = sorted(entries)
+        self._max_numbers = {}
+        self._dir_mtime_ns = dir_mtime
+        if changed or dir_changed:
+            self._save()
+        return changed
+
+    def update(self, path: str | Path, content: Optional[str] = None) -> Optional[SpecIndexEntry]:
+        """Re-index one spec file after it was written.
+
+        Args:
+            path: Spec file inside the specs directory
+            content: The file's contents, if already in hand
+        """
+        if not self._loaded:
+            self._load()
+        name = Path(path).name
+        try:
+            st = (self.specs_dir / name).stat()
+        except OSError:
+            self.remove(name)
+            return None
+        entry = self._index_file(name, st, content)
+        if entry is None:
+            return None
+        if name not in self._entries:
+            bisect.insort(self._names, name)
+            for prefix, highest in self._max_numbers.items():
+                number = _number_in(prefix, name)
+                if number is not None and (highest is None or number > highest):
+                    self._max_numbers[prefix] = number
+        self._entries[name] = entry
+        self._save()
+        return entry
+
+    def remove(self, name: str) -> None:
+        """Drop a file from the index."""
+        if self._entries.pop(name, None) is not None:
+            self._names.remove(name)
+            self._max_numbers = {}
+            self._save()
+
+    def get(self, name: str) -> Optional[SpecIndexEntry]:
+        """Return the entry of a file name (``SPEC-00001-login.md``)."""
+        self._ensure_current()
+        return self._entries.get(name)
+
+    def _first_with_prefix(self, prefix: str) -> Optional[str]:
+        i = bisect.bisect_left(self._names, prefix)
+        while i < len(self._names) and self._names[i].startswith(prefix):
+            name = self._names[i]
+            if len(name) >= len(prefix) + 3:
+                return name
+            i += 1
+        return None
+
+    def _first_matching(self, pattern: str) -> Optional[str]:
+        return next((name for name in self._names if fnmatch.fnmatchcase(name, pattern)), None)
+
+    def find(self, spec_id: str) -> Optional[SpecIndexEntry]:
+        """Resolve a spec ID, work ID or file name prefix to an entry."""
+        self._ensure_current()
+        if not _GLOB_CHARS.isdisjoint(spec_id):
+            name = self._first_matching(f"{spec_id}*.md")
+        else:
+            name = self._first_with_prefix(spec_id)
+        if name is None and spec_id.isdigit():
+            name = self._first_with_prefix(f"WORK-{spec_id:0>5}")
+        if name is None:
+            name = self._first_matching(f"*{spec_id}*.md")
+        return self._entries[name] if name is not None else None
+
+    def max_number(self, prefix: str, refresh: bool = True) -> Optional[int]:
+        """Highest ``NNNNN`` among files named ``{prefix}-NNNNN...``.
+
+        Used as a floor for new IDs, so a file removed since the last scan
+        may still count.
+
+        Args:
+            prefix: ID prefix, e.g. ``SPEC``
+            refresh: Also consider files added since the last scan (one
+                directory stat when nothing changed); without it only files
+                the index already knows of are considered
+        """
+        if not self._loaded:
+            self._load()
+        highest = self._known_max_number(prefix)
+        if refresh and not self._names_current():
+            # Only names are needed: list the directory and look at the names
+            # the index does not know yet, without re-reading any headers
+            try:
+                names = os.listdir(self.specs_dir)
+            except FileNotFoundError:
+                names = []
+            leading = re.compile(rf"{re.escape(prefix)}-(\d+)")
+            for name in names:
+                if name in self._entries or not name.endswith(".md"):
+                    continue
+                match = leading.match(name)
+                number = int(match.group(1)) if match else _number_in(prefix, name)
+                if number is not None and (highest is None or number > highest):
+                    highest = number
+        return highest
+
+    def _known_max_number(self, prefix: str) -> Optional[int]:
+        if prefix not in self._max_numbers:
+            start = f"{prefix}-"
+            numbers = []
+            i = bisect.bisect_left(self._names, start)
+            while i < len(self._names) and self._names[i].startswith(start):
+                number = _number_in(prefix, self._names[i])
+                if number is not None:
+                    numbers.append(number)
+                i += 1
+            self._max_numbers[prefix] = max(numbers) if numbers else None
+        return self._max_numbers[prefix]
+
+    def entries(
+        self,
+        status: Optional[str] = None,
+        work_id: Optional[str] = None,
+    ) -> Iterator[SpecIndexEntry]:
+        """Yield entries in name order, optionally filtered.
+
+        Every file is checked for changes first, so filters see current
+        metadata.
+        """
+        self.refresh()
+        status = status.lower() if status else None
+        for name in self._names:
+            entry = self._entries[name]
+            if status and entry.status != status:
+                continue
+            if work_id and entry.work_id != work_id:
+                continue
+            yield entry
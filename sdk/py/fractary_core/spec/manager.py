@@ -6,7 +6,9 @@ Handles creation, validation, and refinement of specifications.
 
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +16,21 @@ from typing import Any, Optional
 
 import yaml
 
+from fractary_core.spec.document import SpecDocument
+from fractary_core.spec.header import SpecHeader, parse_spec_header
+from fractary_core.spec.ids import SpecIdAllocator
+from fractary_core.spec.index import SpecIndex
+from fractary_core.spec.validation import (
+    ValidationCache,
+    ValidationResult,
+    content_digest,
+    scan_spec,
+    validate_content,
+)
+
+# Specs to revalidate before validate_all() starts worker processes
+_PARALLEL_MIN_SPECS = 32
+
 
 @dataclass
 class Specification:
@@ -30,17 +47,6 @@ class Specification:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
-class ValidationResult:
-    """Result of specification validation."""
-
-    status: str  # complete | partial | incomplete
-    completeness: float
-    missing_sections: list[str] = field(default_factory=list)
-    suggestions: list[str] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
-
-
 # Default templates for different work types
 TEMPLATES = {
     "feature": """# {title}
@@ -397,12 +403,20 @@ class SpecManager:
 
     Handles creation, validation, and management of specifications
     without any LangChain dependencies.
+
+    Lookups go through a ``SpecIndex`` persisted in ``<specs_dir>/.index``,
+    so finding a spec by ID or work ID does not scan the directory, and
+    listing re-reads only files that changed since the index last saw them.
+    New spec IDs come from a locked counter, so concurrent creators in
+    other threads or processes never receive the same ID.
     """
 
     def __init__(self, config: Optional[dict[str, Any]] = None) -> None:
         """Initialize SpecManager with optional config."""
         self.config = config or self._load_config()
         self.specs_dir = Path(self.config.get("specs_dir", "specs"))
+        self.index = SpecIndex(self.specs_dir)
+        self.ids = SpecIdAllocator(self.specs_dir)
 
     def _load_config(self) -> dict[str, Any]:
         """Load configuration from .faber/config.yaml."""
@@ -418,23 +432,22 @@ class SpecManager:
             "templates_dir": ".faber/spec-templates",
         }
 
-    def _generate_spec_id(self) -> str:
-        """Generate a new unique specification ID."""
-        prefix = self.config.get("id_prefix", "SPEC")
-
-        # Find existing specs and get next number
-        existing = list(self.specs_dir.glob(f"{prefix}-*.md"))
-        if not existing:
-            return f"{prefix}-00001"
-
-        # Extract numbers from existing specs
-        numbers = []
-        for path in existing:
-            match = re.search(rf"{prefix}-(\d+)", path.name)
-            if match:
-                numbers.append(int(match.group(1)))
+    def _generate_spec_id(self, reserve: bool = True) -> str:
+        """Generate a new unique specification ID.
 
-        next_num = max(numbers) + 1 if numbers else 1
+        Args:
+            reserve: Mark the number as taken; specs filed under a work ID
+                report the next number without using it up
+        """
+        prefix = self.config.get("id_prefix", "SPEC")
+        # Spec files that arrived without the counter (a pull, a file added by
+        # hand) are skipped; the index only rescans if the directory changed
+        next_num = self.ids.allocate(
+            prefix,
+            seed=lambda: self.index.max_number(prefix),
+            floor=self.index.max_number(prefix),
+            reserve=reserve,
+        )
         return f"{prefix}-{next_num:05d}"
 
     def _get_template(self, template_name: str) -> str:
@@ -465,7 +478,7 @@ class SpecManager:
         Returns:
             Created Specification object
         """
-        spec_id = self._generate_spec_id()
+        spec_id = self._generate_spec_id(reserve=not work_id)
         template_content = self._get_template(template)
         created_date = datetime.now().strftime("%Y-%m-%d")
 
@@ -488,6 +501,7 @@ class SpecManager:
         path = self.specs_dir / filename
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(content)
+        self.index.update(path, content)
 
         return Specification(
             id=spec_id,
@@ -501,6 +515,27 @@ class SpecManager:
             metadata={"created_date": created_date},
         )
 
+    def _spec_path(self, spec_id: str, refresh: bool = False) -> Path:
+        """Resolve a spec ID or work ID to its file through the index."""
+        if refresh:
+            self.index.refresh()
+        entry = self.index.find(spec_id)
+        if entry is None:
+            raise FileNotFoundError(f"Specification not found: {spec_id}")
+        return self.specs_dir / entry.name
+
+    def _specification(
+        self, spec_id: str, path: Path, content: str, header: Optional[SpecHeader] = None,
+    ) -> Specification:
+        header = header or parse_spec_header(content, path.stem)
+        return Specification(
+            id=spec_id,
+            path=str(path),
+            content=content,
+            metadata=header.metadata,
+            **header.fields(),
+        )
+
     def get_spec(self, spec_id: str) -> Specification:
         """Get a specification by ID or work ID.
 
@@ -510,44 +545,29 @@ class SpecManager:
         Returns:
             Specification object
         """
-        # Try to find by spec ID
-        matches = list(self.specs_dir.glob(f"{spec_id}*.md"))
-
-        # Try to find by work ID
-        if not matches:
-            matches = list(self.specs_dir.glob(f"WORK-{spec_id:0>5}*.md")) if spec_id.isdigit() else []
+        path = self._spec_path(spec_id)
+        try:
+            content = path.read_text()
+        except FileNotFoundError:
+            # Removed since the index last looked; retry against a fresh scan
+            path = self._spec_path(spec_id, refresh=True)
+            content = path.read_text()
+        return self._specification(spec_id, path, content)
+
+    def open_spec(self, spec_id: str) -> SpecDocument:
+        """Open a specification for section-level reading and editing.
 
-        if not matches:
-            matches = list(self.specs_dir.glob(f"*{spec_id}*.md"))
-
-        if not matches:
-            raise FileNotFoundError(f"Specification not found: {spec_id}")
-
-        path = matches[0]
-        content = path.read_text()
-
-        # Parse metadata from content
-        title_match = re.search(r"^# (.+)$", content, re.MULTILINE)
-        title = title_match.group(1) if title_match else path.stem
-
-        version_match = re.search(r"## Version: (.+)$", content, re.MULTILINE)
-        version = version_match.group(1) if version_match else "1.0.0"
-
-        status_match = re.search(r"## Status: (.+)$", content, re.MULTILINE)
-        status = status_match.group(1).lower() if status_match else "draft"
-
-        work_id_match = re.search(r"## Work ID: (.+)$", content, re.MULTILINE)
-        work_id = work_id_match.group(1) if work_id_match and work_id_match.group(1) != "N/A" else None
+        Args:
+            spec_id: Spec ID (SPEC-00001) or work ID (123)
 
-        return Specification(
-            id=spec_id,
-            path=str(path),
-            title=title,
-            work_id=work_id,
-            status=status,
-            version=version,
-            content=content,
-        )
+        Returns:
+            SpecDocument bound to the spec's file; call ``save()`` after editing
+        """
+        path = self._spec_path(spec_id)
+        try:
+            return SpecDocument.load(path)
+        except FileNotFoundError:
+            return SpecDocument.load(self._spec_path(spec_id, refresh=True))
 
     def update_spec(
         self,
@@ -558,6 +578,9 @@ class SpecManager:
     ) -> Specification:
         """Update an existing specification.
 
+        Status and version are changed in the header block only, by splicing
+        those lines; the rest of the file is left byte for byte as it was.
+
         Args:
             spec_id: Specification ID
             content: New content (optional)
@@ -567,29 +590,17 @@ class SpecManager:
         Returns:
             Updated Specification object
         """
-        spec = self.get_spec(spec_id)
-        new_content = content or spec.content
-
-        # Update status in content
-        if status:
-            new_content = re.sub(
-                r"## Status: .+$",
-                f"## Status: {status.title()}",
-                new_content,
-                flags=re.MULTILINE,
-            )
-
-        # Update version in content
-        if version:
-            new_content = re.sub(
-                r"## Version: .+$",
-                f"## Version: {version}",
-                new_content,
-                flags=re.MULTILINE,
-            )
-
-        Path(spec.path).write_text(new_content)
-        return self.get_spec(spec_id)
+        if content:
+            doc = SpecDocument(content, self._spec_path(spec_id))
+        else:
+            doc = self.open_spec(spec_id)
+        doc.set_header(status=status, version=version)
+        doc.save()
+
+        assert doc.path is not None
+        text = doc.text
+        self.index.update(doc.path, text)
+        return self._specification(spec_id, doc.path, text, doc.header)
 
     def validate_spec(self, spec_id: str) -> ValidationResult:
         """Validate a specification for completeness.
@@ -600,83 +611,101 @@ class SpecManager:
         Returns:
             ValidationResult with completeness assessment
         """
-        spec = self.get_spec(spec_id)
-        content = spec.content
-
-        # Required sections for all specs
-        required_sections = [
-            ("## 1. Summary", "## 1. Overview", "## 1. Problem Description"),
-            ("## 2. Requirements",),
-            ("## 3. ", "## 4. "),  # Technical approach or similar
-            ("## Acceptance Criteria", "## 4. Acceptance Criteria", "## 3. Acceptance Criteria"),
-        ]
-
-        missing = []
-        for section_options in required_sections:
-            found = any(section in content for section in section_options)
-            if not found:
-                missing.append(section_options[0])
-
-        # Check for unchecked checkboxes (incomplete items)
-        unchecked = len(re.findall(r"- \[ \]", content))
-        checked = len(re.findall(r"- \[x\]", content, re.IGNORECASE))
-        total_checkboxes = unchecked + checked
-
-        # Calculate completeness
-        section_completeness = 1.0 - (len(missing) / len(required_sections))
-        checkbox_completeness = checked / total_checkboxes if total_checkboxes > 0 else 1.0
-        completeness = (section_completeness * 0.7) + (checkbox_completeness * 0.3)
-
-        # Determine status
-        if completeness >= 0.9 and not missing:
-            status = "complete"
-        elif completeness >= 0.5:
-            status = "partial"
-        else:
-            status = "incomplete"
-
-        # Generate suggestions
-        suggestions = []
-        for section in missing:
-            suggestions.append(f"Add section: {section}")
-        if unchecked > 0:
-            suggestions.append(f"Complete {unchecked} unchecked items")
-
-        return ValidationResult(
-            status=status,
-            completeness=completeness,
-            missing_sections=missing,
-            suggestions=suggestions,
-        )
+        return validate_content(self.get_spec(spec_id).content)
+
+    def validate_all(self, max_workers: Optional[int] = None) -> dict[str, ValidationResult]:
+        """Validate every specification in the specs directory.
+
+        Results are cached in ``<specs_dir>/.index/validation.json`` keyed on
+        a hash of each spec's content, so only new or changed specs are
+        validated again. When many are, they are validated in a process pool.
+        A spec that cannot be decoded gets an ``incomplete`` result with the
+        reason in ``errors``.
+
+        Args:
+            max_workers: Worker processes (default: CPU count); 1 validates
+                in this process
+
+        Returns:
+            ValidationResult per spec ID, in spec ID order
+        """
+        cache = ValidationCache(self.specs_dir)
+        digests: dict[str, str] = {}
+        results: dict[str, ValidationResult] = {}
+        pending: dict[str, str] = {}
+        for entry in self.index.entries():
+            try:
+                data = (self.specs_dir / entry.name).read_bytes()
+            except OSError:
+                continue
+            digest = digests[entry.stem] = content_digest(data)
+            cached = cache.get(digest)
+            if cached is not None:
+                results[entry.stem] = cached
+                continue
+            try:
+                pending[entry.stem] = data.decode()
+            except UnicodeDecodeError as e:
+                results[entry.stem] = ValidationResult(
+                    status="incomplete", completeness=0.0, errors=[f"Cannot decode spec: {e}"],
+                )
+
+        if pending:
+            workers = max_workers or os.cpu_count() or 1
+            if workers > 1 and len(pending) >= _PARALLEL_MIN_SPECS:
+                chunksize = max(1, len(pending) // (workers * 4))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    validated = executor.map(
+                        validate_content, pending.values(), chunksize=chunksize
+                    )
+                    results.update(zip(pending, validated))
+            else:
+                results.update((stem, validate_content(text)) for stem, text in pending.items())
+
+        for stem, result in results.items():
+            if cache.get(digests[stem]) is None:
+                cache.put(digests[stem], result)
+        cache.save(keep=set(digests.values()))
+        return {stem: results[stem] for stem in digests}
 
     def list_specs(
         self,
         status: Optional[str] = None,
         work_id: Optional[str] = None,
+        include_content: bool = True,
     ) -> list[Specification]:
         """List specifications with optional filtering.
 
+        Metadata comes from the spec index, which re-reads only the headers
+        of changed files. With ``include_content=False`` no spec bodies are
+        read at all.
+
         Args:
             status: Filter by status
             work_id: Filter by work ID
+            include_content: Load each spec's full content
 
         Returns:
             List of Specification objects
         """
         specs = []
-        for path in self.specs_dir.glob("*.md"):
-            try:
-                spec = self.get_spec(path.stem)
-
-                # Apply filters
-                if status and spec.status.lower() != status.lower():
-                    continue
-                if work_id and spec.work_id != work_id:
+        for entry in self.index.entries(status=status, work_id=work_id):
+            path = self.specs_dir / entry.name
+            content = ""
+            if include_content:
+                try:
+                    content = path.read_text()
+                except (OSError, UnicodeDecodeError):
                     continue
-
-                specs.append(spec)
-            except Exception:
-                continue
+            specs.append(Specification(
+                id=entry.stem,
+                path=str(path),
+                title=entry.title,
+                work_id=entry.work_id,
+                status=entry.status,
+                version=entry.version,
+                content=content,
+            ))
 
         return specs
 
@@ -700,40 +729,4 @@ class SpecManager:
         Returns:
             List of refinement questions
         """
-        spec = self.get_spec(spec_id)
-        validation = self.validate_spec(spec_id)
-        content = spec.content
-
-        questions = []
-
-        # Questions for missing sections
-        for section in validation.missing_sections:
-            questions.append(f"Can you provide details for {section}?")
-
-        # Check for vague content
-        vague_patterns = [
-            (r"\[.+\]", "There are placeholder texts that need to be filled in"),
-            (r"TODO", "There are TODO items that need to be addressed"),
-            (r"TBD", "There are TBD items that need to be determined"),
-        ]
-
-        for pattern, message in vague_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                questions.append(message)
-
-        # Standard refinement questions
-        standard_questions = [
-            "Are there any edge cases we should consider?",
-            "What are the security implications?",
-            "Are there any performance requirements or constraints?",
-            "What dependencies does this work have?",
-            "What is the rollback strategy if something goes wrong?",
-        ]
-
-        # Only add questions not already covered by spec content
-        for q in standard_questions:
-            keyword = q.split()[3].lower()  # Get main keyword
-            if keyword not in content.lower():
-                questions.append(q)
-
-        return questions[:10]  # Limit to 10 questions
+        return scan_spec(self.get_spec(spec_id).content).questions()
@@ -0,0 +1,209 @@
+"""
+Spec validation - Completeness checks over specification content.
+
+Everything validation and refinement look at (required sections, checkbox
+counts, placeholder/TODO/TBD markers and the topics of the standard
+refinement questions) is collected by ``scan_spec`` in one pass per spec,
+so ``validate_spec`` and ``generate_refinement_questions`` share the work.
+``ValidationCache`` keeps results in ``<specs_dir>/.index/validation.json``
+keyed on a hash of the content, so ``SpecManager.validate_all`` revalidates
+only specs that changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from fractary_core.common.config import atomic_write
+from fractary_core.spec.index import INDEX_DIR, ensure_index_dir
+
+VALIDATION_FILE = "validation.json"
+# Bump when the checks change so cached results are discarded
+_VALIDATION_VERSION = 1
+
+# Required sections for all specs; any one heading of a group satisfies it
+REQUIRED_SECTIONS = (
+    ("## 1. Summary", "## 1. Overview", "## 1. Problem Description"),
+    ("## 2. Requirements",),
+    ("## 3. ", "## 4. "),  # Technical approach or similar
+    ("## Acceptance Criteria", "## 4. Acceptance Criteria", "## 3. Acceptance Criteria"),
+)
+
+_PLACEHOLDER = re.compile(r"\[.+\]")
+_PLACEHOLDER_MESSAGE = "There are placeholder texts that need to be filled in"
+# Case-insensitive markers of vague content, searched in the lowered text
+VAGUE_MARKERS = (
+    ("todo", "There are TODO items that need to be addressed"),
+    ("tbd", "There are TBD items that need to be determined"),
+)
+
+STANDARD_QUESTIONS = (
+    "Are there any edge cases we should consider?",
+    "What are the security implications?",
+    "Are there any performance requirements or constraints?",
+    "What dependencies does this work have?",
+    "What is the rollback strategy if something goes wrong?",
+)
+# A standard question is asked only if the spec never mentions its main keyword
+_QUESTION_KEYWORDS = tuple(q.split()[3].lower() for q in STANDARD_QUESTIONS)
+
+
+@dataclass
+class ValidationResult:
+    """Result of specification validation."""
+
+    status: str  # complete | partial | incomplete
+    completeness: float
+    missing_sections: list[str] = field(default_factory=list)
+    suggestions: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SpecSignals:
+    """What one scan of a spec's content found."""
+
+    missing_sections: list[str]
+    unchecked: int
+    checked: int
+    vague: list[str]
+    unanswered: list[str]
+
+    def result(self) -> ValidationResult:
+        """Score the signals as ``SpecManager.validate_spec`` reports them."""
+        total_checkboxes = self.unchecked + self.checked
+        section_completeness = 1.0 - (len(self.missing_sections) / len(REQUIRED_SECTIONS))
+        checkbox_completeness = self.checked / total_checkboxes if total_checkboxes > 0 else 1.0
+        completeness = (section_completeness * 0.7) + (checkbox_completeness * 0.3)
+
+        if completeness >= 0.9 and not self.missing_sections:
+            status = "complete"
+        elif completeness >= 0.5:
+            status = "partial"
+        else:
+            status = "incomplete"
+
+        suggestions = [f"Add section: {section}" for section in self.missing_sections]
+        if self.unchecked > 0:
+            suggestions.append(f"Complete {self.unchecked} unchecked items")
+
+        return ValidationResult(
+            status=status,
+            completeness=completeness,
+            missing_sections=list(self.missing_sections),
+            suggestions=suggestions,
+        )
+
+    def questions(self) -> list[str]:
+        """Refinement questions, at most 10."""
+        questions = [f"Can you provide details for {section}?" for section in self.missing_sections]
+        questions.extend(self.vague)
+        questions.extend(self.unanswered)
+        return questions[:10]
+
+
+def scan_spec(content: str) -> SpecSignals:
+    """Collect the validation and refinement signals of spec content."""
+    lowered = content.lower()
+    missing = [
+        options[0]
+        for options in REQUIRED_SECTIONS
+        if not any(section in content for section in options)
+    ]
+    vague = [_PLACEHOLDER_MESSAGE] if _PLACEHOLDER.search(content) else []
+    vague.extend(message for marker, message in VAGUE_MARKERS if marker in lowered)
+    return SpecSignals(
+        missing_sections=missing,
+        unchecked=content.count("- [ ]"),
+        checked=lowered.count("- [x]"),
+        vague=vague,
+        unanswered=[
+            question
+            for question, keyword in zip(STANDARD_QUESTIONS, _QUESTION_KEYWORDS)
+            if keyword not in lowered
+        ],
+    )
+
+
+def validate_content(content: str) -> ValidationResult:
+    """Validate spec content; a process pool worker for ``validate_all``."""
+    return scan_spec(content).result()
+
+
+def content_digest(data: bytes) -> str:
+    """Cache key of a spec's raw content."""
+    return hashlib.sha1(data).hexdigest()
+
+
+class ValidationCache:
+    """Validation results persisted by content hash.
+
+    Example:
+        cache = ValidationCache("specs")
+        result = cache.get(content_digest(data))
+        ...
+        cache.save(keep=digests_in_use)
+    """
+
+    def __init__(self, specs_dir: str | Path) -> None:
+        """Initialize ValidationCache.
+
+        Args:
+            specs_dir: Directory holding the spec files
+        """
+        self.specs_dir = Path(specs_dir)
+        self.path = self.specs_dir / INDEX_DIR / VALIDATION_FILE
+        self._results: Optional[dict[str, ValidationResult]] = None
+        self._dirty = False
+
+    def _load(self) -> dict[str, ValidationResult]:
+        if self._results is None:
+            self._results = {}
+            try:
+                data = json.loads(self.path.read_text())
+                if data.get("version") == _VALIDATION_VERSION:
+                    self._results = {
+                        digest: ValidationResult(*fields)
+                        for digest, fields in data["results"].items()
+                    }
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+        return self._results
+
+    def get(self, digest: str) -> Optional[ValidationResult]:
+        """Return the cached result for a content digest."""
+        return self._load().get(digest)
+
+    def put(self, digest: str, result: ValidationResult) -> None:
+        """Remember the result for a content digest."""
+        self._load()[digest] = result
+        self._dirty = True
+
+    def save(self, keep: Optional[set[str]] = None) -> None:
+        """Write the cache if it changed.
+
+        Args:
+            keep: Digests still in use; results for other content are dropped
+        """
+        results = self._load()
+        if keep is not None and not keep.issuperset(results):
+            self._results = results = {d: r for d, r in results.items() if d in keep}
+            self._dirty = True
+        if not self._dirty:
+            return
+        data = {
+            "version": _VALIDATION_VERSION,
+            "results": {digest: astuple(result) for digest, result in results.items()},
+        }
+        try:
+            ensure_index_dir(self.specs_dir)
+            atomic_write(self.path, json.dumps(data, separators=(",", ":")).encode())
+            self._dirty = False
+        except OSError:
+            # Results are recomputed next time; a read-only specs directory still works
+            pass
@@ -8,6 +8,7 @@ import os
 import subprocess
 from typing import Any, Optional
 
+from fractary_core.common import telemetry
 from fractary_core.work.manager import Comment, Issue
 from fractary_core.work.providers.base import WorkProvider
 
@@ -27,7 +28,7 @@ class GitHubWorkProvider(WorkProvider):
     def _detect_repo(self) -> None:
         """Detect owner/repo from git remote."""
         try:
-            result = subprocess.run(
+            result = telemetry.run(
                 ["gh", "repo", "view", "--json", "owner,name"],
                 capture_output=True,
                 text=True,
@@ -47,7 +48,7 @@ class GitHubWorkProvider(WorkProvider):
         if self.owner and self.repo:
             cmd.extend(["--repo", f"{self.owner}/{self.repo}"])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = telemetry.run(cmd, capture_output=True, text=True, check=True)
         return result.stdout
 
     def _parse_issue(self, data: dict[str, Any]) -> Issue:
@@ -0,0 +1,60 @@
+"""
+Shared fixtures for fractary-core tests.
+"""
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+GIT_IDENTITY = {
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+
+def git(cwd: Path, *args: str) -> str:
+    """Run a git command in cwd and return stripped stdout."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+def count_spawns(monkeypatch):
+    """Record the argv of every process spawned from now on."""
+    spawned = []
+    real_popen = subprocess.Popen
+
+    def counting_popen(*args, **kwargs):
+        spawned.append(args[0])
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", counting_popen)
+    return spawned
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    """Provide a git identity so commits work without global config."""
+    for key, value in GIT_IDENTITY.items():
+        monkeypatch.setenv(key, value)
+
+
+@pytest.fixture
+def git_repo(tmp_path, git_identity):
+    """Create a repository on 'main' with a single commit."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    git(repo, "init", "-q", "-b", "main")
+    (repo / "README.md").write_text("# Test\n")
+    git(repo, "add", "README.md")
+    git(repo, "commit", "-q", "-m", "Initial commit")
+    return repo
@@ -0,0 +1,92 @@
+"""
+Tests for AsyncRepoManager.
+"""
+
+import asyncio
+import subprocess
+import time
+
+import pytest
+
+from fractary_core.repo.async_manager import AsyncRepoManager
+from fractary_core.repo.manager import RepoManager
+
+from conftest import git
+
+
+@pytest.fixture
+def async_repo(git_repo):
+    return AsyncRepoManager({"default_branch": "main"}, repo_path=git_repo)
+
+
+class TestAsyncRepoManager:
+    """AsyncRepoManager should agree with RepoManager."""
+
+    def test_branch_queries_match_sync(self, async_repo, git_repo):
+        git(git_repo, "branch", "feat/one")
+
+        async def run():
+            return await asyncio.gather(
+                async_repo.get_current_branch(),
+                async_repo.get_default_branch(),
+                async_repo.get_branch("feat/one"),
+                async_repo.list_branches(),
+            )
+
+        current, default, branch, branches = asyncio.run(run())
+
+        with RepoManager({"default_branch": "main"}, repo_path=git_repo) as sync:
+            assert current == sync.get_current_branch()
+            assert default == sync.get_default_branch()
+            assert branch == sync.get_branch("feat/one")
+            assert branches == sync.list_branches()
+
+    def test_concurrent_writes_are_serialized(self, async_repo, git_repo):
+        # Concurrent ``git add`` calls would race for index.lock if unserialized
+        paths = [f"file{i}.txt" for i in range(20)]
+        for path in paths:
+            (git_repo / path).write_text(f"{path}\n")
+
+        async def run():
+            await asyncio.gather(*(async_repo.stage_files([p]) for p in paths))
+            return await async_repo.commit("add files", commit_type="chore")
+
+        commit = asyncio.run(run())
+
+        assert commit.sha == git(git_repo, "rev-parse", "HEAD")
+        assert commit.message == "chore: add files"
+        assert git(git_repo, "status", "--porcelain") == ""
+
+    def test_parallel_repositories(self, tmp_path, git_repo):
+        repos = []
+        for i in range(3):
+            clone = tmp_path / f"clone{i}"
+            git(tmp_path, "clone", "-q", str(git_repo), str(clone))
+            repos.append(AsyncRepoManager({}, repo_path=clone))
+
+        async def run():
+            return await asyncio.gather(*(repo.fetch() for repo in repos))
+
+        assert asyncio.run(run()) == [{"success": True}] * 3
+
+    def test_cancel_long_fetch(self, async_repo, git_repo, monkeypatch):
+        git(git_repo, "remote", "add", "slow", "ssh://example.invalid/repo.git")
+        monkeypatch.setenv("GIT_SSH_COMMAND", "sh -c 'sleep 5'")
+
+        async def run():
+            task = asyncio.create_task(async_repo.fetch("slow"))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start < 3
+
+    def test_timeout_kills_fetch(self, async_repo, git_repo, monkeypatch):
+        git(git_repo, "remote", "add", "slow", "ssh://example.invalid/repo.git")
+        monkeypatch.setenv("GIT_SSH_COMMAND", "sh -c 'sleep 5'")
+
+        with pytest.raises(subprocess.TimeoutExpired):
+            asyncio.run(async_repo.fetch("slow", timeout=0.3))
@@ -0,0 +1,95 @@
+"""
+Tests for blame and file history.
+"""
+
+import pytest
+
+from fractary_core.repo.blame import BlameParser
+from fractary_core.repo.manager import RepoManager
+
+from conftest import count_spawns, git
+
+
+@pytest.fixture
+def repo(git_repo):
+    (git_repo / "a.txt").write_text("one\ntwo\nthree\n")
+    git(git_repo, "add", "a.txt")
+    git(git_repo, "commit", "-q", "-m", "Add a")
+    (git_repo / "a.txt").write_text("one\nTWO\nthree\nfour\n")
+    git(git_repo, "commit", "-q", "-am", "Edit a", "--author", "Bob <bob@example.com>")
+    git(git_repo, "mv", "a.txt", "b.txt")
+    git(git_repo, "commit", "-q", "-m", "Rename a to b")
+    manager = RepoManager({"default_branch": "main"}, repo_path=git_repo)
+    yield manager
+    manager.close()
+
+
+def git_blame_shas(repo_path, path):
+    output = git(repo_path, "blame", "-l", "-s", "HEAD", "--", path)
+    return [line.split()[0].lstrip("^") for line in output.splitlines()]
+
+
+class TestBlame:
+    """blame() should match git blame and be cached on the blob sha."""
+
+    def test_matches_git(self, repo, git_repo):
+        lines = repo.blame("b.txt")
+
+        assert [line.content for line in lines] == ["one", "TWO", "three", "four"]
+        assert [line.sha for line in lines] == git_blame_shas(git_repo, "b.txt")
+        assert lines[1].commit.author == "Bob"
+        assert lines[1].commit.author_email == "bob@example.com"
+        assert lines[1].commit.summary == "Edit a"
+        assert lines[0].orig_path == "a.txt"
+        assert lines[1].commit is lines[3].commit
+
+    def test_cached_on_blob(self, repo, git_repo, monkeypatch):
+        first = repo.blame("b.txt")
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "Unrelated")
+
+        spawned = count_spawns(monkeypatch)
+        second = repo.blame("b.txt")
+
+        assert [argv for argv in spawned if "blame" in argv] == []
+        assert second == first
+        assert list((git_repo / ".fractary" / "cache" / "blame").rglob("*.json"))
+
+        (git_repo / "b.txt").write_text("changed\n")
+        git(git_repo, "commit", "-q", "-am", "Change b")
+        assert [line.content for line in repo.blame("b.txt")] == ["changed"]
+
+    def test_working_tree_and_errors(self, repo, git_repo):
+        (git_repo / "b.txt").write_text("one\nlocal\n")
+        hunks = list(repo.iter_blame("b.txt", rev=None))
+        assert {h.commit.sha for h in hunks if h.final_start == 2} == {"0" * 40}
+
+        with pytest.raises(ValueError, match="missing.txt"):
+            repo.blame("missing.txt")
+
+
+def test_file_history_follows_renames(repo, git_repo):
+    history = repo.file_history("b.txt")
+
+    assert [r.commit.message for r in history] == ["Rename a to b", "Edit a", "Add a"]
+    assert [r.path for r in history] == ["b.txt", "a.txt", "a.txt"]
+    assert history[0].old_path == "a.txt"
+    assert [r.path for r in repo.file_history("b.txt", max_count=1)] == ["b.txt"]
+
+
+def test_parser_unquotes_filenames():
+    parser = BlameParser()
+    hunks = list(parser.feed([
+        "1" * 40 + " 1 1 2",
+        "author Ada",
+        "author-mail <ada@example.com>",
+        "author-time 1700000000",
+        "summary Add file",
+        "boundary",
+        'filename "tab\\there.txt"',
+        "1" * 40 + " 3 3 1",
+        "filename plain.txt",
+    ]))
+
+    assert [h.orig_path for h in hunks] == ["tab\there.txt", "plain.txt"]
+    assert hunks[0].commit is hunks[1].commit
+    assert hunks[0].commit.boundary and hunks[0].commit.author_time == 1700000000
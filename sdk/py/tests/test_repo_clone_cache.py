@@ -0,0 +1,116 @@
+"""
+Tests for the clone cache.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fractary_core.common import locking
+from fractary_core.repo.clone_cache import CloneCache
+from fractary_core.repo.manager import RepoManager
+
+from conftest import git
+
+
+@pytest.fixture
+def upstream(git_repo):
+    """A remote with two directories, reachable over file://."""
+    for path in ("docs/guide.md", "src/app.py"):
+        (git_repo / path).parent.mkdir(exist_ok=True)
+        (git_repo / path).write_text(f"{path}\n")
+    git(git_repo, "add", "-A")
+    git(git_repo, "commit", "-q", "-m", "Add docs and src")
+    git(git_repo, "update-ref", "refs/pull/1/head", "HEAD")
+    git(git_repo, "config", "uploadpack.allowFilter", "true")
+    return git_repo
+
+
+@pytest.fixture
+def url(upstream):
+    return upstream.as_uri()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CloneCache(tmp_path / "cache")
+
+
+def push_commit(upstream, name):
+    (upstream / name).write_text("new\n")
+    git(upstream, "add", name)
+    git(upstream, "commit", "-q", "-m", f"Add {name}")
+    return git(upstream, "rev-parse", "HEAD")
+
+
+class TestCloneCache:
+    """CloneCache should create working copies from refreshed local mirrors."""
+
+    def test_reference_clone(self, cache, url, upstream, tmp_path):
+        dest = cache.clone(url, tmp_path / "work")
+        mirror = cache.mirror_path(url)
+
+        assert (dest / "src" / "app.py").exists()
+        assert git(dest, "remote", "get-url", "origin") == url
+        assert git(dest, "branch", "--show-current") == "main"
+        alternates = (dest / ".git" / "objects" / "info" / "alternates").read_text()
+        assert alternates.strip() == str(mirror / "objects")
+        assert git(mirror, "for-each-ref", "--format=%(refname)") == "refs/heads/main"
+
+        # The mirror is refreshed incrementally for the next clone
+        sha = push_commit(upstream, "later.txt")
+        dest2 = cache.clone(url, tmp_path / "work2")
+        assert git(dest2, "rev-parse", "HEAD") == sha
+        assert git(mirror, "rev-parse", "main") == sha
+
+    def test_partial_sparse_clone(self, cache, url, tmp_path):
+        dest = cache.clone(url, tmp_path / "work", mode="partial", sparse=["docs"])
+
+        assert (dest / "docs" / "guide.md").exists()
+        assert not (dest / "src").exists()
+        assert git(dest, "config", "remote.origin.partialclonefilter") == "blob:none"
+        missing = git(dest, "rev-list", "--objects", "--all", "--missing=print")
+        assert "?" in missing
+
+        # Blobs outside the cone are fetched on demand from the real remote
+        assert git(dest, "show", "HEAD:src/app.py") == "src/app.py"
+
+    def test_full_clone_and_branch(self, cache, url, upstream, tmp_path):
+        git(upstream, "branch", "develop")
+        dest = cache.clone(url, tmp_path / "work", mode="full", branch="develop")
+
+        assert git(dest, "branch", "--show-current") == "develop"
+        assert not (dest / ".git" / "objects" / "info" / "alternates").exists()
+        with pytest.raises(ValueError, match="Unknown clone mode"):
+            cache.clone(url, tmp_path / "bad", mode="shallow")
+
+    def test_refresh_interval(self, url, upstream, tmp_path):
+        cache = CloneCache(tmp_path / "cache", refresh_interval=3600)
+        first = cache.clone(url, tmp_path / "work")
+        push_commit(upstream, "later.txt")
+
+        second = cache.clone(url, tmp_path / "work2")
+        assert git(second, "rev-parse", "HEAD") == git(first, "rev-parse", "HEAD")
+
+    def test_concurrent_clones_share_one_mirror(self, cache, url, tmp_path):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            dests = list(pool.map(lambda i: cache.clone(url, tmp_path / f"work{i}"), range(4)))
+
+        assert all((dest / "README.md").exists() for dest in dests)
+        assert [p.name for p in cache.cache_dir.glob("*.git")] == [cache.mirror_path(url).name]
+
+    def test_concurrent_clones_without_fcntl(self, cache, url, tmp_path, monkeypatch):
+        monkeypatch.setattr(locking, "fcntl", None)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            dests = list(pool.map(lambda i: cache.clone(url, tmp_path / f"work{i}"), range(4)))
+
+        assert all((dest / "README.md").exists() for dest in dests)
+        assert list(cache.cache_dir.glob("*.held")) == []
+
+    def test_repo_manager_clone(self, url, tmp_path):
+        config = {"default_branch": "main", "clone_cache_dir": str(tmp_path / "cache")}
+        repo = RepoManager.clone(url, tmp_path / "work", config=config)
+
+        assert repo.repo_path == tmp_path / "work"
+        assert repo.get_current_branch() == "main"
+        assert (tmp_path / "cache").is_dir()
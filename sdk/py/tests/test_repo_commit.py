@@ -0,0 +1,162 @@
+"""
+Tests for the commit pipeline: targeted staging and session read-back.
+"""
+
+import subprocess
+
+import pytest
+
+from fractary_core.repo.history import commit_log_args, parse_commit_log, parse_commit_object
+from fractary_core.repo.manager import RepoManager
+
+from conftest import count_spawns, git
+
+
+@pytest.fixture
+def repo(git_repo):
+    manager = RepoManager({"default_branch": "main"}, repo_path=git_repo)
+    yield manager
+    manager.close()
+
+
+def log_head(repo_path):
+    result = subprocess.run(
+        ["git", *commit_log_args("HEAD", max_count=1)],
+        cwd=repo_path, capture_output=True, text=True, check=True,
+    )
+    return parse_commit_log(result.stdout)[0]
+
+
+class TestCommit:
+    """commit() should stage only changed paths and read the commit back in-process."""
+
+    def test_stages_changed_paths(self, repo, git_repo):
+        (git_repo / "keep.txt").write_text("keep\n")
+        git(git_repo, "add", "keep.txt")
+        git(git_repo, "commit", "-q", "-m", "add keep")
+        (git_repo / "README.md").write_text("edited\n")
+        (git_repo / "keep.txt").unlink()
+        (git_repo / "new [1] *.txt").write_text("literal\n")
+
+        commit = repo.commit("update files", commit_type="chore", scope="repo")
+
+        assert commit == log_head(git_repo)
+        assert commit.message == "chore(repo): update files"
+        assert commit.author_email
+        assert git(git_repo, "ls-tree", "--name-only", "HEAD").split("\n") == [
+            "README.md", "new [1] *.txt",
+        ]
+        assert repo.status(refresh=True).clean
+
+    def test_forks_per_commit(self, repo, git_repo, monkeypatch):
+        repo.session.read_object("HEAD")  # warm the batch process
+        (git_repo / "a.txt").write_text("a\n")
+        repo.status()
+
+        spawned = count_spawns(monkeypatch)
+        repo.commit("add a")
+
+        # A fresh status, then the commit is read back by the warm session
+        assert [args[:3] for args in spawned] == [
+            ["git", "status", "--porcelain=v2"],
+            ["git", "add", "-A"],
+            ["git", "commit", "-q"],
+        ]
+
+    def test_forks_per_commit_in_operation(self, repo, git_repo, monkeypatch):
+        repo.session.read_object("HEAD")
+        (git_repo / "a.txt").write_text("a\n")
+        with repo.operation():
+            repo.status()
+
+            spawned = count_spawns(monkeypatch)
+            repo.commit("add a")
+
+        # Status came from the cache
+        assert len(spawned) == 2
+        assert spawned[0][:3] == ["git", "add", "-A"]
+        assert spawned[1][:2] == ["git", "commit"]
+
+    def test_edit_after_status(self, repo, git_repo):
+        (git_repo / "a.txt").write_text("a\n")
+        repo.status()
+        (git_repo / "README.md").write_text("edited\n")
+
+        repo.commit("add a and edit readme")
+
+        assert git(git_repo, "ls-tree", "--name-only", "HEAD").split("\n") == [
+            "README.md", "a.txt",
+        ]
+        assert git(git_repo, "show", "HEAD:README.md") == "edited"
+        assert repo.status(refresh=True).clean
+
+    def test_explicit_paths(self, repo, git_repo):
+        (git_repo / "a.txt").write_text("a\n")
+        (git_repo / "b.txt").write_text("b\n")
+
+        repo.commit("add a", paths=["a.txt"])
+
+        assert git(git_repo, "ls-tree", "--name-only", "HEAD").split("\n") == [
+            "README.md", "a.txt",
+        ]
+        assert [e.path for e in repo.status(refresh=True).untracked] == ["b.txt"]
+
+    def test_from_subdirectory(self, git_repo, monkeypatch):
+        (git_repo / "sub").mkdir()
+        (git_repo / "sub" / "f [x].txt").write_text("f\n")
+        (git_repo / "README.md").write_text("edited\n")
+        monkeypatch.chdir(git_repo / "sub")
+        repo = RepoManager({"default_branch": "main"}, repo_path=git_repo / "sub")
+
+        repo.commit("from sub")
+        repo.close()
+
+        assert git(git_repo, "ls-tree", "-r", "--name-only", "HEAD").split("\n") == [
+            "README.md", "sub/f [x].txt",
+        ]
+        assert git(git_repo, "status", "--porcelain") == ""
+
+    def test_cached_path_removed_since(self, repo, git_repo):
+        (git_repo / "gone.txt").write_text("x\n")
+        (git_repo / "README.md").write_text("edited\n")
+        with repo.operation():
+            repo.status()
+            (git_repo / "gone.txt").unlink()
+
+            commit = repo.commit("edit readme", commit_type="docs")
+
+        assert commit.sha == git(git_repo, "rev-parse", "HEAD")
+        assert git(git_repo, "ls-tree", "--name-only", "HEAD") == "README.md"
+
+
+def test_parse_commit_object():
+    data = (
+        b"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+        b"parent 1111111111111111111111111111111111111111\n"
+        b"parent 2222222222222222222222222222222222222222\n"
+        b"author Ada Lovelace <ada@example.com> 1700000000 -0130\n"
+        b"committer Ada Lovelace <ada@example.com> 1700000000 -0130\n"
+        b"gpgsig -----BEGIN PGP SIGNATURE-----\n"
+        b" \n"
+        b" abc\n"
+        b" -----END PGP SIGNATURE-----\n"
+        b"\n"
+        b"Merge branch 'x'\n"
+        b"  into main\n"
+        b"\n"
+        b"Body text\n"
+    )
+    commit = parse_commit_object("3" * 40, data)
+
+    assert commit.message == "Merge branch 'x' into main"
+    assert (commit.author, commit.author_email) == ("Ada Lovelace", "ada@example.com")
+    assert commit.date == "2023-11-14 20:43:20 -0130"
+    assert commit.parents == ("1" * 40, "2" * 40)
+
+
+def test_read_object(repo, git_repo):
+    info, data = repo.session.read_object("HEAD:README.md")
+    assert info.type == "blob" and data == (git_repo / "README.md").read_bytes()
+    assert repo.session.read_object("does-not-exist") is None
+    assert repo.session.read_object("main@{upstream}") is None
+    assert repo.session.read_object("HEAD")[0].type == "commit"
@@ -0,0 +1,115 @@
+"""
+Tests for the commit-graph index.
+"""
+
+import random
+
+import pytest
+
+from fractary_core.repo.commit_graph import CommitGraph
+from fractary_core.repo.manager import RepoManager
+
+from conftest import git
+
+
+def random_dag(repo, commits=40, seed=7):
+    """Build a random history with merges using commit-tree; return reachable shas."""
+    rng = random.Random(seed)
+    tree = git(repo, "rev-parse", "HEAD^{tree}")
+    shas = [git(repo, "rev-parse", "HEAD")]
+    for i in range(commits):
+        parents = rng.sample(shas[-8:], k=min(len(shas[-8:]), rng.choice([1, 1, 2])))
+        args = ["commit-tree", tree, "-m", f"c{i}"]
+        for parent in parents:
+            args += ["-p", parent]
+        shas.append(git(repo, *args))
+    for i, sha in enumerate(shas[-6:]):
+        git(repo, "branch", f"tip{i}", sha)
+    return git(repo, "rev-list", "--all").split()
+
+
+@pytest.fixture
+def repo(git_repo):
+    return RepoManager({"default_branch": "main"}, repo_path=git_repo)
+
+
+class TestCommitGraph:
+    """Graph answers must match git's."""
+
+    def test_matches_git_on_random_history(self, git_repo):
+        shas = random_dag(git_repo)
+        graph = CommitGraph()
+        assert graph.update(git_repo) == len(shas)
+
+        rng = random.Random(1)
+        for _ in range(40):
+            a, b = rng.choice(shas), rng.choice(shas)
+            left, right = git(git_repo, "rev-list", "--left-right", "--count", f"{a}...{b}").split()
+            assert graph.ahead_behind(a, b) == (int(left), int(right))
+            assert set(graph.merge_bases(a, b)) == set(
+                git(git_repo, "merge-base", "--all", a, b).split()
+            )
+            assert sorted(graph.range(a, b)) == sorted(
+                git(git_repo, "rev-list", f"{a}..{b}").split()
+            )
+            expected = git(git_repo, "merge-base", a, b) == a
+            assert graph.is_ancestor(a, b) is expected
+
+    def test_persistence_round_trip(self, git_repo, tmp_path):
+        random_dag(git_repo, commits=10)
+        graph = CommitGraph()
+        graph.update(git_repo)
+        graph.save(tmp_path / "graph")
+
+        loaded = CommitGraph.load(tmp_path / "graph")
+        assert len(loaded) == len(graph)
+        assert loaded.heads == graph.heads
+        head = git(git_repo, "rev-parse", "tip5")
+        assert loaded.parents(head) == graph.parents(head)
+        assert loaded.update(git_repo) == 0
+
+    def test_corrupt_file_loads_empty(self, tmp_path):
+        (tmp_path / "graph").write_bytes(b"garbage")
+        assert len(CommitGraph.load(tmp_path / "graph")) == 0
+
+
+class TestRepoManagerGraph:
+    """RepoManager exposes graph queries and keeps the index current."""
+
+    def test_queries(self, repo, git_repo):
+        git(git_repo, "checkout", "-q", "-b", "feat")
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "feat 1")
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "feat 2")
+        git(git_repo, "checkout", "-q", "main")
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "main 1")
+
+        assert repo.ahead_behind("feat") == (2, 1)
+        assert repo.merge_base("feat", "main") == git(git_repo, "rev-parse", "main~1")
+        assert repo.is_ancestor("main~1", "feat")
+        assert not repo.is_ancestor("main", "feat")
+        assert repo.list_range("main", "feat") == git(git_repo, "rev-list", "main..feat").split()
+
+        # New commits are picked up incrementally
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "main 2")
+        assert repo.ahead_behind("feat") == (2, 2)
+
+        with pytest.raises(ValueError):
+            repo.is_ancestor("no-such-branch", "main")
+
+    def test_persisted_and_ignored(self, repo, git_repo):
+        repo.commit_graph()
+        assert (git_repo / ".fractary" / "cache" / "commit-graph").exists()
+        assert git(git_repo, "status", "--porcelain") == ""
+
+    def test_refreshed_after_fetch(self, tmp_path, git_repo):
+        clone = tmp_path / "clone"
+        git(tmp_path, "clone", "-q", str(git_repo), str(clone))
+        manager = RepoManager({"default_branch": "main"}, repo_path=clone)
+        size = len(manager.commit_graph())
+
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "upstream")
+        manager.fetch()
+
+        graph = CommitGraph.load(clone / ".fractary" / "cache" / "commit-graph")
+        assert len(graph) == size + 1
+        assert git(git_repo, "rev-parse", "HEAD") in graph
@@ -0,0 +1,187 @@
+"""
+Tests for structured diffs.
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from fractary_core.repo.diff import ChangedFile, PatchParser
+from fractary_core.repo.manager import RepoManager
+
+from conftest import git
+
+
+@pytest.fixture
+def repo(git_repo):
+    return RepoManager({"default_branch": "main"}, repo_path=git_repo)
+
+
+@pytest.fixture
+def changed(git_repo):
+    """A commit with a modify, add, delete, rename and binary change."""
+    (git_repo / "keep.txt").write_text("one\ntwo\nthree\n")
+    (git_repo / "gone.txt").write_text("bye\n")
+    (git_repo / "old name.txt").write_text("".join(f"line {i}\n" for i in range(20)))
+    (git_repo / "logo.bin").write_bytes(b"\0\1\2")
+    git(git_repo, "add", "-A")
+    git(git_repo, "commit", "-q", "-m", "base")
+
+    (git_repo / "keep.txt").write_text("one\n--- not a header\n-- also not\nthree")
+    (git_repo / "gone.txt").unlink()
+    (git_repo / "new.txt").write_text("diff --git a/x b/x\n")
+    os.rename(git_repo / "old name.txt", git_repo / "new\tname.txt")
+    with open(git_repo / "new\tname.txt", "a") as f:
+        f.write("line 20\n")
+    (git_repo / "logo.bin").write_bytes(b"\0\1\3")
+    git(git_repo, "add", "-A")
+    git(git_repo, "commit", "-q", "-m", "change")
+    return git_repo
+
+
+class TestChangedFiles:
+    """changed_files should expose raw diff entries exactly."""
+
+    def test_statuses_and_paths(self, repo, changed):
+        files = {f.path: f for f in repo.changed_files("HEAD~1", "HEAD")}
+        assert {p: f.status for p, f in files.items()} == {
+            "gone.txt": "D",
+            "keep.txt": "M",
+            "logo.bin": "M",
+            "new.txt": "A",
+            "new\tname.txt": "R",
+        }
+        renamed = files["new\tname.txt"]
+        assert renamed.old_path == "old name.txt"
+        assert 50 < renamed.similarity < 100
+        assert files["new.txt"].new_sha == git(changed, "rev-parse", "HEAD:new.txt")
+        assert files["new.txt"].old_mode == "000000"
+
+    def test_copies_and_no_renames(self, repo, git_repo):
+        (git_repo / "src.txt").write_text("".join(f"{i}\n" for i in range(30)))
+        git(git_repo, "add", "-A")
+        git(git_repo, "commit", "-q", "-m", "src")
+        (git_repo / "copy.txt").write_text((git_repo / "src.txt").read_text())
+        with open(git_repo / "src.txt", "a") as f:
+            f.write("more\n")
+        git(git_repo, "add", "-A")
+
+        files = repo.changed_files(staged=True, copies=True)
+        copy = next(f for f in files if f.path == "copy.txt")
+        assert (copy.status, copy.old_path) == ("C", "src.txt")
+        assert {f.status for f in repo.changed_files(staged=True, renames=False)} == {"A", "M"}
+
+    def test_working_tree_and_paths(self, repo, git_repo):
+        (git_repo / "README.md").write_text("changed\n")
+        (git_repo / "other.txt").write_text("x\n")
+        git(git_repo, "add", "other.txt")
+
+        assert [f.path for f in repo.changed_files()] == ["README.md"]
+        assert [f.path for f in repo.changed_files(staged=True)] == ["other.txt"]
+        assert [f.path for f in repo.changed_files("HEAD", paths=["other.txt"])] == ["other.txt"]
+
+
+class TestDiff:
+    """diff should yield structured hunks per file."""
+
+    def test_hunks(self, repo, changed):
+        diffs = {d.path: d for d in repo.diff("HEAD~1", "HEAD")}
+        assert list(diffs) == [f.path for f in repo.changed_files("HEAD~1", "HEAD")]
+
+        keep = diffs["keep.txt"]
+        [hunk] = keep.hunks
+        assert (hunk.old_start, hunk.old_lines, hunk.new_start, hunk.new_lines) == (1, 3, 1, 4)
+        assert hunk.lines == [
+            " one",
+            "-two",
+            "-three",
+            "+--- not a header",
+            "+-- also not",
+            "+three",
+            "\\ No newline at end of file",
+        ]
+        assert (keep.additions, keep.deletions) == (3, 2)
+
+        assert diffs["new.txt"].hunks[0].lines == ["+diff --git a/x b/x"]
+        assert diffs["gone.txt"].deletions == 1
+        assert diffs["logo.bin"].binary and not diffs["logo.bin"].hunks
+        renamed = diffs["new\tname.txt"]
+        assert renamed.status == "R" and renamed.additions == 1
+
+    def test_truncation_keeps_counts(self, repo, git_repo):
+        (git_repo / "big.txt").write_text("".join(f"{i}\n" for i in range(500)))
+        diffs = list(repo.diff("HEAD", max_lines_per_file=10))
+        assert diffs == []  # untracked files are not part of a diff
+
+        git(git_repo, "add", "big.txt")
+        [big] = repo.diff(staged=True, max_lines_per_file=10)
+        assert big.truncated
+        assert sum(len(h.lines) for h in big.hunks) == 10
+        assert big.additions == 500
+
+    def test_type_change(self, repo, git_repo):
+        os.symlink("README.md", git_repo / "link")
+        (git_repo / "z.txt").write_text("z\n")
+        git(git_repo, "add", "-A")
+        git(git_repo, "commit", "-q", "-m", "link")
+        (git_repo / "link").unlink()
+        (git_repo / "link").write_text("now a file\n")
+        (git_repo / "z.txt").write_text("zz\n")
+
+        link, z = repo.diff()
+        assert link.status == "T"
+        assert [line for h in link.hunks for line in h.lines] == [
+            "-README.md", "\\ No newline at end of file", "+now a file",
+        ]
+        assert z.path == "z.txt" and z.hunks[0].lines == ["-z", "+zz"]
+
+    def test_unmerged_paths(self, repo, git_repo):
+        (git_repo / "a.txt").write_text("base\n")
+        (git_repo / "b.txt").write_text("base\n")
+        git(git_repo, "add", "-A")
+        git(git_repo, "commit", "-q", "-m", "base")
+        git(git_repo, "checkout", "-q", "-b", "other")
+        (git_repo / "a.txt").write_text("other\n")
+        git(git_repo, "commit", "-q", "-am", "other")
+        git(git_repo, "checkout", "-q", "main")
+        (git_repo / "a.txt").write_text("main\n")
+        git(git_repo, "commit", "-q", "-am", "main")
+        with pytest.raises(subprocess.CalledProcessError):
+            git(git_repo, "merge", "-q", "other")
+        (git_repo / "b.txt").write_text("edited\n")
+
+        marker, conflict, edited = repo.diff()
+        assert (marker.path, marker.status) == ("a.txt", "U")
+        assert conflict.path == "a.txt" and conflict.combined and not conflict.hunks
+        assert edited.path == "b.txt" and edited.hunks[0].lines == ["-base", "+edited"]
+
+    def test_quoted_paths_and_prefix_config(self, repo, git_repo):
+        names = ['say "hi".txt', "caf\u00e9.txt", "back\\slash.txt"]
+        for name in names:
+            (git_repo / name).write_text("x\n")
+        git(git_repo, "add", "-A")
+        git(git_repo, "config", "diff.noprefix", "true")
+
+        diffs = list(repo.diff(staged=True))
+
+        assert sorted(d.path for d in diffs) == sorted(names)
+        assert all(d.hunks[0].lines == ["+x"] for d in diffs)
+
+    def test_patch_for_another_file_fails(self):
+        parser = PatchParser([ChangedFile(status="M", path="a.txt")])
+        lines = ["diff --git a/b.txt b/b.txt", "@@ -1 +1 @@", "-a", "+b"]
+
+        with pytest.raises(RuntimeError, match="does not match"):
+            list(parser.feed(lines))
+
+    def test_missing_patch_fails(self):
+        parser = PatchParser([ChangedFile(status="M", path="a.txt")])
+
+        with pytest.raises(RuntimeError, match="no patch for 'a.txt'"):
+            list(parser.close())
+
+    def test_early_close(self, repo, changed):
+        iterator = repo.diff("HEAD~1", "HEAD")
+        next(iterator)
+        iterator.close()
@@ -0,0 +1,83 @@
+"""
+Tests for environment and protected-branch lookups.
+"""
+
+from fractary_core.repo.environments import EnvironmentIndex
+from fractary_core.repo.manager import RepoManager
+
+ENVIRONMENTS = {
+    "production": {"branch": "main", "protected": True},
+    "staging": {"branch": "staging", "protected": False},
+    "hotfix": {"branch": "hotfix/*", "protected": True},
+    "release": {"branch": "release/*", "protected": False},
+    "release-lts": {"branch": "release/lts-*", "protected": True},
+    "preview": {"branch": "preview/[0-9]*"},
+    "legacy": "not-a-dict",
+    "duplicate": {"branch": "main", "protected": False},
+}
+
+
+class TestEnvironmentIndex:
+    """EnvironmentIndex should resolve exact names and glob patterns."""
+
+    def test_exact_names(self):
+        index = EnvironmentIndex(ENVIRONMENTS)
+        assert index.environment_for("main") == "production"
+        assert index.environment_for("staging") == "staging"
+        assert index.environment_for("feat/x") is None
+        assert index.branch_for("hotfix") == "hotfix/*"
+        assert index.branch_for("legacy") is None
+
+    def test_patterns(self):
+        index = EnvironmentIndex(ENVIRONMENTS)
+        assert index.environment_for("hotfix/crash") == "hotfix"
+        # The first configured pattern wins
+        assert index.environment_for("release/lts-2") == "release"
+        assert index.environment_for("preview/42") == "preview"
+        assert index.environment_for("preview/x") is None
+        assert index.environment_for("release") is None
+
+    def test_protection(self):
+        index = EnvironmentIndex(ENVIRONMENTS)
+        assert index.is_protected("main")
+        assert index.is_protected("hotfix/crash")
+        # Protected if any matching environment is protected
+        assert index.is_protected("release/lts-2")
+        assert not index.is_protected("release/1.0")
+        assert not index.is_protected("staging")
+
+    def test_many_environments(self):
+        environments = {
+            f"env{i}": {"branch": f"team{i}/*", "protected": i % 2 == 0} for i in range(200)
+        }
+        index = EnvironmentIndex(environments)
+        assert index.environment_for("team137/feature") == "env137"
+        assert index.is_protected("team42/x") and not index.is_protected("team43/x")
+
+
+class TestRepoManagerEnvironments:
+    """RepoManager lookups should go through the index."""
+
+    def test_lookups(self):
+        repo = RepoManager({"environments": ENVIRONMENTS})
+        assert repo.get_environment_for_branch("hotfix/1") == "hotfix"
+        assert repo.get_branch_for_environment("production") == "main"
+        assert repo.is_protected_branch("hotfix/1")
+        assert not repo.is_protected_branch("develop")
+
+    def test_fallback_without_environments(self):
+        repo = RepoManager({"default_branch": "main"})
+        assert repo.is_protected_branch("develop")
+        assert repo.get_environment_for_branch("main") is None
+
+    def test_rebuilt_when_config_changes(self):
+        repo = RepoManager({"environments": {"prod": {"branch": "main", "protected": True}}})
+        assert repo.is_protected_branch("main")
+
+        repo.config["environments"] = {"prod": {"branch": "trunk", "protected": True}}
+        assert not repo.is_protected_branch("main")
+        assert repo.is_protected_branch("trunk")
+
+        repo.config["environments"]["qa"] = {"branch": "qa/*", "protected": True}
+        repo.invalidate_environment_index()
+        assert repo.is_protected_branch("qa/1")
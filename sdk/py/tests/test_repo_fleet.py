@@ -0,0 +1,95 @@
+"""
+Tests for RepoFleet.
+"""
+
+import time
+
+import pytest
+
+from fractary_core.repo.fleet import RepoFleet
+
+from conftest import git
+
+
+@pytest.fixture
+def clones(tmp_path, git_repo):
+    """Three clones of git_repo, which then gains a new commit."""
+    paths = []
+    for i in range(3):
+        clone = tmp_path / f"clone{i}"
+        git(tmp_path, "clone", "-q", str(git_repo), str(clone))
+        paths.append(clone)
+    (git_repo / "new.txt").write_text("new\n")
+    git(git_repo, "add", "new.txt")
+    git(git_repo, "commit", "-q", "-m", "Upstream change")
+    return paths
+
+
+def slow_remote(repo, monkeypatch):
+    git(repo, "remote", "set-url", "origin", "ssh://example.invalid/repo.git")
+    monkeypatch.setenv("GIT_SSH_COMMAND", "sh -c 'sleep 5'")
+
+
+class TestRepoFleet:
+    """RepoFleet should fan operations out and aggregate results."""
+
+    def test_fetch_status_pull(self, clones):
+        fleet = RepoFleet(clones, config={"default_branch": "main"}, max_workers=2)
+
+        assert len(fleet.fetch().succeeded) == 3
+
+        statuses = fleet.status().by_repo()
+        for clone in clones:
+            status = statuses[clone].value
+            assert status.branch == "main"
+            assert status.upstream == "origin/main"
+            assert status.behind == 1
+            assert status.clean
+
+        assert len(fleet.pull().succeeded) == 3
+        for clone in clones:
+            assert (clone / "new.txt").exists()
+
+    def test_branches(self, clones):
+        git(clones[0], "branch", "feat/x")
+        report = RepoFleet(clones, config={"default_branch": "main"}).branches("feat/*")
+        names = {r.repo_path: [b.name for b in r.value] for r in report.results}
+        assert names == {clones[0]: ["feat/x"], clones[1]: [], clones[2]: []}
+
+    def test_failures_are_reported_per_repo(self, clones, tmp_path):
+        missing = tmp_path / "not-a-repo"
+        missing.mkdir()
+        report = RepoFleet(clones + [missing], config={}).fetch()
+
+        assert len(report.succeeded) == 3
+        [failure] = report.failed
+        assert failure.repo_path == missing
+        assert "not a git repository" in failure.error
+
+    def test_unexpected_exception_is_reported(self, clones):
+        def operation(repo):
+            if repo.repo_path == clones[1]:
+                raise RuntimeError("boom")
+            return repo.get_current_branch()
+
+        report = RepoFleet(clones, config={"default_branch": "main"}).run("custom", operation)
+
+        assert len(report.results) == 3
+        assert [r.value for r in report.succeeded] == ["main", "main"]
+        [failure] = report.failed
+        assert failure.repo_path == clones[1]
+        assert failure.error == "RuntimeError: boom"
+        assert isinstance(failure.exception, RuntimeError)
+
+    def test_timeout_and_streaming(self, clones, monkeypatch):
+        slow_remote(clones[0], monkeypatch)
+        fleet = RepoFleet(clones, config={}, max_workers=3, timeout=1)
+
+        start = time.monotonic()
+        results = list(fleet.iter_fetch())
+
+        assert time.monotonic() - start < 4
+        # Fast repositories are reported before the one that hangs
+        assert results[-1].repo_path == clones[0]
+        assert results[-1].timed_out
+        assert all(r.ok for r in results[:-1])
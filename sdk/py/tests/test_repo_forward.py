@@ -0,0 +1,156 @@
+"""
+Tests for RepoManager.forward_branches.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from fractary_core.repo.forward import BranchForwarder, ForwardResult, ForwardState
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.worktree import WorktreePool
+
+from conftest import git
+
+
+def commit_file(repo, name, content, message):
+    (repo / name).write_text(content)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def forest(git_repo):
+    """main plus branches that are up to date, behind, diverged and conflicting."""
+    git(git_repo, "branch", "behind")
+    git(git_repo, "checkout", "-q", "-b", "clean")
+    commit_file(git_repo, "clean.txt", "clean\n", "clean work")
+    git(git_repo, "checkout", "-q", "-b", "conflict", "main")
+    commit_file(git_repo, "README.md", "# Branch\n", "rewrite readme")
+    git(git_repo, "checkout", "-q", "main")
+    commit_file(git_repo, "README.md", "# Main\n", "update readme")
+    git(git_repo, "branch", "current")
+    return git_repo
+
+
+@pytest.fixture
+def repo(forest):
+    manager = RepoManager({"default_branch": "main"}, repo_path=forest)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def pool(forest):
+    return WorktreePool(forest, max_worktrees=2)
+
+
+class TestForwardBranches:
+    """forward_branches should bring branches up to date without a checkout."""
+
+    def test_classifies_and_forwards(self, repo, pool, forest):
+        main = git(forest, "rev-parse", "main")
+        conflict_tip = git(forest, "rev-parse", "conflict")
+        before = git(forest, "status", "--porcelain")
+
+        results = repo.forward_branches(
+            ["current", "behind", "clean", "conflict", "missing"], pool=pool,
+        )
+
+        assert [r.branch for r in results] == ["current", "behind", "clean", "conflict", "missing"]
+        current, behind, clean, conflict, missing = results
+        assert current.status == "up_to_date"
+        assert behind.status == "fast_forward" and behind.new_sha == main
+        assert git(forest, "rev-parse", "behind") == main
+        assert clean.status == "rebased" and clean.ok
+        assert git(forest, "rev-parse", "clean^") == main
+        assert git(forest, "show", "clean:clean.txt") == "clean"
+        assert conflict.status == "conflict" and conflict.conflicts == ["README.md"]
+        assert git(forest, "rev-parse", "conflict") == conflict_tip
+        assert missing.status == "error"
+
+        # The main checkout is untouched and the pool worktrees are idle again
+        assert git(forest, "branch", "--show-current") == "main"
+        assert git(forest, "status", "--porcelain") == before
+        assert all(not wt.leased for wt in pool.worktrees())
+        assert not list((forest / ".fractary" / "cache" / "forward").glob("*.json"))
+
+    def test_skips_branches_checked_out_elsewhere(self, repo, pool, forest, tmp_path):
+        git(forest, "worktree", "add", "-q", str(tmp_path / "other"), "behind")
+        git(forest, "checkout", "-q", "clean")
+        clean_tip = git(forest, "rev-parse", "clean")
+
+        [behind, clean] = repo.forward_branches(["behind", "clean"], onto="current", pool=pool)
+
+        assert behind.status == "skipped" and str(tmp_path / "other") in behind.error
+        assert clean.status == "skipped"
+        assert git(forest, "rev-parse", "clean") == clean_tip
+
+    def test_rebase_conflict_reported_and_aborted(self, repo, pool, forest):
+        # The branch reverts its own change, so the merge is clean, but
+        # replaying its first commit onto main conflicts
+        git(forest, "checkout", "-q", "-b", "flip-flop", "main~1")
+        commit_file(forest, "README.md", "# Branch\n", "change readme")
+        tip = commit_file(forest, "README.md", "# Test\n", "restore readme")
+        git(forest, "checkout", "-q", "main")
+
+        [result] = repo.forward_branches(["flip-flop"], pool=pool)
+
+        assert result.status == "conflict" and result.conflicts == ["README.md"]
+        assert git(forest, "rev-parse", "flip-flop") == tip
+        assert all(not wt.leased for wt in pool.worktrees())
+
+    def test_resume_reuses_recorded_results(self, repo, pool, forest):
+        main = git(forest, "rev-parse", "main")
+        conflict_tip = git(forest, "rev-parse", "conflict")
+        branches = ["conflict", "clean"]
+        state_dir = repo._cache_root() / "forward"
+
+        # An interrupted run finished the conflict check but not the rebase
+        state = BranchForwarder(repo, state_dir=state_dir)._state(main, branches)
+        state.record(ForwardResult("conflict", "conflict", conflict_tip, conflicts=["README.md"]))
+
+        conflict, clean = repo.forward_branches(branches, pool=pool)
+
+        assert conflict.resumed and conflict.conflicts == ["README.md"]
+        assert clean.status == "rebased" and not clean.resumed
+        assert not state.path.exists()
+
+    def test_resume_ignores_branches_that_moved(self, tmp_path):
+        state = ForwardState(tmp_path / "state.json")
+        state.record(ForwardResult("a", "conflict", "1" * 40, conflicts=["x"]))
+        state.record(ForwardResult("b", "rebased", "2" * 40, "3" * 40))
+        state.record(ForwardResult("c", "error", "4" * 40, error="boom"))
+        reloaded = ForwardState(tmp_path / "state.json")
+
+        assert reloaded.resumable("a", "1" * 40).conflicts == ["x"]
+        assert reloaded.resumable("a", "5" * 40) is None
+        assert reloaded.resumable("b", "3" * 40).status == "rebased"
+        assert reloaded.resumable("c", "4" * 40) is None
+        assert json.loads((tmp_path / "state.json").read_text())["results"]["b"]["new_sha"]
+
+    def test_interrupted_rebase_worktree_is_reclaimed(self, repo, pool, forest):
+        # A process dies mid-rebase while holding a pool lease
+        script = (
+            "import subprocess; from fractary_core.repo.worktree import WorktreePool; "
+            f"lease = WorktreePool({str(forest)!r}).acquire('conflict'); "
+            "subprocess.run(['git', 'rebase', '-q', 'main'], cwd=lease.path)"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+        [stale] = pool.worktrees()
+        assert stale.leased
+
+        [result] = repo.forward_branches(["clean"], pool=pool)
+        assert result.status == "rebased"
+        assert pool.reclaim() == 0
+        assert all(not wt.leased for wt in pool.worktrees())
+        # The branch the dead process was rebasing can be checked out again
+        with pool.lease("conflict") as lease:
+            assert git(lease.path, "branch", "--show-current") == "conflict"
+
+    def test_unknown_onto(self, repo):
+        with pytest.raises(ValueError):
+            repo.forward_branches(["clean"], onto="nope")
@@ -0,0 +1,131 @@
+"""
+Tests for streaming commit history.
+"""
+
+import subprocess
+import time
+
+import pytest
+
+from fractary_core.repo.history import CommitLogParser, commit_log_args, stream_commit_log
+from fractary_core.repo.manager import RepoManager
+
+from conftest import git
+
+
+def commit_file(repo, path, content, message, monkeypatch=None, date=None, author=None):
+    (repo / path).parent.mkdir(parents=True, exist_ok=True)
+    (repo / path).write_bytes(content if isinstance(content, bytes) else content.encode())
+    git(repo, "add", "-A")
+    args = ["commit", "-q", "-m", message]
+    if author:
+        args += ["--author", author]
+    if date:
+        monkeypatch.setenv("GIT_AUTHOR_DATE", date)
+        monkeypatch.setenv("GIT_COMMITTER_DATE", date)
+    git(repo, *args)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def history_repo(git_repo, monkeypatch):
+    commit_file(git_repo, "src/a.py", "a\n", "feat: pipes | in | subject", monkeypatch,
+                date="2024-01-10T12:00:00")
+    commit_file(git_repo, "logo.bin", b"\0\1\2", "add binary", monkeypatch,
+                date="2024-02-10T12:00:00", author="Other Dev <other@example.com>")
+    git(git_repo, "mv", "src/a.py", "src/b.py")
+    commit_file(git_repo, "src/b.py", "a\nb\n", "rename a to b", monkeypatch,
+                date="2024-03-10T12:00:00")
+    return git_repo
+
+
+@pytest.fixture
+def repo(history_repo):
+    return RepoManager({"default_branch": "main"}, repo_path=history_repo)
+
+
+class TestIterCommits:
+    """iter_commits should stream and parse git log -z output."""
+
+    def test_matches_git_log(self, repo, history_repo):
+        commits = list(repo.iter_commits())
+        assert [c.sha for c in commits] == git(history_repo, "log", "--format=%H").split("\n")
+        assert commits[2].message == "feat: pipes | in | subject"
+        assert commits[1].author == "Other Dev"
+        assert commits[1].author_email == "other@example.com"
+        assert commits[0].parents == (commits[1].sha,)
+        assert commits[-1].parents == ()
+        assert commits[0].files is None
+
+    def test_commit_is_slotted(self, repo):
+        commit = next(repo.iter_commits())
+        assert not hasattr(commit, "__dict__")
+
+    def test_stats(self, repo):
+        rename, binary, first, _ = repo.iter_commits(stats=True)
+        [stat] = rename.files
+        assert (stat.old_path, stat.path) == ("src/a.py", "src/b.py")
+        assert (stat.additions, stat.deletions) == (1, 0)
+        [stat] = binary.files
+        assert stat.path == "logo.bin" and stat.binary
+        assert [(f.path, f.additions) for f in first.files] == [("src/a.py", 1)]
+
+    def test_filters(self, repo):
+        assert [c.message for c in repo.iter_commits(paths=["src/b.py"])] == ["rename a to b"]
+        assert [c.message for c in repo.iter_commits(author="other@")] == ["add binary"]
+        dated = repo.iter_commits(since_date="2024-02-01", until_date="2024-02-28")
+        assert [c.message for c in dated] == ["add binary"]
+        assert len(list(repo.iter_commits("HEAD~2..HEAD"))) == 2
+        assert len(list(repo.iter_commits(max_count=1))) == 1
+
+    def test_get_commits_uses_iterator(self, repo):
+        commits = repo.get_commits(limit=2)
+        assert [c.message for c in commits] == ["rename a to b", "add binary"]
+        assert repo.get_commits(since="HEAD~1", until="HEAD")[0].message == "rename a to b"
+
+    def test_early_close_terminates_git(self, repo):
+        iterator = repo.iter_commits()
+        next(iterator)
+        iterator.close()
+
+    def test_bad_revision_raises(self, repo):
+        with pytest.raises(subprocess.CalledProcessError):
+            list(repo.iter_commits("no-such-branch"))
+
+    def test_large_stderr_does_not_block(self, history_repo):
+        # Far more warnings than a pipe buffer holds, then the log itself
+        alias = '!f() { head -c 1000000 /dev/zero >&2; git log "$@"; }; f'
+        args = ["-c", f"alias.noisy={alias}", "noisy", *commit_log_args()[1:]]
+
+        commits = list(stream_commit_log(args, cwd=history_repo, timeout=30))
+
+        assert [c.message for c in commits][:1] == ["rename a to b"]
+
+    def test_timeout_kills_git(self, history_repo):
+        args = ["-c", "alias.hang=!exec >/dev/null 2>&1; sleep 5", "hang"]
+
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired):
+            list(stream_commit_log(args, cwd=history_repo, timeout=0.5))
+        assert time.monotonic() - start < 4
+
+
+class TestCommitLogParser:
+    """The parser must not depend on how output is chunked."""
+
+    def test_byte_at_a_time(self, history_repo):
+        output = subprocess.run(
+            ["git", *commit_log_args(stats=True)],
+            cwd=history_repo, capture_output=True, text=True, check=True,
+        ).stdout
+        whole = CommitLogParser(stats=True)
+        expected = whole.feed(output) + whole.close()
+
+        parser = CommitLogParser(stats=True)
+        commits = []
+        for char in output:
+            commits.extend(parser.feed(char))
+        commits.extend(parser.close())
+
+        assert commits == expected
+        assert len(commits) == 4
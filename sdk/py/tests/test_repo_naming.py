@@ -0,0 +1,94 @@
+"""
+Tests for branch name generation and validation.
+"""
+
+import random
+import subprocess
+
+import pytest
+
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.naming import BranchNamer, branch_name_error
+
+from conftest import git
+
+CONFIG = {"branch_prefixes": {"feature": "feat", "bug": "fix"}}
+
+
+def git_accepts(name):
+    result = subprocess.run(
+        ["git", "check-ref-format", "--branch", name], capture_output=True,
+    )
+    return result.returncode == 0
+
+
+class TestValidation:
+    """branch_name_error should agree with git check-ref-format --branch."""
+
+    @pytest.mark.parametrize("name", [
+        "feat/x", "a.b", "x@y", "unicodé", "-x", "HEAD", "a..b", "a/.b", "a.lock",
+        "a.lock/b", "a/", "/a", "a//b", "a.", "a b", "a~1", "a^", "a:b", "a?", "a*",
+        "a[b", "a\\b", "a@{b", "a\x7f", "a\tb", "", ".a", "a/b.lock", "a/.", "lock.a",
+    ])
+    def test_known_cases(self, name):
+        assert (branch_name_error(name) is None) == git_accepts(name)
+
+    def test_at_sign_alone_is_reserved(self):
+        assert branch_name_error("@") is not None
+
+    def test_random_names_match_git(self):
+        rng = random.Random(0)
+        alphabet = "ab./-@{}~^:?*[\\ .lock"
+        for _ in range(300):
+            name = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 8)))
+            if name == "@":
+                continue  # git expands "@" to the current branch
+            assert (branch_name_error(name) is None) == git_accepts(name), repr(name)
+
+
+class TestBranchNamer:
+    """BranchNamer should generate names like generate_branch_name did."""
+
+    def test_generate(self):
+        namer = BranchNamer(CONFIG)
+        assert namer.generate("Add  User--Login!", "feature", "42") == "feat/42-add-user-login"
+        assert namer.generate("Crash on start", "bug") == "fix/crash-on-start"
+        assert namer.generate("Tidy", "unknown") == "feat/tidy"
+        assert len(namer.slugify("x" * 80)) == 50
+
+    def test_generate_many_is_unique(self):
+        namer = BranchNamer(CONFIG)
+        names = namer.generate_many(
+            ["Login", ("Login", "feature"), "Login", ("Crash", "bug", "7"), "Docs"],
+            existing=["feat/login", "feat/docs/intro"],
+        )
+        assert names == [
+            "feat/login-2", "feat/login-3", "feat/login-4", "fix/7-crash", "feat/docs-2",
+        ]
+
+    def test_directory_conflicts(self):
+        namer = BranchNamer({"branch_prefixes": {"feature": "feat/login"}})
+        # "feat/login/x" cannot coexist with a branch named "feat/login"
+        with pytest.raises(ValueError, match="conflicts with existing branch 'feat/login'"):
+            namer.generate_many(["x"], existing=["feat/login"])
+        namer = BranchNamer({"branch_prefixes": {"feature": "feat"}})
+        assert namer.generate_many(["login"], existing=["feat/login/x"]) == ["feat/login-2"]
+
+    def test_invalid_names_raise(self):
+        namer = BranchNamer(CONFIG)
+        with pytest.raises(ValueError, match="Invalid branch name"):
+            namer.generate_many([("Thing", "feature", "a..b")])
+
+
+class TestRepoManagerNaming:
+    """RepoManager should generate names unique against its branches."""
+
+    def test_generate_branch_names(self, git_repo):
+        git(git_repo, "branch", "feat/1-login")
+        repo = RepoManager({**CONFIG, "default_branch": "main"}, repo_path=git_repo)
+
+        assert repo.generate_branch_name("Login", work_id="1") == "feat/1-login"
+        names = repo.generate_branch_names([("Login", "feature", "1"), ("Login", "feature", "1")])
+        assert names == ["feat/1-login-2", "feat/1-login-3"]
+        for name in names:
+            repo.create_branch(name)
@@ -0,0 +1,260 @@
+"""
+Tests for the HTTP pull request provider against a local fake GitHub API.
+"""
+
+import asyncio
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from fractary_core.repo.async_manager import AsyncRepoManager
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.providers.github_http import GitHubHTTPProvider, RetryPolicy, parse_remote
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Minimal GitHub REST pulls API for owner ``o``, repo ``r``."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload=None, headers=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        state = self.server.state
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length)) if length else None
+        state["requests"].append({
+            "method": method,
+            "path": self.path,
+            "headers": dict(self.headers),
+            "port": self.client_address[1],
+        })
+        if state["failures"]:
+            status, headers = state["failures"].pop(0)
+            return self._reply(status, {"message": "injected"}, headers)
+
+        prs = state["prs"]
+        path, _, query = self.path.partition("?")
+        if method == "POST" and path == "/repos/o/r/pulls":
+            number = max(prs, default=0) + 1
+            prs[number] = make_pr(number, payload["head"], payload["base"], payload["title"],
+                                  draft=payload["draft"])
+            return self._reply(201, prs[number])
+        if method == "GET" and path == "/repos/o/r/pulls":
+            params = dict(p.split("=") for p in query.split("&"))
+            page, per_page = int(params["page"]), int(params["per_page"])
+            items = [
+                pr for _, pr in sorted(prs.items(), reverse=True)
+                if params["state"] == "all" or pr["state"] == params["state"]
+            ]
+            return self._reply(200, items[(page - 1) * per_page:page * per_page])
+        match = re.fullmatch(r"/repos/o/r/pulls/(\d+)(/merge)?", path)
+        if match and int(match.group(1)) in prs:
+            pr = prs[int(match.group(1))]
+            if method == "PUT" and match.group(2):
+                pr.update(state="closed", merged_at="2024-01-01T00:00:00Z")
+                return self._reply(200, {"sha": "abc123", "merged": True})
+            etag = f'"{pr["number"]}-{pr["state"]}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._reply(304, headers={"ETag": etag})
+            return self._reply(200, pr, {"ETag": etag})
+        if method == "DELETE" and path.startswith("/repos/o/r/git/refs/heads/"):
+            state["deleted"].append(path.rsplit("/heads/", 1)[1])
+            return self._reply(204)
+        return self._reply(404, {"message": "Not Found"})
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+def make_pr(
+    number, head="feat/x", base="main", title=None, state="open", draft=False, head_repo="o/r",
+):
+    return {
+        "number": number,
+        "title": title or f"PR {number}",
+        "body": None,
+        "state": state,
+        "merged_at": None,
+        "draft": draft,
+        "head": {"ref": head, "repo": {"full_name": head_repo}},
+        "base": {"ref": base},
+        "html_url": f"https://github.com/o/r/pull/{number}",
+    }
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    httpd.state = {"prs": {}, "requests": [], "failures": [], "deleted": []}
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def config(server):
+    return {
+        "owner": "o",
+        "repo": "r",
+        "token": "secret",
+        "api_url": f"http://127.0.0.1:{server.server_address[1]}",
+    }
+
+
+@pytest.fixture
+def provider(config):
+    provider = GitHubHTTPProvider(config, retry=RetryPolicy(backoff=0.001))
+    yield provider
+    provider.close()
+
+
+class TestGitHubHTTPProvider:
+    """The HTTP provider should pool, cache, retry and parse responses."""
+
+    def test_create_returns_post_response(self, provider, server):
+        pr = provider.create_pr("Add login", "body", "feat/login", "main", draft=True)
+
+        assert (pr.number, pr.title) == (1, "Add login")
+        assert (pr.head_branch, pr.base_branch) == ("feat/login", "main")
+        assert pr.draft and pr.state == "open"
+        [request] = server.state["requests"]
+        assert request["method"] == "POST"
+        assert request["headers"]["Authorization"] == "Bearer secret"
+
+    def test_etag_revalidation_and_pooling(self, provider, server):
+        server.state["prs"][7] = make_pr(7)
+
+        first = provider.get_pr(7)
+        second = provider.get_pr(7)
+
+        assert first == second
+        requests_seen = server.state["requests"]
+        assert "If-None-Match" not in requests_seen[0]["headers"]
+        assert requests_seen[1]["headers"]["If-None-Match"] == '"7-open"'
+        # Both requests reused one keep-alive connection
+        assert requests_seen[0]["port"] == requests_seen[1]["port"]
+
+    def test_retries(self, provider, server):
+        server.state["prs"][1] = make_pr(1)
+        server.state["failures"] = [(503, {}), (502, {})]
+        assert provider.get_pr(1).number == 1
+        assert len(server.state["requests"]) == 3
+
+        # POST is not repeated after a server error, which may have created the PR
+        server.state["failures"] = [(503, {})]
+        with pytest.raises(requests.HTTPError):
+            provider.create_pr("t", "b", "feat/y", "main", draft=False)
+        assert server.state["prs"].keys() == {1}
+
+        # ... but rate-limit rejections are retried for every method
+        server.state["failures"] = [
+            (429, {"Retry-After": "0"}),
+            (403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}),
+        ]
+        assert provider.create_pr("t", "b", "feat/y", "main", draft=False).number == 2
+
+        server.state["failures"] = [(503, {})] * 5
+        with pytest.raises(requests.HTTPError):
+            provider.get_pr(1)
+
+    def test_list_and_get_many(self, provider, server):
+        for number in range(1, 151):
+            server.state["prs"][number] = make_pr(number, state="open" if number % 3 else "closed")
+        server.state["prs"][3]["merged_at"] = "2024-01-01T00:00:00Z"
+
+        open_prs = provider.list_prs("open", None, None, None, None, False)
+        assert len(open_prs) == 100 and open_prs[0].number == 149
+        merged = provider.list_prs("merged", None, None, None, None, False)
+        assert [pr.number for pr in merged] == [3]
+        assert len(provider.list_prs("all", None, None, None, 120, False)) == 120
+
+        prs = provider.get_prs([1, 2, 999], None, raw=True)
+        assert sorted(prs) == [1, 2]
+        assert prs[1].raw["html_url"].endswith("/1")
+
+    def test_merge_deletes_branch(self, provider, server):
+        server.state["prs"][4] = make_pr(4, head="feat/done")
+
+        result = provider.merge_pr(4, "squash", delete_branch=True)
+
+        assert result == {"success": True, "method": "squash", "sha": "abc123"}
+        assert server.state["deleted"] == ["feat/done"]
+        assert provider.get_pr(4).state == "merged"
+
+    def test_merge_keeps_fork_branch(self, provider, server):
+        server.state["prs"][5] = make_pr(5, head="develop", head_repo="someone/r")
+
+        provider.merge_pr(5, "merge", delete_branch=True)
+
+        assert provider.get_pr(5).head_repo == "someone/r"
+        assert server.state["deleted"] == []
+
+
+class TestRepoManagerProvider:
+    """RepoManager should route PR operations through the configured provider."""
+
+    def test_http_provider(self, git_repo, config, server):
+        config = {**config, "pr_provider": "http", "default_branch": "main"}
+        repo = RepoManager(config, repo_path=git_repo)
+        pr = repo.create_pr("From manager", "body", head="feat/m")
+
+        assert pr.base_branch == "main"
+        assert len(server.state["requests"]) == 1
+        assert repo.get_prs([pr.number])[pr.number].title == "From manager"
+        repo.close()
+
+    def test_async_http_provider(self, git_repo, config, server):
+        config = {**config, "pr_provider": "http", "default_branch": "main"}
+        repo = AsyncRepoManager(config, repo_path=git_repo)
+
+        async def scenario():
+            pr = await repo.create_pr("From async", "body", head="feat/a")
+            result = await repo.merge_pr(pr.number, delete_branch=True)
+            return pr, result, await repo.get_pr(pr.number)
+
+        pr, result, merged = asyncio.run(scenario())
+        repo.close()
+
+        assert pr.base_branch == "main"
+        assert result["success"]
+        assert merged.state == "merged"
+        assert server.state["deleted"] == ["feat/a"]
+
+    def test_unknown_provider(self, git_repo):
+        repo = RepoManager({"pr_provider": "carrier-pigeon"}, repo_path=git_repo)
+        with pytest.raises(ValueError, match="carrier-pigeon"):
+            repo.get_pr(1)
+
+
+def test_parse_remote():
+    assert parse_remote("git@github.com:fractary/core.git\n") == ("fractary", "core")
+    assert parse_remote("https://github.com/fractary/core") == ("fractary", "core")
+    with pytest.raises(ValueError):
+        parse_remote("core")
@@ -0,0 +1,136 @@
+"""
+Tests for batched pull request queries.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.pulls import get_prs_query, list_prs_query, pr_selection
+
+# A stand-in for `gh api graphql` serving 250 pull requests, numbered 1-250.
+# Requests are appended to $FAKE_GH_LOG so tests can count round trips.
+FAKE_GH = r'''
+import json, os, re, sys
+
+args = sys.argv[1:]
+fields = {}
+for flag, value in zip(args, args[1:]):
+    if flag in ("-f", "-F"):
+        key, _, val = value.partition("=")
+        fields[key] = int(val) if flag == "-F" and val.isdigit() else val
+with open(os.environ["FAKE_GH_LOG"], "a") as log:
+    log.write(json.dumps(fields) + "\n")
+
+def node(n):
+    return {"number": n, "title": f"PR {n}", "body": None, "state": "OPEN",
+            "headRefName": f"feat/{n}", "baseRefName": "main",
+            "url": f"https://github.com/o/r/pull/{n}", "isDraft": n % 2 == 0}
+
+def project(data, query):
+    selection = query.rsplit("{", 1)[1].split("}")[0].split()
+    return {k: v for k, v in data.items() if k in selection}
+
+query = fields["query"]
+if "pullRequests(" in query:
+    numbers = list(range(250, 0, -1))
+    start = int(fields.get("after", 0))
+    page = numbers[start:start + fields["first"]]
+    end = start + len(page)
+    result = {"data": {"repository": {"pullRequests": {
+        "pageInfo": {"hasNextPage": end < len(numbers), "endCursor": str(end)},
+        "nodes": [project(node(n), query) for n in page],
+    }}}}
+    print(json.dumps(result))
+else:
+    repository, errors = {}, []
+    for n in map(int, re.findall(r"pullRequest\(number: (\d+)\)", query)):
+        repository[f"pr{n}"] = project(node(n), query) if n <= 250 else None
+        if n > 250:
+            message = f"Could not resolve to a PullRequest with the number of {n}."
+            errors.append({"message": message})
+    extra = {"errors": errors} if errors else {}
+    print(json.dumps({"data": {"repository": repository}, **extra}))
+    sys.exit(1 if errors else 0)
+'''
+
+
+@pytest.fixture
+def gh_log(tmp_path, monkeypatch):
+    """Put the fake gh first on PATH; return a reader for logged requests."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "gh"
+    script.write_text(f"#!{sys.executable}\n{FAKE_GH}")
+    script.chmod(0o755)
+    log = tmp_path / "gh.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_GH_LOG", str(log))
+    return lambda: [json.loads(line) for line in log.read_text().splitlines()]
+
+
+@pytest.fixture
+def repo(git_repo):
+    return RepoManager({"default_branch": "main"}, repo_path=git_repo)
+
+
+class TestQueries:
+    """Query builders should project fields and validate input."""
+
+    def test_selection(self):
+        assert pr_selection(["title", "head_branch"]) == "number title headRefName"
+        assert "isDraft" in pr_selection()
+        with pytest.raises(ValueError, match="labels"):
+            pr_selection(["labels"])
+
+    def test_list_query(self):
+        query = list_prs_query("all", ["title"])
+        assert "states: [OPEN, CLOSED, MERGED]" in query
+        assert "nodes { number title }" in query
+        with pytest.raises(ValueError, match="state"):
+            list_prs_query("draft")
+
+    def test_batch_query(self):
+        query = get_prs_query([7, 12], ["url"])
+        assert "pr7: pullRequest(number: 7) { number url }" in query
+        assert "pr12: pullRequest(number: 12)" in query
+
+
+class TestListPrs:
+    """list_prs should page through results with projected fields."""
+
+    def test_pagination(self, repo, gh_log):
+        prs = repo.list_prs(base="main")
+
+        assert [pr.number for pr in prs] == list(range(250, 0, -1))
+        requests = gh_log()
+        assert [r.get("after") for r in requests] == [None, "100", "200"]
+        assert all(r["base"] == "main" and "head" not in r for r in requests)
+        assert requests[0]["owner"] == "{owner}" and requests[0]["name"] == "{repo}"
+        pr = prs[0]
+        assert (pr.title, pr.state, pr.head_branch, pr.body) == ("PR 250", "open", "feat/250", "")
+        assert pr.draft and pr.raw == {}
+
+    def test_limit_and_projection(self, repo, gh_log):
+        prs = repo.list_prs(fields=["title"], limit=120, raw=True)
+
+        assert len(prs) == 120
+        assert [r["first"] for r in gh_log()] == [100, 20]
+        assert prs[0].title == "PR 250" and prs[0].url == ""
+        assert prs[0].raw == {"number": 250, "title": "PR 250"}
+
+
+class TestGetPrs:
+    """get_prs should fetch many PRs per request and skip missing ones."""
+
+    def test_batches_and_missing(self, repo, gh_log):
+        numbers = list(range(1, 121)) + [999, 5]
+        prs = repo.get_prs(numbers, fields=["base_branch"])
+
+        assert sorted(prs) == list(range(1, 121))
+        assert prs[42].base_branch == "main" and prs[42].title == ""
+        assert len(gh_log()) == 3
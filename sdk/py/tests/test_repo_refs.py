@@ -0,0 +1,126 @@
+"""
+Tests for the in-process RefReader, checked against real git output.
+"""
+
+import subprocess
+
+import pytest
+
+from fractary_core.repo import refs as refs_module
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.refs import RefReader, UnsupportedRepository
+from fractary_core.repo.session import GitQuerySession
+
+from conftest import git
+
+
+def records_from_git(path):
+    with GitQuerySession(path) as session:
+        refs = session.read_refs(["refs/heads", "refs/remotes/origin/HEAD"])
+    return [(r.name, r.sha, r.short_sha, r.upstream, r.symref, r.is_head) for r in refs]
+
+
+def records_from_reader(path):
+    refs = RefReader(path).branch_records()
+    return [(r.name, r.sha, r.short_sha, r.upstream, r.symref, r.is_head) for r in refs]
+
+
+def assert_matches_git(path):
+    reader = RefReader(path)
+    assert reader.current_branch() == git(path, "branch", "--show-current")
+    assert records_from_reader(path) == records_from_git(path)
+
+
+@pytest.fixture
+def cloned_repo(git_repo, tmp_path):
+    """A clone of git_repo with a few tracking and local branches."""
+    git(git_repo, "branch", "release/1.0")
+    git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", str(git_repo), str(clone))
+    git(clone, "checkout", "-q", "-b", "feat/42-login", "origin/release/1.0")
+    git(clone, "branch", "scratch")
+    git(clone, "branch", "--set-upstream-to=main", "scratch")
+    return clone
+
+
+class TestRefReaderAgainstGit:
+    """Each scenario compares RefReader output with git on the same repo."""
+
+    def test_loose_refs(self, cloned_repo):
+        assert_matches_git(cloned_repo)
+
+    def test_packed_refs_with_loose_override(self, cloned_repo):
+        git(cloned_repo, "pack-refs", "--all")
+        git(cloned_repo, "commit", "-q", "--allow-empty", "-m", "after pack")
+        assert_matches_git(cloned_repo)
+
+    def test_detached_head(self, cloned_repo):
+        git(cloned_repo, "checkout", "-q", "--detach", "main~1")
+        assert_matches_git(cloned_repo)
+
+    def test_linked_worktree(self, cloned_repo, tmp_path):
+        worktree = tmp_path / "wt"
+        git(cloned_repo, "worktree", "add", "-q", "-b", "wt-branch", str(worktree))
+        git(worktree, "commit", "-q", "--allow-empty", "-m", "in worktree")
+        assert_matches_git(worktree)
+        assert_matches_git(cloned_repo)
+
+    def test_resolve_matches_rev_parse(self, cloned_repo):
+        git(cloned_repo, "tag", "v1.0.0")
+        reader = RefReader(cloned_repo)
+        for rev in ["HEAD", "main", "feat/42-login", "origin/main", "origin", "v1.0.0"]:
+            assert reader.resolve(rev) == git(cloned_repo, "rev-parse", rev), rev
+        assert reader.resolve("HEAD~1") is None
+
+    def test_cache_invalidates_on_change(self, cloned_repo):
+        reader = RefReader(cloned_repo)
+        before = reader.resolve_ref("refs/heads/scratch")
+        git(cloned_repo, "commit", "-q", "--allow-empty", "-m", "move")
+        git(cloned_repo, "branch", "-f", "scratch", "HEAD")
+        after = reader.resolve_ref("refs/heads/scratch")
+        assert before != after == git(cloned_repo, "rev-parse", "scratch")
+
+
+    @pytest.mark.parametrize("abbrev", ["12", "4", "no", "auto"])
+    def test_core_abbrev(self, cloned_repo, abbrev):
+        git(cloned_repo, "config", "core.abbrev", abbrev)
+        assert_matches_git(cloned_repo)
+
+
+class TestRefReaderFallback:
+    """Unsupported layouts raise so RepoManager can fall back to git."""
+
+    def test_config_include_unsupported(self, git_repo):
+        git(git_repo, "config", "include.path", "extra.cfg")
+        with pytest.raises(UnsupportedRepository):
+            RefReader(git_repo).branch_records()
+
+    def test_auto_abbrev_in_large_repo_unsupported(self, cloned_repo, monkeypatch):
+        git(cloned_repo, "gc", "-q")
+        monkeypatch.setattr(refs_module, "_AUTO_ABBREV_MAX_OBJECTS", 2)
+        with pytest.raises(UnsupportedRepository):
+            RefReader(cloned_repo).branch_records()
+
+        git(cloned_repo, "config", "core.abbrev", "9")
+        assert_matches_git(cloned_repo)
+
+    def test_manager_falls_back(self, git_repo, monkeypatch):
+        git(git_repo, "config", "include.path", "extra.cfg")
+        git(git_repo, "branch", "feature")
+        with RepoManager({"ref_reader": True}, repo_path=git_repo) as manager:
+            names = [b.name for b in manager.list_branches()]
+        assert names == ["feature", "main"]
+
+    def test_manager_zero_forks(self, git_repo, monkeypatch):
+        git(git_repo, "branch", "feature")
+        manager = RepoManager({"ref_reader": True}, repo_path=git_repo)
+
+        def no_popen(*args, **kwargs):
+            raise AssertionError(f"unexpected process: {args[0]}")
+
+        monkeypatch.setattr(subprocess, "Popen", no_popen)
+        assert manager.get_current_branch() == "main"
+        assert manager.get_default_branch() == "main"
+        assert manager.get_branch("feature").sha == manager.get_branch("main").sha
+        assert [b.name for b in manager.list_branches()] == ["feature", "main"]
@@ -0,0 +1,175 @@
+"""
+Tests for GitQuerySession and the session-backed RepoManager branch queries.
+"""
+
+import subprocess
+
+import pytest
+
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.session import GitQuerySession
+
+from conftest import count_spawns, git
+
+
+@pytest.fixture
+def repo_manager(git_repo):
+    manager = RepoManager({"default_branch": "main"}, repo_path=git_repo)
+    yield manager
+    manager.close()
+
+
+class TestGitQuerySession:
+    """Tests for the pipelined cat-file session."""
+
+    def test_resolve_many_matches_rev_parse(self, git_repo):
+        git(git_repo, "branch", "feature")
+        with GitQuerySession(git_repo) as session:
+            resolved = session.resolve_many(["main", "feature", "HEAD", "does-not-exist"])
+
+        head = git(git_repo, "rev-parse", "HEAD")
+        assert resolved == {
+            "main": head,
+            "feature": head,
+            "HEAD": head,
+            "does-not-exist": None,
+        }
+
+    def test_recovers_after_unparseable_revision(self, git_repo):
+        with GitQuerySession(git_repo) as session:
+            # No upstream configured: cat-file exits instead of answering
+            results = session.resolve_many(["main@{upstream}", "main"])
+
+        assert results["main@{upstream}"] is None
+        assert results["main"] == git(git_repo, "rev-parse", "main")
+
+    def test_revision_with_spaces(self, git_repo):
+        with GitQuerySession(git_repo) as session:
+            infos = session.object_info(["no such", "HEAD", "no such missing"])
+            blob = session.object_info(["HEAD:README.md"])[0]
+            read = session.read_object("no such missing")
+            content = session.read_object("HEAD:README.md")
+
+        assert infos[0] is None and infos[2] is None
+        assert infos[1].sha == git(git_repo, "rev-parse", "HEAD")
+        assert blob.type == "blob" and blob.sha == git(git_repo, "rev-parse", "HEAD:README.md")
+        assert read is None
+        assert content[0] == blob
+
+    def test_sees_refs_created_after_start(self, git_repo):
+        with GitQuerySession(git_repo) as session:
+            assert session.resolve("later") is None
+            git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+            git(git_repo, "branch", "later")
+            assert session.resolve("later") == git(git_repo, "rev-parse", "HEAD")
+
+    def test_pipelines_large_batches(self, git_repo):
+        revs = ["HEAD"] * 1000
+        with GitQuerySession(git_repo) as session:
+            infos = session.object_info(revs)
+
+        assert len(infos) == 1000
+        assert all(info is not None and info.type == "commit" for info in infos)
+
+
+class TestSessionBackedBranches:
+    """Branch queries should agree with plain git."""
+
+    def test_get_branch(self, repo_manager, git_repo):
+        git(git_repo, "branch", "feature")
+        git(git_repo, "branch", "--set-upstream-to=main", "feature")
+
+        branch = repo_manager.get_branch("feature")
+
+        assert branch.sha == git(git_repo, "rev-parse", "feature")
+        assert branch.upstream == "main"
+        assert not branch.is_current
+        assert not branch.is_default
+
+        main = repo_manager.get_branch("main")
+        assert main.is_current and main.is_default and main.upstream is None
+
+    def test_get_branch_unknown_raises(self, repo_manager):
+        with pytest.raises(subprocess.CalledProcessError):
+            repo_manager.get_branch("missing")
+        with pytest.raises(subprocess.CalledProcessError):
+            repo_manager.get_branch("no such missing")
+
+    def test_default_branch_from_remote_head(self, git_repo, tmp_path):
+        clone = tmp_path / "clone"
+        git(tmp_path, "clone", "-q", str(git_repo), str(clone))
+        with RepoManager({"default_branch": "develop"}, repo_path=clone) as manager:
+            assert manager.get_default_branch() == "main"
+
+    def test_list_branches_pattern(self, repo_manager, git_repo):
+        git(git_repo, "branch", "feat/one")
+        git(git_repo, "branch", "feat/two")
+
+        names = [b.name for b in repo_manager.list_branches("feat/*")]
+        assert names == ["feat/one", "feat/two"]
+
+        branches = {b.name: b for b in repo_manager.list_branches()}
+        assert branches["main"].is_current and branches["main"].is_default
+        assert branches["feat/one"].sha == git(git_repo, "rev-parse", "--short", "feat/one")
+
+    def test_get_branch_uses_single_fork_when_warm(self, git_repo, monkeypatch):
+        manager = RepoManager({"branch_cache_ttl": 0}, repo_path=git_repo)
+        manager.get_branch("main")  # start the batch process
+
+        spawned = count_spawns(monkeypatch)
+        manager.get_branch("main")
+        manager.close()
+
+        assert len(spawned) == 1
+
+
+class TestBranchSnapshot:
+    """Branch state is computed once per operation and invalidated on change."""
+
+    def test_operation_scope_reads_refs_once(self, repo_manager, git_repo, monkeypatch):
+        for i in range(5):
+            git(git_repo, "branch", f"feat/{i}")
+        repo_manager.get_branch("main")  # start the batch process
+        repo_manager.invalidate_branch_cache()
+
+        spawned = count_spawns(monkeypatch)
+        with repo_manager.operation() as snapshot:
+            assert snapshot.current == "main"
+            for branch in repo_manager.list_branches():
+                repo_manager.get_branch(branch.name)
+            repo_manager.get_default_branch()
+        assert len(spawned) == 1
+
+    def test_create_branch_invalidates(self, repo_manager):
+        with repo_manager.operation():
+            assert repo_manager.get_current_branch() == "main"
+            branch = repo_manager.create_branch("feat/new", base="main")
+            assert branch.is_current
+            assert repo_manager.get_current_branch() == "feat/new"
+            repo_manager.checkout_branch("main")
+            repo_manager.delete_branch("feat/new")
+            assert [b.name for b in repo_manager.list_branches()] == ["main"]
+
+    def test_external_change_invalidates_ttl_cache(self, repo_manager, git_repo):
+        assert repo_manager.get_current_branch() == "main"
+        git(git_repo, "checkout", "-q", "-b", "elsewhere")
+        assert repo_manager.get_current_branch() == "elsewhere"
+
+    def test_external_nested_branch_move_invalidates(self, repo_manager, git_repo):
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+        git(git_repo, "branch", "feat/x")
+        assert repo_manager.get_branch("feat/x").sha == git(git_repo, "rev-parse", "HEAD")
+
+        git(git_repo, "branch", "-f", "feat/x", "HEAD~1")
+        moved = git(git_repo, "rev-parse", "HEAD~1")
+        assert repo_manager.get_branch("feat/x").sha == moved
+        assert moved.startswith({b.name: b.sha for b in repo_manager.list_branches()}["feat/x"])
+
+    def test_ttl_zero_disables_cache(self, git_repo, monkeypatch):
+        manager = RepoManager({"branch_cache_ttl": 0}, repo_path=git_repo)
+        manager.get_default_branch()
+        spawned = count_spawns(monkeypatch)
+        manager.get_default_branch()
+        manager.get_default_branch()
+        manager.close()
+        assert len(spawned) == 2
@@ -0,0 +1,112 @@
+"""
+Tests for working tree status.
+"""
+
+import subprocess
+
+import pytest
+
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.status import parse_status
+
+from conftest import count_spawns, git
+
+
+@pytest.fixture
+def repo(git_repo):
+    return RepoManager({"default_branch": "main"}, repo_path=git_repo)
+
+
+class TestParseStatus:
+    """parse_status should understand every porcelain v2 record type."""
+
+    def test_records(self):
+        output = "\0".join([
+            "# branch.oid 1111111111111111111111111111111111111111",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +2 -1",
+            "1 M. N... 100644 100644 100644 aaaa bbbb staged file.txt",
+            "1 .M N... 100644 100644 100644 aaaa aaaa dirty.txt",
+            "2 R. N... 100644 100644 100644 aaaa aaaa R87 new name.txt",
+            "old name.txt",
+            "u UU N... 100644 100644 100644 100644 h1 h2 h3 conflict.txt",
+            "? new.txt",
+            "! build/",
+            "",
+        ])
+        status = parse_status(output)
+
+        assert status.oid == "1" * 40
+        assert (status.branch, status.upstream) == ("main", "origin/main")
+        assert (status.ahead, status.behind) == (2, 1)
+        assert [e.path for e in status.staged] == ["staged file.txt", "new name.txt"]
+        assert [e.path for e in status.unstaged] == ["dirty.txt"]
+        renamed = status.entries[2]
+        assert (renamed.orig_path, renamed.similarity) == ("old name.txt", 87)
+        assert [e.path for e in status.unmerged] == ["conflict.txt"]
+        assert [e.path for e in status.untracked] == ["new.txt"]
+        assert [e.path for e in status.ignored] == ["build/"]
+        assert not status.clean
+
+    def test_detached_and_initial(self):
+        status = parse_status("# branch.oid (initial)\0# branch.head (detached)\0")
+        assert status.oid is None and status.branch is None
+        assert status.clean
+
+
+class TestStatus:
+    """RepoManager.status should match git and be cached between changes."""
+
+    def test_status(self, repo, git_repo):
+        git(git_repo, "mv", "README.md", "DOCS.md")
+        (git_repo / "new.txt").write_text("x\n")
+
+        status = repo.status()
+        assert status.branch == "main"
+        assert status.oid == git(git_repo, "rev-parse", "HEAD")
+        [renamed, untracked] = status.entries
+        assert (renamed.kind, renamed.path, renamed.orig_path) == (
+            "renamed", "DOCS.md", "README.md",
+        )
+        assert (untracked.kind, untracked.path) == ("untracked", "new.txt")
+        assert repo.status(untracked="no", refresh=True).entries == [renamed]
+
+    def test_cached_until_index_changes(self, repo, git_repo, monkeypatch):
+        repo.status()
+        spawned = count_spawns(monkeypatch)
+        repo.status()
+        assert spawned == []
+
+        # External staging rewrites the index and invalidates the cache
+        (git_repo / "new.txt").write_text("x\n")
+        subprocess.run(["git", "add", "new.txt"], cwd=git_repo, check=True)
+        assert [e.path for e in repo.status().staged] == ["new.txt"]
+
+    def test_ttl_zero_disables_cache(self, git_repo, monkeypatch):
+        repo = RepoManager({"status_cache_ttl": 0}, repo_path=git_repo)
+        repo.status()
+        spawned = count_spawns(monkeypatch)
+        repo.status()
+        assert len(spawned) == 1
+
+    def test_commit_sees_edits_after_cached_clean(self, repo, git_repo):
+        assert repo.status().clean
+        (git_repo / "README.md").write_text("edited\n")
+
+        repo.commit("edit readme", commit_type="docs")
+
+        assert git(git_repo, "show", "HEAD:README.md") == "edited"
+        assert repo.status().clean
+
+    def test_enable_fast_status(self, git_repo):
+        repo = RepoManager({"untracked_cache": True, "fsmonitor": "/bin/true"}, repo_path=git_repo)
+        repo.status()
+
+        assert git(git_repo, "config", "core.untrackedCache") == "true"
+        assert git(git_repo, "config", "core.fsmonitor") == "/bin/true"
+
+        # Existing settings are left alone
+        git(git_repo, "config", "core.untrackedCache", "false")
+        settings = repo.enable_fast_status()
+        assert settings["untracked_cache"] == "false"
@@ -0,0 +1,129 @@
+"""
+Tests for tag listing, semantic version ordering and batch creation.
+"""
+
+import random
+import subprocess
+
+import pytest
+
+from fractary_core.repo.manager import RepoManager
+from fractary_core.repo.tags import TagSpec, compare_versions, version_key
+
+from conftest import count_spawns, git
+
+
+@pytest.fixture
+def repo(git_repo):
+    manager = RepoManager({"default_branch": "main"}, repo_path=git_repo)
+    yield manager
+    manager.close()
+
+
+SEMVER_ORDER = [
+    "0.9.0",
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "v1.9.0",
+    "1.10.0",
+    "v2.0.0",
+]
+
+
+class TestVersions:
+    """version_key should implement semantic version precedence."""
+
+    def test_precedence(self):
+        shuffled = SEMVER_ORDER[:]
+        random.Random(7).shuffle(shuffled)
+        assert sorted(shuffled, key=version_key) == SEMVER_ORDER
+
+    def test_compare(self):
+        assert compare_versions("1.0.0", "1.0.0-rc.1") == 1
+        assert compare_versions("v1.2.3", "1.2.3+build.5") == 0
+        assert compare_versions("1.2.3", "1.2.10") == -1
+        with pytest.raises(ValueError, match="release-1"):
+            compare_versions("1.0.0", "release-1")
+
+    def test_not_versions(self):
+        for name in ("latest", "1.2", "01.2.3", "1.2.3-", "1.2.3-01", "v1.2.3.4"):
+            assert version_key(name) is None
+
+
+class TestTags:
+    """RepoManager should list and create tags in bulk."""
+
+    def test_create_and_list(self, repo, git_repo):
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+        created = repo.create_tags([
+            TagSpec("v1.10.0", message="Release 1.10\n\nNotes"),
+            TagSpec("v1.9.0", target="HEAD~1"),
+            "latest",
+            TagSpec("v1.10.0-rc.1", target="HEAD~1", message="RC"),
+        ])
+
+        assert [t.annotated for t in created] == [True, False, False, True]
+        assert created[0].message == "Release 1.10"
+        assert git(git_repo, "cat-file", "-p", "v1.10.0").endswith("Release 1.10\n\nNotes")
+        assert git(git_repo, "rev-parse", "v1.10.0^{commit}") == git(git_repo, "rev-parse", "HEAD")
+        assert git(git_repo, "rev-parse", "v1.9.0") == git(git_repo, "rev-parse", "HEAD~1")
+        subprocess.run(["git", "fsck", "--strict"], cwd=git_repo, check=True, capture_output=True)
+
+        tags = repo.list_tags()
+        assert [t.name for t in tags] == ["latest", "v1.9.0", "v1.10.0-rc.1", "v1.10.0"]
+        assert tags[-1] == created[0]
+        assert [t.name for t in repo.list_tags(descending=True, limit=2)] == [
+            "v1.10.0", "v1.10.0-rc.1",
+        ]
+        assert [t.name for t in repo.list_tags("v1.*", sort="name")] == [
+            "v1.10.0", "v1.10.0-rc.1", "v1.9.0",
+        ]
+        # Refname order: the limit keeps the last tags, not the first ones reversed
+        assert [t.name for t in repo.list_tags(sort="none", descending=True, limit=2)] == [
+            "v1.9.0", "v1.10.0-rc.1",
+        ]
+        assert [t.name for t in repo.list_tags(sort="none", limit=2)] == ["latest", "v1.10.0"]
+        with pytest.raises(ValueError, match="sort"):
+            repo.list_tags(sort="size")
+
+    def test_batch_is_one_transaction(self, repo, git_repo, monkeypatch):
+        repo.session.resolve("HEAD")
+        specs = [TagSpec(f"v0.{i}.0", message=f"Release 0.{i}") for i in range(200)]
+
+        spawned = count_spawns(monkeypatch)
+        repo.create_tags(specs)
+
+        assert [argv[1] for argv in spawned] == ["var", "hash-object", "update-ref"]
+        assert len(repo.list_tags("v0.*")) == 200
+
+    def test_all_or_nothing(self, repo, git_repo):
+        git(git_repo, "tag", "v1.0.0")
+        with pytest.raises(ValueError, match="already exist: v1.0.0"):
+            repo.create_tags(["v0.9.0", "v1.0.0"])
+        with pytest.raises(ValueError, match="resolve"):
+            repo.create_tags([TagSpec("v2.0.0", target="nope")])
+        with pytest.raises(ValueError, match="more than once"):
+            repo.create_tags(["a", "a"])
+        with pytest.raises(ValueError, match="Invalid tag name"):
+            repo.create_tags(["bad..name"])
+        assert [t.name for t in repo.list_tags()] == ["v1.0.0"]
+
+        git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+        [moved] = repo.create_tags([TagSpec("v1.0.0", force=True)])
+        assert moved.sha == git(git_repo, "rev-parse", "HEAD")
+
+    def test_push(self, repo, git_repo, tmp_path):
+        remote = tmp_path / "remote.git"
+        git(tmp_path, "init", "-q", "--bare", str(remote))
+        git(git_repo, "remote", "add", "origin", str(remote))
+
+        repo.create_tags(["v1.0.0", TagSpec("v1.1.0", message="Release")], push=True)
+
+        remote_tags = git(remote, "for-each-ref", "--format=%(refname)", "refs/tags")
+        assert remote_tags.split("\n") == ["refs/tags/v1.0.0", "refs/tags/v1.1.0"]
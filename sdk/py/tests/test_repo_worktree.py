@@ -0,0 +1,94 @@
+"""
+Tests for WorktreePool.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from fractary_core.repo.worktree import WorktreePool
+
+from conftest import git
+
+
+@pytest.fixture
+def pool(git_repo):
+    return WorktreePool(git_repo, max_worktrees=2, config={"default_branch": "main"})
+
+
+class TestWorktreePool:
+    """WorktreePool should lease, recycle and evict worktrees."""
+
+    def test_lease_and_recycle(self, pool, git_repo):
+        with pool.lease("feat/one") as lease:
+            assert git(lease.path, "branch", "--show-current") == "feat/one"
+            assert pool.root in lease.path.parents
+            (lease.path / "work.txt").write_text("work\n")
+            lease.repo.commit("Add work", commit_type="feat")
+            (lease.path / "scratch.txt").write_text("left behind\n")
+            (lease.path / "README.md").write_text("dirty\n")
+            first = lease.path
+
+        # The commit survives on the branch; the worktree is clean and detached
+        assert git(git_repo, "show", "feat/one:work.txt") == "work"
+        assert not (first / "scratch.txt").exists()
+        assert git(first, "status", "--porcelain") == ""
+        [idle] = pool.worktrees()
+        assert idle.path == first and not idle.leased and idle.branch is None
+
+        # The branch is free again and the same directory is reused
+        git(git_repo, "checkout", "-q", "feat/one")
+        git(git_repo, "checkout", "-q", "main")
+        with pool.lease("feat/one") as lease:
+            assert lease.path == first
+            assert (lease.path / "work.txt").exists()
+
+    def test_new_branch_from_base(self, pool, git_repo):
+        git(git_repo, "checkout", "-q", "-b", "develop")
+        (git_repo / "dev.txt").write_text("dev\n")
+        git(git_repo, "add", "dev.txt")
+        git(git_repo, "commit", "-q", "-m", "dev")
+        git(git_repo, "checkout", "-q", "main")
+
+        with pool.lease("feat/two", base="develop") as lease:
+            assert (lease.path / "dev.txt").exists()
+        with pool.lease("feat/three") as lease:
+            assert not (lease.path / "dev.txt").exists()
+
+    def test_concurrent_leases_and_eviction(self, pool):
+        leases = [pool.acquire(f"feat/{i}") for i in range(4)]
+        assert len({lease.path for lease in leases}) == 4
+        assert all(wt.leased for wt in pool.worktrees())
+
+        with pytest.raises(ValueError, match="checked out"):
+            pool.acquire("feat/0")
+
+        for lease in leases:
+            lease.release()
+        # Least recently released worktrees are evicted down to max_worktrees
+        expected = sorted(lease.path for lease in leases[2:])
+        assert sorted(wt.path for wt in pool.worktrees()) == expected
+
+    def test_max_bytes(self, git_repo):
+        pool = WorktreePool(git_repo, max_worktrees=10, max_bytes=1)
+        assert pool.prewarm(3) == 3
+        assert pool.prewarm(3) == 0
+        with pool.lease("feat/x"):
+            pass
+        assert pool.worktrees() == []
+
+    def test_stale_lease_is_reclaimed(self, pool, git_repo):
+        script = (
+            "import sys; from fractary_core.repo.worktree import WorktreePool; "
+            f"WorktreePool({str(git_repo)!r}).acquire('feat/crashed')"
+        )
+        subprocess.run([sys.executable, "-c", script], check=True)
+        [stale] = pool.worktrees()
+        assert stale.leased
+
+        pool.clear()
+        assert pool.worktrees() == [stale]
+
+        with pool.lease("feat/next") as lease:
+            assert lease.path == stale.path
@@ -0,0 +1,149 @@
+"""
+Tests for SpecDocument section indexing and in-place edits.
+"""
+
+import os
+
+import pytest
+
+from fractary_core.spec import SpecDocument, SpecManager
+
+CONTENT = """# Login form
+
+## Status: Draft
+## Version: 1.0.0
+## Work ID: N/A
+
+---
+
+## 1. Summary
+
+Short summary.
+
+## 4. Implementation Plan
+
+### 4.1 Prerequisites
+
+- [ ] Prerequisite 1
+- [ ] Prerequisite 2
+
+### 4.2 Steps
+
+1. Step 1
+2. Step 2
+
+```bash
+# not a heading
+```
+
+### 4.3 Rollback Plan
+
+- [x] Keep the old form
+
+## 5. Notes
+
+## Status: Unrelated
+"""
+
+
+def reindexed(doc):
+    return SpecDocument(doc.data).sections
+
+
+class TestSpecDocument:
+    """Sections should be indexed by offset and edited by splicing."""
+
+    def test_sections(self):
+        doc = SpecDocument(CONTENT)
+        assert [(s.level, s.number, s.title) for s in doc.sections if s.number] == [
+            (2, "1", "Summary"),
+            (2, "4", "Implementation Plan"),
+            (3, "4.1", "Prerequisites"),
+            (3, "4.2", "Steps"),
+            (3, "4.3", "Rollback Plan"),
+            (2, "5", "Notes"),
+        ]
+        assert doc.section("steps") == doc.section("4.2") == doc.section("4.2 Steps")
+        assert doc.body("4.2").startswith("\n1. Step 1") and "# not a heading" in doc.body("4.2")
+        assert doc.body("4").count("###") == 3
+        assert doc.data[doc.section("5").start:].startswith(b"## 5. Notes")
+        with pytest.raises(KeyError):
+            doc.section("9.9")
+
+    def test_checkboxes(self):
+        doc = SpecDocument(CONTENT)
+        assert [(b.label, b.checked) for b in doc.checkboxes("4.1")] == [
+            ("Prerequisite 1", False), ("Prerequisite 2", False),
+        ]
+        sections = doc.sections
+
+        assert doc.set_checkbox("Prerequisite 2") is True
+        assert doc.set_checkbox("Prerequisite 2") is False
+        assert doc.set_checkbox("Keep", checked=False, section="Rollback Plan") is True
+        assert doc.text == CONTENT.replace("[ ] Prerequisite 2", "[x] Prerequisite 2").replace(
+            "[x] Keep", "[ ] Keep"
+        )
+        assert doc.sections is sections  # offsets unchanged, nothing re-indexed
+        with pytest.raises(KeyError):
+            doc.set_checkbox("Prerequisite 3")
+
+    def test_replace_section_splices(self):
+        doc = SpecDocument(CONTENT)
+        before = doc.sections
+
+        doc.replace_section("4.2", "\n1. Add the form\n2. Wire up the API\n\n")
+        assert doc.text == CONTENT.replace(
+            CONTENT[CONTENT.index("1. Step 1"):CONTENT.index("### 4.3")],
+            "1. Add the form\n2. Wire up the API\n\n",
+        )
+        assert doc.sections == reindexed(doc) and doc.sections is not before
+
+        doc.replace_section("Implementation Plan", "\nTBD")
+        assert doc.body("4") == "\nTBD\n" and doc.find_section("4.1") is None
+        assert doc.sections == reindexed(doc)
+
+        doc.replace_section("Summary", "\n### 1.1 Scope\n\nNew subsection.\n\n")
+        assert doc.section("1.1").level == 3 and doc.sections == reindexed(doc)
+
+    def test_set_header_only_touches_header(self):
+        doc = SpecDocument(CONTENT)
+        doc.set_header(status="complete", version="1.1.0")
+        assert doc.header.status == "complete" and doc.header.version == "1.1.0"
+        assert "## Status: Unrelated" in doc.text
+        assert doc.text.endswith(CONTENT[CONTENT.index("---"):])
+
+        front = SpecDocument("---\nstatus: draft\n---\n# Title\n\n## Status: Kept\n")
+        front.set_header(status="archived")
+        assert front.text == "---\nstatus: archived\n---\n# Title\n\n## Status: Kept\n"
+
+    def test_save_keeps_permissions(self, tmp_path):
+        path = tmp_path / "SPEC-00001-login.md"
+        path.write_text(CONTENT)
+        os.chmod(path, 0o644)
+
+        doc = SpecDocument.load(path)
+        doc.set_checkbox("Prerequisite 1")
+        doc.save()
+        assert path.read_text() == doc.text and os.stat(path).st_mode & 0o777 == 0o644
+        assert doc.header.title == "Login form"
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
+        with pytest.raises(ValueError):
+            SpecDocument(CONTENT).save()
+
+    def test_manager_updates_in_place(self, tmp_path, monkeypatch):
+        manager = SpecManager({"specs_dir": str(tmp_path / "specs")})
+        spec = manager.create_spec("Login form")
+
+        doc = manager.open_spec(spec.id)
+        doc.set_checkbox("Requirement 1")
+        doc.replace_section("4.2", "\n1. Build it\n\n")
+        doc.save()
+
+        def no_reads(*args, **kwargs):
+            raise AssertionError("update_spec re-read the spec")
+
+        monkeypatch.setattr(SpecManager, "get_spec", no_reads)
+        updated = manager.update_spec(spec.id, status="complete")
+        assert updated.status == "complete" and updated.title == "Login form"
+        assert "- [x] Requirement 1" in updated.content and "1. Build it" in updated.content
+        assert manager.list_specs(status="complete")[0].content == updated.content
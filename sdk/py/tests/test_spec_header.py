@@ -0,0 +1,113 @@
+"""
+Tests for spec header parsing.
+"""
+
+import builtins
+from pathlib import Path
+
+import pytest
+
+from fractary_core.spec import SpecManager
+from fractary_core.spec.header import parse_spec_header, read_spec_header, update_header
+
+MARKDOWN = """# Login form
+
+## Status: In_Progress
+## Version: 1.2.0
+## Work ID: 123
+## Created: 2024-01-01
+
+---
+
+## 1. Summary
+
+## Status: Ignored
+"""
+
+FRONT_MATTER = """---
+title: OAuth support
+status: Complete
+version: 2.0.0
+work_id: 77
+owner: platform
+---
+# Heading title
+
+## Status: Draft
+"""
+
+
+class TestSpecHeader:
+    """Headers should be parsed in one pass without reading bodies."""
+
+    def test_markdown_header(self):
+        header = parse_spec_header(MARKDOWN, "fallback")
+        assert header.fields() == {
+            "title": "Login form", "status": "in_progress", "version": "1.2.0", "work_id": "123",
+        }
+        assert not header.front_matter
+
+    def test_defaults_and_na_work_id(self):
+        header = parse_spec_header("## Work ID: N/A\n\nbody\n", "SPEC-00001-x")
+        assert header.fields() == {
+            "title": "SPEC-00001-x", "status": "draft", "version": "1.0.0", "work_id": None,
+        }
+
+    def test_front_matter_wins(self):
+        header = parse_spec_header(FRONT_MATTER, "fallback")
+        assert header.front_matter
+        assert header.fields() == {
+            "title": "OAuth support", "status": "complete", "version": "2.0.0", "work_id": "77",
+        }
+        assert header.metadata == {"owner": "platform"}
+
+    def test_read_stops_at_limit(self, tmp_path):
+        path = tmp_path / "big.md"
+        path.write_text("# Big\n\n" + "x" * 1_000_000 + "\n## Status: Complete\n")
+
+        assert read_spec_header(path, limit=4096).status == "draft"
+        assert read_spec_header(path, limit=2_000_000).status == "complete"
+
+    def test_update_header(self):
+        updated = update_header(MARKDOWN, status="complete", version="1.3.0")
+        assert "## Status: Complete" in updated and "## Version: 1.3.0" in updated
+
+        updated = update_header(FRONT_MATTER, status="archived")
+        header = parse_spec_header(updated, "fallback")
+        assert header.status == "archived" and "## Status: Draft" in updated
+        assert update_header(FRONT_MATTER, version="2.1").count("version: '2.1'") == 1
+
+        added = update_header("---\ntitle: X\n---\nbody\n", status="draft")
+        assert added == "---\ntitle: X\nstatus: draft\n---\nbody\n"
+
+    def test_metadata_listing_reads_no_bodies(self, tmp_path, monkeypatch):
+        manager = SpecManager({"specs_dir": str(tmp_path / "specs")})
+        manager.create_spec("Login form")
+        manager.create_spec("Session timeout", work_id="5")
+        (tmp_path / "specs" / "SPEC-00009-front.md").write_text(FRONT_MATTER)
+        manager.archive_spec("SPEC-00009")
+
+        opened = []
+        real_open = builtins.open
+
+        def tracking_open(file, mode="r", *args, **kwargs):
+            opened.append((Path(file).name, mode))
+            return real_open(file, mode, *args, **kwargs)
+
+        def no_full_reads(self, *args, **kwargs):
+            raise AssertionError(f"read {self}")
+
+        monkeypatch.setattr(builtins, "open", tracking_open)
+        monkeypatch.setattr(Path, "read_text", no_full_reads)
+        manager.index._entries.clear()  # force every header to be re-read
+
+        specs = manager.list_specs(include_content=False)
+        assert [s.title for s in specs] == ["Login form", "OAuth support", "Session timeout"]
+        assert specs[1].status == "archived" and all(s.content == "" for s in specs)
+        assert sorted(name for name, mode in opened if mode == "rb") == [
+            "SPEC-00001-login-form.md", "SPEC-00009-front.md", "WORK-00005-session-timeout.md",
+        ]
+
+    @pytest.mark.parametrize("text", ["", "\n\n", "---\nnot: [closed\n"])
+    def test_degenerate_input(self, text):
+        assert parse_spec_header(text, "stem").title == "stem"
@@ -0,0 +1,66 @@
+"""
+Tests for spec ID allocation.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from fractary_core.common import locking
+from fractary_core.spec import SpecIdAllocator, SpecManager
+
+
+def create_specs(specs_dir, count):
+    """Process pool worker: create ``count`` specs and return their IDs."""
+    manager = SpecManager({"specs_dir": specs_dir})
+    return [manager.create_spec(f"Spec {os.getpid()} {i}").id for i in range(count)]
+
+
+class TestSpecIdAllocator:
+    """Spec IDs should be unique across threads and processes."""
+
+    def test_counters_per_prefix(self, tmp_path):
+        ids = SpecIdAllocator(tmp_path)
+        assert [ids.allocate("SPEC") for _ in range(3)] == [1, 2, 3]
+        assert ids.allocate("ADR", seed=lambda: 41) == 42
+        assert ids.allocate("SPEC", seed=lambda: 99) == 4  # seeds only a new prefix
+        assert ids.allocate("SPEC", floor=10) == 11
+        assert ids.allocate("SPEC", reserve=False) == 12 == ids.allocate("SPEC")
+        assert (tmp_path / ".index" / "counters").read_text() == "ADR 42\nSPEC 12\n"
+        with pytest.raises(ValueError):
+            ids.allocate("MY SPEC")
+
+    def test_threads_share_allocator(self, tmp_path):
+        ids = SpecIdAllocator(tmp_path)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            numbers = list(pool.map(lambda _: ids.allocate("SPEC"), range(400)))
+        assert sorted(numbers) == list(range(1, 401))
+
+    def test_threads_without_fcntl(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(locking, "fcntl", None)
+        ids = SpecIdAllocator(tmp_path)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            numbers = list(pool.map(lambda _: ids.allocate("SPEC"), range(100)))
+        assert sorted(numbers) == list(range(1, 101))
+        assert ids.allocate("SPEC", reserve=False) == 101 == ids.allocate("SPEC")
+        assert (tmp_path / ".index" / "counters").read_text() == "SPEC 101\n"
+        assert not (tmp_path / ".index" / "counters.lock.held").exists()
+
+    def test_externally_added_spec_is_skipped(self, tmp_path):
+        manager = SpecManager({"specs_dir": str(tmp_path)})
+        assert manager.create_spec("One").id == "SPEC-00001"
+        (tmp_path / "SPEC-00002-from-teammate.md").write_text("# From a teammate\n")
+
+        assert manager.create_spec("Two").id == "SPEC-00003"
+
+    def test_processes_create_unique_specs(self, tmp_path):
+        specs_dir = str(tmp_path / "specs")
+        workers, per_worker = 8, 250
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batches = list(pool.map(create_specs, [specs_dir] * workers, [per_worker] * workers))
+
+        created = [spec_id for batch in batches for spec_id in batch]
+        assert len(set(created)) == len(created) == workers * per_worker
+        assert len(list((tmp_path / "specs").glob("SPEC-*.md"))) == len(created)
+        assert SpecManager({"specs_dir": specs_dir}).create_spec("Last").id == "SPEC-02001"
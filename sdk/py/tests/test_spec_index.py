@@ -0,0 +1,115 @@
+"""
+Tests for SpecIndex and the SpecManager lookups built on it.
+"""
+
+import os
+import time
+
+import pytest
+
+from fractary_core.spec import SpecManager
+from fractary_core.spec.index import SpecIndex
+
+
+def age(path, seconds=60):
+    """Move a file's (or directory's) mtime into the past."""
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def age_all(specs_dir):
+    for path in specs_dir.glob("*.md"):
+        age(path)
+    age(specs_dir)
+
+
+@pytest.fixture
+def specs_dir(tmp_path):
+    return tmp_path / "specs"
+
+
+@pytest.fixture
+def manager(specs_dir):
+    return SpecManager({"specs_dir": str(specs_dir), "id_prefix": "SPEC"})
+
+
+class TestSpecIndex:
+    """SpecManager lookups should be answered from the index."""
+
+    def test_lookup_paths(self, manager, specs_dir):
+        first = manager.create_spec("Login form")
+        second = manager.create_spec("Session timeout")
+        work = manager.create_spec("OAuth support", work_id="123")
+
+        assert (first.id, second.id) == ("SPEC-00001", "SPEC-00002")
+        assert manager.get_spec("SPEC-00002").title == "Session timeout"
+        assert manager.get_spec("123").path == work.path
+        assert manager.get_spec("WORK-00123").work_id == "123"
+        assert manager.get_spec("timeout").path == second.path
+        assert manager.get_spec("SPEC-0000?").path == first.path
+        with pytest.raises(FileNotFoundError):
+            manager.get_spec("SPEC-00099")
+
+        assert (specs_dir / ".index" / "specs.json").exists()
+        assert (specs_dir / ".index" / ".gitignore").read_text() == "*\n"
+
+    def test_list_filters_on_indexed_metadata(self, manager):
+        manager.create_spec("Login form", work_id="7")
+        spec = manager.create_spec("Session timeout")
+        manager.archive_spec(spec.id)
+
+        assert [s.title for s in manager.list_specs()] == ["Session timeout", "Login form"]
+        [archived] = manager.list_specs(status="Archived")
+        assert archived.id == "SPEC-00001-session-timeout"
+        assert "## Status: Archived" in archived.content
+        assert [s.title for s in manager.list_specs(work_id="7")] == ["Login form"]
+
+    def test_picks_up_external_changes(self, manager, specs_dir):
+        spec = manager.create_spec("Login form")
+        age_all(specs_dir)
+        assert manager.list_specs(status="draft")
+
+        path = specs_dir / os.path.basename(spec.path)
+        path.write_text(path.read_text().replace("## Status: Draft", "## Status: In_Progress"))
+        assert [s.status for s in manager.list_specs()] == ["in_progress"]
+
+        (specs_dir / "SPEC-00007-imported.md").write_text("# Imported\n")
+        assert manager.get_spec("SPEC-00007").title == "Imported"
+        assert manager.create_spec("Next").id == "SPEC-00008"
+
+        path.unlink()
+        with pytest.raises(FileNotFoundError):
+            manager.get_spec("SPEC-00001")
+
+    def test_persisted_index_avoids_rescans(self, manager, specs_dir, monkeypatch):
+        for i in range(20):
+            manager.create_spec(f"Spec {i}")
+        age_all(specs_dir)
+        assert manager.index.refresh() == 20  # recorded with their settled mtimes
+
+        scans = []
+        reads = []
+        real_scandir, real_read_text = os.scandir, type(specs_dir).read_text
+        monkeypatch.setattr(os, "scandir", lambda *a: scans.append(a) or real_scandir(*a))
+        monkeypatch.setattr(
+            type(specs_dir), "read_text",
+            lambda self, *a, **k: reads.append(self.name) or real_read_text(self, *a, **k),
+        )
+
+        fresh = SpecManager({"specs_dir": str(specs_dir)})
+        assert fresh.get_spec("SPEC-00005").title == "Spec 4"
+        assert scans == []
+        assert reads == ["specs.json", "SPEC-00005-spec-4.md"]
+
+        # Listing stats every file but reads none of the unchanged ones for metadata
+        reads.clear()
+        assert len(fresh.list_specs()) == 20
+        assert len(scans) == 1 and len(reads) == 20
+
+    def test_corrupt_index_is_rebuilt(self, manager, specs_dir):
+        manager.create_spec("Login form")
+        (specs_dir / ".index" / "specs.json").write_text("{not json")
+
+        index = SpecIndex(specs_dir)
+        assert index.find("SPEC-00001").title == "Login form"
+        assert index.max_number("SPEC") == 1
@@ -0,0 +1,127 @@
+"""
+Tests for spec validation and validate_all().
+"""
+
+import re
+
+import pytest
+
+import fractary_core.spec.manager as manager_module
+from fractary_core.spec import SpecManager, ValidationResult
+from fractary_core.spec.validation import scan_spec, validate_content
+
+
+def legacy_validate(content):
+    """The section/checkbox scoring validate_spec used to compute."""
+    required = [
+        ("## 1. Summary", "## 1. Overview", "## 1. Problem Description"),
+        ("## 2. Requirements",),
+        ("## 3. ", "## 4. "),
+        ("## Acceptance Criteria", "## 4. Acceptance Criteria", "## 3. Acceptance Criteria"),
+    ]
+    missing = [opts[0] for opts in required if not any(s in content for s in opts)]
+    unchecked = len(re.findall(r"- \[ \]", content))
+    checked = len(re.findall(r"- \[x\]", content, re.IGNORECASE))
+    total = unchecked + checked
+    completeness = (1.0 - len(missing) / len(required)) * 0.7 + (
+        checked / total if total else 1.0
+    ) * 0.3
+    return missing, unchecked, completeness
+
+
+def legacy_questions(content, missing):
+    questions = [f"Can you provide details for {s}?" for s in missing]
+    for pattern, message in [
+        (r"\[.+\]", "There are placeholder texts that need to be filled in"),
+        (r"TODO", "There are TODO items that need to be addressed"),
+        (r"TBD", "There are TBD items that need to be determined"),
+    ]:
+        if re.search(pattern, content, re.IGNORECASE):
+            questions.append(message)
+    for q in [
+        "Are there any edge cases we should consider?",
+        "What are the security implications?",
+        "Are there any performance requirements or constraints?",
+        "What dependencies does this work have?",
+        "What is the rollback strategy if something goes wrong?",
+    ]:
+        if q.split()[3].lower() not in content.lower():
+            questions.append(q)
+    return questions[:10]
+
+
+SAMPLES = [
+    "",
+    "# Empty\n",
+    "## 1. Summary\n## 2. Requirements\n## 3. Acceptance Criteria\n- [x] done\n- [X] done\n",
+    "## 1. Overview\n### 3. nested\n- [ ] one\n- [ ] two\n- [x] three\ntodo: Tbd\n",
+    "## Acceptance Criteria\n## 4. Plan\n[fill [in]\n]\nthisecurity performancedge\n",
+    "- [ ]- [ ]- [x]\n## 1. Problem Description\nRollback EDGE dependencies this\n",
+]
+
+
+class TestSpecValidation:
+    """Validation should match the previous checks while scanning once."""
+
+    @pytest.mark.parametrize("content", SAMPLES)
+    def test_matches_legacy_checks(self, content):
+        missing, unchecked, completeness = legacy_validate(content)
+        result = validate_content(content)
+        assert result.missing_sections == missing
+        assert result.completeness == pytest.approx(completeness)
+        assert (f"Complete {unchecked} unchecked items" in result.suggestions) == (unchecked > 0)
+        assert scan_spec(content).questions() == legacy_questions(content, missing)
+
+    def test_manager_entry_points(self, tmp_path):
+        manager = SpecManager({"specs_dir": str(tmp_path / "specs")})
+        spec = manager.create_spec("Login API", template="api")
+
+        result = manager.validate_spec(spec.id)
+        assert result.status == "partial"
+        assert result.missing_sections == ["## 2. Requirements", "## Acceptance Criteria"]
+        questions = manager.generate_refinement_questions(spec.id)
+        assert questions[:2] == [
+            "Can you provide details for ## 2. Requirements?",
+            "Can you provide details for ## Acceptance Criteria?",
+        ]
+        assert "There are placeholder texts that need to be filled in" in questions
+
+    def test_validate_all_caches_by_content(self, tmp_path, monkeypatch):
+        specs_dir = tmp_path / "specs"
+        manager = SpecManager({"specs_dir": str(specs_dir)})
+        first = manager.create_spec("Login form")
+        manager.create_spec("Session timeout")
+        (specs_dir / "SPEC-00009-binary.md").write_bytes(b"# Bad \xff\n")
+
+        results = manager.validate_all(max_workers=1)
+        assert list(results) == [
+            "SPEC-00001-login-form", "SPEC-00002-session-timeout", "SPEC-00009-binary",
+        ]
+        assert results["SPEC-00001-login-form"] == manager.validate_spec(first.id)
+        assert results["SPEC-00009-binary"].errors
+        assert (specs_dir / ".index" / "validation.json").exists()
+
+        validated = []
+        def tracking(content):
+            validated.append(content.splitlines()[0])
+            return validate_content(content)
+
+        monkeypatch.setattr(manager_module, "validate_content", tracking)
+        fresh = SpecManager({"specs_dir": str(specs_dir)})
+        assert fresh.validate_all(max_workers=1) == results
+        assert validated == []
+
+        manager.update_spec(first.id, status="complete")
+        fresh.validate_all(max_workers=1)
+        assert validated == ["# Login form"]
+
+    def test_validate_all_in_process_pool(self, tmp_path):
+        manager = SpecManager({"specs_dir": str(tmp_path / "specs")})
+        for i in range(40):
+            manager.create_spec(f"Spec {i}", template="api" if i % 2 else "feature")
+
+        parallel = manager.validate_all(max_workers=4)
+        (tmp_path / "specs" / ".index" / "validation.json").unlink()
+        serial = manager.validate_all(max_workers=1)
+        assert parallel == serial and len(parallel) == 40
+        assert all(isinstance(r, ValidationResult) for r in parallel.values())
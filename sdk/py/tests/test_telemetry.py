@@ -0,0 +1,107 @@
+"""
+Tests for subprocess telemetry.
+"""
+
+import json
+import subprocess
+
+import pytest
+
+from fractary_core.common import telemetry
+from fractary_core.common.telemetry import Telemetry, command_class
+from fractary_core.logs.manager import FaberPhase, LogManager
+from fractary_core.repo.manager import RepoManager
+
+
+@pytest.fixture
+def registry():
+    registry = telemetry.enable_telemetry()
+    yield registry
+    telemetry.disable_telemetry()
+
+
+def test_command_class():
+    assert command_class(["git", "status", "--porcelain=v2"]) == "git status"
+    argv = ["git", "-C", "/x", "-c", "a=b", "--literal-pathspecs", "add", "--", "f"]
+    assert command_class(argv) == "git add"
+    assert command_class(["gh", "pr", "view", "12", "--json", "title"]) == "gh pr view"
+    assert command_class(["gh", "api", "repos/o/r/pulls", "--method", "POST"]) == "gh api"
+    assert command_class(["/usr/bin/git"]) == "git"
+
+
+def test_disabled_by_default():
+    assert telemetry.get_telemetry() is None
+    telemetry.record(["git", "status"], 1.0, 0)
+    assert telemetry.run(["git", "--version"], capture_output=True).returncode == 0
+
+
+class TestTelemetry:
+    """An enabled registry should see every git call made by the repo layer."""
+
+    def test_records_repo_operations(self, registry, git_repo):
+        repo = RepoManager({"default_branch": "main"}, repo_path=git_repo)
+        (git_repo / "a.txt").write_text("a\n")
+        repo.commit("add a")
+        list(repo.iter_commits())
+        repo.close()
+
+        stats = registry.stats()
+        assert {"git status", "git add", "git commit", "git log", "git cat-file"} <= stats.keys()
+        assert stats["git commit"].exit_codes == {"0": 1}
+        assert stats["git log"].output_bytes > 0
+        assert stats["git cat-file"].count == 1  # the session's batch process, on close
+
+    def test_failures(self, registry, git_repo):
+        with pytest.raises(subprocess.CalledProcessError):
+            telemetry.run(
+                ["git", "rev-parse", "nope"], cwd=git_repo, capture_output=True, check=True,
+            )
+        with pytest.raises(FileNotFoundError):
+            telemetry.run(["definitely-not-a-command"])
+        with pytest.raises(subprocess.TimeoutExpired):
+            telemetry.run(["sleep", "5"], timeout=0.05)
+
+        stats = registry.stats()
+        assert stats["git rev-parse"].exit_codes == {"128": 1}
+        assert stats["definitely-not-a-command"].exit_codes == {"error": 1}
+        assert stats["sleep 5"].exit_codes == {"timeout": 1}
+
+    def test_exports(self):
+        registry = Telemetry(buckets=(0.1, 1.0))
+        registry.record(["git", "fetch"], 0.05, 0, 10)
+        registry.record(["git", "fetch"], 0.5, 0, 20)
+        registry.record(["git", "fetch"], 5.0, 1)
+
+        data = json.loads(registry.to_json())
+        assert data["git fetch"]["count"] == 3
+        assert data["git fetch"]["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+        assert data["git fetch"]["exit_codes"] == {"0": 2, "1": 1}
+        assert data["git fetch"]["output_bytes"] == 30
+
+        text = registry.to_prometheus()
+        assert "# TYPE fractary_subprocess_duration_seconds histogram" in text
+        assert 'fractary_subprocess_duration_seconds_bucket{command="git fetch",le="1.0"} 2' in text
+        assert 'fractary_subprocess_duration_seconds_count{command="git fetch"} 3' in text
+        assert 'fractary_subprocess_exits_total{command="git fetch",code="1"} 1' in text
+        assert 'fractary_subprocess_output_bytes_total{command="git fetch"} 30' in text
+
+        registry.reset()
+        assert registry.to_dict() == {}
+
+    def test_slow_calls_are_logged(self, tmp_path, capsys):
+        logs = LogManager({"logs_dir": str(tmp_path / "logs"), "log_level": "info"})
+        logs.start_workflow("wf-1")
+        logs.start_phase(FaberPhase.BUILD)
+        telemetry.enable_telemetry(slow_threshold=0.5, log_manager=logs)
+        try:
+            telemetry.record(["git", "status"], 0.1, 0)
+            telemetry.record(["git", "fetch", "origin"], 2.0, 0, 5)
+        finally:
+            telemetry.disable_telemetry()
+
+        entries = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        slow = [e for e in entries if "tool" in e]
+        assert len(slow) == 1
+        assert slow[0]["level"] == "warning" and slow[0]["phase"] == "build"
+        assert slow[0]["tool"] == "git fetch" and slow[0]["duration_ms"] == 2000
+        assert slow[0]["metadata"]["argv"] == ["git", "fetch", "origin"]